@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import ccxt.async_support as ccxt
+
+from app.ccxt.api.parser import parse_cancel_order, parse_limit_order, parse_market_order
+from app.ccxt.dtos.order.cancel_order_response_dto import CancelOrderResponseDTO
+from app.ccxt.dtos.order.limit.limit_order_request_dto import LimitOrderRequestDTO
+from app.ccxt.dtos.order.limit.limit_order_response_dto import LimitOrderResponseDTO
+from app.ccxt.dtos.order.market.market_order_request_dto import MarketOrderRequestDTO
+from app.ccxt.dtos.order.market.market_order_response_dto import MarketOrderResponseDTO
+from app.ccxt.dtos.order.order_result_dto import OrderResultDTO
+
+# SpotOrder/FutureOrder가 공유하는 배치 주문/취소 함수 모음입니다.
+# 거래소가 batch 엔드포인트(createOrders, cancelOrders, cancelAllOrders)를 지원하면 그것을 쓰고,
+# 지원하지 않으면 최대 max_concurrency개씩 동시에 단건 요청을 보냅니다.
+# 결과는 요청과 같은 순서로 반환되고, 한 건이 거절되어도 나머지 결과는 그대로 반환됩니다.
+
+# Binance USDⓈ-M batchOrders 한도(5)에 맞춘 기본값입니다.
+NATIVE_BATCH_SIZE = 5
+# Binance 선물 cancelOrders(orderIdList) 한도(10)에 맞춘 값입니다.
+NATIVE_CANCEL_BATCH_SIZE = 10
+
+
+async def submit_limit_orders(
+    client: ccxt.Exchange,
+    limit_orders: list[LimitOrderRequestDTO],
+    side: str,
+    max_concurrency: int = 8,
+    batch_size: int = NATIVE_BATCH_SIZE,
+) -> list[OrderResultDTO[LimitOrderResponseDTO]]:
+    orders = [
+        {
+            "symbol": limit_order.ticker,
+            "type": "limit",
+            "side": side,
+            "amount": limit_order.amount,
+            "price": limit_order.price,
+            "params": {"timeInForce": limit_order.time_in_force.value},
+        }
+        for limit_order in limit_orders
+    ]
+    results = await _create_orders(client, orders, max_concurrency, batch_size)
+    return [_to_result(result, parse_limit_order) for result in results]
+
+
+async def submit_market_orders(
+    client: ccxt.Exchange,
+    market_orders: list[MarketOrderRequestDTO],
+    side: str,
+    max_concurrency: int = 8,
+    batch_size: int = NATIVE_BATCH_SIZE,
+) -> list[OrderResultDTO[MarketOrderResponseDTO]]:
+    orders: list[dict[str, Any]] = [
+        {
+            "symbol": market_order.ticker,
+            "type": "market",
+            "side": side,
+            "amount": market_order.amount,
+            "price": None,
+            "params": {},
+        }
+        for market_order in market_orders
+    ]
+    results = await _create_orders(client, orders, max_concurrency, batch_size)
+    return [_to_result(result, parse_market_order) for result in results]
+
+
+async def cancel_orders(
+    client: ccxt.Exchange,
+    order_ids: list[str],
+    ticker: str,
+    max_concurrency: int = 8,
+) -> list[OrderResultDTO[CancelOrderResponseDTO]]:
+    if not order_ids:
+        return []
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    if client.has.get("cancelOrders") and _is_contract(client, ticker):
+        chunks = [
+            order_ids[i : i + NATIVE_CANCEL_BATCH_SIZE]
+            for i in range(0, len(order_ids), NATIVE_CANCEL_BATCH_SIZE)
+        ]
+        chunk_results = await asyncio.gather(
+            *(_cancel_chunk(client, chunk, ticker, semaphore) for chunk in chunks)
+        )
+        results = [result for results in chunk_results for result in results]
+    else:
+        results = await _fan_out(
+            lambda order_id: client.cancel_order(order_id, ticker), order_ids, semaphore
+        )
+
+    return [_to_result(result, parse_cancel_order) for result in results]
+
+
+async def cancel_all_orders(client: ccxt.Exchange, ticker: str, max_concurrency: int = 8) -> None:
+    """
+    ticker의 미체결 주문을 모두 취소합니다.
+    cancelAllOrders가 없으면 미체결 주문을 조회한 뒤 cancel_orders로 취소하고, 실패한 건이 있으면 첫 오류를 올립니다.
+    """
+    if client.has.get("cancelAllOrders"):
+        await client.cancel_all_orders(ticker)
+        return
+
+    open_orders = await client.fetch_open_orders(ticker)
+    results = await cancel_orders(
+        client, [order["id"] for order in open_orders], ticker, max_concurrency
+    )
+    for result in results:
+        if result.error is not None:
+            raise result.error
+
+
+# ---------------------------------------------------------
+# Internal
+# ---------------------------------------------------------
+async def _create_orders(
+    client: ccxt.Exchange,
+    orders: list[dict[str, Any]],
+    max_concurrency: int,
+    batch_size: int,
+) -> list[dict[str, Any] | Exception]:
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    if not client.has.get("createOrders"):
+        return await _fan_out(lambda order: client.create_order(**order), orders, semaphore)
+
+    chunks = [orders[i : i + batch_size] for i in range(0, len(orders), batch_size)]
+    chunk_results = await asyncio.gather(
+        *(_create_chunk(client, chunk, semaphore) for chunk in chunks)
+    )
+    return [result for results in chunk_results for result in results]
+
+
+async def _create_chunk(
+    client: ccxt.Exchange, chunk: list[dict[str, Any]], semaphore: asyncio.Semaphore
+) -> list[dict[str, Any] | Exception]:
+    try:
+        async with semaphore:
+            created = await client.create_orders(chunk)
+    except ccxt.NotSupported:
+        # ex) Binance 현물은 has["createOrders"]가 True여도 요청을 보내기 전에 NotSupported를 올립니다.
+        return await _fan_out(lambda order: client.create_order(**order), chunk, semaphore)
+    except Exception as e:
+        return [e] * len(chunk)
+
+    return [_check_rejected(order) for order in created]
+
+
+async def _cancel_chunk(
+    client: ccxt.Exchange, chunk: list[str], ticker: str, semaphore: asyncio.Semaphore
+) -> list[dict[str, Any] | Exception]:
+    try:
+        async with semaphore:
+            canceled = await client.cancel_orders(chunk, ticker)
+    except Exception:
+        # batch 요청 자체가 실패하면 어떤 건이 취소됐는지 알 수 없으므로 단건 취소로 다시 보냅니다.
+        return await _fan_out(
+            lambda order_id: client.cancel_order(order_id, ticker), chunk, semaphore
+        )
+
+    # 응답이 요청과 1:1로 대응하지 않는 거래소도 있어서 id로 맞춥니다.
+    by_id = {order.get("id"): order for order in canceled}
+    return [
+        (
+            _check_rejected(by_id[order_id])
+            if order_id in by_id
+            else ccxt.OrderNotFound(f"{order_id} is missing from cancelOrders response")
+        )
+        for order_id in chunk
+    ]
+
+
+def _is_contract(client: ccxt.Exchange, ticker: str) -> bool:
+    """
+    Binance는 has["cancelOrders"]가 True여도 현물에서는 BadRequest를 올리므로 선물 마켓에서만 batch 취소를 씁니다.
+    마켓 정보가 아직 로드되지 않았으면 통합 심볼 형식(BTC/USDT:USDT)으로 판단합니다.
+    """
+    market = (client.markets or {}).get(ticker)
+    if market is not None:
+        return bool(market.get("contract"))
+    return ":" in ticker
+
+
+def _check_rejected(order: dict[str, Any]) -> dict[str, Any] | Exception:
+    """
+    batch 응답 중 거절된 건은 ccxt가 status='rejected'와 원본 오류(info)로 돌려줍니다.
+    """
+    if order.get("status") != "rejected":
+        return order
+    info = order.get("info") or {}
+    return ccxt.InvalidOrder(f"{info.get('code')}: {info.get('msg') or info}")
+
+
+async def _fan_out[T, R](
+    call: Callable[[T], Awaitable[R]], items: list[T], semaphore: asyncio.Semaphore
+) -> list[R | Exception]:
+    async def call_one(item: T) -> R | Exception:
+        async with semaphore:
+            try:
+                return await call(item)
+            except Exception as e:
+                return e
+
+    return await asyncio.gather(*(call_one(item) for item in items))
+
+
+def _to_result[R](
+    result: dict[str, Any] | Exception, parse: Callable[[dict[str, Any]], R]
+) -> OrderResultDTO[R]:
+    if isinstance(result, Exception):
+        return OrderResultDTO(error=result)
+    return OrderResultDTO(response=parse(result))
@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar
+
+import ccxt.async_support as ccxt
+import orjson
+
+from app.ccxt.dtos.order.limit.limit_order_response_dto import LimitOrderResponseDTO
+from app.ccxt.dtos.order.market.market_order_response_dto import MarketOrderResponseDTO
+from app.ccxt.dtos.order_book_dto import OrderBookDTO, PriceLevelDTO
+from app.ccxt.dtos.ticker_dto import TickerDTO
+
+# 거래소 원본 JSON을 ccxt의 unified dict(safe_* 호출, Precise 문자열 연산)를 거치지 않고 바로 DTO로 변환합니다.
+# 값은 ccxt parser와 같은 의미로 채우며, 원본에 없는 값(change, average 등)은 float 연산으로 계산합니다.
+# raw는 응답 bytes/str(orjson으로 디코딩) 또는 이미 디코딩된 dict 모두 받습니다.
+
+type RawJson = bytes | str | dict[str, Any]
+
+
+class FastParser(ABC):
+    """
+    거래소별 원본 응답 -> DTO 변환기. MarketData(fast_path=True)가 ccxt의 implicit API로 원본을 받아 사용합니다.
+    """
+
+    exchange_id: ClassVar[str]
+
+    @abstractmethod
+    def ticker(self, raw: RawJson, symbol: str) -> TickerDTO: ...
+
+    @abstractmethod
+    def order_book(self, raw: RawJson, symbol: str) -> OrderBookDTO: ...
+
+    @abstractmethod
+    def limit_order(self, raw: RawJson) -> LimitOrderResponseDTO: ...
+
+    @abstractmethod
+    def market_order(self, raw: RawJson) -> MarketOrderResponseDTO: ...
+
+    @abstractmethod
+    async def fetch_ticker(self, client: ccxt.Exchange, symbol: str) -> TickerDTO: ...
+
+    @abstractmethod
+    async def fetch_order_book(
+        self, client: ccxt.Exchange, symbol: str, limit: int | None = None
+    ) -> OrderBookDTO: ...
+
+
+class BinanceFastParser(FastParser):
+    """
+    현물 /api/v3, USDⓈ-M 선물 /fapi/v1, COIN-M 선물 /dapi/v1 응답
+    """
+
+    exchange_id = "binance"
+
+    def ticker(self, raw: RawJson, symbol: str) -> TickerDTO:
+        data = _load(raw)
+        open_, last = float(data["openPrice"]), float(data["lastPrice"])
+        timestamp = data["closeTime"]
+        previous_close = data.get("prevClosePrice")
+        bid, ask = data.get("bidPrice"), data.get("askPrice")
+        vwap = float(data["weightedAvgPrice"])
+        if "baseVolume" in data:
+            # COIN-M의 volume은 계약 수라서 ccxt와 같이 baseVolume x 가중 평균가를 quote 거래량으로 씁니다.
+            base_volume = float(data["baseVolume"])
+            quote_volume = base_volume * vwap
+        else:
+            base_volume, quote_volume = float(data["volume"]), float(data["quoteVolume"])
+        return TickerDTO(
+            symbol=symbol,
+            timestamp=timestamp,
+            datetime=ccxt.Exchange.iso8601(timestamp),
+            high=float(data["highPrice"]),
+            low=float(data["lowPrice"]),
+            open=open_,
+            close=last,
+            last=last,
+            previous_close=float(previous_close) if previous_close is not None else None,
+            vwap=vwap,
+            change=float(data["priceChange"]),
+            percentage=float(data["priceChangePercent"]),
+            average=(open_ + last) / 2,
+            base_volume=base_volume,
+            quote_volume=quote_volume,
+            mark_price=None,
+            index_price=None,
+            bid=_nonzero(bid),
+            bid_volume=_optional(data.get("bidQty")),
+            ask=_nonzero(ask),
+            ask_volume=_optional(data.get("askQty")),
+        )
+
+    def order_book(self, raw: RawJson, symbol: str) -> OrderBookDTO:
+        data = _load(raw)
+        timestamp = data.get("T")  # 선물만 제공
+        return OrderBookDTO(
+            asks=_levels(data["asks"]),
+            bids=_levels(data["bids"]),
+            symbol=symbol,
+            timestamp=timestamp,
+            datetime=ccxt.Exchange.iso8601(timestamp) if timestamp is not None else None,
+            nonce=data["lastUpdateId"],
+        )
+
+    def limit_order(self, raw: RawJson) -> LimitOrderResponseDTO:
+        return LimitOrderResponseDTO(**self._order_fields(_load(raw)))
+
+    def market_order(self, raw: RawJson) -> MarketOrderResponseDTO:
+        return MarketOrderResponseDTO(**self._order_fields(_load(raw)))
+
+    async def fetch_ticker(self, client: ccxt.Exchange, symbol: str) -> TickerDTO:
+        market = await _market(client, symbol)
+        endpoint = getattr(client, f"{_binance_api(market)}GetTicker24hr")
+        response = await endpoint({"symbol": market["id"]})
+        if isinstance(response, list):
+            # COIN-M은 symbol을 지정해도 배열로 응답합니다.
+            response = response[0]
+        return self.ticker(response, symbol)
+
+    async def fetch_order_book(
+        self, client: ccxt.Exchange, symbol: str, limit: int | None = None
+    ) -> OrderBookDTO:
+        market = await _market(client, symbol)
+        endpoint = getattr(client, f"{_binance_api(market)}GetDepth")
+        request: dict[str, Any] = {"symbol": market["id"]}
+        if limit is not None:
+            request["limit"] = limit
+        return self.order_book(await endpoint(request), symbol)
+
+    @staticmethod
+    def _order_fields(data: dict[str, Any]) -> dict[str, Any]:
+        timestamp = data.get("transactTime") or data.get("updateTime")
+        amount = float(data["origQty"])
+        filled = float(data["executedQty"])
+        cost = float(data.get("cummulativeQuoteQty") or data.get("cumQuote") or 0.0)
+        average = cost / filled if filled else None
+
+        fee = None
+        fills = data.get("fills")
+        if fills:
+            # ccxt와 같이 수수료 통화가 하나일 때만 합산합니다.
+            if len({fill["commissionAsset"] for fill in fills}) == 1:
+                fee = sum(float(fill["commission"]) for fill in fills)
+
+        return {
+            "timestamp": timestamp,
+            "datetime": ccxt.Exchange.iso8601(timestamp),
+            "price": _nonzero(data.get("price")) or average,
+            "average": average,
+            "amount": amount,
+            "filled": filled,
+            "remaining": amount - filled,
+            "cost": cost,
+            "fee": fee,
+            "id": str(data["orderId"]),
+        }
+
+
+class BybitFastParser(FastParser):
+    """
+    v5 API 응답 ({"retCode": 0, "result": {...}, "time": ...})
+    """
+
+    exchange_id = "bybit"
+
+    def ticker(self, raw: RawJson, symbol: str) -> TickerDTO:
+        response = _load(raw)
+        data = response["result"]["list"][0]
+        open_, last = float(data["prevPrice24h"]), float(data["lastPrice"])
+        base_volume, quote_volume = float(data["volume24h"]), float(data["turnover24h"])
+        # 티커 항목에는 시각이 없어서 응답 시각을 사용합니다.
+        timestamp = response["time"]
+        return TickerDTO(
+            symbol=symbol,
+            timestamp=timestamp,
+            datetime=ccxt.Exchange.iso8601(timestamp),
+            high=float(data["highPrice24h"]),
+            low=float(data["lowPrice24h"]),
+            open=open_,
+            close=last,
+            last=last,
+            previous_close=None,
+            vwap=quote_volume / base_volume if base_volume else None,
+            change=last - open_,
+            percentage=float(data["price24hPcnt"]) * 100,
+            average=(open_ + last) / 2,
+            base_volume=base_volume,
+            quote_volume=quote_volume,
+            mark_price=_optional(data.get("markPrice")),
+            index_price=_optional(data.get("indexPrice")),
+            bid=_nonzero(data.get("bid1Price")),
+            bid_volume=_optional(data.get("bid1Size")),
+            ask=_nonzero(data.get("ask1Price")),
+            ask_volume=_optional(data.get("ask1Size")),
+        )
+
+    def order_book(self, raw: RawJson, symbol: str) -> OrderBookDTO:
+        data = _load(raw)["result"]
+        timestamp = data["ts"]
+        return OrderBookDTO(
+            asks=_levels(data["a"]),
+            bids=_levels(data["b"]),
+            symbol=symbol,
+            timestamp=timestamp,
+            datetime=ccxt.Exchange.iso8601(timestamp),
+            nonce=data["u"],
+        )
+
+    def limit_order(self, raw: RawJson) -> LimitOrderResponseDTO:
+        return LimitOrderResponseDTO(**self._order_fields(_load(raw)))
+
+    def market_order(self, raw: RawJson) -> MarketOrderResponseDTO:
+        return MarketOrderResponseDTO(**self._order_fields(_load(raw)))
+
+    async def fetch_ticker(self, client: ccxt.Exchange, symbol: str) -> TickerDTO:
+        market = await _market(client, symbol)
+        response = await client.publicGetV5MarketTickers(
+            {"category": _bybit_category(market), "symbol": market["id"]}
+        )
+        return self.ticker(response, symbol)
+
+    async def fetch_order_book(
+        self, client: ccxt.Exchange, symbol: str, limit: int | None = None
+    ) -> OrderBookDTO:
+        market = await _market(client, symbol)
+        response = await client.publicGetV5MarketOrderbook(
+            {
+                "category": _bybit_category(market),
+                "symbol": market["id"],
+                "limit": limit if limit is not None else (50 if market["spot"] else 25),
+            }
+        )
+        return self.order_book(response, symbol)
+
+    @staticmethod
+    def _order_fields(data: dict[str, Any]) -> dict[str, Any]:
+        """
+        주문 조회(/v5/order/realtime, /v5/order/history)의 항목 하나 또는 그 응답 전체
+        """
+        if "result" in data:
+            data = data["result"]["list"][0]
+
+        timestamp = int(data["createdTime"])
+        amount = float(data["qty"])
+        filled = float(data["cumExecQty"])
+        average = _nonzero(data.get("avgPrice"))
+        fee = data.get("cumExecFee")
+        return {
+            "timestamp": timestamp,
+            "datetime": ccxt.Exchange.iso8601(timestamp),
+            "price": _nonzero(data.get("price")) or average,
+            "average": average,
+            "amount": amount,
+            "filled": filled,
+            "remaining": float(data.get("leavesQty") or amount - filled),
+            "cost": float(data.get("cumExecValue") or 0.0),
+            "fee": float(fee) if fee not in (None, "") else None,
+            "id": data["orderId"],
+        }
+
+
+_PARSERS: dict[str, FastParser] = {
+    parser.exchange_id: parser for parser in (BinanceFastParser(), BybitFastParser())
+}
+
+
+def fast_parser_for(exchange_id: str) -> FastParser | None:
+    return _PARSERS.get(exchange_id)
+
+
+def _load(raw: RawJson) -> dict[str, Any]:
+    return raw if isinstance(raw, dict) else orjson.loads(raw)
+
+
+def _levels(levels: list[list[str]]) -> list[PriceLevelDTO]:
+    # frozen dataclass는 키워드 인자 생성이 느려서 위치 인자로 만듭니다. (호가 수백 개에서 차이가 큼)
+    return [PriceLevelDTO(float(level[0]), float(level[1])) for level in levels]
+
+
+def _optional(value: str | None) -> float | None:
+    return float(value) if value not in (None, "") else None
+
+
+def _nonzero(value: str | None) -> float | None:
+    """
+    ccxt의 omit_zero와 같이 0은 값이 없는 것으로 봅니다.
+    """
+    number = _optional(value)
+    return number if number else None
+
+
+async def _market(client: ccxt.Exchange, symbol: str) -> dict[str, Any]:
+    if not client.markets:
+        await client.load_markets()
+    return client.market(symbol)
+
+
+def _binance_api(market: dict[str, Any]) -> str:
+    """
+    ccxt implicit API 이름의 접두사. inverse(COIN-M) 마켓은 /fapi가 아니라 /dapi를 씁니다.
+    """
+    if market["spot"]:
+        return "public"
+    return "dapiPublic" if market.get("inverse") else "fapiPublic"
+
+
+def _bybit_category(market: dict[str, Any]) -> str:
+    if market["spot"]:
+        return "spot"
+    if market.get("option"):
+        return "option"
+    return "linear" if market.get("linear") else "inverse"
@@ -2,12 +2,20 @@ from __future__ import annotations
 
 from typing import Any
 
+from app.ccxt.api import batch_order
+from app.ccxt.api.parser import parse_balance, parse_limit_order, parse_market_order, parse_position
 from app.ccxt.domain.exchange import Exchange
-from app.ccxt.dtos.balance_dto import AssetBalanceDTO, BalanceDTO
+from app.ccxt.domain.instrumentation import instrumented
+from app.ccxt.domain.rate_limiter import with_priority
+from app.ccxt.dtos.balance_dto import BalanceDTO
+from app.ccxt.dtos.order.cancel_order_response_dto import CancelOrderResponseDTO
 from app.ccxt.dtos.order.limit.limit_order_request_dto import LimitOrderRequestDTO
 from app.ccxt.dtos.order.limit.limit_order_response_dto import LimitOrderResponseDTO
 from app.ccxt.dtos.order.market.market_order_request_dto import MarketOrderRequestDTO
 from app.ccxt.dtos.order.market.market_order_response_dto import MarketOrderResponseDTO
+from app.ccxt.dtos.order.order_result_dto import OrderResultDTO
+from app.ccxt.dtos.position_dto import PositionDTO
+from app.ccxt.enums.request_priority import RequestPriority
 
 
 class FutureOrder:
@@ -17,34 +25,33 @@ class FutureOrder:
         if not exchange.is_future():
             raise ValueError("Exchange must be a future market type.")
 
+    @instrumented
+    @with_priority(RequestPriority.ACCOUNT)
     async def fetch_balance(self) -> BalanceDTO:
         """
         거래소 계정의 선물 자산 잔고를 조회합니다.
         """
         balance_info: dict[str, Any] = await self._client.fetch_balance()
+        return parse_balance(balance_info)
 
-        balances = {
-            currency: AssetBalanceDTO(
-                free=float(info["free"]),
-                used=float(info["used"]),
-                total=float(info["total"]),
-            )
-            for currency, info in balance_info.items()
-            if isinstance(info, dict)  # 'free', 'used', 'total' 키를 가진 딕셔너리만 처리
-            and all(key in info for key in ["free", "used", "total"])
-        }
-
-        return BalanceDTO(
-            balances=balances,
-            timestamp=balance_info.get("timestamp"),
-            datetime=balance_info.get("datetime"),
-        )
-
-    # TODO(yeonghwan): implement fetch_positions
+    @instrumented
+    @with_priority(RequestPriority.ACCOUNT)
+    async def fetch_positions(self, symbols: list[str] | None = None) -> list[PositionDTO]:
+        """
+        열려 있는 선물 포지션을 조회합니다. (수량이 0인 항목은 제외)
+        """
+        positions: list[dict[str, Any]] = await self._client.fetch_positions(symbols)
+        return [
+            position
+            for position in map(parse_position, positions)
+            if position.side is not None and position.size > 0
+        ]
 
     # ---------------------------------------------------------
     # Future Limit Order
     # ---------------------------------------------------------
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
     async def open_long_limit_order(
         self, limit_order: LimitOrderRequestDTO
     ) -> LimitOrderResponseDTO:
@@ -55,18 +62,10 @@ class FutureOrder:
             params={"timeInForce": limit_order.time_in_force.value},
         )
 
-        return LimitOrderResponseDTO(
-            timestamp=long_order.get("timestamp"),
-            datetime=long_order.get("datetime"),
-            price=long_order.get("price"),
-            average=long_order.get("average"),
-            amount=long_order.get("amount"),
-            filled=long_order.get("filled"),
-            remaining=long_order.get("remaining"),
-            cost=long_order.get("cost"),
-            fee=long_order.get("fee").get("cost") if long_order.get("fee") else None,
-        )
+        return parse_limit_order(long_order)
 
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
     async def open_short_limit_order(
         self, limit_order: LimitOrderRequestDTO
     ) -> LimitOrderResponseDTO:
@@ -77,18 +76,10 @@ class FutureOrder:
             params={"timeInForce": limit_order.time_in_force.value},
         )
 
-        return LimitOrderResponseDTO(
-            timestamp=short_order.get("timestamp"),
-            datetime=short_order.get("datetime"),
-            price=short_order.get("price"),
-            average=short_order.get("average"),
-            amount=short_order.get("amount"),
-            filled=short_order.get("filled"),
-            remaining=short_order.get("remaining"),
-            cost=short_order.get("cost"),
-            fee=short_order.get("fee").get("cost") if short_order.get("fee") else None,
-        )
+        return parse_limit_order(short_order)
 
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
     async def close_long_limit_order(
         self, limit_order: LimitOrderRequestDTO
     ) -> LimitOrderResponseDTO:
@@ -99,18 +90,10 @@ class FutureOrder:
             params={"timeInForce": limit_order.time_in_force.value},
         )
 
-        return LimitOrderResponseDTO(
-            timestamp=close_long_order.get("timestamp"),
-            datetime=close_long_order.get("datetime"),
-            price=close_long_order.get("price"),
-            average=close_long_order.get("average"),
-            amount=close_long_order.get("amount"),
-            filled=close_long_order.get("filled"),
-            remaining=close_long_order.get("remaining"),
-            cost=close_long_order.get("cost"),
-            fee=close_long_order.get("fee").get("cost") if close_long_order.get("fee") else None,
-        )
+        return parse_limit_order(close_long_order)
 
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
     async def close_short_limit_order(
         self, limit_order: LimitOrderRequestDTO
     ) -> LimitOrderResponseDTO:
@@ -121,21 +104,13 @@ class FutureOrder:
             params={"timeInForce": limit_order.time_in_force.value},
         )
 
-        return LimitOrderResponseDTO(
-            timestamp=close_short_order.get("timestamp"),
-            datetime=close_short_order.get("datetime"),
-            price=close_short_order.get("price"),
-            average=close_short_order.get("average"),
-            amount=close_short_order.get("amount"),
-            filled=close_short_order.get("filled"),
-            remaining=close_short_order.get("remaining"),
-            cost=close_short_order.get("cost"),
-            fee=close_short_order.get("fee").get("cost") if close_short_order.get("fee") else None,
-        )
+        return parse_limit_order(close_short_order)
 
     # ---------------------------------------------------------
     # Future Market Order
     # ---------------------------------------------------------
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
     async def open_long_market_order(
         self, market_order: MarketOrderRequestDTO
     ) -> MarketOrderResponseDTO:
@@ -143,18 +118,10 @@ class FutureOrder:
             symbol=market_order.ticker, amount=market_order.amount
         )
 
-        return MarketOrderResponseDTO(
-            timestamp=long_market_order.get("timestamp"),
-            datetime=long_market_order.get("datetime"),
-            price=long_market_order.get("price"),
-            average=long_market_order.get("average"),
-            amount=long_market_order.get("amount"),
-            filled=long_market_order.get("filled"),
-            remaining=long_market_order.get("remaining"),
-            cost=long_market_order.get("cost"),
-            fee=long_market_order.get("fee").get("cost") if long_market_order.get("fee") else None,
-        )
+        return parse_market_order(long_market_order)
 
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
     async def open_short_market_order(
         self, market_order: MarketOrderRequestDTO
     ) -> MarketOrderResponseDTO:
@@ -162,20 +129,10 @@ class FutureOrder:
             symbol=market_order.ticker, amount=market_order.amount
         )
 
-        return MarketOrderResponseDTO(
-            timestamp=short_market_order.get("timestamp"),
-            datetime=short_market_order.get("datetime"),
-            price=short_market_order.get("price"),
-            average=short_market_order.get("average"),
-            amount=short_market_order.get("amount"),
-            filled=short_market_order.get("filled"),
-            remaining=short_market_order.get("remaining"),
-            cost=short_market_order.get("cost"),
-            fee=(
-                short_market_order.get("fee").get("cost") if short_market_order.get("fee") else None
-            ),
-        )
+        return parse_market_order(short_market_order)
 
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
     async def close_long_market_order(
         self, market_order: MarketOrderRequestDTO
     ) -> MarketOrderResponseDTO:
@@ -183,22 +140,10 @@ class FutureOrder:
             symbol=market_order.ticker, amount=market_order.amount
         )
 
-        return MarketOrderResponseDTO(
-            timestamp=close_long_market_order.get("timestamp"),
-            datetime=close_long_market_order.get("datetime"),
-            price=close_long_market_order.get("price"),
-            average=close_long_market_order.get("average"),
-            amount=close_long_market_order.get("amount"),
-            filled=close_long_market_order.get("filled"),
-            remaining=close_long_market_order.get("remaining"),
-            cost=close_long_market_order.get("cost"),
-            fee=(
-                close_long_market_order.get("fee").get("cost")
-                if close_long_market_order.get("fee")
-                else None
-            ),
-        )
+        return parse_market_order(close_long_market_order)
 
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
     async def close_short_market_order(
         self, market_order: MarketOrderRequestDTO
     ) -> MarketOrderResponseDTO:
@@ -206,18 +151,94 @@ class FutureOrder:
             symbol=market_order.ticker, amount=market_order.amount
         )
 
-        return MarketOrderResponseDTO(
-            timestamp=close_short_market_order.get("timestamp"),
-            datetime=close_short_market_order.get("datetime"),
-            price=close_short_market_order.get("price"),
-            average=close_short_market_order.get("average"),
-            amount=close_short_market_order.get("amount"),
-            filled=close_short_market_order.get("filled"),
-            remaining=close_short_market_order.get("remaining"),
-            cost=close_short_market_order.get("cost"),
-            fee=(
-                close_short_market_order.get("fee").get("cost")
-                if close_short_market_order.get("fee")
-                else None
-            ),
-        )
+        return parse_market_order(close_short_market_order)
+
+    # ---------------------------------------------------------
+    # Batch Order
+    # ---------------------------------------------------------
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
+    async def open_long_limit_orders(
+        self, limit_orders: list[LimitOrderRequestDTO], max_concurrency: int = 8
+    ) -> list[OrderResultDTO[LimitOrderResponseDTO]]:
+        """
+        여러 건의 지정가 롱 주문을 한 번에 보냅니다. 결과는 요청 순서대로 건별 응답 또는 오류를 담습니다.
+        """
+        return await batch_order.submit_limit_orders(
+            self._client, limit_orders, "buy", max_concurrency
+        )
+
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
+    async def open_short_limit_orders(
+        self, limit_orders: list[LimitOrderRequestDTO], max_concurrency: int = 8
+    ) -> list[OrderResultDTO[LimitOrderResponseDTO]]:
+        return await batch_order.submit_limit_orders(
+            self._client, limit_orders, "sell", max_concurrency
+        )
+
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
+    async def close_long_limit_orders(
+        self, limit_orders: list[LimitOrderRequestDTO], max_concurrency: int = 8
+    ) -> list[OrderResultDTO[LimitOrderResponseDTO]]:
+        return await batch_order.submit_limit_orders(
+            self._client, limit_orders, "sell", max_concurrency
+        )
+
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
+    async def close_short_limit_orders(
+        self, limit_orders: list[LimitOrderRequestDTO], max_concurrency: int = 8
+    ) -> list[OrderResultDTO[LimitOrderResponseDTO]]:
+        return await batch_order.submit_limit_orders(
+            self._client, limit_orders, "buy", max_concurrency
+        )
+
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
+    async def open_long_market_orders(
+        self, market_orders: list[MarketOrderRequestDTO], max_concurrency: int = 8
+    ) -> list[OrderResultDTO[MarketOrderResponseDTO]]:
+        return await batch_order.submit_market_orders(
+            self._client, market_orders, "buy", max_concurrency
+        )
+
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
+    async def open_short_market_orders(
+        self, market_orders: list[MarketOrderRequestDTO], max_concurrency: int = 8
+    ) -> list[OrderResultDTO[MarketOrderResponseDTO]]:
+        return await batch_order.submit_market_orders(
+            self._client, market_orders, "sell", max_concurrency
+        )
+
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
+    async def close_long_market_orders(
+        self, market_orders: list[MarketOrderRequestDTO], max_concurrency: int = 8
+    ) -> list[OrderResultDTO[MarketOrderResponseDTO]]:
+        return await batch_order.submit_market_orders(
+            self._client, market_orders, "sell", max_concurrency
+        )
+
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
+    async def close_short_market_orders(
+        self, market_orders: list[MarketOrderRequestDTO], max_concurrency: int = 8
+    ) -> list[OrderResultDTO[MarketOrderResponseDTO]]:
+        return await batch_order.submit_market_orders(
+            self._client, market_orders, "buy", max_concurrency
+        )
+
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
+    async def cancel_orders(
+        self, order_ids: list[str], ticker: str, max_concurrency: int = 8
+    ) -> list[OrderResultDTO[CancelOrderResponseDTO]]:
+        return await batch_order.cancel_orders(self._client, order_ids, ticker, max_concurrency)
+
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
+    async def cancel_all_orders(self, ticker: str) -> None:
+        await batch_order.cancel_all_orders(self._client, ticker)
@@ -1,100 +1,194 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Literal, overload
 
+import ccxt.async_support as ccxt
+
+from app.ccxt.api.fast_parser import fast_parser_for
+from app.ccxt.api.parser import (
+    parse_liquidation,
+    parse_order_book,
+    parse_ticker,
+    parse_trade,
+)
 from app.ccxt.domain.exchange import Exchange
+from app.ccxt.domain.instrumentation import instrumented
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
 from app.ccxt.dtos.candle_dto import CandleDTO
+from app.ccxt.dtos.funding_history_array_dto import FundingHistoryArrayDTO
+from app.ccxt.dtos.funding_rate_array_dto import FundingRateArrayDTO
 from app.ccxt.dtos.future_funding_rate_dto import FutureFundingRateDTO
-from app.ccxt.dtos.order_book_dto import OrderBookDTO, PriceLevelDTO
+from app.ccxt.dtos.latency_dto import LatencyDTO
+from app.ccxt.dtos.liquidation_dto import LiquidationDTO
+from app.ccxt.dtos.order_book_dto import OrderBookDTO
 from app.ccxt.dtos.status_dto import StatusDTO
+from app.ccxt.dtos.ticker_array_dto import TickerArrayDTO
 from app.ccxt.dtos.ticker_dto import TickerDTO
+from app.ccxt.dtos.trade_array_dto import TradeArrayDTO
+from app.ccxt.dtos.trade_dto import TradeDTO
+from app.ccxt.enums.market_type import MarketType
+
+logger = logging.getLogger(__name__)
 
 
 class MarketData:
-    def __init__(self, exchange: Exchange) -> None:
+    def __init__(self, exchange: Exchange, fast_path: bool = False) -> None:
+        """
+        fast_path=True 이면 지원하는 거래소(binance, bybit)의 ticker/order book을 원본 응답에서
+        바로 DTO로 변환합니다. (ccxt unified 파싱 생략, app.ccxt.api.fast_parser)
+        """
         self._client = exchange.client
+        self._fast_parser = fast_parser_for(self._client.id) if fast_path else None
+
+    @property
+    def exchange_id(self) -> str:
+        return self._client.id
+
+    @property
+    def market_type(self) -> MarketType:
+        return MarketType(self._client.options.get("defaultType"))
 
     # ---------------------------------------------------------
     # Basic Methods
     # ---------------------------------------------------------
 
     # TODO(yeonghwan): get necessary fields using DTO
-    async def load_markets(self) -> dict[str, Any]:
-        return await self._client.load_markets()
+    @instrumented
+    async def load_markets(self, reload: bool = False) -> dict[str, Any]:
+        """
+        ccxt는 한 번 로드한 마켓 정보를 캐시해서 돌려주므로, 새로 받아오려면 reload=True로 호출합니다.
+        """
+        return await self._client.load_markets(reload=reload)
 
+    @instrumented
     async def fetch_markets(self) -> list[dict[str, Any]]:
         return await self._client.fetch_markets()
 
     # ---------------------------------------------------------
     # Market Data Methods
     # ---------------------------------------------------------
+    @instrumented
     async def fetch_ticker(self, ticker: str) -> TickerDTO:
+        if self._fast_parser is not None:
+            return await self._fast_parser.fetch_ticker(self._client, ticker)
+
         ticker_info: dict[str, Any] = await self._client.fetch_ticker(ticker)
+        return parse_ticker(ticker_info)
 
-        return TickerDTO(
-            symbol=ticker_info["symbol"],
-            timestamp=ticker_info["timestamp"],
-            datetime=ticker_info["datetime"],
-            high=ticker_info["high"],
-            low=ticker_info["low"],
-            open=ticker_info["open"],
-            close=ticker_info["close"],
-            last=ticker_info["last"],
-            previous_close=ticker_info.get("previousClose"),
-            vwap=ticker_info["vwap"],
-            change=ticker_info["change"],
-            percentage=ticker_info["percentage"],
-            average=ticker_info.get("average"),
-            base_volume=ticker_info["baseVolume"],
-            quote_volume=ticker_info["quoteVolume"],
-            mark_price=ticker_info.get("markPrice"),
-            index_price=ticker_info.get("indexPrice"),
-            bid=ticker_info.get("bid"),
-            bid_volume=ticker_info.get("bidVolume"),
-            ask=ticker_info.get("ask"),
-            ask_volume=ticker_info.get("askVolume"),
-        )
+    @instrumented
+    async def fetch_tickers(self, tickers: list[str], max_concurrency: int = 16) -> TickerArrayDTO:
+        """
+        여러 심볼의 ticker를 한 번에 조회합니다.
+        거래소가 fetchTickers를 지원하지 않으면 최대 max_concurrency개씩 동시에 fetch_ticker를 호출합니다.
+        이때 심볼 자체가 잘못된(상장 폐지 등) 심볼은 로그만 남기고 결과에서 제외합니다.
+        """
+        if self._client.has.get("fetchTickers"):
+            tickers_info: dict[str, Any] = await self._client.fetch_tickers(tickers)
+        else:
+            tickers_info = await self._fan_out(self._client.fetch_ticker, tickers, max_concurrency)
+
+        return TickerArrayDTO.from_ccxt(tickers_info, tickers)
 
+    @instrumented
     async def fetch_order_book(self, ticker: str, limit: int | None = None) -> OrderBookDTO:
+        if self._fast_parser is not None:
+            return await self._fast_parser.fetch_order_book(self._client, ticker, limit)
+
         order_book: dict[str, Any] = await self._client.fetch_order_book(symbol=ticker, limit=limit)
-        return OrderBookDTO(
-            asks=[
-                PriceLevelDTO(price=price, amount=amount) for price, amount in order_book["asks"]
-            ],
-            bids=[
-                PriceLevelDTO(price=price, amount=amount) for price, amount in order_book["bids"]
-            ],
-            symbol=order_book["symbol"],
-            timestamp=order_book["timestamp"],
-            datetime=order_book["datetime"],
-            nonce=order_book["nonce"],
-        )
+        return parse_order_book(order_book)
+
+    @overload
+    async def fetch_candles(
+        self,
+        ticker: str,
+        timeframe: str,
+        since: int | None = None,
+        limit: int | None = None,
+        *,
+        columnar: Literal[False] = False,
+    ) -> list[CandleDTO]: ...
 
+    @overload
     async def fetch_candles(
-        self, ticker: str, timeframe: str, since: int | None = None, limit: int | None = None
-    ) -> list[CandleDTO]:
+        self,
+        ticker: str,
+        timeframe: str,
+        since: int | None = None,
+        limit: int | None = None,
+        *,
+        columnar: Literal[True],
+    ) -> CandleArrayDTO: ...
+
+    @instrumented
+    async def fetch_candles(
+        self,
+        ticker: str,
+        timeframe: str,
+        since: int | None = None,
+        limit: int | None = None,
+        *,
+        columnar: bool = False,
+    ) -> list[CandleDTO] | CandleArrayDTO:
         """
         timeframe: '1m', '3m', '5m', '15m', '1h', '4h', '1d', '1w', '1M'
+        columnar=True 이면 CandleDTO 리스트 대신 CandleArrayDTO를 반환합니다.
         """
         candles: list[list[Any]] = await self._client.fetch_ohlcv(
             symbol=ticker, timeframe=timeframe, since=since, limit=limit
         )
 
-        return [
-            CandleDTO(
-                timestamp=candle[0],
-                open=candle[1],
-                high=candle[2],
-                low=candle[3],
-                close=candle[4],
-                volume=candle[5],
-            )
-            for candle in candles
-        ]
+        candle_array = CandleArrayDTO.from_ohlcv(candles)
+        return candle_array if columnar else candle_array.to_dtos()
+
+    @overload
+    async def fetch_trades(
+        self,
+        ticker: str,
+        since: int | None = None,
+        limit: int | None = None,
+        *,
+        columnar: Literal[False] = False,
+    ) -> list[TradeDTO]: ...
+
+    @overload
+    async def fetch_trades(
+        self,
+        ticker: str,
+        since: int | None = None,
+        limit: int | None = None,
+        *,
+        columnar: Literal[True],
+    ) -> TradeArrayDTO: ...
+
+    @instrumented
+    async def fetch_trades(
+        self,
+        ticker: str,
+        since: int | None = None,
+        limit: int | None = None,
+        *,
+        columnar: bool = False,
+    ) -> list[TradeDTO] | TradeArrayDTO:
+        """
+        since 이후의 공개 체결 내역을 시간 순서대로 반환합니다. (거래소마다 최대 limit가 다릅니다)
+        columnar=True 이면 TradeDTO 리스트 대신 TradeArrayDTO를 반환합니다.
+        """
+        trades: list[dict[str, Any]] = await self._client.fetch_trades(
+            symbol=ticker, since=since, limit=limit
+        )
+
+        if columnar:
+            return TradeArrayDTO.from_ccxt(trades)
+        return [parse_trade(trade) for trade in trades]
 
     # ---------------------------------------------------------
     # Exchange Status Methods
     # ---------------------------------------------------------
+    @instrumented
     async def fetch_status(self) -> StatusDTO:
         if hasattr(self._client, "fetch_status"):
             status: dict[str, Any] = await self._client.fetch_status()
@@ -108,6 +202,7 @@ class MarketData:
         else:
             raise NotImplementedError("This exchange does not support fetching status.")
 
+    @instrumented
     async def fetch_time(self) -> int:
         """
         Fetch the current server time in milliseconds.
@@ -117,9 +212,31 @@ class MarketData:
         else:
             raise NotImplementedError("This exchange does not support fetching time.")
 
+    @instrumented
+    async def fetch_latency(self) -> LatencyDTO:
+        """
+        fetch_time 왕복 한 번으로 RTT와 서버 시각 차이를 잽니다.
+        서버 시각은 요청과 응답의 중간 시점에 찍혔다고 보고 offset = 서버 시각 - 로컬 중간 시각으로 계산합니다.
+        """
+        if not hasattr(self._client, "fetch_time"):
+            raise NotImplementedError("This exchange does not support fetching time.")
+
+        sent = time.time() * 1000
+        started = time.perf_counter()
+        server_time: int = await self._client.fetch_time()
+        rtt = (time.perf_counter() - started) * 1000
+
+        return LatencyDTO(
+            rtt=rtt,
+            offset=server_time - (sent + rtt / 2),
+            server_time=server_time,
+            timestamp=int(sent + rtt),
+        )
+
     # ---------------------------------------------------------
     # Funding Rate Methods
     # ---------------------------------------------------------
+    @instrumented
     async def fetch_funding_rate(self, ticker: str) -> FutureFundingRateDTO:
         """
         Fetch the current funding rate for a given ticker.
@@ -140,8 +257,85 @@ class MarketData:
         else:
             raise NotImplementedError("This exchange does not support fetching funding rates.")
 
-    # TODO(yeonghwan): fetch_trades
+    @instrumented
+    async def fetch_funding_rates(
+        self, tickers: list[str], max_concurrency: int = 16
+    ) -> FundingRateArrayDTO:
+        """
+        여러 무기한 선물의 funding rate를 한 번에 조회합니다.
+        거래소가 fetchFundingRates를 지원하지 않으면 최대 max_concurrency개씩 동시에 조회합니다.
+        이때 심볼 자체가 잘못된(상장 폐지 등) 심볼은 로그만 남기고 결과에서 제외합니다.
+        """
+        if self._client.has.get("fetchFundingRates"):
+            funding_rates: dict[str, Any] = await self._client.fetch_funding_rates(tickers)
+        elif hasattr(self._client, "fetch_funding_rate"):
+            funding_rates = await self._fan_out(
+                self._client.fetch_funding_rate, tickers, max_concurrency
+            )
+        else:
+            raise NotImplementedError("This exchange does not support fetching funding rates.")
+
+        return FundingRateArrayDTO.from_ccxt(funding_rates, tickers)
+
+    @instrumented
+    async def fetch_funding_rate_history(
+        self, ticker: str, since: int | None = None, limit: int | None = None
+    ) -> FundingHistoryArrayDTO:
+        """
+        since 이후의 과거 funding rate 정산 내역을 시간 순서대로 반환합니다. (거래소마다 최대 limit가 다릅니다)
+        """
+        if not self._client.has.get("fetchFundingRateHistory"):
+            raise NotImplementedError(
+                "This exchange does not support fetching funding rate history."
+            )
+
+        history: list[dict[str, Any]] = await self._client.fetch_funding_rate_history(
+            ticker, since=since, limit=limit
+        )
+        return FundingHistoryArrayDTO.from_ccxt(history)
+
+    # ---------------------------------------------------------
+    # Liquidation Methods
+    # ---------------------------------------------------------
+    @instrumented
+    async def fetch_liquidations(
+        self, ticker: str, since: int | None = None, limit: int | None = None
+    ) -> list[LiquidationDTO]:
+        """
+        선물 시장의 공개 청산 내역을 시간 순서대로 반환합니다.
+        REST로 공개 청산을 주지 않는 거래소(binance, bybit 등)는 MarketStream.watch_liquidations를 사용합니다.
+        """
+        if not self._client.has.get("fetchLiquidations"):
+            raise NotImplementedError("This exchange does not support fetching liquidations.")
 
-    # TODO(yeonghwan): fetch_liquidations
+        liquidations: list[dict[str, Any]] = await self._client.fetch_liquidations(
+            ticker, since=since, limit=limit
+        )
+        return [parse_liquidation(liquidation, self._client.id) for liquidation in liquidations]
 
-    # TODO(yeonghwan): fetch_latency
+    async def _fan_out(
+        self,
+        fetch: Callable[[str], Awaitable[dict[str, Any]]],
+        tickers: list[str],
+        max_concurrency: int,
+    ) -> dict[str, dict[str, Any]]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_one(ticker: str) -> dict[str, Any]:
+            async with semaphore:
+                return await fetch(ticker)
+
+        results = await asyncio.gather(
+            *(fetch_one(ticker) for ticker in tickers), return_exceptions=True
+        )
+        fetched: dict[str, dict[str, Any]] = {}
+        for ticker, result in zip(tickers, results, strict=True):
+            # 심볼 하나에 대한 오류(BadSymbol 등 BadRequest)만 건너뛰고,
+            # 인증/네트워크/rate limit 오류나 취소는 호출한 쪽으로 그대로 올립니다.
+            if isinstance(result, ccxt.BadRequest):
+                logger.warning("failed to fetch %s from %s: %r", ticker, self._client.id, result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                fetched[ticker] = result
+        return fetched
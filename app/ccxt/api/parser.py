@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from typing import Any
+
+from app.ccxt.dtos.balance_dto import AssetBalanceDTO, BalanceDTO
+from app.ccxt.dtos.liquidation_dto import LiquidationDTO
+from app.ccxt.dtos.market_dto import MarketDTO, MarketLimitsDTO, MarketPrecisionDTO
+from app.ccxt.dtos.order.cancel_order_response_dto import CancelOrderResponseDTO
+from app.ccxt.dtos.order.limit.limit_order_response_dto import LimitOrderResponseDTO
+from app.ccxt.dtos.order.market.market_order_response_dto import MarketOrderResponseDTO
+from app.ccxt.dtos.order_book_dto import OrderBookDTO, PriceLevelDTO
+from app.ccxt.dtos.position_dto import PositionDTO
+from app.ccxt.dtos.ticker_dto import TickerDTO
+from app.ccxt.dtos.trade_dto import TradeDTO
+
+# ccxt의 unified 구조(dict)를 DTO로 변환하는 함수 모음입니다.
+# REST(MarketData)와 WebSocket(MarketStream)이 같은 변환 로직을 공유합니다.
+
+# ccxt liquidation의 side는 거래소 원본 값입니다. 대부분은 청산 주문 방향(sell = 롱 청산)이고,
+# 아래 거래소는 청산된 포지션 방향(buy = 롱 청산)입니다.
+_POSITION_SIDE_EXCHANGES = frozenset({"bybit"})
+
+
+def parse_ticker(ticker_info: dict[str, Any]) -> TickerDTO:
+    return TickerDTO(
+        symbol=ticker_info["symbol"],
+        timestamp=ticker_info["timestamp"],
+        datetime=ticker_info["datetime"],
+        high=ticker_info["high"],
+        low=ticker_info["low"],
+        open=ticker_info["open"],
+        close=ticker_info["close"],
+        last=ticker_info["last"],
+        previous_close=ticker_info.get("previousClose"),
+        vwap=ticker_info["vwap"],
+        change=ticker_info["change"],
+        percentage=ticker_info["percentage"],
+        average=ticker_info.get("average"),
+        base_volume=ticker_info["baseVolume"],
+        quote_volume=ticker_info["quoteVolume"],
+        mark_price=ticker_info.get("markPrice"),
+        index_price=ticker_info.get("indexPrice"),
+        bid=ticker_info.get("bid"),
+        bid_volume=ticker_info.get("bidVolume"),
+        ask=ticker_info.get("ask"),
+        ask_volume=ticker_info.get("askVolume"),
+    )
+
+
+def parse_order_book(order_book: dict[str, Any]) -> OrderBookDTO:
+    return OrderBookDTO(
+        asks=[
+            PriceLevelDTO(price=price, amount=amount) for price, amount, *_ in order_book["asks"]
+        ],
+        bids=[
+            PriceLevelDTO(price=price, amount=amount) for price, amount, *_ in order_book["bids"]
+        ],
+        symbol=order_book["symbol"],
+        timestamp=order_book["timestamp"],
+        datetime=order_book["datetime"],
+        nonce=order_book["nonce"],
+    )
+
+
+def parse_trade(trade: dict[str, Any]) -> TradeDTO:
+    return TradeDTO(
+        symbol=trade["symbol"],
+        timestamp=trade["timestamp"],
+        datetime=trade["datetime"],
+        side=trade["side"],
+        price=trade["price"],
+        amount=trade["amount"],
+        cost=trade.get("cost"),
+        id=trade.get("id"),
+    )
+
+
+def parse_liquidation(liquidation: dict[str, Any], exchange_id: str) -> LiquidationDTO:
+    price = liquidation["price"]
+    amount = liquidation.get("baseValue")
+    if amount is None:
+        amount = liquidation["contracts"] * (liquidation.get("contractSize") or 1)
+    notional = liquidation.get("quoteValue")
+    if notional is None:
+        notional = amount * price
+
+    long_side = "buy" if exchange_id in _POSITION_SIDE_EXCHANGES else "sell"
+    return LiquidationDTO(
+        symbol=liquidation["symbol"],
+        timestamp=liquidation["timestamp"],
+        datetime=liquidation["datetime"],
+        side="long" if liquidation["side"] == long_side else "short",
+        price=price,
+        amount=amount,
+        notional=notional,
+    )
+
+
+def parse_market(market: dict[str, Any]) -> MarketDTO:
+    precision = market.get("precision") or {}
+    limits = market.get("limits") or {}
+    amount_limits = limits.get("amount") or {}
+    price_limits = limits.get("price") or {}
+    cost_limits = limits.get("cost") or {}
+    leverage_limits = limits.get("leverage") or {}
+
+    return MarketDTO(
+        symbol=market["symbol"],
+        id=market["id"],
+        base=market["base"],
+        quote=market["quote"],
+        settle=market.get("settle"),
+        type=market["type"],
+        active=market.get("active"),
+        contract=bool(market.get("contract")),
+        contract_size=market.get("contractSize"),
+        precision=MarketPrecisionDTO(amount=precision.get("amount"), price=precision.get("price")),
+        limits=MarketLimitsDTO(
+            amount_min=amount_limits.get("min"),
+            amount_max=amount_limits.get("max"),
+            price_min=price_limits.get("min"),
+            price_max=price_limits.get("max"),
+            cost_min=cost_limits.get("min"),
+            cost_max=cost_limits.get("max"),
+            leverage_max=leverage_limits.get("max"),
+        ),
+        maker=market.get("maker"),
+        taker=market.get("taker"),
+    )
+
+
+def parse_balance(balance_info: dict[str, Any]) -> BalanceDTO:
+    """
+    ccxt가 함께 주는 free/used/total 통화별 dict를 사용하고, 없으면 통화 항목을 순회합니다.
+    """
+    free, used, total = (balance_info.get(key) for key in ("free", "used", "total"))
+    if isinstance(free, dict) and isinstance(used, dict) and isinstance(total, dict):
+        balances = {
+            currency: AssetBalanceDTO(
+                free=float(free.get(currency) or 0.0),
+                used=float(used.get(currency) or 0.0),
+                total=float(amount or 0.0),
+            )
+            for currency, amount in total.items()
+        }
+    else:
+        balances = {
+            currency: AssetBalanceDTO(
+                free=float(info["free"]),
+                used=float(info["used"]),
+                total=float(info["total"]),
+            )
+            for currency, info in balance_info.items()
+            if isinstance(info, dict)  # 'free', 'used', 'total' 키를 가진 딕셔너리만 처리
+            and all(key in info for key in ["free", "used", "total"])
+        }
+
+    return BalanceDTO(
+        balances=balances,
+        timestamp=balance_info.get("timestamp"),
+        datetime=balance_info.get("datetime"),
+    )
+
+
+def parse_limit_order(order: dict[str, Any]) -> LimitOrderResponseDTO:
+    return LimitOrderResponseDTO(
+        timestamp=order.get("timestamp"),
+        datetime=order.get("datetime"),
+        price=order.get("price"),
+        average=order.get("average"),
+        amount=order.get("amount"),
+        filled=order.get("filled"),
+        remaining=order.get("remaining"),
+        cost=order.get("cost"),
+        fee=order.get("fee").get("cost") if order.get("fee") else None,
+        id=order.get("id"),
+    )
+
+
+def parse_market_order(order: dict[str, Any]) -> MarketOrderResponseDTO:
+    return MarketOrderResponseDTO(
+        timestamp=order.get("timestamp"),
+        datetime=order.get("datetime"),
+        price=order.get("price"),
+        average=order.get("average"),
+        amount=order.get("amount"),
+        filled=order.get("filled"),
+        remaining=order.get("remaining"),
+        cost=order.get("cost"),
+        fee=order.get("fee").get("cost") if order.get("fee") else None,
+        id=order.get("id"),
+    )
+
+
+def parse_cancel_order(order: dict[str, Any]) -> CancelOrderResponseDTO:
+    return CancelOrderResponseDTO(
+        id=order.get("id"),
+        symbol=order.get("symbol"),
+        status=order.get("status"),
+    )
+
+
+def parse_position(position: dict[str, Any]) -> PositionDTO:
+    size = float(position.get("contracts") or 0.0) * float(position.get("contractSize") or 1.0)
+    return PositionDTO(
+        symbol=position["symbol"],
+        side=position["side"],
+        size=size,
+        notional=abs(float(position.get("notional") or 0.0)),
+        leverage=float(position.get("leverage") or 1.0),
+        entry_price=float(position.get("entryPrice") or 0.0),
+        mark_price=float(position.get("markPrice") or 0.0),
+        liquidation_price=position.get("liquidationPrice"),
+        margin_mode=position.get("marginMode"),
+        unrealized_pnl=position.get("unrealizedPnl"),
+        percentage=position.get("percentage"),
+    )
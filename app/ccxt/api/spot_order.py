@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import logging
 from typing import Any
 
+from app.ccxt.api import batch_order
+from app.ccxt.api.parser import parse_balance, parse_limit_order, parse_market_order
 from app.ccxt.domain.exchange import Exchange
-from app.ccxt.dtos.balance_dto import AssetBalanceDTO, BalanceDTO
+from app.ccxt.domain.instrumentation import instrumented
+from app.ccxt.domain.rate_limiter import with_priority
+from app.ccxt.dtos.balance_dto import BalanceDTO
+from app.ccxt.dtos.order.cancel_order_response_dto import CancelOrderResponseDTO
 from app.ccxt.dtos.order.limit.limit_order_request_dto import LimitOrderRequestDTO
 from app.ccxt.dtos.order.limit.limit_order_response_dto import LimitOrderResponseDTO
 from app.ccxt.dtos.order.market.market_order_request_dto import MarketOrderRequestDTO
 from app.ccxt.dtos.order.market.market_order_response_dto import MarketOrderResponseDTO
+from app.ccxt.dtos.order.order_result_dto import OrderResultDTO
+from app.ccxt.dtos.position_dto import PositionDTO
+from app.ccxt.enums.request_priority import RequestPriority
+
+logger = logging.getLogger(__name__)
 
 
 class SpotOrder:
@@ -17,34 +28,63 @@ class SpotOrder:
         if not exchange.is_spot():
             raise ValueError("Exchange must be a spot market type.")
 
+    @instrumented
+    @with_priority(RequestPriority.ACCOUNT)
     async def fetch_balance(self) -> BalanceDTO:
         """
         거래소 계정의 현물 자산 잔고를 조회합니다.
         """
         balance_info: dict[str, Any] = await self._client.fetch_balance()
+        return parse_balance(balance_info)
 
-        balances = {
-            currency: AssetBalanceDTO(
-                free=float(info["free"]),
-                used=float(info["used"]),
-                total=float(info["total"]),
-            )
+    @instrumented
+    @with_priority(RequestPriority.ACCOUNT)
+    async def fetch_positions(self, quote: str = "USDT") -> list[PositionDTO]:
+        """
+        현물 보유 자산을 quote 기준 롱 포지션으로 조회합니다.
+        현물은 거래소가 평균 매수가를 주지 않으므로 entry_price는 현재가이고 unrealized_pnl은 None 입니다.
+        평균 매수가와 손익은 PositionBook(spot=True)이 체결 기준으로 추적합니다.
+        현재가(ticker의 last)를 받지 못한 자산은 로그만 남기고 결과에서 제외합니다.
+        """
+        balance_info: dict[str, Any] = await self._client.fetch_balance()
+        await self._client.load_markets()
+
+        holdings = {
+            f"{currency}/{quote}": float(info["total"])
             for currency, info in balance_info.items()
-            if isinstance(info, dict)  # 'free', 'used', 'total' 키를 가진 딕셔너리만 처리
-            and all(key in info for key in ["free", "used", "total"])
+            if isinstance(info, dict)
+            and info.get("total")
+            and currency != quote
+            and f"{currency}/{quote}" in self._client.markets
         }
-
-        return BalanceDTO(
-            balances=balances,
-            timestamp=balance_info.get("timestamp"),
-            datetime=balance_info.get("datetime"),
-        )
-
-    # TODO(yeonghwan): implement fetch_positions
+        if not holdings:
+            return []
+
+        tickers: dict[str, Any] = await self._client.fetch_tickers(list(holdings))
+        positions = []
+        for symbol, size in holdings.items():
+            price = (tickers.get(symbol) or {}).get("last")
+            if price is None:
+                logger.warning("skipping spot position %s: no last price in tickers", symbol)
+                continue
+            positions.append(
+                PositionDTO(
+                    symbol=symbol,
+                    side="long",
+                    size=size,
+                    notional=size * price,
+                    leverage=1.0,
+                    entry_price=price,
+                    mark_price=price,
+                )
+            )
+        return positions
 
     # ---------------------------------------------------------
     # Spot Limit Order
     # ---------------------------------------------------------
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
     async def open_limit_order(self, limit_order: LimitOrderRequestDTO) -> LimitOrderResponseDTO:
         limit_buy_order = await self._client.create_limit_buy_order(
             symbol=limit_order.ticker,
@@ -53,18 +93,10 @@ class SpotOrder:
             params={"timeInForce": limit_order.time_in_force.value},
         )
 
-        return LimitOrderResponseDTO(
-            timestamp=limit_buy_order.get("timestamp"),
-            datetime=limit_buy_order.get("datetime"),
-            price=limit_buy_order.get("price"),
-            average=limit_buy_order.get("average"),
-            amount=limit_buy_order.get("amount"),
-            filled=limit_buy_order.get("filled"),
-            remaining=limit_buy_order.get("remaining"),
-            cost=limit_buy_order.get("cost"),
-            fee=limit_buy_order.get("fee").get("cost") if limit_buy_order.get("fee") else None,
-        )
+        return parse_limit_order(limit_buy_order)
 
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
     async def close_limit_order(self, limit_order: LimitOrderRequestDTO) -> LimitOrderResponseDTO:
         limit_sell_order = await self._client.create_limit_sell_order(
             symbol=limit_order.ticker,
@@ -73,21 +105,13 @@ class SpotOrder:
             params={"timeInForce": limit_order.time_in_force.value},
         )
 
-        return LimitOrderResponseDTO(
-            timestamp=limit_sell_order.get("timestamp"),
-            datetime=limit_sell_order.get("datetime"),
-            price=limit_sell_order.get("price"),
-            average=limit_sell_order.get("average"),
-            amount=limit_sell_order.get("amount"),
-            filled=limit_sell_order.get("filled"),
-            remaining=limit_sell_order.get("remaining"),
-            cost=limit_sell_order.get("cost"),
-            fee=limit_sell_order.get("fee").get("cost") if limit_sell_order.get("fee") else None,
-        )
+        return parse_limit_order(limit_sell_order)
 
     # ---------------------------------------------------------
     # Spot Market Order
     # ---------------------------------------------------------
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
     async def open_market_order(
         self, market_order: MarketOrderRequestDTO
     ) -> MarketOrderResponseDTO:
@@ -95,32 +119,68 @@ class SpotOrder:
             symbol=market_order.ticker, amount=market_order.amount
         )
 
-        return MarketOrderResponseDTO(
-            timestamp=market_buy_order.get("timestamp"),
-            datetime=market_buy_order.get("datetime"),
-            price=market_buy_order.get("price"),
-            average=market_buy_order.get("average"),
-            amount=market_buy_order.get("amount"),
-            filled=market_buy_order.get("filled"),
-            remaining=market_buy_order.get("remaining"),
-            cost=market_buy_order.get("cost"),
-            fee=market_buy_order.get("fee").get("cost") if market_buy_order.get("fee") else None,
-        )
+        return parse_market_order(market_buy_order)
 
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
     async def close_market_order(
         self, limit_order: MarketOrderRequestDTO
     ) -> MarketOrderResponseDTO:
         market_sell_order = await self._client.create_market_sell_order(
             symbol=limit_order.ticker, amount=limit_order.amount
         )
-        return MarketOrderResponseDTO(
-            timestamp=market_sell_order.get("timestamp"),
-            datetime=market_sell_order.get("datetime"),
-            price=market_sell_order.get("price"),
-            average=market_sell_order.get("average"),
-            amount=market_sell_order.get("amount"),
-            filled=market_sell_order.get("filled"),
-            remaining=market_sell_order.get("remaining"),
-            cost=market_sell_order.get("cost"),
-            fee=market_sell_order.get("fee").get("cost") if market_sell_order.get("fee") else None,
+        return parse_market_order(market_sell_order)
+
+    # ---------------------------------------------------------
+    # Batch Order
+    # ---------------------------------------------------------
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
+    async def open_limit_orders(
+        self, limit_orders: list[LimitOrderRequestDTO], max_concurrency: int = 8
+    ) -> list[OrderResultDTO[LimitOrderResponseDTO]]:
+        """
+        여러 건의 지정가 매수 주문을 한 번에 보냅니다. 결과는 요청 순서대로 건별 응답 또는 오류를 담습니다.
+        """
+        return await batch_order.submit_limit_orders(
+            self._client, limit_orders, "buy", max_concurrency
+        )
+
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
+    async def close_limit_orders(
+        self, limit_orders: list[LimitOrderRequestDTO], max_concurrency: int = 8
+    ) -> list[OrderResultDTO[LimitOrderResponseDTO]]:
+        return await batch_order.submit_limit_orders(
+            self._client, limit_orders, "sell", max_concurrency
+        )
+
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
+    async def open_market_orders(
+        self, market_orders: list[MarketOrderRequestDTO], max_concurrency: int = 8
+    ) -> list[OrderResultDTO[MarketOrderResponseDTO]]:
+        return await batch_order.submit_market_orders(
+            self._client, market_orders, "buy", max_concurrency
         )
+
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
+    async def close_market_orders(
+        self, market_orders: list[MarketOrderRequestDTO], max_concurrency: int = 8
+    ) -> list[OrderResultDTO[MarketOrderResponseDTO]]:
+        return await batch_order.submit_market_orders(
+            self._client, market_orders, "sell", max_concurrency
+        )
+
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
+    async def cancel_orders(
+        self, order_ids: list[str], ticker: str, max_concurrency: int = 8
+    ) -> list[OrderResultDTO[CancelOrderResponseDTO]]:
+        return await batch_order.cancel_orders(self._client, order_ids, ticker, max_concurrency)
+
+    @instrumented
+    @with_priority(RequestPriority.ORDER)
+    async def cancel_all_orders(self, ticker: str) -> None:
+        await batch_order.cancel_all_orders(self._client, ticker)
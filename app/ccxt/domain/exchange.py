@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from typing import Any
+
+import aiohttp
 import ccxt.async_support as ccxt
+import ccxt.pro as ccxtpro
 
+from app.ccxt.domain.instrumentation import instrument_client
 from app.ccxt.enums.exchange_type import ExchangeType
 from app.ccxt.enums.market_type import MarketType
 from app.core.config import (
@@ -23,20 +28,41 @@ class Exchange:
         api_key: str,
         secret: str,
         market_type: MarketType,
+        session: aiohttp.ClientSession | None = None,
     ) -> None:
-        self._client = getattr(ccxt, exchange_id)(
-            {
-                "apiKey": api_key,
-                "secret": secret,
-                "enableRateLimit": True,
-                "options": {"defaultType": market_type},
-            }
-        )
+        self._exchange_id = exchange_id
+        self._config: dict[str, Any] = {
+            "apiKey": api_key,
+            "secret": secret,
+            "enableRateLimit": True,
+            "options": {"defaultType": market_type},
+        }
+        if session is not None:
+            # 외부에서 준 세션은 ccxt가 닫지 않습니다. (own_session=False)
+            self._config["session"] = session
+        self._client = self._create_client()
+        instrument_client(self._client)
+        self._ws_client: ccxtpro.Exchange | None = None
+
+    def _create_client(self) -> ccxt.Exchange:
+        return getattr(ccxt, self._exchange_id)(self._config)
 
     @property
     def client(self) -> ccxt.Exchange:
         return self._client
 
+    @property
+    def ws_client(self) -> ccxtpro.Exchange:
+        """
+        WebSocket(ccxt.pro) 클라이언트. 처음 접근할 때 REST 클라이언트와 같은 설정으로 생성합니다.
+        """
+        if self._ws_client is None:
+            self._ws_client = getattr(ccxtpro, self._exchange_id)(self._config)
+            self._ws_client.set_sandbox_mode(self._client.isSandboxModeEnabled)
+            self._ws_client.options["defaultType"] = self._client.options.get("defaultType")
+
+        return self._ws_client
+
     def is_future(self) -> bool:
         return self._client.options.get("defaultType") == MarketType.FUTURE
 
@@ -46,31 +72,43 @@ class Exchange:
     async def close(self) -> None:
         if hasattr(self._client, "close"):
             await self._client.close()
+        if self._ws_client is not None:
+            await self._ws_client.close()
 
 
 class Binance(Exchange):
-    def __init__(self, market_type: MarketType) -> None:
-        super().__init__(ExchangeType.BINANCE, BINANCE_API_KEY, BINANCE_API_SECRET, market_type)
+    def __init__(
+        self, market_type: MarketType, session: aiohttp.ClientSession | None = None
+    ) -> None:
+        super().__init__(
+            ExchangeType.BINANCE, BINANCE_API_KEY, BINANCE_API_SECRET, market_type, session
+        )
 
 
 class BinanceSpotTestnet(Exchange):
-    def __init__(self, market_type: MarketType) -> None:
+    def __init__(
+        self, market_type: MarketType, session: aiohttp.ClientSession | None = None
+    ) -> None:
         super().__init__(
             ExchangeType.BINANCE,
             BINANCE_TESTNET_SPOT_API_KEY,
             BINANCE_TESTNET_SPOT_API_SECRET,
             market_type,
+            session,
         )
         self._client.set_sandbox_mode(True)
 
 
 class BinanceFutureTestnet(Exchange):
-    def __init__(self, market_type: MarketType) -> None:
+    def __init__(
+        self, market_type: MarketType, session: aiohttp.ClientSession | None = None
+    ) -> None:
         super().__init__(
             ExchangeType.BINANCE,
             BINANCE_TESTNET_FUTURE_API_KEY,
             BINANCE_TESTNET_FUTURE_API_SECRET,
             market_type,
+            session,
         )
         # Enable sandbox mode and point fapi endpoints to Binance Futures Testnet
         # ccxt expects testnet URLs under urls["test"] when sandbox mode is enabled
@@ -87,5 +125,7 @@ class BinanceFutureTestnet(Exchange):
 
 
 class Bybit(Exchange):
-    def __init__(self, market_type: MarketType) -> None:
-        super().__init__(ExchangeType.BYBIT, BYBIT_API_KEY, BYBIT_API_SECRET, market_type)
+    def __init__(
+        self, market_type: MarketType, session: aiohttp.ClientSession | None = None
+    ) -> None:
+        super().__init__(ExchangeType.BYBIT, BYBIT_API_KEY, BYBIT_API_SECRET, market_type, session)
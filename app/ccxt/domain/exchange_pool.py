@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import ClassVar
+
+import aiohttp
+
+from app.ccxt.domain.exchange import Exchange
+from app.ccxt.enums.market_type import MarketType
+
+
+@dataclass(slots=True)
+class _PoolEntry:
+    exchange: Exchange
+    refs: int
+
+
+class ExchangePool:
+    """
+    Exchange 인스턴스를 (Exchange 클래스, MarketType) 단위로 공유하는 프로세스 전역 풀입니다.
+    Exchange 서브클래스(Binance, BinanceFutureTestnet, Bybit ...)가 거래소 id와 API 키를 결정하므로
+    클래스가 곧 "거래소 + 인증 정보" 키가 됩니다.
+
+    - 모든 클라이언트가 keep-alive와 연결 수 제한이 설정된 aiohttp 세션 하나를 공유합니다.
+    - acquire/release는 참조 카운트를 관리하고, 마지막 사용자가 release하면 클라이언트를 닫습니다.
+    - close()는 남은 클라이언트를 모두 닫은 뒤 공유 세션을 닫습니다.
+
+    Example:
+        async with ExchangePool.default().lease(Binance, MarketType.FUTURE) as exchange:
+            market_data = MarketData(exchange)
+    """
+
+    _default: ClassVar[ExchangePool | None] = None
+
+    def __init__(
+        self,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 20,
+        keepalive_timeout: float = 60.0,
+        dns_cache_ttl: int = 300,
+    ) -> None:
+        self._connection_limit = connection_limit
+        self._connection_limit_per_host = connection_limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        self._session: aiohttp.ClientSession | None = None
+        self._entries: dict[tuple[type[Exchange], MarketType], _PoolEntry] = {}
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def default(cls) -> ExchangePool:
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def acquire(self, exchange_cls: type[Exchange], market_type: MarketType) -> Exchange:
+        async with self._lock:
+            key = (exchange_cls, market_type)
+            entry = self._entries.get(key)
+
+            if entry is None:
+                exchange = exchange_cls(market_type, session=self._get_session())
+                entry = self._entries[key] = _PoolEntry(exchange=exchange, refs=0)
+
+            entry.refs += 1
+            return entry.exchange
+
+    async def release(self, exchange: Exchange) -> None:
+        async with self._lock:
+            key = next(
+                (key for key, entry in self._entries.items() if entry.exchange is exchange), None
+            )
+            if key is None:
+                raise ValueError("Exchange was not acquired from this pool.")
+
+            entry = self._entries[key]
+            entry.refs -= 1
+            if entry.refs == 0:
+                del self._entries[key]
+                await entry.exchange.close()
+
+    @asynccontextmanager
+    async def lease(
+        self, exchange_cls: type[Exchange], market_type: MarketType
+    ) -> AsyncIterator[Exchange]:
+        exchange = await self.acquire(exchange_cls, market_type)
+        try:
+            yield exchange
+        finally:
+            await self.release(exchange)
+
+    async def close(self) -> None:
+        async with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+
+            await asyncio.gather(*(entry.exchange.close() for entry in entries))
+
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._connection_limit,
+                limit_per_host=self._connection_limit_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+                ttl_dns_cache=self._dns_cache_ttl,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(connector=connector, trust_env=True)
+        return self._session
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import functools
+import time
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Concatenate, Protocol
+
+import ccxt.async_support as ccxt
+
+from app.core.metrics import EXCHANGE_CALL_SECONDS
+
+PHASE_RATE_LIMIT_WAIT = "rate_limit_wait"
+PHASE_REQUEST_BUILD = "request_build"
+PHASE_NETWORK = "network"
+PHASE_PARSE = "parse"
+PHASE_TOTAL = "total"
+
+
+@dataclass(slots=True)
+class _CallTimings:
+    phases: dict[str, float] = field(default_factory=dict)
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+
+_current_call: ContextVar[_CallTimings | None] = ContextVar("exchange_call", default=None)
+
+
+def record_phase(phase: str, seconds: float) -> None:
+    """
+    진행 중인 instrumented 호출이 있으면 phase에 걸린 시간을 더합니다. 없으면 아무것도 하지 않습니다.
+    """
+    timings = _current_call.get()
+    if timings is not None:
+        timings.add(phase, seconds)
+
+
+class _HasClient(Protocol):
+    _client: ccxt.Exchange
+
+
+def instrumented[S: _HasClient, **P, R](
+    func: Callable[Concatenate[S, P], Awaitable[R]],
+) -> Callable[Concatenate[S, P], Awaitable[R]]:
+    """
+    SpotOrder/FutureOrder/MarketData 메서드의 호출 시간을 phase 별로 기록합니다.
+
+    rate_limit_wait, request_build(sign), network(fetch + 응답 JSON 디코딩)는 클라이언트 hook이
+    더하고, 나머지(ccxt 파싱 + DTO 변환)는 parse로 기록합니다.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(self: S, *args: P.args, **kwargs: P.kwargs) -> R:
+        timings = _CallTimings()
+        token = _current_call.set(timings)
+        started = time.perf_counter()
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            total = time.perf_counter() - started
+            _current_call.reset(token)
+            _observe(self._client, func.__name__, timings, total)
+
+    return wrapper
+
+
+def instrument_client(client: ccxt.Exchange) -> None:
+    """
+    ccxt 클라이언트의 throttle/sign/fetch를 감싸서 instrumented 호출 안에서 걸린 시간을 기록합니다.
+    WeightedRateLimiter.install()로 throttle을 바꾸면 대기 시간은 limiter가 직접 기록합니다.
+    """
+    throttle = client.throttle
+    sign = client.sign
+    fetch = client.fetch
+
+    async def timed_throttle(cost: float | None = None) -> Any:
+        started = time.perf_counter()
+        try:
+            return await throttle(cost)
+        finally:
+            record_phase(PHASE_RATE_LIMIT_WAIT, time.perf_counter() - started)
+
+    def timed_sign(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return sign(*args, **kwargs)
+        finally:
+            record_phase(PHASE_REQUEST_BUILD, time.perf_counter() - started)
+
+    async def timed_fetch(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return await fetch(*args, **kwargs)
+        finally:
+            record_phase(PHASE_NETWORK, time.perf_counter() - started)
+
+    client.throttle = timed_throttle
+    client.sign = timed_sign
+    client.fetch = timed_fetch
+
+
+def _observe(client: ccxt.Exchange, method: str, timings: _CallTimings, total: float) -> None:
+    exchange = getattr(client, "id", None) or "unknown"
+    market_type = getattr(client, "options", {}).get("defaultType") or "unknown"
+    market_type = getattr(market_type, "value", market_type)  # MarketType 또는 str
+
+    # 동시에 fan-out 된 요청은 phase 합이 전체 시간보다 클 수 있으므로 parse는 0 아래로 내려가지 않게 합니다.
+    parse = max(total - sum(timings.phases.values()), 0.0)
+
+    for phase, seconds in (*timings.phases.items(), (PHASE_PARSE, parse), (PHASE_TOTAL, total)):
+        EXCHANGE_CALL_SECONDS.labels(exchange, method, market_type, phase).observe(seconds)
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import heapq
+import itertools
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Protocol
+
+from app.ccxt.domain.exchange import Exchange
+from app.ccxt.domain.instrumentation import PHASE_RATE_LIMIT_WAIT, record_phase
+from app.ccxt.enums.request_priority import RequestPriority
+from app.core.metrics import RATE_LIMIT_WAIT_SECONDS
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+_PRIORITY_RANK: dict[RequestPriority, int] = {
+    RequestPriority.ORDER: 0,
+    RequestPriority.ACCOUNT: 1,
+    RequestPriority.MARKET_DATA: 2,
+}
+
+# ccxt는 엔드포인트 cost를 "거래소 request weight x API별 계수"로 정의합니다.
+# (binance: api/papi weight 1 = cost 0.2, sapi weight 1 = cost 0.1, fapi/dapi weight 1 = cost 1)
+# 여기에 없는 API는 cost를 그대로 weight로 사용합니다.
+CCXT_COST_SCALES: dict[str, dict[str, float]] = {
+    "binance": {
+        "public": 0.2,
+        "private": 0.2,
+        "papi": 0.2,
+        "sapi": 0.1,
+        "sapiV2": 0.1,
+        "sapiV3": 0.1,
+        "sapiV4": 0.1,
+    },
+}
+
+_current_priority: ContextVar[RequestPriority] = ContextVar(
+    "request_priority", default=RequestPriority.MARKET_DATA
+)
+
+
+def with_priority[**P, R](
+    priority: RequestPriority,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """
+    데코레이터가 붙은 코루틴 안에서 발생하는 ccxt 요청을 priority 레인으로 보냅니다.
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            token = _current_priority.set(priority)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _current_priority.reset(token)
+
+        return wrapper
+
+    return decorator
+
+
+# ---------------------------------------------------------
+# Backends
+# ---------------------------------------------------------
+class RateLimitBackend(Protocol):
+    async def consume(self, key: str, weight: float, capacity: float, window: float) -> float:
+        """
+        현재 윈도우에서 weight를 소비할 수 있으면 소비하고 0을, 아니면 다음 윈도우까지 남은 초를 반환합니다.
+        """
+        ...
+
+
+class LocalRateLimitBackend:
+    """
+    프로세스 안에서만 공유되는 고정 윈도우(weight per window) 카운터입니다.
+    """
+
+    def __init__(self) -> None:
+        self._windows: dict[str, tuple[int, float]] = {}
+
+    async def consume(self, key: str, weight: float, capacity: float, window: float) -> float:
+        now = time.time()
+        index = int(now // window)
+        current_index, used = self._windows.get(key, (index, 0.0))
+        if current_index != index:
+            used = 0.0
+
+        if used + weight > capacity:
+            return (index + 1) * window - now
+
+        self._windows[key] = (index, used + weight)
+        return 0.0
+
+
+class RedisRateLimitBackend:
+    """
+    Redis(또는 호환 서버)에 윈도우별 사용량을 기록해서 여러 프로세스가 같은 weight 예산을 나눠 씁니다.
+    Binance의 X-MBX-USED-WEIGHT-1M 처럼 벽시계 기준 고정 윈도우로 계산합니다.
+    """
+
+    _SCRIPT = """
+    local used = tonumber(redis.call('GET', KEYS[1]) or '0')
+    local weight = tonumber(ARGV[1])
+    if used + weight > tonumber(ARGV[2]) then
+        return 0
+    end
+    redis.call('INCRBYFLOAT', KEYS[1], weight)
+    redis.call('PEXPIRE', KEYS[1], ARGV[3])
+    return 1
+    """
+
+    def __init__(self, redis: Redis, prefix: str = "atlas:ratelimit") -> None:
+        self._redis = redis
+        self._prefix = prefix
+        self._script = redis.register_script(self._SCRIPT)
+
+    async def consume(self, key: str, weight: float, capacity: float, window: float) -> float:
+        now = time.time()
+        index = int(now // window)
+        granted = await self._script(
+            keys=[f"{self._prefix}:{key}:{index}"],
+            args=[weight, capacity, int(window * 2000)],
+        )
+        return 0.0 if int(granted) == 1 else (index + 1) * window - now
+
+
+# ---------------------------------------------------------
+# Limiter
+# ---------------------------------------------------------
+class WeightedRateLimiter:
+    """
+    요청 weight 기반 rate limiter. 대기 중인 요청은 우선순위(ORDER > ACCOUNT > MARKET_DATA),
+    같은 우선순위 안에서는 도착 순서대로 처리됩니다.
+
+    install()로 ccxt 클라이언트의 throttle을 교체하면 ccxt가 엔드포인트마다 계산한 cost를
+    API별 계수(cost_scales, 기본값은 CCXT_COST_SCALES)로 나눈 거래소 request weight로 소비합니다.
+    binance의 sapi처럼 거래소에서는 따로 집계되는 API도 같은 윈도우에서 함께 세므로 보수적으로 동작합니다.
+
+    Example:
+        limiter = WeightedRateLimiter("binance", capacity=2400, backend=RedisRateLimitBackend(redis))
+        limiter.install(exchange)
+    """
+
+    def __init__(
+        self,
+        key: str,
+        capacity: float,
+        window: float = 60.0,
+        backend: RateLimitBackend | None = None,
+        cost_scales: Mapping[str, float] | None = None,
+    ) -> None:
+        self._key = key
+        self._cost_scales = cost_scales
+        self._capacity = capacity
+        self._window = window
+        self._backend = backend or LocalRateLimitBackend()
+        self._queue: list[tuple[int, int, float, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._dispatcher: asyncio.Task[None] | None = None
+
+    def install(self, exchange: Exchange) -> None:
+        client = exchange.client
+        scales = (
+            self._cost_scales
+            if self._cost_scales is not None
+            else CCXT_COST_SCALES.get(client.id, {})
+        )
+        calculate_cost = getattr(client, "calculate_rate_limiter_cost", None)
+
+        if scales and calculate_cost is not None:
+            # ccxt fetch2는 calculate_rate_limiter_cost(api, ...)의 결과를 throttle(cost)에 넘기므로,
+            # api를 알 수 있는 이 단계에서 cost를 거래소 weight로 바꿔 둡니다.
+            @functools.wraps(calculate_cost)
+            def calculate_weight(api: Any, *args: Any, **kwargs: Any) -> float:
+                cost = calculate_cost(api, *args, **kwargs)
+                return float(cost) / scales.get(api if isinstance(api, str) else "", 1.0)
+
+            client.calculate_rate_limiter_cost = calculate_weight
+
+        client.throttle = self.throttle
+
+    async def throttle(self, cost: float | None = None) -> None:
+        await self.acquire(cost if cost is not None else 1.0)
+
+    async def acquire(self, weight: float, priority: RequestPriority | None = None) -> None:
+        if weight > self._capacity:
+            raise ValueError(f"weight {weight} exceeds rate limit capacity {self._capacity}")
+
+        priority = priority or _current_priority.get()
+        started = time.perf_counter()
+
+        # 대기열이 비어 있으면 dispatcher를 거치지 않고 바로 소비를 시도합니다.
+        granted = not self._queue and (
+            await self._backend.consume(self._key, weight, self._capacity, self._window) == 0
+        )
+
+        if not granted:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(
+                self._queue, (_PRIORITY_RANK[priority], next(self._sequence), weight, future)
+            )
+            self._wakeup.set()
+            if self._dispatcher is None or self._dispatcher.done():
+                self._dispatcher = asyncio.create_task(self._dispatch())
+            await future
+
+        waited = time.perf_counter() - started
+        RATE_LIMIT_WAIT_SECONDS.labels(self._key, priority.value).observe(waited)
+        record_phase(PHASE_RATE_LIMIT_WAIT, waited)
+
+    async def close(self) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+
+    async def _dispatch(self) -> None:
+        while True:
+            while self._queue and self._queue[0][3].done():
+                heapq.heappop(self._queue)  # 취소된 요청
+
+            if not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            _, _, weight, future = self._queue[0]
+            try:
+                wait = await self._backend.consume(self._key, weight, self._capacity, self._window)
+            except Exception as e:
+                heapq.heappop(self._queue)
+                if not future.done():
+                    future.set_exception(e)
+                continue
+
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+
+            heapq.heappop(self._queue)
+            if not future.done():
+                future.set_result(None)
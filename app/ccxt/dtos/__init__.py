@@ -1,16 +1,30 @@
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
 from app.ccxt.dtos.candle_dto import CandleDTO
+from app.ccxt.dtos.funding_rate_array_dto import FundingRateArrayDTO
 from app.ccxt.dtos.future_funding_rate_dto import FutureFundingRateDTO
+from app.ccxt.dtos.market_dto import MarketDTO, MarketLimitsDTO, MarketPrecisionDTO
+from app.ccxt.dtos.order_book_delta_dto import OrderBookDeltaDTO
 from app.ccxt.dtos.order_book_dto import OrderBookDTO, PriceLevelDTO
 from app.ccxt.dtos.position_dto import PositionDTO
 from app.ccxt.dtos.status_dto import StatusDTO
+from app.ccxt.dtos.ticker_array_dto import TickerArrayDTO
 from app.ccxt.dtos.ticker_dto import TickerDTO
+from app.ccxt.dtos.trade_dto import TradeDTO
 
 __all__ = [
     "FutureFundingRateDTO",
+    "FundingRateArrayDTO",
     "CandleDTO",
+    "CandleArrayDTO",
+    "MarketDTO",
+    "MarketLimitsDTO",
+    "MarketPrecisionDTO",
     "OrderBookDTO",
+    "OrderBookDeltaDTO",
     "PriceLevelDTO",
     "PositionDTO",
     "StatusDTO",
     "TickerDTO",
+    "TickerArrayDTO",
+    "TradeDTO",
 ]
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, overload
+
+import numpy as np
+import numpy.typing as npt
+
+from app.ccxt.dtos.candle_dto import CandleDTO
+from app.core.timeframe import WEEK_ORIGIN_MS, timeframe_to_ms
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass(slots=True, frozen=True)
+class CandleArrayDTO:
+    """
+    OHLCV 캔들을 컬럼 단위의 연속된 NumPy 배열로 보관하는 컨테이너입니다.
+    모든 배열은 timestamp 오름차순으로 정렬되어 있어야 합니다.
+    """
+
+    timestamp: npt.NDArray[np.int64]  # [1755365820000, 1755365880000, ...]
+    open: npt.NDArray[np.float64]  # [117666.3, 117648.2, ...]
+    high: npt.NDArray[np.float64]  # [117666.4, 117660.0, ...]
+    low: npt.NDArray[np.float64]  # [117620.6, 117640.1, ...]
+    close: npt.NDArray[np.float64]  # [117648.2, 117655.5, ...]
+    volume: npt.NDArray[np.float64]  # [143.549, 98.102, ...]
+
+    @classmethod
+    def empty(cls) -> CandleArrayDTO:
+        return cls(
+            timestamp=np.empty(0, dtype=np.int64),
+            open=np.empty(0, dtype=np.float64),
+            high=np.empty(0, dtype=np.float64),
+            low=np.empty(0, dtype=np.float64),
+            close=np.empty(0, dtype=np.float64),
+            volume=np.empty(0, dtype=np.float64),
+        )
+
+    @classmethod
+    def from_ohlcv(cls, rows: Sequence[Sequence[Any]]) -> CandleArrayDTO:
+        """
+        ccxt fetch_ohlcv 결과([[timestamp, open, high, low, close, volume], ...])를 변환합니다.
+        """
+        if len(rows) == 0:
+            return cls.empty()
+
+        values = np.asarray(rows, dtype=np.float64)
+
+        return cls(
+            timestamp=values[:, 0].astype(np.int64),
+            open=np.ascontiguousarray(values[:, 1]),
+            high=np.ascontiguousarray(values[:, 2]),
+            low=np.ascontiguousarray(values[:, 3]),
+            close=np.ascontiguousarray(values[:, 4]),
+            volume=np.ascontiguousarray(values[:, 5]),
+        )
+
+    @classmethod
+    def from_dtos(cls, candles: Sequence[CandleDTO]) -> CandleArrayDTO:
+        return cls.from_ohlcv(
+            [(c.timestamp, c.open, c.high, c.low, c.close, c.volume) for c in candles]
+        )
+
+    @classmethod
+    def concat(cls, chunks: Sequence[CandleArrayDTO]) -> CandleArrayDTO:
+        if len(chunks) == 0:
+            return cls.empty()
+
+        return cls(
+            timestamp=np.concatenate([c.timestamp for c in chunks]),
+            open=np.concatenate([c.open for c in chunks]),
+            high=np.concatenate([c.high for c in chunks]),
+            low=np.concatenate([c.low for c in chunks]),
+            close=np.concatenate([c.close for c in chunks]),
+            volume=np.concatenate([c.volume for c in chunks]),
+        )
+
+    # ---------------------------------------------------------
+    # Sequence Access (CandleDTO compatibility view)
+    # ---------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @overload
+    def __getitem__(self, index: int) -> CandleDTO: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> CandleArrayDTO: ...
+
+    def __getitem__(self, index: int | slice) -> CandleDTO | CandleArrayDTO:
+        if isinstance(index, slice):
+            return self.take(index)
+
+        return CandleDTO(
+            timestamp=int(self.timestamp[index]),
+            open=float(self.open[index]),
+            high=float(self.high[index]),
+            low=float(self.low[index]),
+            close=float(self.close[index]),
+            volume=float(self.volume[index]),
+        )
+
+    def __iter__(self) -> Iterator[CandleDTO]:
+        return iter(self.to_dtos())
+
+    def to_dtos(self) -> list[CandleDTO]:
+        return [
+            CandleDTO(timestamp=t, open=o, high=h, low=lo, close=c, volume=v)
+            for t, o, h, lo, c, v in zip(
+                self.timestamp.tolist(),
+                self.open.tolist(),
+                self.high.tolist(),
+                self.low.tolist(),
+                self.close.tolist(),
+                self.volume.tolist(),
+                strict=True,
+            )
+        ]
+
+    # ---------------------------------------------------------
+    # Slicing / Resampling
+    # ---------------------------------------------------------
+    def take(self, index: slice | npt.NDArray[Any]) -> CandleArrayDTO:
+        """
+        slice 인덱스는 복사 없이 view를 반환하고, 배열 인덱스(mask)는 복사본을 반환합니다.
+        """
+        return CandleArrayDTO(
+            timestamp=self.timestamp[index],
+            open=self.open[index],
+            high=self.high[index],
+            low=self.low[index],
+            close=self.close[index],
+            volume=self.volume[index],
+        )
+
+    def between(self, start: int | None = None, end: int | None = None) -> CandleArrayDTO:
+        """
+        start <= timestamp < end 구간을 이진 탐색으로 잘라 view로 반환합니다. (밀리초)
+        """
+        lo = 0 if start is None else int(np.searchsorted(self.timestamp, start, side="left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.timestamp, end, side="left"))
+        return self.take(slice(lo, hi))
+
+    def resample(self, timeframe: str) -> CandleArrayDTO:
+        """
+        더 큰 timeframe으로 캔들을 집계합니다. (예: '1m' -> '15m')
+        주 단위 timeframe은 거래소 주봉과 같이 월요일 00:00 UTC를 기준으로 나눕니다.
+        """
+        if len(self) == 0:
+            return CandleArrayDTO.empty()
+
+        step = timeframe_to_ms(timeframe)
+        origin = WEEK_ORIGIN_MS if step % timeframe_to_ms("1w") == 0 else 0
+        buckets = self.timestamp - (self.timestamp - origin) % step
+        starts = np.flatnonzero(np.diff(buckets, prepend=buckets[0] - 1))
+        ends = np.append(starts[1:], len(self)) - 1
+
+        return CandleArrayDTO(
+            timestamp=buckets[starts],
+            open=self.open[starts],
+            high=np.maximum.reduceat(self.high, starts),
+            low=np.minimum.reduceat(self.low, starts),
+            close=self.close[ends],
+            volume=np.add.reduceat(self.volume, starts),
+        )
+
+    # ---------------------------------------------------------
+    # Export
+    # ---------------------------------------------------------
+    def to_pandas(self) -> pd.DataFrame:
+        """
+        배열을 복사하지 않고 DatetimeIndex(UTC 기준 밀리초) DataFrame으로 감싸서 반환합니다.
+        """
+        import pandas as pd
+
+        index = pd.DatetimeIndex(
+            self.timestamp.view("datetime64[ms]"), name="timestamp", copy=False
+        )
+        return pd.DataFrame(
+            {
+                "open": self.open,
+                "high": self.high,
+                "low": self.low,
+                "close": self.close,
+                "volume": self.volume,
+            },
+            index=index,
+            copy=False,
+        )
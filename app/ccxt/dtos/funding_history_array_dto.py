@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+
+@dataclass(slots=True, frozen=True)
+class FundingHistoryArrayDTO:
+    """
+    한 무기한 선물의 과거 funding rate 정산 내역을 컬럼 단위의 NumPy 배열로 보관합니다.
+    timestamp 오름차순이어야 합니다.
+    """
+
+    timestamp: npt.NDArray[np.int64]  # [1755360000000, 1755388800000, ...]
+    funding_rate: npt.NDArray[np.float64]  # [0.0001, -0.000023, ...]
+
+    @classmethod
+    def empty(cls) -> FundingHistoryArrayDTO:
+        return cls(
+            timestamp=np.empty(0, dtype=np.int64),
+            funding_rate=np.empty(0, dtype=np.float64),
+        )
+
+    @classmethod
+    def from_ccxt(cls, history: Sequence[Mapping[str, Any]]) -> FundingHistoryArrayDTO:
+        """
+        ccxt fetch_funding_rate_history 결과([{timestamp, fundingRate, ...}, ...])를 변환합니다.
+        """
+        return cls(
+            timestamp=np.array([row["timestamp"] for row in history], dtype=np.int64),
+            funding_rate=np.array([row["fundingRate"] for row in history], dtype=np.float64),
+        )
+
+    @classmethod
+    def concat(cls, chunks: Sequence[FundingHistoryArrayDTO]) -> FundingHistoryArrayDTO:
+        if len(chunks) == 0:
+            return cls.empty()
+
+        return cls(
+            timestamp=np.concatenate([c.timestamp for c in chunks]),
+            funding_rate=np.concatenate([c.funding_rate for c in chunks]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def between(self, start: int | None = None, end: int | None = None) -> FundingHistoryArrayDTO:
+        """
+        start <= timestamp < end 구간을 이진 탐색으로 잘라 view로 반환합니다. (밀리초)
+        """
+        lo = 0 if start is None else int(np.searchsorted(self.timestamp, start, side="left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.timestamp, end, side="left"))
+        return FundingHistoryArrayDTO(
+            timestamp=self.timestamp[lo:hi], funding_rate=self.funding_rate[lo:hi]
+        )
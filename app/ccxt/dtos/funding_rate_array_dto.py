@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+
+@dataclass(slots=True, frozen=True)
+class FundingRateArrayDTO:
+    """
+    여러 무기한 선물의 현재 funding rate를 심볼 순서의 컬럼 배열로 보관합니다.
+    값이 없는 필드는 NaN, funding_timestamp가 없으면 0 입니다.
+    """
+
+    symbols: tuple[str, ...]  # ("BTC/USDT:USDT", "ETH/USDT:USDT", ...)
+    funding_rate: npt.NDArray[np.float64]  # [0.000072, ...]
+    next_funding_rate: npt.NDArray[np.float64]  # [-0.000018, ...]
+    funding_timestamp: npt.NDArray[np.int64]  # [1755362327800, ...]
+    mark_price: npt.NDArray[np.float64]  # [117700.0, ...]
+    index_price: npt.NDArray[np.float64]  # [117700.0, ...]
+    interest_rate: npt.NDArray[np.float64]  # [0.0003, ...]
+    _index: dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_index", {symbol: i for i, symbol in enumerate(self.symbols)})
+
+    @classmethod
+    def from_ccxt(
+        cls, funding_rates: Mapping[str, Mapping[str, Any]], symbols: Sequence[str] | None = None
+    ) -> FundingRateArrayDTO:
+        """
+        ccxt fetch_funding_rates 결과({symbol: funding_rate})를 변환합니다.
+        symbols를 주면 그 순서를 따릅니다.
+        """
+        order = (
+            [s for s in symbols if s in funding_rates]
+            if symbols is not None
+            else list(funding_rates)
+        )
+        rows = [funding_rates[symbol] for symbol in order]
+
+        def column(key: str) -> npt.NDArray[np.float64]:
+            return np.array([row.get(key) for row in rows], dtype=np.float64)
+
+        return cls(
+            symbols=tuple(order),
+            funding_rate=column("fundingRate"),
+            next_funding_rate=column("nextFundingRate"),
+            funding_timestamp=np.array(
+                [row.get("fundingTimestamp") or 0 for row in rows], dtype=np.int64
+            ),
+            mark_price=column("markPrice"),
+            index_price=column("indexPrice"),
+            interest_rate=column("interestRate"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._index
+
+    def index_of(self, symbol: str) -> int:
+        return self._index[symbol]
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class LatencyDTO:
+    rtt: float  # 42.1 (ms, fetch_time 왕복)
+    offset: float  # -12.5 (ms, 서버 시각 - 로컬 시각)
+    server_time: int  # 1755362327278
+    timestamp: int  # 1755362327290 (응답을 받은 로컬 시각)
+
+
+@dataclass(slots=True, frozen=True)
+class LatencyStatsDTO:
+    venue: str  # binance
+    samples: int  # 60
+    rtt_p50: float  # 41.8 (ms)
+    rtt_p90: float  # 55.2 (ms)
+    rtt_p99: float  # 120.4 (ms)
+    offset: float  # -12.5 (ms, RTT가 가장 짧은 표본 기준)
+    offset_error: float  # 19.6 (ms, 그 표본의 RTT / 2)
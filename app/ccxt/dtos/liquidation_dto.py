@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal
+
+
+@dataclass(slots=True, frozen=True)
+class LiquidationDTO:
+    symbol: str  # BTC/USDT:USDT
+    timestamp: int  # 1755365820000
+    datetime: str  # 2025-08-16T16:38:43.278Z
+    side: Literal["long", "short"]  # 청산된 포지션 방향
+    price: float  # 117700.0
+    amount: float  # 0.5 (base 수량)
+    notional: float  # 58850.0 (quote 금액, price * amount)
+
+
+@dataclass(slots=True, frozen=True)
+class LiquidationSpikeDTO:
+    symbol: str  # BTC/USDT:USDT
+    side: Literal["long", "short"] | None  # None 이면 양쪽 합계
+    notional: float  # 1250000.0 (window 동안 청산된 quote 금액)
+    threshold: float  # 1000000.0
+    window: float  # 60.0 (초)
+    timestamp: int  # 1755365820000 (threshold를 넘긴 청산 시각)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class MarketPrecisionDTO:
+    amount: float | None  # 0.001 (tick size of amount)
+    price: float | None  # 0.1 (tick size of price)
+
+
+@dataclass(slots=True, frozen=True)
+class MarketLimitsDTO:
+    amount_min: float | None  # 0.001
+    amount_max: float | None  # 1000.0
+    price_min: float | None  # 556.8
+    price_max: float | None  # 4529764.0
+    cost_min: float | None  # 100.0 (min notional)
+    cost_max: float | None  # None
+    leverage_max: float | None  # 125.0
+
+
+@dataclass(slots=True, frozen=True)
+class MarketDTO:
+    symbol: str  # BTC/USDT:USDT
+    id: str  # BTCUSDT (exchange specific id)
+    base: str  # BTC
+    quote: str  # USDT
+    settle: str | None  # USDT (contract only)
+    type: str  # 'spot' | 'swap' | 'future' | 'option'
+    active: bool | None
+    contract: bool
+    contract_size: float | None  # 1.0
+    precision: MarketPrecisionDTO
+    limits: MarketLimitsDTO
+    maker: float | None  # 0.0002
+    taker: float | None  # 0.0005
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class CancelOrderResponseDTO:
+    id: str | None  # 거래소 주문 id
+    symbol: str | None  # BTC/USDT:USDT
+    status: str | None  # canceled
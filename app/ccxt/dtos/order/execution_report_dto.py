@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Literal
+
+
+@dataclass(slots=True, frozen=True)
+class ExecutionReportDTO:
+    parent_id: str  # twap-1
+    algo: str  # twap | vwap | iceberg
+    symbol: str  # BTC/USDT:USDT
+    side: Literal["buy", "sell"]
+    amount: float  # 부모 주문 수량
+    filled: float  # 자식 주문 체결 합계
+    average: float | None  # 평균 체결가
+    children: int  # 낸 자식 주문 수
+    status: Literal["running", "done", "canceled", "failed"]
+    error: str | None = None  # failed 일 때 원인
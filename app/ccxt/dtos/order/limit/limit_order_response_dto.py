@@ -12,4 +12,5 @@ class LimitOrderResponseDTO:
     remaining: float
     cost: float  # filled * price
     fee: float | None
+    id: str | None = None  # 거래소 주문 id (취소/조회용)
     # todo: stopLossPrice
@@ -12,3 +12,4 @@ class MarketOrderResponseDTO:
     remaining: float
     cost: float  # filled * price
     fee: float | None  # USDT
+    id: str | None = None  # 거래소 주문 id (취소/조회용)
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class OrderResultDTO[T]:
+    """
+    배치 주문/취소에서 한 건(leg)의 결과입니다. response와 error 중 하나만 채워집니다.
+    """
+
+    response: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
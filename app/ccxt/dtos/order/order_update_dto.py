@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Literal
+
+from app.ccxt.enums.order_status import OrderStatus
+
+
+@dataclass(slots=True, frozen=True)
+class OrderUpdateDTO:
+    client_order_id: str  # atlas-3f9c1e0b7a2d4c68b1e5f0a9
+    id: str | None  # 거래소 주문 id, 접수 전에는 None
+    symbol: str  # BTC/USDT:USDT
+    side: Literal["buy", "sell"]
+    status: OrderStatus
+    price: float | None  # 지정가, 시장가는 None
+    average: float | None  # 평균 체결가
+    amount: float  # 0.01
+    filled: float  # 0.006
+    remaining: float  # 0.004
+    timestamp: int | None  # 1755365820000 (마지막 변경 시각)
+    last_filled: float = 0.0  # 직전 업데이트 이후 새로 체결된 수량
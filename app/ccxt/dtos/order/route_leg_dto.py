@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Literal
+
+
+@dataclass(slots=True, frozen=True)
+class RouteLegDTO:
+    venue: str  # binance
+    symbol: str  # BTC/USDT:USDT (해당 거래소의 심볼)
+    side: Literal["buy", "sell"]
+    amount: float  # 이 거래소에 보낼 수량
+    price: float  # 지정가(IOC) 한도, 소진하는 가장 나쁜 호가
+    effective_price: float  # 수수료를 포함한 평균 단가
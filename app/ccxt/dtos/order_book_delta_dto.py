@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from app.ccxt.dtos.order_book_dto import PriceLevelDTO
+
+
+@dataclass(slots=True, frozen=True)
+class OrderBookDeltaDTO:
+    """
+    증분 depth 업데이트. amount가 0인 가격 레벨은 삭제를 의미합니다.
+    """
+
+    asks: list[PriceLevelDTO]  # [[117700.1, 0.0], [117700.5, 1.2]]
+    bids: list[PriceLevelDTO]  # [[117700.0, 3.4]]
+    symbol: str  # BTC/USDT
+    timestamp: int  # 1755362327800
+    first_nonce: int  # 8358168772431 (binance: U)
+    nonce: int  # 8358168772439 (binance: u)
+    prev_nonce: int | None = None  # optional: 8358168772430 (binance futures: pu)
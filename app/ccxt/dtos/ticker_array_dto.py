@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+
+@dataclass(slots=True, frozen=True)
+class TickerArrayDTO:
+    """
+    여러 심볼의 ticker를 심볼 순서의 컬럼 배열로 보관합니다.
+    값이 없는 필드는 NaN, timestamp가 없으면 0 입니다.
+    """
+
+    symbols: tuple[str, ...]  # ("BTC/USDT:USDT", "ETH/USDT:USDT", ...)
+    timestamp: npt.NDArray[np.int64]  # [1755362327800, ...]
+    last: npt.NDArray[np.float64]  # [117700.0, ...]
+    bid: npt.NDArray[np.float64]  # [117699.9, ...]
+    ask: npt.NDArray[np.float64]  # [117700.0, ...]
+    percentage: npt.NDArray[np.float64]  # [0.529, ...]
+    base_volume: npt.NDArray[np.float64]  # [66556.723, ...]
+    quote_volume: npt.NDArray[np.float64]  # [7815623475.78, ...]
+    mark_price: npt.NDArray[np.float64]  # [117701.2, ...]
+    index_price: npt.NDArray[np.float64]  # [117705.3, ...]
+    _index: dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_index", {symbol: i for i, symbol in enumerate(self.symbols)})
+
+    @classmethod
+    def from_ccxt(
+        cls, tickers: Mapping[str, Mapping[str, Any]], symbols: Sequence[str] | None = None
+    ) -> TickerArrayDTO:
+        """
+        ccxt fetch_tickers 결과({symbol: ticker})를 변환합니다. symbols를 주면 그 순서를 따릅니다.
+        """
+        order = [s for s in symbols if s in tickers] if symbols is not None else list(tickers)
+        rows = [tickers[symbol] for symbol in order]
+
+        def column(key: str) -> npt.NDArray[np.float64]:
+            return np.array([row.get(key) for row in rows], dtype=np.float64)
+
+        return cls(
+            symbols=tuple(order),
+            timestamp=np.array([row.get("timestamp") or 0 for row in rows], dtype=np.int64),
+            last=column("last"),
+            bid=column("bid"),
+            ask=column("ask"),
+            percentage=column("percentage"),
+            base_volume=column("baseVolume"),
+            quote_volume=column("quoteVolume"),
+            mark_price=column("markPrice"),
+            index_price=column("indexPrice"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._index
+
+    def index_of(self, symbol: str) -> int:
+        return self._index[symbol]
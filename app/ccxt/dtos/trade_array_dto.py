@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from app.ccxt.dtos.trade_dto import TradeDTO
+
+_SIDES = {"buy": 1, "sell": -1}
+
+
+@dataclass(slots=True, frozen=True)
+class TradeArrayDTO:
+    """
+    체결을 컬럼 단위의 NumPy 배열로 보관합니다. (체결 1건당 25 bytes)
+    timestamp 오름차순이어야 하고, side는 taker 방향으로 매수 1, 매도 -1, 알 수 없으면 0 입니다.
+    """
+
+    timestamp: npt.NDArray[np.int64]  # [1755365820000, 1755365820012, ...]
+    price: npt.NDArray[np.float64]  # [117700.0, 117699.9, ...]
+    amount: npt.NDArray[np.float64]  # [0.012, 0.5, ...]
+    side: npt.NDArray[np.int8]  # [1, -1, ...]
+
+    @classmethod
+    def empty(cls) -> TradeArrayDTO:
+        return cls(
+            timestamp=np.empty(0, dtype=np.int64),
+            price=np.empty(0, dtype=np.float64),
+            amount=np.empty(0, dtype=np.float64),
+            side=np.empty(0, dtype=np.int8),
+        )
+
+    @classmethod
+    def from_ccxt(cls, trades: Sequence[Mapping[str, Any]]) -> TradeArrayDTO:
+        """
+        ccxt fetch_trades / watch_trades 결과([{timestamp, price, amount, side, ...}, ...])를 변환합니다.
+        """
+        return cls(
+            timestamp=np.array([trade["timestamp"] for trade in trades], dtype=np.int64),
+            price=np.array([trade["price"] for trade in trades], dtype=np.float64),
+            amount=np.array([trade["amount"] for trade in trades], dtype=np.float64),
+            side=np.array([_SIDES.get(trade["side"], 0) for trade in trades], dtype=np.int8),
+        )
+
+    @classmethod
+    def from_dtos(cls, trades: Sequence[TradeDTO]) -> TradeArrayDTO:
+        return cls(
+            timestamp=np.array([trade.timestamp for trade in trades], dtype=np.int64),
+            price=np.array([trade.price for trade in trades], dtype=np.float64),
+            amount=np.array([trade.amount for trade in trades], dtype=np.float64),
+            side=np.array([_SIDES.get(trade.side, 0) for trade in trades], dtype=np.int8),
+        )
+
+    @classmethod
+    def concat(cls, chunks: Sequence[TradeArrayDTO]) -> TradeArrayDTO:
+        if len(chunks) == 0:
+            return cls.empty()
+
+        return cls(
+            timestamp=np.concatenate([c.timestamp for c in chunks]),
+            price=np.concatenate([c.price for c in chunks]),
+            amount=np.concatenate([c.amount for c in chunks]),
+            side=np.concatenate([c.side for c in chunks]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def take(self, index: slice | npt.NDArray[Any]) -> TradeArrayDTO:
+        """
+        slice 인덱스는 복사 없이 view를 반환하고, 배열 인덱스(mask)는 복사본을 반환합니다.
+        """
+        return TradeArrayDTO(
+            timestamp=self.timestamp[index],
+            price=self.price[index],
+            amount=self.amount[index],
+            side=self.side[index],
+        )
+
+    def between(self, start: int | None = None, end: int | None = None) -> TradeArrayDTO:
+        """
+        start <= timestamp < end 구간을 이진 탐색으로 잘라 view로 반환합니다. (밀리초)
+        """
+        lo = 0 if start is None else int(np.searchsorted(self.timestamp, start, side="left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.timestamp, end, side="left"))
+        return self.take(slice(lo, hi))
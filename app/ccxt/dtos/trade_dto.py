@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Literal
+
+
+@dataclass(slots=True, frozen=True)
+class TradeDTO:
+    symbol: str  # BTC/USDT:USDT
+    timestamp: int  # 1755365820000
+    datetime: str  # 2025-08-16T16:38:43.278Z
+    side: Literal["buy", "sell"]  # taker side
+    price: float  # 117700.0
+    amount: float  # 0.012
+    cost: float | None = None  # optional: 1412.4 (price * amount)
+    id: str | None = None  # optional: "6514021324"
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class OrderStatus(str, Enum):
+    OPEN = "open"  # 대기 중 (부분 체결 포함)
+    CLOSED = "closed"  # 전량 체결
+    CANCELED = "canceled"
+    EXPIRED = "expired"  # IOC/FOK 미체결분 소멸 등
+    REJECTED = "rejected"
+
+    @property
+    def is_final(self) -> bool:
+        return self != OrderStatus.OPEN
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class RequestPriority(str, Enum):
+    ORDER = "order"  # order placement / cancel (served first)
+    ACCOUNT = "account"  # balance, positions, open orders
+    MARKET_DATA = "market_data"  # tickers, order books, candles (bulk reads)
@@ -0,0 +1,5 @@
+from app.ccxt.exceptions.order_book_exception import OrderBookSyncError
+
+__all__ = [
+    "OrderBookSyncError",
+]
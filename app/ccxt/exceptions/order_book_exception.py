@@ -0,0 +1,2 @@
+class OrderBookSyncError(Exception):
+    """로컬 오더북을 거래소 스냅샷과 다시 맞추지 못했을 때 발생합니다."""
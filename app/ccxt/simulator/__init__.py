@@ -0,0 +1,13 @@
+from app.ccxt.simulator.market_replay import MarketReplay
+from app.ccxt.simulator.matching_engine import Fill, MatchingEngine, SimulatedOrder
+from app.ccxt.simulator.simulated_client import SimulatedClient
+from app.ccxt.simulator.simulated_exchange import SimulatedExchange
+
+__all__ = [
+    "Fill",
+    "MarketReplay",
+    "MatchingEngine",
+    "SimulatedClient",
+    "SimulatedExchange",
+    "SimulatedOrder",
+]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import bisect
+from collections.abc import Sequence
+
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.ccxt.dtos.order_book_dto import OrderBookDTO
+from app.core.timeframe import timeframe_to_ms
+
+
+class MarketReplay:
+    """
+    기록된 캔들과 오더북 스냅샷을 시뮬레이션 시각(now, 밀리초)에 맞춰 돌려줍니다.
+
+    - 캔들: timestamp + timeframe <= now 인 (이미 닫힌) 봉만 보입니다. 미래 데이터를 보지 않도록 합니다.
+    - 오더북: timestamp <= now 인 가장 최근 스냅샷을 사용합니다.
+
+    Example:
+        replay = MarketReplay()
+        replay.add_candles("BTC/USDT", "1m", await store.read(key))
+        replay.add_order_books("BTC/USDT", recorded_books)
+    """
+
+    def __init__(self) -> None:
+        self._candles: dict[tuple[str, str], CandleArrayDTO] = {}
+        self._books: dict[str, list[OrderBookDTO]] = {}
+        self._book_timestamps: dict[str, list[int]] = {}
+
+    def add_candles(self, symbol: str, timeframe: str, candles: CandleArrayDTO) -> None:
+        timeframe_to_ms(timeframe)  # 지원하지 않는 timeframe은 여기서 ValueError
+        self._candles[(symbol, timeframe)] = candles
+
+    def add_order_books(self, symbol: str, order_books: Sequence[OrderBookDTO]) -> None:
+        books = sorted(order_books, key=lambda book: book.timestamp)
+        self._books[symbol] = books
+        self._book_timestamps[symbol] = [book.timestamp for book in books]
+
+    def symbols(self) -> list[str]:
+        symbols = {symbol for symbol, _ in self._candles} | set(self._books)
+        return sorted(symbols)
+
+    def timeframes(self, symbol: str) -> list[str]:
+        timeframes = [tf for s, tf in self._candles if s == symbol]
+        return sorted(timeframes, key=timeframe_to_ms)
+
+    @property
+    def start(self) -> int | None:
+        """
+        가장 이른 데이터 시각. (첫 봉은 닫힌 뒤부터 보이므로 봉의 종료 시각 기준)
+        """
+        starts = [
+            int(candles.timestamp[0]) + timeframe_to_ms(tf)
+            for (_, tf), candles in self._candles.items()
+            if len(candles) > 0
+        ]
+        starts += [timestamps[0] for timestamps in self._book_timestamps.values() if timestamps]
+        return min(starts) if starts else None
+
+    # ---------------------------------------------------------
+    # Lookup
+    # ---------------------------------------------------------
+    def candles(self, symbol: str, timeframe: str, now: int) -> CandleArrayDTO:
+        candles = self._candles.get((symbol, timeframe))
+        if candles is None:
+            return CandleArrayDTO.empty()
+        return candles.between(end=now - timeframe_to_ms(timeframe) + 1)
+
+    def order_book(self, symbol: str, now: int) -> OrderBookDTO | None:
+        timestamps = self._book_timestamps.get(symbol)
+        if not timestamps:
+            return None
+        index = bisect.bisect_right(timestamps, now) - 1
+        return self._books[symbol][index] if index >= 0 else None
+
+    def order_books_between(self, symbol: str, start: int, end: int) -> list[OrderBookDTO]:
+        """
+        start < timestamp <= end 구간의 스냅샷을 시간 순서대로 반환합니다.
+        """
+        timestamps = self._book_timestamps.get(symbol)
+        if not timestamps:
+            return []
+        lo = bisect.bisect_right(timestamps, start)
+        hi = bisect.bisect_right(timestamps, end)
+        return self._books[symbol][lo:hi]
+
+    def last_price(self, symbol: str, now: int) -> float | None:
+        """
+        오더북 mid 가격, 오더북이 없으면 가장 짧은 timeframe의 마지막 종가를 반환합니다.
+        """
+        book = self.order_book(symbol, now)
+        if book is not None and book.asks and book.bids:
+            return (book.asks[0].price + book.bids[0].price) / 2
+
+        for timeframe in self.timeframes(symbol):
+            candles = self.candles(symbol, timeframe, now)
+            if len(candles) > 0:
+                return float(candles.close[-1])
+        return None
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import bisect
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import ccxt.async_support as ccxt
+
+from app.ccxt.dtos.order_book_dto import OrderBookDTO, PriceLevelDTO
+
+
+@dataclass(slots=True)
+class SimulatedOrder:
+    id: str
+    symbol: str
+    side: str  # buy | sell
+    type: str  # limit | market
+    amount: float
+    price: float | None  # market 주문은 None
+    timestamp: int
+    time_in_force: str = "GTC"
+    reduce_only: bool = False
+    client_order_id: str | None = None
+    filled: float = 0.0
+    cost: float = 0.0
+    fee: float = 0.0
+    fee_currency: str | None = None
+    status: str = "open"  # open | closed | canceled | expired
+
+    @property
+    def remaining(self) -> float:
+        return self.amount - self.filled
+
+    @property
+    def average(self) -> float | None:
+        return self.cost / self.filled if self.filled > 0 else None
+
+
+@dataclass(slots=True, frozen=True)
+class Fill:
+    order: SimulatedOrder
+    price: float
+    amount: float
+    maker: bool
+
+
+class MatchingEngine:
+    """
+    심볼 하나의 시뮬레이션 주문을 재생 중인 시장 데이터와 매칭합니다.
+
+    - 시장가/지정가(taker) 주문은 현재 오더북 스냅샷의 호가를 순서대로 소진합니다.
+      같은 스냅샷에서 이미 소진한 수량은 기억해서 두 번 체결되지 않도록 합니다.
+    - 오더북이 없으면 마지막 가격(캔들 종가)에서 수량 제한 없이 체결합니다.
+    - 미체결 지정가 주문은 가격-시간 우선순위로 보관하고, 이후 스냅샷의 반대편 최우선 호가나
+      캔들의 고가/저가가 주문 가격에 닿으면 주문 가격으로 전량 체결(maker)합니다.
+    - 자기 주문끼리는 매칭하지 않습니다.
+    """
+
+    def __init__(self, symbol: str) -> None:
+        self.symbol = symbol
+        self._orders: dict[str, SimulatedOrder] = {}
+        # (정렬 key, 접수 순번, 주문 id). bid는 -price를 key로 써서 양쪽 모두 index 0이 최우선입니다.
+        self._bids: list[tuple[float, int, str]] = []
+        self._asks: list[tuple[float, int, str]] = []
+        self._sequence = 0
+        self._book_key: tuple[int, int] | None = None
+        self._consumed: dict[tuple[str, float], float] = {}
+
+    def open_orders(self) -> list[SimulatedOrder]:
+        return list(self._orders.values())
+
+    def get(self, order_id: str) -> SimulatedOrder | None:
+        return self._orders.get(order_id)
+
+    # ---------------------------------------------------------
+    # Order Entry
+    # ---------------------------------------------------------
+    def quote(
+        self, side: str, amount: float, book: OrderBookDTO | None, last_price: float | None
+    ) -> tuple[float, float]:
+        """
+        side 방향으로 amount를 즉시 체결하면 얻는 (체결 수량, 체결 금액)을 계산만 합니다.
+        """
+        self._sync_book(book)
+        fills = self._walk(side, amount, None, book, last_price)
+        return sum(qty for _, qty in fills), sum(price * qty for price, qty in fills)
+
+    def submit(
+        self, order: SimulatedOrder, book: OrderBookDTO | None, last_price: float | None
+    ) -> list[Fill]:
+        if order.symbol != self.symbol:
+            raise ccxt.BadSymbol(f"{order.symbol} is not handled by {self.symbol} engine")
+
+        self._sync_book(book)
+        levels = self._walk(order.side, order.amount, order.price, book, last_price)
+        filled = sum(qty for _, qty in levels)
+
+        if order.type == "market" and not levels:
+            raise ccxt.InvalidOrder(f"{self.symbol}: no liquidity for market order")
+
+        if order.time_in_force == "FOK" and filled < order.amount:
+            order.status = "expired"
+            return []
+
+        fills = [Fill(order, price, qty, maker=False) for price, qty in levels]
+        for fill in fills:
+            self._apply(fill)
+            if book is not None:
+                key = (self._opposite(order.side), fill.price)
+                self._consumed[key] = self._consumed.get(key, 0.0) + fill.amount
+
+        if order.remaining <= 0:
+            order.status = "closed"
+        elif order.type == "market" or order.time_in_force == "IOC":
+            order.status = "closed" if order.filled > 0 else "expired"
+        else:
+            self._rest(order)
+        return fills
+
+    def cancel(self, order_id: str) -> SimulatedOrder:
+        order = self._orders.pop(order_id, None)
+        if order is None:
+            raise ccxt.OrderNotFound(f"{self.symbol}: order {order_id} is not open")
+
+        side = self._bids if order.side == "buy" else self._asks
+        side.pop(next(i for i, entry in enumerate(side) if entry[2] == order_id))
+        order.status = "canceled"
+        return order
+
+    # ---------------------------------------------------------
+    # Market Data
+    # ---------------------------------------------------------
+    def on_order_book(self, book: OrderBookDTO) -> list[Fill]:
+        self._sync_book(book)
+        fills: list[Fill] = []
+        if book.asks:
+            fills += self._fill_resting(self._bids, lambda price: book.asks[0].price <= price)
+        if book.bids:
+            fills += self._fill_resting(self._asks, lambda price: book.bids[0].price >= price)
+        return fills
+
+    def on_candle(self, high: float, low: float) -> list[Fill]:
+        return self._fill_resting(self._bids, lambda price: low <= price) + self._fill_resting(
+            self._asks, lambda price: high >= price
+        )
+
+    # ---------------------------------------------------------
+    # Internal
+    # ---------------------------------------------------------
+    def _walk(
+        self,
+        side: str,
+        amount: float,
+        limit_price: float | None,
+        book: OrderBookDTO | None,
+        last_price: float | None,
+    ) -> list[tuple[float, float]]:
+        if book is None:
+            if last_price is None or not self._crosses(side, last_price, limit_price):
+                return []
+            return [(last_price, amount)]
+
+        opposite = self._opposite(side)
+        levels: list[PriceLevelDTO] = book.asks if side == "buy" else book.bids
+        fills: list[tuple[float, float]] = []
+        remaining = amount
+
+        for level in levels:
+            if remaining <= 0 or not self._crosses(side, level.price, limit_price):
+                break
+            available = level.amount - self._consumed.get((opposite, level.price), 0.0)
+            if available <= 0:
+                continue
+            qty = min(available, remaining)
+            fills.append((level.price, qty))
+            remaining -= qty
+
+        return fills
+
+    def _fill_resting(
+        self, side: list[tuple[float, int, str]], touches: Callable[[float], bool]
+    ) -> list[Fill]:
+        fills: list[Fill] = []
+        while side:
+            order = self._orders[side[0][2]]
+            if order.price is None or not touches(order.price):
+                break
+            side.pop(0)
+            del self._orders[order.id]
+            fill = Fill(order, order.price, order.remaining, maker=True)
+            self._apply(fill)
+            order.status = "closed"
+            fills.append(fill)
+        return fills
+
+    def _rest(self, order: SimulatedOrder) -> None:
+        assert order.price is not None
+        self._sequence += 1
+        if order.side == "buy":
+            bisect.insort(self._bids, (-order.price, self._sequence, order.id))
+        else:
+            bisect.insort(self._asks, (order.price, self._sequence, order.id))
+        self._orders[order.id] = order
+
+    def _sync_book(self, book: OrderBookDTO | None) -> None:
+        # 새 스냅샷이 오면 이전 스냅샷에서 소진한 수량은 잊습니다.
+        if book is not None and (book.timestamp, book.nonce) != self._book_key:
+            self._book_key = (book.timestamp, book.nonce)
+            self._consumed.clear()
+
+    @staticmethod
+    def _apply(fill: Fill) -> None:
+        fill.order.filled += fill.amount
+        fill.order.cost += fill.price * fill.amount
+
+    @staticmethod
+    def _crosses(side: str, price: float, limit_price: float | None) -> bool:
+        if limit_price is None:
+            return True
+        return price <= limit_price if side == "buy" else price >= limit_price
+
+    @staticmethod
+    def _opposite(side: str) -> str:
+        return "sell" if side == "buy" else "buy"
@@ -0,0 +1,676 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import random
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import ccxt.async_support as ccxt
+
+from app.ccxt.dtos.order_book_dto import OrderBookDTO
+from app.ccxt.enums.market_type import MarketType
+from app.ccxt.simulator.market_replay import MarketReplay
+from app.ccxt.simulator.matching_engine import Fill, MatchingEngine, SimulatedOrder
+from app.core.timeframe import timeframe_to_ms
+
+
+@dataclass(slots=True)
+class _Position:
+    amount: float = 0.0  # 롱은 양수, 숏은 음수
+    entry_price: float = 0.0
+
+
+class SimulatedClient:
+    """
+    ccxt async 클라이언트와 같은 메서드/반환 구조를 가진 인프로세스 시뮬레이션 거래소입니다.
+    MarketData, SpotOrder, FutureOrder가 네트워크 없이 그대로 동작합니다.
+
+    - 시세: MarketReplay의 기록 데이터를 시뮬레이션 시각(now) 기준으로 돌려줍니다.
+      advance()로 시간을 진행하면 새 스냅샷/캔들에 닿은 미체결 주문이 체결됩니다.
+    - 계정: 현물은 통화별 잔고, 선물은 정산 통화 잔고 + 심볼별 포지션(단방향)을 관리합니다.
+    - 지연: 요청마다 latency + U(0, jitter)초를 기다립니다. (fetch 단계)
+    - rate limit: rate_limit=(weight, 초)를 주면 거래소처럼 초과 요청에 RateLimitExceeded를 올립니다.
+      클라이언트 쪽 throttle은 아무것도 하지 않으므로 WeightedRateLimiter.install()로 교체해서 시험합니다.
+    """
+
+    _WEIGHTS: dict[str, float] = {
+        "fetchOrderBook": 5.0,
+        "fetchTickers": 40.0,
+        "fetchBalance": 5.0,
+        "fetchPositions": 5.0,
+        "createOrders": 5.0,
+        "cancelAllOrders": 1.0,
+    }
+
+    def __init__(
+        self,
+        replay: MarketReplay,
+        market_type: MarketType,
+        balances: dict[str, float] | None = None,
+        maker_fee: float = 0.0002,
+        taker_fee: float = 0.0005,
+        leverage: float = 1.0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit: tuple[float, float] | None = None,
+        seed: int | None = None,
+        exchange_id: str = "simulated",
+    ) -> None:
+        self.id = exchange_id
+        self.options: dict[str, Any] = {"defaultType": market_type}
+        self.has: dict[str, bool] = {
+            "createOrders": True,
+            "cancelOrders": True,
+            "cancelAllOrders": True,
+            "fetchTickers": True,
+        }
+        self.isSandboxModeEnabled = False
+        self.markets: dict[str, Any] | None = None
+
+        self._replay = replay
+        self._contract = market_type == MarketType.FUTURE
+        self._maker_fee = maker_fee
+        self._taker_fee = taker_fee
+        self._leverage = leverage
+        self._latency = latency
+        self._jitter = jitter
+        self._rate_limit = rate_limit
+        self._random = random.Random(seed)
+
+        self._now = replay.start or int(time.time() * 1000)
+        self._symbols = {self._to_symbol(symbol): symbol for symbol in replay.symbols()}
+        self._engines = {symbol: MatchingEngine(symbol) for symbol in self._symbols}
+        self._orders: dict[str, SimulatedOrder] = {}
+        self._order_ids = itertools.count(1)
+        self._totals: dict[str, float] = dict(balances or {})
+        self._positions: dict[str, _Position] = {}
+        # 미체결 주문이 묶어 둔 (통화, 수량). 주문마다 다시 합산하지 않도록 합계도 함께 관리합니다.
+        self._reservations: dict[str, tuple[str, float]] = {}
+        self._reserved: dict[str, float] = {}
+        self._window: tuple[int, float] = (0, 0.0)
+
+    # ---------------------------------------------------------
+    # Simulation Control
+    # ---------------------------------------------------------
+    def milliseconds(self) -> int:
+        return self._now
+
+    def advance(self, milliseconds: int) -> list[Fill]:
+        """
+        시뮬레이션 시각을 진행하고, 그 사이의 오더북 스냅샷/캔들로 미체결 주문을 매칭합니다.
+        """
+        start, self._now = self._now, self._now + milliseconds
+        fills: list[Fill] = []
+
+        for symbol, engine in self._engines.items():
+            source = self._symbols[symbol]
+            books = self._replay.order_books_between(source, start, self._now)
+            for book in books:
+                fills += engine.on_order_book(book)
+
+            timeframes = self._replay.timeframes(source)
+            if not books and timeframes:
+                step = timeframe_to_ms(timeframes[0])
+                candles = self._replay.candles(source, timeframes[0], self._now).between(
+                    start=start - step + 1
+                )
+                for high, low in zip(candles.high.tolist(), candles.low.tolist(), strict=True):
+                    fills += engine.on_candle(high, low)
+
+        for fill in fills:
+            self._release(fill.order.id)
+            self._settle(fill)
+        return fills
+
+    # ---------------------------------------------------------
+    # ccxt Transport (instrumentation / rate limit hooks)
+    # ---------------------------------------------------------
+    async def throttle(self, cost: float | None = None) -> None:
+        return None
+
+    def sign(self, path: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        return {"url": path, "method": "GET", "headers": None, "body": None}
+
+    async def fetch(self, url: str, *args: Any, **kwargs: Any) -> None:
+        delay = self._latency + (self._random.uniform(0, self._jitter) if self._jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def close(self) -> None:
+        return None
+
+    async def _request(self, path: str) -> None:
+        cost = self._WEIGHTS.get(path, 1.0)
+        await self.throttle(cost)
+        request = self.sign(path)
+        self._consume_rate_limit(path, cost)
+        await self.fetch(request["url"])
+
+    def _consume_rate_limit(self, path: str, cost: float) -> None:
+        if self._rate_limit is None:
+            return
+        capacity, window = self._rate_limit
+        index = int(time.monotonic() // window)
+        current, used = self._window
+        used = used if current == index else 0.0
+        if used + cost > capacity:
+            raise ccxt.RateLimitExceeded(f"{self.id} {path}: request weight exceeds {capacity}")
+        self._window = (index, used + cost)
+
+    # ---------------------------------------------------------
+    # Markets
+    # ---------------------------------------------------------
+    async def load_markets(self, reload: bool = False) -> dict[str, Any]:
+        if self.markets is None or reload:
+            self.set_markets(await self.fetch_markets())
+        assert self.markets is not None
+        return self.markets
+
+    async def fetch_markets(self) -> list[dict[str, Any]]:
+        await self._request("fetchMarkets")
+        return [self._market(symbol) for symbol in self._symbols]
+
+    def set_markets(self, markets: dict[str, Any] | list[dict[str, Any]]) -> None:
+        values = markets.values() if isinstance(markets, dict) else markets
+        self.markets = {market["symbol"]: market for market in values}
+
+    # ---------------------------------------------------------
+    # Market Data
+    # ---------------------------------------------------------
+    async def fetch_ticker(self, symbol: str) -> dict[str, Any]:
+        await self._request("fetchTicker")
+        return self._ticker(symbol)
+
+    async def fetch_tickers(self, symbols: list[str] | None = None) -> dict[str, Any]:
+        await self._request("fetchTickers")
+        return {symbol: self._ticker(symbol) for symbol in symbols or list(self._symbols)}
+
+    async def fetch_order_book(self, symbol: str, limit: int | None = None) -> dict[str, Any]:
+        await self._request("fetchOrderBook")
+        book = self._order_book(symbol)
+        if book is None:
+            raise ccxt.ExchangeNotAvailable(f"{symbol}: no recorded order book at {self._now}")
+
+        return {
+            "symbol": symbol,
+            "asks": [[level.price, level.amount] for level in book.asks[:limit]],
+            "bids": [[level.price, level.amount] for level in book.bids[:limit]],
+            "timestamp": book.timestamp,
+            "datetime": ccxt.Exchange.iso8601(book.timestamp),
+            "nonce": book.nonce,
+        }
+
+    async def fetch_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str = "1m",
+        since: int | None = None,
+        limit: int | None = None,
+    ) -> list[list[float]]:
+        await self._request("fetchOHLCV")
+        candles = self._replay.candles(self._source(symbol), timeframe, self._now)
+        candles = candles.between(start=since) if since is not None else candles
+        if limit is not None:
+            candles = candles[:limit] if since is not None else candles[-limit:]
+
+        return [
+            [t, o, h, lo, c, v]
+            for t, o, h, lo, c, v in zip(
+                candles.timestamp.tolist(),
+                candles.open.tolist(),
+                candles.high.tolist(),
+                candles.low.tolist(),
+                candles.close.tolist(),
+                candles.volume.tolist(),
+                strict=True,
+            )
+        ]
+
+    async def fetch_status(self) -> dict[str, Any]:
+        await self._request("fetchStatus")
+        return {"status": "ok", "updated": self._now, "eta": None, "url": None}
+
+    async def fetch_time(self) -> int:
+        await self._request("fetchTime")
+        return self._now
+
+    # ---------------------------------------------------------
+    # Account
+    # ---------------------------------------------------------
+    async def fetch_balance(self) -> dict[str, Any]:
+        await self._request("fetchBalance")
+        used = self._used()
+        balance: dict[str, Any] = {"timestamp": self._now, "datetime": self._iso(self._now)}
+        currencies = sorted(set(self._totals) | set(used))
+        for currency in currencies:
+            total = self._totals.get(currency, 0.0)
+            balance[currency] = {
+                "free": total - used.get(currency, 0.0),
+                "used": used.get(currency, 0.0),
+                "total": total,
+            }
+        # ccxt와 같이 통화별 free/used/total dict도 함께 넣습니다.
+        for key in ("free", "used", "total"):
+            balance[key] = {currency: balance[currency][key] for currency in currencies}
+        return balance
+
+    async def fetch_positions(self, symbols: list[str] | None = None) -> list[dict[str, Any]]:
+        await self._request("fetchPositions")
+        return [
+            self._position(symbol, position)
+            for symbol, position in self._positions.items()
+            if position.amount != 0 and (symbols is None or symbol in symbols)
+        ]
+
+    # ---------------------------------------------------------
+    # Orders
+    # ---------------------------------------------------------
+    async def create_order(
+        self,
+        symbol: str,
+        type: str,
+        side: str,
+        amount: float,
+        price: float | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        await self._request("createOrder")
+        return self._to_ccxt(self._place(symbol, type, side, amount, price, params or {}))
+
+    async def create_limit_buy_order(
+        self, symbol: str, amount: float, price: float, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        return await self.create_order(symbol, "limit", "buy", amount, price, params)
+
+    async def create_limit_sell_order(
+        self, symbol: str, amount: float, price: float, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        return await self.create_order(symbol, "limit", "sell", amount, price, params)
+
+    async def create_market_buy_order(
+        self, symbol: str, amount: float, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        return await self.create_order(symbol, "market", "buy", amount, None, params)
+
+    async def create_market_sell_order(
+        self, symbol: str, amount: float, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        return await self.create_order(symbol, "market", "sell", amount, None, params)
+
+    async def create_orders(self, orders: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        거절된 건은 Binance batchOrders처럼 status='rejected'와 오류 정보(info)로 돌려줍니다.
+        """
+        await self._request("createOrders")
+        results = []
+        for order in orders:
+            try:
+                placed = self._place(
+                    order["symbol"],
+                    order["type"],
+                    order["side"],
+                    order["amount"],
+                    order.get("price"),
+                    order.get("params") or {},
+                )
+                results.append(self._to_ccxt(placed))
+            except ccxt.ExchangeError as e:
+                results.append(
+                    {"status": "rejected", "info": {"code": type(e).__name__, "msg": str(e)}}
+                )
+        return results
+
+    async def cancel_order(self, id: str, symbol: str | None = None) -> dict[str, Any]:
+        await self._request("cancelOrder")
+        return self._to_ccxt(self._cancel(id))
+
+    async def cancel_orders(
+        self, ids: list[str], symbol: str | None = None
+    ) -> list[dict[str, Any]]:
+        await self._request("cancelOrders")
+        if not self._contract:
+            # Binance와 마찬가지로 현물 batch 취소는 지원하지 않습니다.
+            raise ccxt.BadRequest("cancelOrders() is only supported for swap markets")
+        results = []
+        for order_id in ids:
+            try:
+                results.append(self._to_ccxt(self._cancel(order_id)))
+            except ccxt.OrderNotFound as e:
+                results.append({"id": order_id, "status": "rejected", "info": {"msg": str(e)}})
+        return results
+
+    async def cancel_all_orders(self, symbol: str | None = None) -> list[dict[str, Any]]:
+        await self._request("cancelAllOrders")
+        engines = [self._engine(symbol)] if symbol else list(self._engines.values())
+        return [
+            self._to_ccxt(self._cancel(order.id))
+            for engine in engines
+            for order in engine.open_orders()
+        ]
+
+    async def fetch_order(self, id: str, symbol: str | None = None) -> dict[str, Any]:
+        await self._request("fetchOrder")
+        order = self._orders.get(id)
+        if order is None:
+            raise ccxt.OrderNotFound(f"order {id} does not exist")
+        return self._to_ccxt(order)
+
+    async def fetch_open_orders(self, symbol: str | None = None) -> list[dict[str, Any]]:
+        await self._request("fetchOpenOrders")
+        engines = [self._engine(symbol)] if symbol else list(self._engines.values())
+        return [self._to_ccxt(order) for engine in engines for order in engine.open_orders()]
+
+    # ---------------------------------------------------------
+    # Internal: Order Handling
+    # ---------------------------------------------------------
+    def _place(
+        self,
+        symbol: str,
+        type: str,
+        side: str,
+        amount: float,
+        price: float | None,
+        params: dict[str, Any],
+    ) -> SimulatedOrder:
+        engine = self._engine(symbol)
+        if amount <= 0:
+            raise ccxt.InvalidOrder(f"{symbol}: amount must be positive")
+        if type == "limit" and (price is None or price <= 0):
+            raise ccxt.InvalidOrder(f"{symbol}: limit order requires a positive price")
+
+        order = SimulatedOrder(
+            id=str(next(self._order_ids)),
+            symbol=symbol,
+            side=side,
+            type=type,
+            amount=amount,
+            price=price if type == "limit" else None,
+            timestamp=self._now,
+            time_in_force=params.get("timeInForce", "GTC"),
+            reduce_only=bool(params.get("reduceOnly", False)),
+            client_order_id=params.get("clientOrderId"),
+        )
+
+        book = self._order_book(symbol)
+        last_price = self._replay.last_price(self._symbols[symbol], self._now)
+        self._check_funds(order, engine, book, last_price)
+
+        fills = engine.submit(order, book, last_price)
+        for fill in fills:
+            self._settle(fill)
+
+        if order.status == "open":
+            self._reserve(order)
+        self._orders[order.id] = order
+        return order
+
+    def _cancel(self, order_id: str) -> SimulatedOrder:
+        order = self._orders.get(order_id)
+        if order is None:
+            raise ccxt.OrderNotFound(f"order {order_id} does not exist")
+        canceled = self._engine(order.symbol).cancel(order_id)
+        self._release(order_id)
+        return canceled
+
+    def _check_funds(
+        self,
+        order: SimulatedOrder,
+        engine: MatchingEngine,
+        book: OrderBookDTO | None,
+        last_price: float | None,
+    ) -> None:
+        if order.price is not None:
+            notional = order.price * order.amount
+        else:
+            _, notional = engine.quote(order.side, order.amount, book, last_price)
+
+        base, quote = self._currencies(order.symbol)
+        used = self._used()
+        free = {
+            currency: total - used.get(currency, 0.0) for currency, total in self._totals.items()
+        }
+
+        if self._contract:
+            position = self._positions.get(order.symbol, _Position())
+            increases = position.amount == 0 or (position.amount > 0) == (order.side == "buy")
+            if order.reduce_only and increases:
+                raise ccxt.InvalidOrder(
+                    f"{order.symbol}: reduce-only order would increase position"
+                )
+            required = notional / self._leverage if increases else 0.0
+            currency = quote
+        elif order.side == "buy":
+            # 현물 매수 수수료는 _settle에서 받는 base에서 차감하므로 quote는 체결 금액만 필요합니다.
+            required, currency = notional, quote
+        else:
+            required, currency = order.amount, base
+
+        if required > free.get(currency, 0.0) + 1e-12:
+            raise ccxt.InsufficientFunds(
+                f"{order.symbol}: {required} {currency} required, {free.get(currency, 0.0)} free"
+            )
+
+    def _settle(self, fill: Fill) -> None:
+        order = fill.order
+        base, quote = self._currencies(order.symbol)
+        notional = fill.price * fill.amount
+        rate = self._maker_fee if fill.maker else self._taker_fee
+
+        if self._contract:
+            fee = notional * rate
+            order.fee_currency = quote
+            self._totals[quote] = self._totals.get(quote, 0.0) - fee + self._apply_position(fill)
+        elif order.side == "buy":
+            fee = fill.amount * rate
+            order.fee_currency = base
+            self._totals[quote] = self._totals.get(quote, 0.0) - notional
+            self._totals[base] = self._totals.get(base, 0.0) + fill.amount - fee
+        else:
+            fee = notional * rate
+            order.fee_currency = quote
+            self._totals[base] = self._totals.get(base, 0.0) - fill.amount
+            self._totals[quote] = self._totals.get(quote, 0.0) + notional - fee
+
+        order.fee += fee
+
+    def _apply_position(self, fill: Fill) -> float:
+        """
+        체결을 포지션에 반영하고 실현 손익을 반환합니다.
+        """
+        position = self._positions.setdefault(fill.order.symbol, _Position())
+        signed = fill.amount if fill.order.side == "buy" else -fill.amount
+        realized = 0.0
+
+        if position.amount == 0 or (position.amount > 0) == (signed > 0):
+            total = position.amount + signed
+            position.entry_price = (
+                position.entry_price * abs(position.amount) + fill.price * fill.amount
+            ) / abs(total)
+            position.amount = total
+            return realized
+
+        closed = min(abs(position.amount), fill.amount)
+        direction = 1.0 if position.amount > 0 else -1.0
+        realized = closed * (fill.price - position.entry_price) * direction
+        position.amount += signed
+        if position.amount == 0:
+            position.entry_price = 0.0
+        elif (position.amount > 0) != (direction > 0):
+            position.entry_price = fill.price  # 반대 방향으로 넘어간 나머지
+        return realized
+
+    def _reserve(self, order: SimulatedOrder) -> None:
+        assert order.price is not None
+        base, quote = self._currencies(order.symbol)
+        if self._contract:
+            reservation = (quote, order.price * order.remaining / self._leverage)
+        elif order.side == "buy":
+            reservation = (quote, order.price * order.remaining)
+        else:
+            reservation = (base, order.remaining)
+
+        currency, amount = self._reservations[order.id] = reservation
+        self._reserved[currency] = self._reserved.get(currency, 0.0) + amount
+
+    def _release(self, order_id: str) -> None:
+        reservation = self._reservations.pop(order_id, None)
+        if reservation is not None:
+            currency, amount = reservation
+            self._reserved[currency] -= amount
+
+    def _used(self) -> dict[str, float]:
+        used = dict(self._reserved)
+        for symbol, position in self._positions.items():
+            _, quote = self._currencies(symbol)
+            margin = abs(position.amount) * position.entry_price / self._leverage
+            used[quote] = used.get(quote, 0.0) + margin
+        return used
+
+    # ---------------------------------------------------------
+    # Internal: Structures
+    # ---------------------------------------------------------
+    def _engine(self, symbol: str) -> MatchingEngine:
+        engine = self._engines.get(symbol)
+        if engine is None:
+            raise ccxt.BadSymbol(f"{self.id} does not have market symbol {symbol}")
+        return engine
+
+    def _source(self, symbol: str) -> str:
+        self._engine(symbol)
+        return self._symbols[symbol]
+
+    def _order_book(self, symbol: str) -> OrderBookDTO | None:
+        return self._replay.order_book(self._source(symbol), self._now)
+
+    def _to_symbol(self, symbol: str) -> str:
+        """
+        기록 데이터의 심볼을 마켓 타입에 맞는 ccxt 심볼로 바꿉니다. (선물: BTC/USDT -> BTC/USDT:USDT)
+        """
+        if not self._contract or ":" in symbol:
+            return symbol
+        return f"{symbol}:{symbol.split('/')[1]}"
+
+    @staticmethod
+    def _currencies(symbol: str) -> tuple[str, str]:
+        base, quote = symbol.split(":")[0].split("/")
+        return base, quote
+
+    @staticmethod
+    def _iso(timestamp: int) -> str:
+        return ccxt.Exchange.iso8601(timestamp)
+
+    def _market(self, symbol: str) -> dict[str, Any]:
+        base, quote = self._currencies(symbol)
+        return {
+            "id": f"{base}{quote}",
+            "symbol": symbol,
+            "base": base,
+            "quote": quote,
+            "settle": quote if self._contract else None,
+            "type": "swap" if self._contract else "spot",
+            "spot": not self._contract,
+            "swap": self._contract,
+            "linear": True if self._contract else None,
+            "contract": self._contract,
+            "contractSize": 1.0 if self._contract else None,
+            "active": True,
+            "precision": {"amount": 1e-8, "price": 1e-8},
+            "limits": {"amount": {"min": 1e-8, "max": None}, "leverage": {"max": 125}},
+            "maker": self._maker_fee,
+            "taker": self._taker_fee,
+            "info": {},
+        }
+
+    def _ticker(self, symbol: str) -> dict[str, Any]:
+        source = self._source(symbol)
+        book = self._replay.order_book(source, self._now)
+        last = self._replay.last_price(source, self._now)
+
+        day: dict[str, float | None] = dict.fromkeys(("open", "high", "low", "base", "quote"))
+        timeframes = self._replay.timeframes(source)
+        if timeframes:
+            candles = self._replay.candles(source, timeframes[0], self._now).between(
+                start=self._now - 86_400_000
+            )
+            if len(candles) > 0:
+                day = {
+                    "open": float(candles.open[0]),
+                    "high": float(candles.high.max()),
+                    "low": float(candles.low.min()),
+                    "base": float(candles.volume.sum()),
+                    "quote": float((candles.volume * candles.close).sum()),
+                }
+
+        change = last - day["open"] if last is not None and day["open"] else None
+        return {
+            "symbol": symbol,
+            "timestamp": self._now,
+            "datetime": self._iso(self._now),
+            "high": day["high"],
+            "low": day["low"],
+            "open": day["open"],
+            "close": last,
+            "last": last,
+            "previousClose": None,
+            "vwap": day["quote"] / day["base"] if day["base"] else None,
+            "change": change,
+            "percentage": (
+                change / day["open"] * 100 if change is not None and day["open"] else None
+            ),
+            "average": (last + day["open"]) / 2 if change is not None and day["open"] else None,
+            "baseVolume": day["base"],
+            "quoteVolume": day["quote"],
+            "markPrice": last if self._contract else None,
+            "indexPrice": last if self._contract else None,
+            "bid": book.bids[0].price if book and book.bids else None,
+            "bidVolume": book.bids[0].amount if book and book.bids else None,
+            "ask": book.asks[0].price if book and book.asks else None,
+            "askVolume": book.asks[0].amount if book and book.asks else None,
+        }
+
+    def _position(self, symbol: str, position: _Position) -> dict[str, Any]:
+        mark = self._replay.last_price(self._symbols[symbol], self._now) or position.entry_price
+        size = abs(position.amount)
+        unrealized = (mark - position.entry_price) * position.amount
+        margin = size * position.entry_price / self._leverage
+        return {
+            "symbol": symbol,
+            "side": "long" if position.amount > 0 else "short",
+            "contracts": size,
+            "contractSize": 1.0,
+            "notional": size * mark,
+            "leverage": self._leverage,
+            "entryPrice": position.entry_price,
+            "markPrice": mark,
+            "liquidationPrice": None,
+            "marginMode": "cross",
+            "unrealizedPnl": unrealized,
+            "percentage": unrealized / margin * 100 if margin else None,
+            "timestamp": self._now,
+            "datetime": self._iso(self._now),
+        }
+
+    def _to_ccxt(self, order: SimulatedOrder) -> dict[str, Any]:
+        return {
+            "id": order.id,
+            "clientOrderId": order.client_order_id,
+            "symbol": order.symbol,
+            "type": order.type,
+            "side": order.side,
+            "timeInForce": order.time_in_force,
+            "reduceOnly": order.reduce_only,
+            "status": order.status,
+            "timestamp": order.timestamp,
+            "datetime": self._iso(order.timestamp),
+            "price": order.price if order.price is not None else order.average,
+            "average": order.average,
+            "amount": order.amount,
+            "filled": order.filled,
+            "remaining": order.remaining,
+            "cost": order.cost,
+            "fee": {"cost": order.fee, "currency": order.fee_currency},
+            "trades": [],
+            "info": {},
+        }
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Any
+
+import ccxt.pro as ccxtpro
+
+from app.ccxt.domain.exchange import Exchange
+from app.ccxt.enums.market_type import MarketType
+from app.ccxt.simulator.market_replay import MarketReplay
+from app.ccxt.simulator.simulated_client import SimulatedClient
+
+
+class SimulatedExchange(Exchange):
+    """
+    ccxt 클라이언트 대신 SimulatedClient를 사용하는 Exchange입니다.
+    MarketData, SpotOrder, FutureOrder에 그대로 넘길 수 있습니다.
+
+    Example:
+        exchange = SimulatedExchange(MarketType.SPOT, replay, balances={"USDT": 10_000.0})
+        order = SpotOrder(exchange)
+        exchange.client.advance(60_000)  # 1분 진행
+    """
+
+    def __init__(self, market_type: MarketType, replay: MarketReplay, **options: Any) -> None:
+        self._replay = replay
+        self._simulator_options = options
+        super().__init__("simulated", "", "", market_type)
+
+    def _create_client(self) -> SimulatedClient:  # type: ignore[override]
+        return SimulatedClient(
+            self._replay,
+            MarketType(self._config["options"]["defaultType"]),
+            **self._simulator_options,
+        )
+
+    @property
+    def client(self) -> SimulatedClient:  # type: ignore[override]
+        return self._client
+
+    @property
+    def ws_client(self) -> ccxtpro.Exchange:
+        raise NotImplementedError("SimulatedExchange does not support WebSocket streams.")
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import ccxt.async_support as ccxt
+
+from app.ccxt.api.parser import (
+    parse_liquidation,
+    parse_order_book,
+    parse_ticker,
+    parse_trade,
+)
+from app.ccxt.domain.exchange import Exchange
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.ccxt.dtos.candle_dto import CandleDTO
+from app.ccxt.dtos.liquidation_dto import LiquidationDTO
+from app.ccxt.dtos.order_book_dto import OrderBookDTO
+from app.ccxt.dtos.ticker_dto import TickerDTO
+from app.ccxt.dtos.trade_dto import TradeDTO
+
+
+class MarketStream:
+    """
+    ccxt.pro watch_* 메서드를 DTO를 반환하는 async iterator로 감쌉니다.
+
+    - 재연결: 네트워크 오류가 나면 지수 백오프 후 watch_*를 다시 호출합니다.
+      ccxt.pro는 다음 watch 호출에서 소켓을 다시 열고 구독을 다시 보냅니다.
+    - 백프레셔: 구독마다 크기가 정해진 큐를 둡니다. ticker/order book/candle은 최신 값만
+      의미가 있으므로 큐가 가득 차면 가장 오래된 값을 버리고, trade는 하나도 버리지 않도록
+      소비자가 따라올 때까지 수신을 멈춥니다.
+    """
+
+    def __init__(
+        self,
+        exchange: Exchange,
+        queue_size: int = 1024,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+    ) -> None:
+        self._client = exchange.ws_client
+        self._queue_size = queue_size
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+
+    # ---------------------------------------------------------
+    # Streams
+    # ---------------------------------------------------------
+    def watch_ticker(self, ticker: str) -> AsyncIterator[TickerDTO]:
+        return self._subscribe(
+            lambda: self._client.watch_ticker(ticker),
+            lambda ticker_info: [parse_ticker(ticker_info)],
+            conflate=True,
+        )
+
+    def watch_trades(self, ticker: str) -> AsyncIterator[TradeDTO]:
+        return self._subscribe(
+            lambda: self._client.watch_trades(ticker),
+            lambda trades: [parse_trade(trade) for trade in trades],
+            conflate=False,
+        )
+
+    def watch_order_book(
+        self, ticker: str, limit: int | None = None
+    ) -> AsyncIterator[OrderBookDTO]:
+        """
+        ccxt.pro가 depth delta를 로컬 오더북에 반영한 뒤의 스냅샷을 반환합니다.
+        """
+        return self._subscribe(
+            lambda: self._client.watch_order_book(ticker, limit),
+            lambda order_book: [parse_order_book(order_book)],
+            conflate=True,
+        )
+
+    def watch_candles(self, ticker: str, timeframe: str) -> AsyncIterator[CandleDTO]:
+        """
+        진행 중인 봉이 갱신될 때마다 해당 봉을 반환합니다. (같은 timestamp가 여러 번 올 수 있습니다)
+        """
+        return self._subscribe(
+            lambda: self._client.watch_ohlcv(ticker, timeframe),
+            lambda candles: CandleArrayDTO.from_ohlcv(candles).to_dtos(),
+            conflate=True,
+        )
+
+    def watch_liquidations(self, ticker: str) -> AsyncIterator[LiquidationDTO]:
+        """
+        선물 심볼의 공개 청산. trade와 같이 하나도 버리지 않습니다.
+        """
+        return self._subscribe(
+            lambda: self._client.watch_liquidations(ticker),
+            lambda liquidations: [
+                parse_liquidation(liquidation, self._client.id) for liquidation in liquidations
+            ],
+            conflate=False,
+        )
+
+    # ---------------------------------------------------------
+    # Subscription
+    # ---------------------------------------------------------
+    async def _subscribe[T](
+        self,
+        watch: Callable[[], Awaitable[Any]],
+        convert: Callable[[Any], list[T]],
+        conflate: bool,
+    ) -> AsyncIterator[T]:
+        queue: asyncio.Queue[T | BaseException] = asyncio.Queue(self._queue_size)
+        pump = asyncio.create_task(self._pump(watch, convert, queue, conflate))
+
+        try:
+            while True:
+                item = await queue.get()
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            pump.cancel()
+
+    async def _pump[T](
+        self,
+        watch: Callable[[], Awaitable[Any]],
+        convert: Callable[[Any], list[T]],
+        queue: asyncio.Queue[T | BaseException],
+        conflate: bool,
+    ) -> None:
+        delay = self._reconnect_delay
+
+        while True:
+            try:
+                items = convert(await watch())
+            except ccxt.NetworkError:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._max_reconnect_delay)
+                continue
+            except Exception as e:
+                await queue.put(e)
+                return
+
+            delay = self._reconnect_delay
+            for item in items:
+                if conflate and queue.full():
+                    queue.get_nowait()
+                await queue.put(item)
@@ -0,0 +1,37 @@
+from prometheus_client import Gauge, Histogram, start_http_server
+
+RATE_LIMIT_WAIT_SECONDS = Histogram(
+    "atlas_rate_limit_wait_seconds",
+    "Time a request spent queued in the client-side rate limiter.",
+    ["limiter", "priority"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+EXCHANGE_CALL_SECONDS = Histogram(
+    "atlas_exchange_call_seconds",
+    "Duration of SpotOrder/FutureOrder/MarketData calls split by phase "
+    "(rate_limit_wait, request_build, network, parse, total).",
+    ["exchange", "method", "market_type", "phase"],
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+EXCHANGE_RTT_SECONDS = Histogram(
+    "atlas_exchange_rtt_seconds",
+    "Round trip time of fetch_time samples taken by ClockMonitor.",
+    ["exchange"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+EXCHANGE_CLOCK_OFFSET_SECONDS = Gauge(
+    "atlas_exchange_clock_offset_seconds",
+    "Estimated exchange server clock minus local clock.",
+    ["exchange"],
+)
+
+
+def start_metrics_server(port: int, addr: str = "0.0.0.0") -> None:
+    """
+    /metrics 스크레이프 엔드포인트를 별도 스레드의 HTTP 서버로 띄웁니다.
+    FastAPI 앱에 붙일 때는 prometheus_client.make_asgi_app()을 mount 하면 됩니다.
+    """
+    start_http_server(port, addr)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+_UNIT_MS: dict[str, int] = {
+    "s": 1_000,
+    "m": 60_000,
+    "h": 3_600_000,
+    "d": 86_400_000,
+    "w": 604_800_000,
+}
+
+# Unix epoch(1970-01-01)는 목요일이므로, 월요일 00:00 UTC에 시작하는 주봉 버킷은 4일만큼 밀어서 계산합니다.
+WEEK_ORIGIN_MS = 4 * _UNIT_MS["d"]
+
+
+def timeframe_to_ms(timeframe: str) -> int:
+    """
+    ccxt 형식의 timeframe('1m', '4h', '1d' ...)을 밀리초 단위 길이로 변환합니다.
+    월 단위('1M')는 길이가 고정되지 않으므로 지원하지 않습니다.
+    """
+    amount, unit = timeframe[:-1], timeframe[-1]
+
+    if unit not in _UNIT_MS or not amount.isdigit() or int(amount) <= 0:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+
+    return int(amount) * _UNIT_MS[unit]
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import ccxt.async_support as ccxt
+import numpy as np
+import numpy.typing as npt
+
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.ccxt.dtos.order.market.market_order_response_dto import MarketOrderResponseDTO
+
+# 신호 함수: (candles, *params) -> 각 봉의 종가 시점에 정한 목표 포지션 배열 (1=롱, 0=없음, -1=숏, 비율 허용)
+type SignalFn = Callable[..., npt.NDArray[np.float64]]
+
+_YEAR_MS = 365 * 86_400_000
+
+
+@dataclass(slots=True, frozen=True)
+class BacktestResult:
+    params: tuple[Any, ...]  # (fast, slow)
+    total_return: float  # 0.183 (= +18.3%)
+    max_drawdown: float  # -0.072
+    sharpe: float  # 1.42 (연율화)
+    trades: int  # 포지션이 바뀐 횟수
+    turnover: float  # 누적 |포지션 변화|
+
+
+@dataclass(slots=True, frozen=True)
+class BacktestFill:
+    side: str  # buy | sell
+    order: MarketOrderResponseDTO
+
+
+class Backtester:
+    """
+    CandleArrayDTO 위에서 목표 포지션 배열을 벡터 연산으로 평가하는 백테스터입니다.
+
+    - 봉 i의 종가에서 정한 포지션은 봉 i+1의 시가에 체결됩니다. (미래 데이터 사용 없음)
+    - 체결 가격은 시가에 slippage(비율)만큼 불리하게, 수수료는 거래 금액 x fee로 계산합니다.
+    - sweep()은 파라미터 조합을 프로세스 풀에 나눠서 평가합니다. 캔들은 워커마다 한 번만 전달됩니다.
+
+    Example:
+        backtester = Backtester(candles, fee=0.0005, slippage=0.0001)
+        results = backtester.sweep(golden_cross, [(fast, slow) for fast in ... for slow in ...])
+    """
+
+    def __init__(
+        self,
+        candles: CandleArrayDTO,
+        fee: float = 0.0005,
+        slippage: float = 0.0001,
+        initial_capital: float = 10_000.0,
+    ) -> None:
+        if len(candles) < 2:
+            raise ValueError("Backtester needs at least two candles.")
+
+        self._candles = candles
+        self._fee = fee
+        self._slippage = slippage
+        self._initial_capital = initial_capital
+
+        open_, close = candles.open, candles.close
+        # 이전 종가 -> 시가(갭) 수익률과 시가 -> 종가 수익률. 첫 봉의 갭은 0입니다.
+        self._gap_return = np.concatenate(([0.0], open_[1:] / close[:-1] - 1.0))
+        self._bar_return = close / open_ - 1.0
+
+        step = float(np.median(np.diff(candles.timestamp)))
+        self._periods_per_year = _YEAR_MS / step
+
+    @property
+    def candles(self) -> CandleArrayDTO:
+        return self._candles
+
+    # ---------------------------------------------------------
+    # Evaluation
+    # ---------------------------------------------------------
+    def equity(self, positions: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """
+        각 봉 종가 시점의 자산 가치를 반환합니다.
+        """
+        return self._initial_capital * np.cumprod(self._growth(self._exposure(positions)))
+
+    def run(
+        self, positions: npt.NDArray[np.float64], params: tuple[Any, ...] = ()
+    ) -> BacktestResult:
+        exposure = self._exposure(positions)
+        growth = self._growth(exposure)
+        equity = np.cumprod(growth)
+
+        returns = growth - 1.0
+        std = float(returns.std())
+        sharpe = float(returns.mean()) / std * math.sqrt(self._periods_per_year) if std else 0.0
+        changes = np.abs(np.diff(exposure, prepend=0.0))
+
+        return BacktestResult(
+            params=params,
+            total_return=float(equity[-1] - 1.0),
+            max_drawdown=float((equity / np.maximum.accumulate(equity) - 1.0).min()),
+            sharpe=sharpe,
+            trades=int(np.count_nonzero(changes)),
+            turnover=float(changes.sum()),
+        )
+
+    def fills(self, positions: npt.NDArray[np.float64]) -> list[BacktestFill]:
+        """
+        포지션 변화를 시장가 주문 체결(MarketOrderResponseDTO)로 펼쳐서 반환합니다.
+        amount는 체결 직전 자산 가치 기준의 기초자산 수량입니다.
+        """
+        exposure = self._exposure(positions)
+        equity = self.equity(positions)
+        changes = np.diff(exposure, prepend=0.0)
+        fills: list[BacktestFill] = []
+
+        for i in np.flatnonzero(changes).tolist():
+            delta = float(changes[i])
+            price = float(self._candles.open[i]) * (1.0 + math.copysign(self._slippage, delta))
+            capital = float(equity[i - 1]) if i > 0 else self._initial_capital
+            amount = abs(delta) * capital / price
+            timestamp = int(self._candles.timestamp[i])
+
+            fills.append(
+                BacktestFill(
+                    side="buy" if delta > 0 else "sell",
+                    order=MarketOrderResponseDTO(
+                        timestamp=timestamp,
+                        datetime=ccxt.Exchange.iso8601(timestamp),
+                        price=price,
+                        average=price,
+                        amount=amount,
+                        filled=amount,
+                        remaining=0.0,
+                        cost=amount * price,
+                        fee=amount * price * self._fee,
+                    ),
+                )
+            )
+        return fills
+
+    def sweep(
+        self,
+        signal: SignalFn,
+        params: Iterable[Sequence[Any]],
+        max_workers: int | None = None,
+        chunksize: int = 16,
+    ) -> list[BacktestResult]:
+        """
+        params의 각 조합으로 signal(candles, *params)를 평가합니다. signal은 모듈 최상위 함수여야 합니다. (pickle)
+        max_workers=1 이면 프로세스 풀 없이 현재 프로세스에서 실행합니다.
+        """
+        params = [tuple(p) for p in params]
+        if max_workers == 1:
+            return [self.run(signal(self._candles, *p), p) for p in params]
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(self, signal)
+        ) as executor:
+            return list(executor.map(_run_worker, params, chunksize=chunksize))
+
+    # ---------------------------------------------------------
+    # Internal
+    # ---------------------------------------------------------
+    def _exposure(self, positions: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """
+        봉 i 동안 보유하는 포지션 = 봉 i-1 종가에서 정한 목표 포지션.
+        """
+        positions = np.asarray(positions, dtype=np.float64)
+        if positions.shape != self._candles.close.shape:
+            raise ValueError(
+                f"positions length {len(positions)} does not match candles {len(self._candles)}"
+            )
+        return np.concatenate(([0.0], np.nan_to_num(positions[:-1])))
+
+    def _growth(self, exposure: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        previous = np.concatenate(([0.0], exposure[:-1]))
+        cost = np.abs(exposure - previous) * (self._fee + self._slippage)
+        return (
+            (1.0 + previous * self._gap_return) * (1.0 - cost) * (1.0 + exposure * self._bar_return)
+        )
+
+
+_worker: tuple[Backtester, SignalFn] | None = None
+
+
+def _init_worker(backtester: Backtester, signal: SignalFn) -> None:
+    global _worker
+    _worker = (backtester, signal)
+
+
+def _run_worker(params: tuple[Any, ...]) -> BacktestResult:
+    assert _worker is not None
+    backtester, signal = _worker
+    return backtester.run(signal(backtester.candles, *params), params)
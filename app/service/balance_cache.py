@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import ccxt.async_support as ccxt
+
+from app.ccxt.api.parser import parse_balance
+from app.ccxt.dtos.balance_dto import AssetBalanceDTO, BalanceDTO
+from app.ccxt.enums.market_type import MarketType
+
+logger = logging.getLogger(__name__)
+
+type BalanceFetcher = Callable[[], Awaitable[BalanceDTO]]
+type BalanceWatcher = Callable[[], Awaitable[dict[str, Any]]]
+
+
+@dataclass(slots=True)
+class _Asset:
+    free: float = 0.0
+    used: float = 0.0
+    version: int = 0  # refresh 도중 로컬에서 바뀐 통화를 구분하기 위한 카운터
+
+
+@dataclass(slots=True)
+class _Reservation:
+    currency: str
+    amount: float  # 아직 묶여 있는 수량
+    per_unit: float  # 주문 수량 1당 묶는 수량 (현물 매수: 가격, 매도: 1, 선물: 가격 / leverage)
+
+
+class BalanceCache:
+    """
+    잔고를 메모리에 두고 우리 주문/체결로 직접 갱신하는 캐시입니다.
+    주문 전 잔고 확인은 REST 호출 없이 로컬 조회로 끝나고, 거래소와는 주기적으로(또는 user-data 스트림으로) 맞춥니다.
+
+    - reserve(): 주문 전에 free -> used로 옮기며, 부족하면 ccxt.InsufficientFunds를 발생시킵니다.
+    - on_fill() / release(): 체결된 만큼 예약을 풀고 잔고를 옮깁니다. / 취소된 주문의 예약을 풉니다.
+    - 선물은 주문 증거금(가격 x 수량 / leverage)만 예약하고, 수수료 외의 손익은 adjust()로 반영합니다.
+      포지션 증거금은 추적하지 않으므로 정확한 값은 다음 refresh에서 맞춰집니다.
+
+    Example:
+        cache = BalanceCache(spot_order.fetch_balance, MarketType.SPOT, watch_balance=ws.watch_balance)
+        await cache.load()
+        cache.start()
+
+        cache.reserve(client_id, "BTC/USDT", "buy", 0.01, 117_700.0)
+        order = await spot_order.open_limit_order(...)
+    """
+
+    def __init__(
+        self,
+        fetch_balance: BalanceFetcher,
+        market_type: MarketType,
+        refresh_interval: float = 30.0,
+        watch_balance: BalanceWatcher | None = None,
+        leverage: float = 1.0,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+    ) -> None:
+        self._fetch_balance = fetch_balance
+        self._market_type = market_type
+        self._refresh_interval = refresh_interval
+        self._watch_balance = watch_balance
+        self._leverage = leverage
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+
+        self._assets: dict[str, _Asset] = {}
+        self._reservations: dict[Hashable, _Reservation] = {}
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def loaded_at(self) -> float | None:
+        return self._loaded_at
+
+    # ---------------------------------------------------------
+    # Load / Refresh
+    # ---------------------------------------------------------
+    async def load(self) -> None:
+        async with self._lock:
+            if self._loaded_at is None:
+                await self._refresh()
+
+    async def refresh(self) -> None:
+        async with self._lock:
+            await self._refresh()
+
+    def on_balance(self, balance: BalanceDTO) -> None:
+        """
+        거래소 잔고 스냅샷을 그대로 반영합니다. (REST 응답, user-data 스트림)
+        """
+        self._apply(balance, skip=set())
+
+    def start(self) -> None:
+        if any(not task.done() for task in self._tasks):
+            return
+        self._tasks = [asyncio.create_task(self._refresh_loop())]
+        if self._watch_balance is not None:
+            self._tasks.append(asyncio.create_task(self._watch_loop(self._watch_balance)))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    # ---------------------------------------------------------
+    # Lookup
+    # ---------------------------------------------------------
+    def free(self, currency: str) -> float:
+        asset = self._assets.get(currency)
+        return asset.free if asset is not None else 0.0
+
+    def get(self, currency: str) -> AssetBalanceDTO:
+        asset = self._assets.get(currency, _Asset())
+        return AssetBalanceDTO(free=asset.free, used=asset.used, total=asset.free + asset.used)
+
+    def snapshot(self) -> BalanceDTO:
+        return BalanceDTO(balances={currency: self.get(currency) for currency in self._assets})
+
+    def required(
+        self, symbol: str, side: Literal["buy", "sell"], amount: float, price: float
+    ) -> tuple[str, float]:
+        """
+        주문에 필요한 (통화, 수량). 시장가 주문은 예상 체결가를 price로 넘깁니다.
+        """
+        currency, per_unit = self._requirement(symbol, side, price)
+        return currency, amount * per_unit
+
+    def can_place(
+        self, symbol: str, side: Literal["buy", "sell"], amount: float, price: float
+    ) -> bool:
+        currency, required = self.required(symbol, side, amount, price)
+        return self.free(currency) >= required
+
+    # ---------------------------------------------------------
+    # Local updates
+    # ---------------------------------------------------------
+    def reserve(
+        self,
+        key: Hashable,
+        symbol: str,
+        side: Literal["buy", "sell"],
+        amount: float,
+        price: float,
+    ) -> None:
+        """
+        key(클라이언트 주문 id 등)로 주문에 필요한 잔고를 묶습니다.
+        """
+        if key in self._reservations:
+            raise ValueError(f"reservation {key!r} already exists")
+
+        currency, per_unit = self._requirement(symbol, side, price)
+        required = amount * per_unit
+        asset = self._asset(currency)
+        if asset.free < required:
+            raise ccxt.InsufficientFunds(
+                f"{symbol} {side} {amount} needs {required} {currency}, free {asset.free}"
+            )
+
+        asset.free -= required
+        asset.used += required
+        asset.version += 1
+        self._reservations[key] = _Reservation(currency, required, per_unit)
+
+    def release(self, key: Hashable) -> None:
+        """
+        취소/거절된 주문의 남은 예약을 풉니다. 없는 key는 무시합니다.
+        """
+        reservation = self._reservations.pop(key, None)
+        if reservation is not None:
+            self._unreserve(reservation, reservation.amount)
+
+    def on_fill(
+        self,
+        symbol: str,
+        side: Literal["buy", "sell"],
+        amount: float,
+        price: float,
+        fee: float = 0.0,
+        fee_currency: str | None = None,
+        key: Hashable | None = None,
+    ) -> None:
+        """
+        체결을 반영합니다. key가 있으면 그 예약에서 체결 수량만큼을 먼저 풉니다.
+        fee_currency 기본값은 quote(선물은 정산) 통화입니다.
+        """
+        base, quote = _currencies(symbol)
+
+        reservation = self._reservations.get(key) if key is not None else None
+        if reservation is not None:
+            self._unreserve(reservation, min(amount * reservation.per_unit, reservation.amount))
+            if reservation.amount <= 1e-12:
+                del self._reservations[key]
+
+        if self._market_type == MarketType.SPOT:
+            sign = 1.0 if side == "buy" else -1.0
+            self._adjust(base, sign * amount)
+            self._adjust(quote, -sign * amount * price)
+
+        if fee:
+            self._adjust(fee_currency or quote, -fee)
+
+    def adjust(self, currency: str, delta: float) -> None:
+        """
+        실현 손익, 펀딩비, 입출금 등 주문 외의 변화를 free에 반영합니다.
+        """
+        self._adjust(currency, delta)
+
+    # ---------------------------------------------------------
+    # Internal
+    # ---------------------------------------------------------
+    async def _refresh(self) -> None:
+        versions = {currency: asset.version for currency, asset in self._assets.items()}
+        balance = await self._fetch_balance()
+
+        # 조회하는 동안 로컬에서 바뀐 통화는 로컬 값이 더 최신일 수 있으므로 다음 refresh로 미룹니다.
+        skip = {
+            currency
+            for currency, asset in self._assets.items()
+            if asset.version != versions.get(currency, 0)
+        }
+        self._apply(balance, skip)
+        self._loaded_at = time.time()
+
+    def _apply(self, balance: BalanceDTO, skip: set[str]) -> None:
+        for currency, asset_balance in balance.balances.items():
+            if currency in skip:
+                continue
+            asset = self._asset(currency)
+            asset.free, asset.used = asset_balance.free, asset_balance.used
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("failed to refresh balance")
+
+    async def _watch_loop(self, watch_balance: BalanceWatcher) -> None:
+        delay = self._reconnect_delay
+        while True:
+            try:
+                balance_info = await watch_balance()
+            except ccxt.NetworkError:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._max_reconnect_delay)
+                continue
+            except Exception:
+                logger.exception("balance stream stopped, falling back to scheduled refresh")
+                return
+
+            delay = self._reconnect_delay
+            self.on_balance(parse_balance(balance_info))
+
+    def _requirement(
+        self, symbol: str, side: Literal["buy", "sell"], price: float
+    ) -> tuple[str, float]:
+        base, quote = _currencies(symbol)
+        if self._market_type == MarketType.FUTURE:
+            return quote, price / self._leverage
+        if side == "buy":
+            return quote, price
+        return base, 1.0
+
+    def _unreserve(self, reservation: _Reservation, amount: float) -> None:
+        asset = self._asset(reservation.currency)
+        asset.used -= amount
+        asset.free += amount
+        asset.version += 1
+        reservation.amount -= amount
+
+    def _adjust(self, currency: str, delta: float) -> None:
+        asset = self._asset(currency)
+        asset.free += delta
+        asset.version += 1
+
+    def _asset(self, currency: str) -> _Asset:
+        asset = self._assets.get(currency)
+        if asset is None:
+            asset = self._assets[currency] = _Asset()
+        return asset
+
+
+def _currencies(symbol: str) -> tuple[str, str]:
+    """
+    'BTC/USDT' -> ('BTC', 'USDT'), 'BTC/USDT:USDT' -> ('BTC', 'USDT') (선물은 정산 통화)
+    """
+    pair, _, settle = symbol.partition(":")
+    base, quote = pair.split("/")
+    return base, settle or quote
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.ccxt.dtos.candle_dto import CandleDTO
+from app.ccxt.dtos.trade_array_dto import TradeArrayDTO
+from app.ccxt.dtos.trade_dto import TradeDTO
+from app.core.timeframe import timeframe_to_ms
+
+# 체결을 OHLCV 봉으로 모읍니다. 거래소 timeframe에 없는 봉(5초 봉, 거래량 봉 등)을 폴링 없이 만듭니다.
+#
+# - 증분: on_trade() / update()는 봉이 닫히는 체결에서 CandleDTO를 바로 반환합니다.
+# - 배치: on_trades()는 TradeArrayDTO를 NumPy로 한 번에 집계해서 닫힌 봉을 CandleArrayDTO로 반환합니다.
+#
+# 두 방식은 상태를 공유하므로 섞어서 호출해도 같은 봉이 나옵니다.
+#
+# - 시간 봉: 봉 timestamp는 구간 시작 시각입니다. 다음 구간의 체결이 오거나 flush(now)를 호출하면 닫힙니다.
+#   체결이 없는 구간의 봉은 만들지 않습니다.
+# - 틱/거래량/금액 봉: 누적 값이 threshold의 배수를 넘는 체결에서 그 체결을 포함해 닫힙니다. (체결을 쪼개지 않음)
+#   봉 timestamp는 첫 체결 시각입니다.
+
+
+@dataclass(slots=True)
+class _Bar:
+    key: int
+    timestamp: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+    def to_dto(self) -> CandleDTO:
+        return CandleDTO(self.timestamp, self.open, self.high, self.low, self.close, self.volume)
+
+
+class BarBuilder(ABC):
+    def __init__(self) -> None:
+        self._bar: _Bar | None = None
+
+    @property
+    def current(self) -> CandleDTO | None:
+        """
+        아직 닫히지 않은 봉
+        """
+        return self._bar.to_dto() if self._bar is not None else None
+
+    def on_trade(self, trade: TradeDTO) -> CandleDTO | None:
+        return self.update(trade.timestamp, trade.price, trade.amount)
+
+    def update(self, timestamp: int, price: float, amount: float) -> CandleDTO | None:
+        """
+        체결 하나를 반영하고, 이 체결로 닫힌 봉이 있으면 반환합니다.
+        """
+        bar = self._bar
+        key = self._key(timestamp, price, amount, bar)
+        closed = None
+        if bar is not None and bar.key != key:
+            closed, bar = bar.to_dto(), None
+
+        if bar is None:
+            bar = self._bar = _Bar(
+                key, self._timestamp(key, timestamp), price, price, price, price, amount
+            )
+        else:
+            if price > bar.high:
+                bar.high = price
+            elif price < bar.low:
+                bar.low = price
+            bar.close = price
+            bar.volume += amount
+
+        if self._closes(key):
+            closed, self._bar = bar.to_dto(), None
+        return closed
+
+    def on_trades(self, trades: TradeArrayDTO) -> CandleArrayDTO:
+        """
+        체결 묶음을 반영하고, 닫힌 봉을 시간 순서로 반환합니다.
+        """
+        if len(trades) == 0:
+            return CandleArrayDTO.empty()
+
+        keys, last_closes = self._keys(trades, self._bar)
+        starts = np.flatnonzero(np.diff(keys, prepend=keys[0] - 1))
+        ends = np.append(starts[1:], len(keys)) - 1
+        price = trades.price
+        bars = CandleArrayDTO(
+            timestamp=self._timestamps(keys[starts], trades.timestamp[starts]),
+            open=price[starts],
+            high=np.maximum.reduceat(price, starts),
+            low=np.minimum.reduceat(price, starts),
+            close=price[ends],
+            volume=np.add.reduceat(trades.amount, starts),
+        )
+        bar_keys = keys[starts]
+
+        bar = self._bar
+        if bar is not None:
+            if bar_keys[0] == bar.key:
+                bars.timestamp[0] = bar.timestamp
+                bars.open[0] = bar.open
+                bars.high[0] = max(bar.high, bars.high[0])
+                bars.low[0] = min(bar.low, bars.low[0])
+                bars.volume[0] += bar.volume
+            else:
+                bars = CandleArrayDTO.concat([CandleArrayDTO.from_dtos([bar.to_dto()]), bars])
+                bar_keys = np.concatenate(([bar.key], bar_keys))
+
+        if last_closes:
+            self._bar = None
+            return bars
+
+        last = bars[-1]
+        self._bar = _Bar(
+            int(bar_keys[-1]),
+            last.timestamp,
+            last.open,
+            last.high,
+            last.low,
+            last.close,
+            last.volume,
+        )
+        return bars[:-1]
+
+    # ---------------------------------------------------------
+    # Extension points
+    # ---------------------------------------------------------
+    @abstractmethod
+    def _key(self, timestamp: int, price: float, amount: float, bar: _Bar | None) -> int:
+        """
+        체결이 속하는 봉의 key. key가 바뀌면 이전 봉이 닫힙니다.
+        """
+
+    def _closes(self, key: int) -> bool:
+        """
+        방금 반영한 체결로 봉이 닫히는지 여부
+        """
+        return False
+
+    @abstractmethod
+    def _keys(self, trades: TradeArrayDTO, bar: _Bar | None) -> tuple[npt.NDArray[np.int64], bool]:
+        """
+        체결마다의 key와 마지막 체결로 마지막 봉이 닫히는지 여부. (_key/_closes의 배열 버전)
+        """
+
+    def _timestamp(self, key: int, timestamp: int) -> int:
+        return timestamp
+
+    def _timestamps(
+        self, keys: npt.NDArray[np.int64], timestamps: npt.NDArray[np.int64]
+    ) -> npt.NDArray[np.int64]:
+        return timestamps.copy()
+
+
+class TimeBarBuilder(BarBuilder):
+    """
+    timeframe('5s', '1m' ...) 단위의 시간 봉. 구간 시작 시각보다 늦게 도착한 이전 구간의 체결은 현재 봉에 넣습니다.
+    flush(now)로 닫은 구간의 체결이 늦게 오면 다음 구간의 봉에 넣어서, 같은 timestamp의 봉이 두 번 나오지 않게 합니다.
+    """
+
+    def __init__(self, timeframe: str) -> None:
+        super().__init__()
+        self._step = timeframe_to_ms(timeframe)
+        self._next_key: int | None = None  # flush(now)로 닫은 봉 다음 구간의 시작 시각
+
+    def flush(self, now: int) -> CandleDTO | None:
+        """
+        now(밀리초)가 현재 봉의 구간을 지났으면 다음 체결을 기다리지 않고 봉을 닫습니다. (타이머에서 호출)
+        """
+        bar = self._bar
+        if bar is None or now < bar.key + self._step:
+            return None
+        self._bar = None
+        self._next_key = bar.key + self._step
+        return bar.to_dto()
+
+    def _key(self, timestamp: int, price: float, amount: float, bar: _Bar | None) -> int:
+        key = timestamp - timestamp % self._step
+        floor = bar.key if bar is not None else self._next_key
+        return max(key, floor) if floor is not None else key
+
+    def _keys(self, trades: TradeArrayDTO, bar: _Bar | None) -> tuple[npt.NDArray[np.int64], bool]:
+        keys = trades.timestamp - trades.timestamp % self._step
+        floor = bar.key if bar is not None else self._next_key
+        if floor is not None:
+            keys = np.maximum(keys, floor)
+        return np.maximum.accumulate(keys), False
+
+    def _timestamp(self, key: int, timestamp: int) -> int:
+        return key
+
+    def _timestamps(
+        self, keys: npt.NDArray[np.int64], timestamps: npt.NDArray[np.int64]
+    ) -> npt.NDArray[np.int64]:
+        return keys.copy()
+
+
+class _ThresholdBarBuilder(BarBuilder):
+    """
+    체결마다 측정값(틱 수, 수량, 금액)을 누적하고, 누적값이 threshold의 배수를 넘으면 봉을 닫습니다.
+    key는 체결 직전 누적값 // threshold 입니다.
+    """
+
+    def __init__(self, threshold: float) -> None:
+        super().__init__()
+        if threshold <= 0:
+            raise ValueError(f"threshold must be positive, got {threshold}")
+        self._threshold = threshold
+        self._total = 0.0
+
+    @abstractmethod
+    def _measure(self, price: float, amount: float) -> float: ...
+
+    @abstractmethod
+    def _measures(self, trades: TradeArrayDTO) -> npt.NDArray[np.float64]: ...
+
+    def _key(self, timestamp: int, price: float, amount: float, bar: _Bar | None) -> int:
+        key = math.floor(self._total / self._threshold)
+        self._total += self._measure(price, amount)
+        return key
+
+    def _closes(self, key: int) -> bool:
+        return math.floor(self._total / self._threshold) > key
+
+    def _keys(self, trades: TradeArrayDTO, bar: _Bar | None) -> tuple[npt.NDArray[np.int64], bool]:
+        # 증분 경로와 같은 순서로 더하도록 현재 누적값부터 누적합을 구합니다.
+        totals = np.cumsum(np.concatenate(([self._total], self._measures(trades))))
+        keys = np.floor(totals / self._threshold).astype(np.int64)
+        self._total = float(totals[-1])
+        return keys[:-1], bool(keys[-1] > keys[-2])
+
+
+class TickBarBuilder(_ThresholdBarBuilder):
+    """
+    threshold개 체결마다 닫히는 봉
+    """
+
+    def _measure(self, price: float, amount: float) -> float:
+        return 1.0
+
+    def _measures(self, trades: TradeArrayDTO) -> npt.NDArray[np.float64]:
+        return np.ones(len(trades))
+
+
+class VolumeBarBuilder(_ThresholdBarBuilder):
+    """
+    체결 수량이 threshold만큼 쌓일 때마다 닫히는 봉
+    """
+
+    def _measure(self, price: float, amount: float) -> float:
+        return amount
+
+    def _measures(self, trades: TradeArrayDTO) -> npt.NDArray[np.float64]:
+        return trades.amount
+
+
+class DollarBarBuilder(_ThresholdBarBuilder):
+    """
+    체결 금액(price x amount)이 threshold만큼 쌓일 때마다 닫히는 봉
+    """
+
+    def _measure(self, price: float, amount: float) -> float:
+        return price * amount
+
+    def _measures(self, trades: TradeArrayDTO) -> npt.NDArray[np.float64]:
+        return trades.price * trades.amount
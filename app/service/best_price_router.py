@@ -0,0 +1,393 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from app.ccxt.api.market_data import MarketData
+from app.ccxt.domain.exchange import Exchange
+from app.ccxt.dtos.market_dto import MarketDTO
+from app.ccxt.dtos.order.limit.limit_order_request_dto import LimitOrderRequestDTO
+from app.ccxt.dtos.order.order_result_dto import OrderResultDTO
+from app.ccxt.dtos.order.order_update_dto import OrderUpdateDTO
+from app.ccxt.dtos.order.route_leg_dto import RouteLegDTO
+from app.ccxt.dtos.order_book_dto import OrderBookDTO, PriceLevelDTO
+from app.ccxt.dtos.ticker_dto import TickerDTO
+from app.ccxt.enums.time_in_force import TimeInForce
+from app.ccxt.websocket.market_stream import MarketStream
+from app.service.clock_monitor import ClockMonitor
+from app.service.market_registry import MarketRegistry
+from app.service.order_manager import OrderManager
+
+logger = logging.getLogger(__name__)
+
+
+class SymbolIndex:
+    """
+    거래소마다 다른 심볼/마켓 id를 하나의 canonical 심볼(BASE/QUOTE[:SETTLE[-EXPIRY]])로 묶습니다.
+
+    - 같은 자산을 거래소마다 다르게 부르면 aliases로 맞춥니다. ({"bybit": {"SHIB1000": "1000SHIB"}})
+    - 거래소 심볼과 마켓 id(스트림 원본 메시지의 'BTCUSDT' 등) 모두로 canonical 심볼을 찾습니다.
+    """
+
+    def __init__(self, aliases: Mapping[str, Mapping[str, str]] | None = None) -> None:
+        self._aliases = aliases or {}
+        self._markets: dict[str, dict[str, MarketDTO]] = {}  # canonical -> venue -> market
+        self._canonical: dict[tuple[str, str], str] = {}  # (venue, 심볼 또는 마켓 id) -> canonical
+
+    def add(self, venue: str, market: MarketDTO) -> str:
+        aliases = self._aliases.get(venue, {})
+        canonical = (
+            f"{aliases.get(market.base, market.base)}/{aliases.get(market.quote, market.quote)}"
+        )
+        if market.settle:
+            canonical += f":{aliases.get(market.settle, market.settle)}"
+            expiry = market.symbol.partition(":")[2].partition("-")[2]
+            if expiry:
+                canonical += f"-{expiry}"
+
+        self._markets.setdefault(canonical, {})[venue] = market
+        self._canonical[(venue, market.symbol)] = canonical
+        self._canonical[(venue, market.id)] = canonical
+        return canonical
+
+    def add_registry(self, venue: str, registry: MarketRegistry) -> None:
+        for symbol in registry.symbols():
+            self.add(venue, registry.get(symbol))
+
+    def canonical(self, venue: str, symbol: str) -> str | None:
+        return self._canonical.get((venue, symbol))
+
+    def market(self, canonical: str, venue: str) -> MarketDTO | None:
+        return self._markets.get(canonical, {}).get(venue)
+
+    def venues(self, canonical: str) -> list[str]:
+        return list(self._markets.get(canonical, {}))
+
+    def common(self, min_venues: int = 2) -> list[str]:
+        """
+        min_venues개 이상의 거래소에 상장된 canonical 심볼
+        """
+        return [
+            canonical for canonical, markets in self._markets.items() if len(markets) >= min_venues
+        ]
+
+
+@dataclass(slots=True)
+class _Book:
+    bids: list[PriceLevelDTO]
+    asks: list[PriceLevelDTO]
+    received: float  # time.monotonic()
+
+
+@dataclass(slots=True)
+class _Leg:
+    amount: float = 0.0
+    cost: float = 0.0  # 수수료 포함
+    price: float = 0.0  # 지금까지 소진한 가장 나쁜 호가
+
+
+class BestPriceRouter:
+    """
+    같은 심볼의 거래소별 상위 호가를 메모리에 두고, 수수료를 포함한 실효 가격이 가장 좋은 거래소로
+    주문을 보내거나 나눕니다. 비교에 REST 호출이 필요 없고, 필요한 호출은 거래소별로 동시에 보냅니다.
+
+    - 호가: watch()는 거래소별 오더북 스트림으로, refresh()는 거래소별 REST 조회를 동시에 보내 갱신합니다.
+    - 실효 가격: 매수 price x (1 + taker), 매도 price x (1 - taker). taker는 fees > 마켓 정보 순입니다.
+    - plan(): 모든 거래소의 호가를 실효 가격 순으로 소진해서 거래소별 수량과 한도 가격을 정합니다.
+      max_age초보다 오래된 호가는 쓰지 않고, 보이는 호가를 넘는 수량은 배정하지 않습니다.
+    - execute(): leg마다 IOC 지정가를 동시에 보내고 최종 상태를 돌려줍니다.
+      주문 응답에 상태가 없으면(bybit 등) fetch_order로 확인하고, order_timeout초까지만 기다립니다.
+    - clock(ClockMonitor)을 주면 실효 가격이 같은 거래소 중 RTT가 짧은 쪽을 먼저 씁니다.
+
+    Example:
+        router = BestPriceRouter({"binance": binance, "bybit": bybit})
+        await router.load()
+        router.watch("BTC/USDT:USDT")
+        results = await router.execute(router.plan("BTC/USDT:USDT", "buy", 2.0))
+    """
+
+    def __init__(
+        self,
+        venues: Mapping[str, Exchange],
+        fees: Mapping[str, float] | None = None,
+        aliases: Mapping[str, Mapping[str, str]] | None = None,
+        depth: int = 5,
+        max_age: float = 2.0,
+        fast_path: bool = False,
+        managers: Mapping[str, OrderManager] | None = None,
+        clock: ClockMonitor | None = None,
+        order_timeout: float = 10.0,
+    ) -> None:
+        self._exchanges = dict(venues)
+        self._market_data = {
+            venue: MarketData(exchange, fast_path=fast_path)
+            for venue, exchange in self._exchanges.items()
+        }
+        self._managers = dict(managers or {})
+        # 직접 만든 OrderManager만 router가 start/stop 합니다. (넘겨받은 manager는 호출한 쪽이 관리)
+        self._owned_managers = [
+            self._managers.setdefault(venue, OrderManager(exchange))
+            for venue, exchange in self._exchanges.items()
+            if venue not in self._managers
+        ]
+        self._order_timeout = order_timeout
+        self._fees = dict(fees or {})
+        self._depth = depth
+        self._max_age = max_age
+        self._clock = clock
+
+        self._index = SymbolIndex(aliases)
+        self._books: dict[str, dict[str, _Book]] = {}  # canonical -> venue -> 호가
+        self._tasks: dict[str, list[asyncio.Task[None]]] = {}
+
+    @property
+    def index(self) -> SymbolIndex:
+        return self._index
+
+    # ---------------------------------------------------------
+    # Load / Streams
+    # ---------------------------------------------------------
+    async def load(self) -> None:
+        """
+        거래소별 마켓 정보를 동시에 읽어 심볼 인덱스를 만듭니다.
+        """
+        registries = {
+            venue: MarketRegistry.shared(market_data)
+            for venue, market_data in self._market_data.items()
+        }
+        await asyncio.gather(*(registry.load() for registry in registries.values()))
+        for venue, registry in registries.items():
+            self._index.add_registry(venue, registry)
+
+    async def refresh(self, symbol: str) -> None:
+        """
+        모든 거래소의 오더북을 동시에 조회합니다. 실패한 거래소는 이전 호가를 유지합니다.
+        """
+        venues = self._index.venues(symbol)
+        results = await asyncio.gather(
+            *(
+                self._market_data[venue].fetch_order_book(self._symbol(symbol, venue), self._depth)
+                for venue in venues
+            ),
+            return_exceptions=True,
+        )
+        for venue, result in zip(venues, results, strict=True):
+            if isinstance(result, OrderBookDTO):
+                self.on_order_book(venue, result)
+            else:
+                logger.warning("failed to fetch %s order book from %s: %r", symbol, venue, result)
+
+    def watch(self, symbol: str) -> None:
+        """
+        거래소별 오더북 스트림을 구독해서 호가를 계속 갱신합니다.
+        """
+        if any(not task.done() for task in self._tasks.get(symbol, [])):
+            return
+        self._tasks[symbol] = [
+            asyncio.create_task(self._watch_loop(venue, self._symbol(symbol, venue)))
+            for venue in self._index.venues(symbol)
+        ]
+
+    async def stop(self) -> None:
+        for tasks in self._tasks.values():
+            for task in tasks:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._tasks = {}
+        for manager in self._owned_managers:
+            await manager.stop()
+
+    def on_order_book(self, venue: str, book: OrderBookDTO) -> None:
+        canonical = self._index.canonical(venue, book.symbol)
+        if canonical is None:
+            return
+        self._books.setdefault(canonical, {})[venue] = _Book(
+            bids=book.bids[: self._depth], asks=book.asks[: self._depth], received=time.monotonic()
+        )
+
+    def on_ticker(self, venue: str, ticker: TickerDTO) -> None:
+        """
+        오더북 대신 ticker의 최우선 호가만으로 갱신합니다. (bid/ask 수량이 없으면 무시)
+        """
+        canonical = self._index.canonical(venue, ticker.symbol)
+        if canonical is None:
+            return
+        bids = (
+            [PriceLevelDTO(ticker.bid, ticker.bid_volume)]
+            if ticker.bid and ticker.bid_volume
+            else []
+        )
+        asks = (
+            [PriceLevelDTO(ticker.ask, ticker.ask_volume)]
+            if ticker.ask and ticker.ask_volume
+            else []
+        )
+        self._books.setdefault(canonical, {})[venue] = _Book(bids, asks, time.monotonic())
+
+    # ---------------------------------------------------------
+    # Routing
+    # ---------------------------------------------------------
+    def fee(self, symbol: str, venue: str) -> float:
+        if venue in self._fees:
+            return self._fees[venue]
+        market = self._index.market(symbol, venue)
+        return market.taker if market is not None and market.taker is not None else 0.0
+
+    def quotes(self, symbol: str, side: Literal["buy", "sell"]) -> list[RouteLegDTO]:
+        """
+        거래소별 최우선 호가를 실효 가격이 좋은 순으로 반환합니다.
+        """
+        quotes = []
+        for venue, levels in self._fresh_levels(symbol, side):
+            if levels:
+                top = levels[0]
+                quotes.append(
+                    RouteLegDTO(
+                        venue=venue,
+                        symbol=self._symbol(symbol, venue),
+                        side=side,
+                        amount=top.amount,
+                        price=top.price,
+                        effective_price=top.price * self._fee_factor(symbol, venue, side),
+                    )
+                )
+        rtts = self._rtts()
+        quotes.sort(key=lambda quote: _rank(side, quote.effective_price, rtts.get(quote.venue)))
+        return quotes
+
+    def best(self, symbol: str, side: Literal["buy", "sell"]) -> RouteLegDTO | None:
+        quotes = self.quotes(symbol, side)
+        return quotes[0] if quotes else None
+
+    def plan(self, symbol: str, side: Literal["buy", "sell"], amount: float) -> list[RouteLegDTO]:
+        """
+        amount를 실효 가격이 좋은 호가부터 채우도록 거래소별로 나눕니다.
+        거래소 최소 주문 수량보다 작은 leg는 뺍니다. 합계가 amount보다 작으면 보이는 호가가 부족한 것입니다.
+        """
+        levels: list[tuple[float, str, float, float]] = []  # (실효 가격, 거래소, 가격, 수량)
+        for venue, venue_levels in self._fresh_levels(symbol, side):
+            factor = self._fee_factor(symbol, venue, side)
+            levels.extend(
+                (level.price * factor, venue, level.price, level.amount) for level in venue_levels
+            )
+        rtts = self._rtts()
+        levels.sort(key=lambda level: _rank(side, level[0], rtts.get(level[1])))
+
+        legs: dict[str, _Leg] = {}
+        remaining = amount
+        for effective_price, venue, price, available in levels:
+            if remaining <= 1e-12:
+                break
+            take = min(available, remaining)
+            leg = legs.setdefault(venue, _Leg())
+            leg.amount += take
+            leg.cost += take * effective_price
+            leg.price = price
+            remaining -= take
+
+        routes = []
+        for venue, leg in legs.items():
+            market = self._index.market(symbol, venue)
+            if market is not None and leg.amount < (market.limits.amount_min or 0.0):
+                continue
+            routes.append(
+                RouteLegDTO(
+                    venue=venue,
+                    symbol=self._symbol(symbol, venue),
+                    side=side,
+                    amount=leg.amount,
+                    price=leg.price,
+                    effective_price=leg.cost / leg.amount,
+                )
+            )
+        routes.sort(key=lambda route: _rank(side, route.effective_price, rtts.get(route.venue)))
+        return routes
+
+    async def execute(
+        self, legs: list[RouteLegDTO], params: dict[str, Any] | None = None
+    ) -> list[OrderResultDTO[OrderUpdateDTO]]:
+        """
+        leg마다 IOC 지정가(한도 = leg.price)를 동시에 보내고, 결과를 legs와 같은 순서로 반환합니다.
+        """
+        return await asyncio.gather(*(self._send(leg, params) for leg in legs))
+
+    # ---------------------------------------------------------
+    # Internal
+    # ---------------------------------------------------------
+    def _symbol(self, symbol: str, venue: str) -> str:
+        market = self._index.market(symbol, venue)
+        if market is None:
+            raise KeyError(f"{symbol} is not listed on {venue}")
+        return market.symbol
+
+    def _fee_factor(self, symbol: str, venue: str, side: Literal["buy", "sell"]) -> float:
+        fee = self.fee(symbol, venue)
+        return 1.0 + fee if side == "buy" else 1.0 - fee
+
+    def _rtts(self) -> dict[str, float | None]:
+        if self._clock is None:
+            return {}
+        return {venue: self._clock.rtt(venue) for venue in self._exchanges}
+
+    def _fresh_levels(
+        self, symbol: str, side: Literal["buy", "sell"]
+    ) -> list[tuple[str, list[PriceLevelDTO]]]:
+        now = time.monotonic()
+        return [
+            (venue, book.asks if side == "buy" else book.bids)
+            for venue, book in self._books.get(symbol, {}).items()
+            if now - book.received <= self._max_age
+        ]
+
+    async def _send(
+        self, leg: RouteLegDTO, params: dict[str, Any] | None
+    ) -> OrderResultDTO[OrderUpdateDTO]:
+        manager = self._managers[leg.venue]
+        if manager in self._owned_managers:
+            manager.start()
+        try:
+            update = await manager.submit_limit(
+                leg.side,
+                LimitOrderRequestDTO(leg.symbol, leg.amount, leg.price, TimeInForce.IOC),
+                params=params,
+            )
+            if not update.status.is_final and update.id is not None:
+                # bybit create_order 응답에는 주문 id만 있어 상태를 알 수 없으므로 바로 조회합니다.
+                order = await self._exchanges[leg.venue].client.fetch_order(update.id, leg.symbol)
+                update = manager.apply(order) or update
+            if not update.status.is_final:
+                async with asyncio.timeout(self._order_timeout):
+                    update = await manager.wait(update.client_order_id)
+        except Exception as e:
+            return OrderResultDTO(error=e)
+
+        manager.forget(update.client_order_id)
+        return OrderResultDTO(response=update)
+
+    async def _watch_loop(self, venue: str, symbol: str) -> None:
+        stream = MarketStream(self._exchanges[venue])
+        try:
+            async for book in stream.watch_order_book(symbol, self._depth):
+                self.on_order_book(venue, book)
+        except Exception:
+            logger.exception("order book stream of %s on %s stopped", symbol, venue)
+
+
+def _rank(
+    side: Literal["buy", "sell"], effective_price: float, rtt: float | None
+) -> tuple[float, float]:
+    """
+    실효 가격이 좋은 순서, 같으면 RTT 중앙값이 짧은 거래소가 먼저입니다. (RTT 표본이 없는 거래소는 뒤로 갑니다)
+    """
+    return (
+        effective_price if side == "buy" else -effective_price,
+        math.inf if rtt is None else rtt,
+    )
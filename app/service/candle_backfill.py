@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+
+import numpy as np
+import orjson
+
+from app.ccxt.api.market_data import MarketData
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.core.timeframe import timeframe_to_ms
+
+
+class BackfillCheckpoint:
+    """
+    백필 진행 상황(다음에 받아야 할 since)을 JSON 파일에 기록합니다.
+    작업이 중단되면 같은 파일로 다시 시작해 마지막으로 소비된 구간 이후부터 이어받습니다.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._progress: dict[str, int] = orjson.loads(path.read_bytes()) if path.exists() else {}
+
+    def load(self, key: str) -> int | None:
+        return self._progress.get(key)
+
+    def save(self, key: str, since: int) -> None:
+        self._progress[key] = since
+
+        # 중간에 프로세스가 죽어도 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체합니다.
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(self._path.suffix + ".tmp")
+        tmp_path.write_bytes(orjson.dumps(self._progress))
+        os.replace(tmp_path, self._path)
+
+
+class CandleBackfill:
+    """
+    [since, until) 구간을 page_limit 크기의 윈도우로 나누어 동시에 fetch_ohlcv를 호출합니다.
+    요청 속도는 ccxt 클라이언트의 rate limiter(enableRateLimit)가 조절하고,
+    결과는 시간 순서대로 청크 단위로 흘려보내므로 전체 구간을 메모리에 올리지 않습니다.
+    checkpoint에는 실제로 받은 마지막 봉 다음 시각을 기록합니다.
+    """
+
+    def __init__(
+        self,
+        market_data: MarketData,
+        page_limit: int = 1000,
+        max_concurrency: int = 8,
+        checkpoint: BackfillCheckpoint | None = None,
+    ) -> None:
+        if page_limit <= 0 or max_concurrency <= 0:
+            raise ValueError("page_limit and max_concurrency must be positive.")
+
+        self._market_data = market_data
+        self._page_limit = page_limit
+        self._max_concurrency = max_concurrency
+        self._checkpoint = checkpoint
+
+    def checkpoint_key(self, ticker: str, timeframe: str) -> str:
+        return ":".join(
+            (self._market_data.exchange_id, self._market_data.market_type.value, ticker, timeframe)
+        )
+
+    async def stream(
+        self, ticker: str, timeframe: str, since: int, until: int | None = None
+    ) -> AsyncIterator[CandleArrayDTO]:
+        """
+        since <= timestamp < until 구간의 캔들을 청크(CandleArrayDTO) 단위로 반환합니다. (밀리초)
+        checkpoint가 있으면 저장된 위치부터 재개하고, 청크가 소비될 때마다 위치를 갱신합니다.
+        """
+        step = timeframe_to_ms(timeframe)
+        until = until if until is not None else int(time.time() * 1000)
+        key = self.checkpoint_key(ticker, timeframe)
+
+        if self._checkpoint is not None:
+            since = max(since, self._checkpoint.load(key) or since)
+
+        windows = self._windows(since, until, step)
+        pending: deque[asyncio.Task[CandleArrayDTO]] = deque()
+        last_timestamp = since - 1
+
+        try:
+            while True:
+                # 앞선 청크가 소비될 때까지 최대 max_concurrency 개의 윈도우만 미리 받아 둡니다.
+                while (
+                    len(pending) < self._max_concurrency
+                    and (window := next(windows, None)) is not None
+                ):
+                    start, end = window
+                    pending.append(
+                        asyncio.create_task(self._fetch_window(ticker, timeframe, start, end, step))
+                    )
+
+                if not pending:
+                    break
+
+                task = pending.popleft()
+                chunk = self._dedupe(await task, last_timestamp)
+                if len(chunk) > 0:
+                    last_timestamp = int(chunk.timestamp[-1])
+                    yield chunk
+
+                    # 실제로 받은 마지막 봉 다음까지만 기록해서 빠진 봉을 건너뛰지 않습니다.
+                    if self._checkpoint is not None:
+                        self._checkpoint.save(key, last_timestamp + step)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def fetch(
+        self, ticker: str, timeframe: str, since: int, until: int | None = None
+    ) -> CandleArrayDTO:
+        chunks = [chunk async for chunk in self.stream(ticker, timeframe, since, until)]
+        return CandleArrayDTO.concat(chunks)
+
+    def _windows(self, since: int, until: int, step: int) -> Iterator[tuple[int, int]]:
+        span = step * self._page_limit
+        start = since - since % step
+        while start < until:
+            yield start, min(start + span, until)
+            start += span
+
+    async def _fetch_window(
+        self, ticker: str, timeframe: str, start: int, end: int, step: int
+    ) -> CandleArrayDTO:
+        """
+        거래소가 page_limit보다 적게 돌려줘도(거래소 최대 개수가 더 작은 경우 등) 윈도우 끝까지
+        마지막으로 받은 봉 다음부터 이어서 받습니다. 빈 페이지가 오면 더 받을 봉이 없는 것으로 봅니다.
+        """
+        chunks: list[CandleArrayDTO] = []
+        cursor = start
+        while cursor < end:
+            candles = await self._market_data.fetch_candles(
+                ticker, timeframe, since=cursor, limit=self._page_limit, columnar=True
+            )
+            page = candles.between(cursor, end)
+            if len(page) == 0:
+                break
+            chunks.append(page)
+            cursor = int(page.timestamp[-1]) + step
+        return chunks[0] if len(chunks) == 1 else CandleArrayDTO.concat(chunks)
+
+    def _dedupe(self, chunk: CandleArrayDTO, last_timestamp: int) -> CandleArrayDTO:
+        chunk = chunk.between(last_timestamp + 1)
+        if len(chunk) < 2 or bool(np.all(np.diff(chunk.timestamp) > 0)):
+            return chunk
+
+        _, first_index = np.unique(chunk.timestamp, return_index=True)
+        return chunk.take(first_index)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from app.ccxt.api.market_data import MarketData
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.ccxt.enums.market_type import MarketType
+from app.core.timeframe import timeframe_to_ms
+from app.service.candle_backfill import CandleBackfill
+
+# timestamp는 마지막에 기록합니다. 읽을 때는 timestamp 길이까지만 유효한 행으로 취급하므로
+# 가격 컬럼을 쓰는 도중에 프로세스가 죽어도 반쯤 쓰인 행이 노출되지 않습니다.
+_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("open", "<f8"),
+    ("high", "<f8"),
+    ("low", "<f8"),
+    ("close", "<f8"),
+    ("volume", "<f8"),
+    ("timestamp", "<i8"),
+)
+_ITEM_SIZE = 8
+
+
+@dataclass(slots=True, frozen=True)
+class CandleStoreKey:
+    exchange: str  # binance
+    market_type: MarketType  # MarketType.FUTURE
+    symbol: str  # BTC/USDT:USDT
+    timeframe: str  # 1m
+
+    def directory(self, root: Path) -> Path:
+        symbol = self.symbol.replace("/", "-").replace(":", "_")
+        return root / self.exchange / self.market_type.value / symbol / self.timeframe
+
+
+class CandleStore:
+    """
+    캔들을 exchange/market_type/symbol/timeframe 디렉터리 아래 컬럼별 append-only 바이너리 파일
+    (little-endian int64/float64)로 저장합니다. 읽기는 np.memmap 기반이라 복사 없이 구간을 잘라냅니다.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+
+    def key(self, market_data: MarketData, ticker: str, timeframe: str) -> CandleStoreKey:
+        return CandleStoreKey(
+            exchange=market_data.exchange_id,
+            market_type=market_data.market_type,
+            symbol=ticker,
+            timeframe=timeframe,
+        )
+
+    def count(self, key: CandleStoreKey) -> int:
+        directory = key.directory(self._root)
+        sizes = [
+            (directory / f"{name}.bin").stat().st_size
+            for name, _ in _COLUMNS
+            if (directory / f"{name}.bin").exists()
+        ]
+        return min(sizes) // _ITEM_SIZE if len(sizes) == len(_COLUMNS) else 0
+
+    def last_timestamp(self, key: CandleStoreKey) -> int | None:
+        count = self.count(key)
+        if count == 0:
+            return None
+
+        path = key.directory(self._root) / "timestamp.bin"
+        with path.open("rb") as f:
+            f.seek((count - 1) * _ITEM_SIZE)
+            return int(np.frombuffer(f.read(_ITEM_SIZE), dtype="<i8")[0])
+
+    # ---------------------------------------------------------
+    # Read / Write
+    # ---------------------------------------------------------
+    def read(
+        self, key: CandleStoreKey, start: int | None = None, end: int | None = None
+    ) -> CandleArrayDTO:
+        """
+        start <= timestamp < end 구간을 memory-map된 read-only 배열의 view로 반환합니다.
+        """
+        count = self.count(key)
+        if count == 0:
+            return CandleArrayDTO.empty()
+
+        directory = key.directory(self._root)
+        columns: dict[str, npt.NDArray[Any]] = {
+            name: np.memmap(directory / f"{name}.bin", dtype=dtype, mode="r", shape=(count,))
+            for name, dtype in _COLUMNS
+        }
+        return CandleArrayDTO(**columns).between(start, end)
+
+    def append(self, key: CandleStoreKey, candles: CandleArrayDTO) -> int:
+        """
+        저장된 마지막 봉 이후의 캔들만 추가하고, 추가된 개수를 반환합니다.
+        """
+        last_timestamp = self.last_timestamp(key)
+        if last_timestamp is not None:
+            candles = candles.between(last_timestamp + 1)
+        if len(candles) == 0:
+            return 0
+
+        directory = key.directory(self._root)
+        directory.mkdir(parents=True, exist_ok=True)
+        self._truncate(directory, self.count(key))
+
+        for name, dtype in _COLUMNS:
+            with (directory / f"{name}.bin").open("ab") as f:
+                np.ascontiguousarray(getattr(candles, name), dtype=dtype).tofile(f)
+                f.flush()
+                os.fsync(f.fileno())
+
+        return len(candles)
+
+    # ---------------------------------------------------------
+    # Exchange Sync
+    # ---------------------------------------------------------
+    async def sync(
+        self,
+        market_data: MarketData,
+        ticker: str,
+        timeframe: str,
+        since: int,
+        until: int | None = None,
+        backfill: CandleBackfill | None = None,
+    ) -> CandleArrayDTO:
+        """
+        로컬에 없는 마지막 구간만 거래소에서 받아 저장한 뒤 [since, until) 구간을 반환합니다.
+        저장소는 append-only 이므로 이미 저장된 첫 봉보다 앞선 구간은 채우지 않으며,
+        아직 마감되지 않은 현재 봉은 저장하지 않습니다.
+        """
+        key = self.key(market_data, ticker, timeframe)
+        backfill = backfill or CandleBackfill(market_data)
+        step = timeframe_to_ms(timeframe)
+
+        now = int(time.time() * 1000)
+        until = min(until if until is not None else now, now - now % step)
+
+        last_timestamp = self.last_timestamp(key)
+        fetch_since = since if last_timestamp is None else last_timestamp + step
+
+        async for chunk in backfill.stream(ticker, timeframe, since=fetch_since, until=until):
+            self.append(key, chunk)
+
+        return self.read(key, since, until)
+
+    def _truncate(self, directory: Path, count: int) -> None:
+        # 이전 append가 중간에 끊겨 timestamp보다 길어진 컬럼 파일을 잘라냅니다.
+        for name, _ in _COLUMNS:
+            path = directory / f"{name}.bin"
+            if path.exists() and path.stat().st_size != count * _ITEM_SIZE:
+                os.truncate(path, count * _ITEM_SIZE)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+
+import numpy as np
+
+from app.ccxt.domain.exchange import Exchange
+from app.ccxt.dtos.latency_dto import LatencyDTO, LatencyStatsDTO
+from app.core.metrics import EXCHANGE_CLOCK_OFFSET_SECONDS, EXCHANGE_RTT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+type LatencySampler = Callable[[], Awaitable[LatencyDTO]]
+
+
+class ClockMonitor:
+    """
+    거래소별 fetch_time 왕복을 주기적으로 재서 RTT 분포와 서버 시각 차이(offset)를 추정합니다.
+
+    - offset: 최근 window개 표본 중 RTT가 가장 짧은 표본의 값을 씁니다. (NTP와 같은 방식, 오차 ±RTT/2)
+    - apply(): ccxt 클라이언트의 options['timeDifference'](서명 timestamp 보정)와 recvWindow를 맞춥니다.
+      attach()한 클라이언트에는 start() 이후 표본을 받을 때마다 다시 반영합니다.
+    - ranked(): RTT 중앙값이 작은 거래소 순서. 거래소 선택(BestPriceRouter 동률 처리 등)에 씁니다.
+
+    Example:
+        monitor = ClockMonitor({"binance": binance_data.fetch_latency, "bybit": bybit_data.fetch_latency})
+        monitor.attach("binance", binance)
+        monitor.start()
+        monitor.stats("binance")  # LatencyStatsDTO
+    """
+
+    def __init__(
+        self,
+        samplers: Mapping[str, LatencySampler],
+        interval: float = 10.0,
+        window: int = 60,
+        min_recv_window: int | None = None,
+        max_recv_window: int = 60_000,
+    ) -> None:
+        """
+        min_recv_window(ms)를 주면 apply()가 recvWindow를 max(min_recv_window, 2 x p99 RTT + offset 오차)로
+        맞춥니다. 없으면 recvWindow는 ccxt 기본값을 그대로 둡니다.
+        """
+        self._samplers = dict(samplers)
+        self._interval = interval
+        self._window = window
+        self._min_recv_window = min_recv_window
+        self._max_recv_window = max_recv_window
+
+        self._samples: dict[str, deque[LatencyDTO]] = {
+            venue: deque(maxlen=window) for venue in self._samplers
+        }
+        self._exchanges: dict[str, list[Exchange]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    # ---------------------------------------------------------
+    # Sampling
+    # ---------------------------------------------------------
+    async def sample(self) -> dict[str, LatencyDTO]:
+        """
+        모든 거래소에서 표본을 하나씩 동시에 받습니다. 실패한 거래소는 결과에서 빠집니다.
+        """
+        venues = list(self._samplers)
+        results = await asyncio.gather(
+            *(self._samplers[venue]() for venue in venues), return_exceptions=True
+        )
+
+        samples = {}
+        for venue, result in zip(venues, results, strict=True):
+            if isinstance(result, LatencyDTO):
+                self.on_sample(venue, result)
+                samples[venue] = result
+            else:
+                logger.warning("failed to sample latency of %s: %r", venue, result)
+        return samples
+
+    def on_sample(self, venue: str, sample: LatencyDTO) -> None:
+        self._samples.setdefault(venue, deque(maxlen=self._window)).append(sample)
+        EXCHANGE_RTT_SECONDS.labels(venue).observe(sample.rtt / 1000)
+        EXCHANGE_CLOCK_OFFSET_SECONDS.labels(venue).set(self.offset(venue) / 1000)
+
+    def attach(self, venue: str, exchange: Exchange) -> None:
+        """
+        표본을 받을 때마다 apply()할 클라이언트를 등록합니다.
+        """
+        self._exchanges.setdefault(venue, []).append(exchange)
+        if self._samples.get(venue):
+            self.apply(venue, exchange)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._sample_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    # ---------------------------------------------------------
+    # Lookup
+    # ---------------------------------------------------------
+    def stats(self, venue: str) -> LatencyStatsDTO | None:
+        samples = self._samples.get(venue)
+        if not samples:
+            return None
+
+        rtts = np.fromiter((sample.rtt for sample in samples), dtype=np.float64, count=len(samples))
+        p50, p90, p99 = (float(p) for p in np.percentile(rtts, (50, 90, 99)))
+        best = self._best(samples)
+        return LatencyStatsDTO(
+            venue=venue,
+            samples=len(samples),
+            rtt_p50=p50,
+            rtt_p90=p90,
+            rtt_p99=p99,
+            offset=best.offset,
+            offset_error=best.rtt / 2,
+        )
+
+    def offset(self, venue: str) -> float:
+        """
+        서버 시각 - 로컬 시각(ms). 표본이 없으면 0입니다.
+        """
+        samples = self._samples.get(venue)
+        return self._best(samples).offset if samples else 0.0
+
+    def server_time(self, venue: str) -> int:
+        """
+        지금 거래소 서버 시각의 추정값(ms). 주문 timestamp를 직접 만들 때 씁니다.
+        """
+        return int(time.time() * 1000 + self.offset(venue))
+
+    def rtt(self, venue: str, percentile: float = 50.0) -> float | None:
+        samples = self._samples.get(venue)
+        if not samples:
+            return None
+        return float(np.percentile([sample.rtt for sample in samples], percentile))
+
+    def recv_window(self, venue: str) -> int | None:
+        stats = self.stats(venue)
+        if self._min_recv_window is None or stats is None:
+            return None
+        window = max(self._min_recv_window, 2 * stats.rtt_p99 + stats.offset_error)
+        return int(min(window, self._max_recv_window))
+
+    def ranked(self, venues: Iterable[str] | None = None) -> list[str]:
+        """
+        RTT 중앙값이 작은 순서. 표본이 없는 거래소는 뒤로 갑니다.
+        """
+        venues = list(venues if venues is not None else self._samplers)
+        median = {venue: self.rtt(venue) for venue in venues}
+        return sorted(venues, key=lambda venue: (median[venue] is None, median[venue] or 0.0))
+
+    # ---------------------------------------------------------
+    # Client Sync
+    # ---------------------------------------------------------
+    def apply(self, venue: str, exchange: Exchange) -> None:
+        """
+        ccxt가 서명 timestamp를 milliseconds() - timeDifference로 만들도록 offset을 반영합니다.
+        """
+        if not self._samples.get(venue):
+            return
+        exchange.client.options["timeDifference"] = round(-self.offset(venue))
+        recv_window = self.recv_window(venue)
+        if recv_window is not None:
+            exchange.client.options["recvWindow"] = recv_window
+
+    # ---------------------------------------------------------
+    # Internal
+    # ---------------------------------------------------------
+    async def _sample_loop(self) -> None:
+        while True:
+            try:
+                samples = await self.sample()
+            except Exception:
+                logger.exception("failed to sample exchange latency")
+            else:
+                for venue in samples:
+                    for exchange in self._exchanges.get(venue, []):
+                        self.apply(venue, exchange)
+            await asyncio.sleep(self._interval)
+
+    @staticmethod
+    def _best(samples: Iterable[LatencyDTO]) -> LatencyDTO:
+        return min(samples, key=lambda sample: sample.rtt)
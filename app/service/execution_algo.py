@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any, ClassVar, Literal
+
+import numpy as np
+
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.ccxt.dtos.order.execution_report_dto import ExecutionReportDTO
+from app.ccxt.dtos.order.limit.limit_order_request_dto import LimitOrderRequestDTO
+from app.ccxt.dtos.order.market.market_order_request_dto import MarketOrderRequestDTO
+from app.ccxt.dtos.order.order_update_dto import OrderUpdateDTO
+from app.ccxt.enums.time_in_force import TimeInForce
+from app.service.order_manager import OrderManager, new_client_order_id
+
+logger = logging.getLogger(__name__)
+
+_DAY_MS = 86_400_000
+
+
+class ExecutionAlgo(ABC):
+    """
+    부모 주문 하나를 자식 주문으로 나눠 내는 알고리즘의 공통 설정입니다.
+
+    - price가 없으면 자식 주문은 시장가, 있으면 그 가격의 지정가(time_in_force)입니다.
+    - IOC/FOK 자식 주문의 미체결분은 다음 자식 주문에 더해집니다.
+    - params는 자식 주문마다 그대로 전달됩니다. (선물 청산: {"reduceOnly": True})
+    """
+
+    name: ClassVar[str]
+
+    def __init__(
+        self,
+        side: Literal["buy", "sell"],
+        symbol: str,
+        amount: float,
+        price: float | None = None,
+        time_in_force: TimeInForce = TimeInForce.IOC,
+        min_amount: float = 0.0,
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        if amount <= 0:
+            raise ValueError(f"parent amount must be positive, got {amount}")
+        self.side = side
+        self.symbol = symbol
+        self.amount = amount
+        self.price = price
+        self.time_in_force = time_in_force
+        self.min_amount = min_amount
+        self.params = params or {}
+
+    @abstractmethod
+    async def execute(self, execution: Execution) -> None: ...
+
+
+class TWAP(ExecutionAlgo):
+    """
+    duration 초 동안 slices 개로 같은 수량씩 나눠 일정한 간격으로 냅니다.
+    """
+
+    name = "twap"
+
+    def __init__(
+        self,
+        side: Literal["buy", "sell"],
+        symbol: str,
+        amount: float,
+        duration: float,
+        slices: int,
+        **options: Any,
+    ) -> None:
+        super().__init__(side, symbol, amount, **options)
+        if slices <= 0:
+            raise ValueError(f"slices must be positive, got {slices}")
+        self.duration = duration
+        self.weights = np.full(slices, 1.0 / slices)
+
+    async def execute(self, execution: Execution) -> None:
+        await execution.follow_schedule(self.weights, self.duration)
+
+
+class VWAP(TWAP):
+    """
+    과거 거래량 분포(volume_profile)에 비례하도록 구간마다 수량을 나눠 냅니다.
+    """
+
+    name = "vwap"
+
+    def __init__(
+        self,
+        side: Literal["buy", "sell"],
+        symbol: str,
+        amount: float,
+        duration: float,
+        profile: Sequence[float],
+        **options: Any,
+    ) -> None:
+        super().__init__(side, symbol, amount, duration, len(profile), **options)
+        weights = np.asarray(profile, dtype=np.float64)
+        if (weights < 0).any() or weights.sum() <= 0:
+            raise ValueError("volume profile must be non-negative with a positive sum")
+        self.weights = weights / weights.sum()
+
+
+class Iceberg(ExecutionAlgo):
+    """
+    display 수량만 보이는 지정가(GTC)를 하나씩 걸고, 체결되면 다음 조각을 겁니다.
+    """
+
+    name = "iceberg"
+
+    def __init__(
+        self,
+        side: Literal["buy", "sell"],
+        symbol: str,
+        amount: float,
+        price: float,
+        display: float,
+        **options: Any,
+    ) -> None:
+        options.setdefault("time_in_force", TimeInForce.GTC)
+        super().__init__(side, symbol, amount, price=price, **options)
+        if display <= 0:
+            raise ValueError(f"display amount must be positive, got {display}")
+        self.display = display
+
+    async def execute(self, execution: Execution) -> None:
+        while execution.remaining > max(self.min_amount, 1e-12):
+            update = await execution.child(min(self.display, execution.remaining))
+            if update.filled == 0:
+                # 취소/만료되어 체결 없이 끝난 조각 -> 부모도 멈춥니다.
+                return
+
+
+def volume_profile(candles: CandleArrayDTO, buckets: int) -> np.ndarray:
+    """
+    하루를 buckets 구간으로 나눈 시간대별 평균 거래량 비중. VWAP(profile=...)에 사용합니다.
+    """
+    bucket = (candles.timestamp % _DAY_MS) * buckets // _DAY_MS
+    volume = np.bincount(bucket, weights=candles.volume, minlength=buckets)
+    total = volume.sum()
+    return volume / total if total > 0 else np.full(buckets, 1.0 / buckets)
+
+
+class Execution:
+    """
+    실행 중인 부모 주문 하나의 상태. 알고리즘은 child()로 자식 주문을 내고 결과를 기다립니다.
+    """
+
+    def __init__(self, parent_id: str, algo: ExecutionAlgo, manager: OrderManager) -> None:
+        self.parent_id = parent_id
+        self.algo = algo
+        self._manager = manager
+        self.filled = 0.0
+        self.cost = 0.0
+        self.children: list[str] = []  # 이 부모 주문이 낸 자식 주문의 client order id
+        self.status: Literal["running", "done", "canceled", "failed"] = "running"
+        self.error: str | None = None
+
+    @property
+    def remaining(self) -> float:
+        return max(self.algo.amount - self.filled, 0.0)
+
+    def report(self) -> ExecutionReportDTO:
+        return ExecutionReportDTO(
+            parent_id=self.parent_id,
+            algo=self.algo.name,
+            symbol=self.algo.symbol,
+            side=self.algo.side,
+            amount=self.algo.amount,
+            filled=self.filled,
+            average=self.cost / self.filled if self.filled else None,
+            children=len(self.children),
+            status=self.status,
+            error=self.error,
+        )
+
+    async def child(self, amount: float) -> OrderUpdateDTO:
+        """
+        자식 주문을 내고 끝날 때까지 기다립니다.
+        부모 id는 스케줄러마다 따로 세므로, 자식 주문 id는 거래소 전체에서 겹치지 않도록 새로 만듭니다.
+        """
+        algo = self.algo
+        client_order_id = new_client_order_id()
+        self.children.append(client_order_id)
+
+        if algo.price is None:
+            update = await self._manager.submit_market(
+                algo.side,
+                MarketOrderRequestDTO(algo.symbol, amount),
+                client_order_id=client_order_id,
+                params=algo.params,
+            )
+        else:
+            update = await self._manager.submit_limit(
+                algo.side,
+                LimitOrderRequestDTO(algo.symbol, amount, algo.price, algo.time_in_force),
+                client_order_id=client_order_id,
+                params=algo.params,
+            )
+
+        if not update.status.is_final:
+            update = await self._manager.wait(client_order_id)
+
+        self._settle(update)
+        return update
+
+    async def follow_schedule(self, weights: np.ndarray, duration: float) -> None:
+        """
+        구간 i가 끝날 때까지 누적 목표 수량 amount x sum(weights[:i+1])을 채우도록 자식 주문을 냅니다.
+        간격은 시작 시각 기준으로 계산해서 자식 주문 지연이 누적되지 않습니다.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        interval = duration / len(weights)
+        targets = self.algo.amount * np.cumsum(weights)
+        targets[-1] = self.algo.amount
+
+        for i, target in enumerate(targets.tolist()):
+            amount = target - self.filled
+            if amount > max(self.algo.min_amount, 1e-12):
+                await self.child(amount)
+            if i < len(targets) - 1:
+                await asyncio.sleep(max(started + interval * (i + 1) - loop.time(), 0.0))
+
+    async def cancel_children(self) -> None:
+        """
+        남아 있는 자식 주문을 취소하고, 취소 전까지 체결된 수량을 부모에 더합니다.
+        child()가 기다리는 도중 취소되면 그 자식 주문의 체결분은 여기서만 반영됩니다.
+        """
+        for client_order_id in self.children:
+            update = self._manager.get(client_order_id)
+            if update is None:
+                continue  # child()에서 이미 반영하고 지운 주문
+            if not update.status.is_final and update.id is not None:
+                update = await self._manager.cancel(client_order_id)
+            self._settle(update)
+
+    def _settle(self, update: OrderUpdateDTO) -> None:
+        self.filled += update.filled
+        self.cost += update.filled * (update.average or update.price or 0.0)
+        self._manager.forget(update.client_order_id)
+
+
+class ExecutionScheduler:
+    """
+    여러 부모 주문(알고리즘)을 하나의 이벤트 루프에서 동시에 실행합니다.
+    max_active를 주면 동시에 실행되는 부모 주문 수를 제한하고 나머지는 순서대로 기다립니다.
+
+    Example:
+        scheduler = ExecutionScheduler(order_manager)
+        parent_id = scheduler.submit(TWAP("buy", "BTC/USDT", 5.0, duration=600, slices=20))
+        report = await scheduler.wait(parent_id)
+    """
+
+    def __init__(self, manager: OrderManager, max_active: int | None = None) -> None:
+        self._manager = manager
+        self._semaphore = asyncio.Semaphore(max_active) if max_active else None
+        self._executions: dict[str, Execution] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._ids = itertools.count(1)
+
+    def submit(self, algo: ExecutionAlgo, parent_id: str | None = None) -> str:
+        parent_id = parent_id or f"{algo.name}-{next(self._ids)}"
+        if parent_id in self._executions:
+            raise ValueError(f"parent order {parent_id!r} already exists")
+
+        execution = Execution(parent_id, algo, self._manager)
+        self._executions[parent_id] = execution
+        self._tasks[parent_id] = asyncio.create_task(self._run(execution))
+        return parent_id
+
+    def report(self, parent_id: str) -> ExecutionReportDTO:
+        return self._executions[parent_id].report()
+
+    def reports(self) -> list[ExecutionReportDTO]:
+        return [execution.report() for execution in self._executions.values()]
+
+    def active(self) -> list[str]:
+        return [parent_id for parent_id, task in self._tasks.items() if not task.done()]
+
+    async def wait(self, parent_id: str) -> ExecutionReportDTO:
+        await asyncio.wait({self._tasks[parent_id]})
+        return self.report(parent_id)
+
+    async def cancel(self, parent_id: str) -> ExecutionReportDTO:
+        task = self._tasks[parent_id]
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        return self.report(parent_id)
+
+    async def close(self) -> None:
+        for parent_id in self.active():
+            await self.cancel(parent_id)
+
+    async def _run(self, execution: Execution) -> None:
+        try:
+            if self._semaphore is None:
+                await execution.algo.execute(execution)
+            else:
+                async with self._semaphore:
+                    await execution.algo.execute(execution)
+        except asyncio.CancelledError:
+            execution.status = "canceled"
+            await execution.cancel_children()
+            raise
+        except Exception as e:
+            logger.exception("execution %s failed", execution.parent_id)
+            execution.status = "failed"
+            execution.error = str(e)
+            await execution.cancel_children()
+        else:
+            execution.status = "done"
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from app.ccxt.api.market_data import MarketData
+from app.ccxt.dtos.funding_history_array_dto import FundingHistoryArrayDTO
+from app.core.timeframe import timeframe_to_ms
+
+logger = logging.getLogger(__name__)
+
+_YEAR_MS = 365 * 24 * 60 * 60 * 1000
+
+# fetch_funding_rate_history 한 번에 받을 수 있는 최대 개수
+_MAX_PAGE_LIMITS: dict[str, int] = {"binance": 1000, "bybit": 200}
+
+
+@dataclass(slots=True, frozen=True)
+class FundingPanel:
+    """
+    시각 x 심볼 funding rate 행렬입니다. 행은 step 간격의 격자(구간 시작 시각), 열은 symbols 순서입니다.
+
+    - 한 칸 안의 정산은 합산하므로 정산 주기가 step보다 짧은 심볼(1h, 4h)도 step당 funding으로 비교됩니다.
+      step은 가장 긴 정산 주기 이상이어야 합니다. (보통 '8h')
+    - 정산이 없는 칸(상장 전, 누락)은 NaN이고 모든 통계에서 제외합니다.
+    - 통계는 모든 심볼을 한 번에 계산합니다. 표준편차는 모집단 표준편차(ddof=0)입니다.
+    """
+
+    symbols: tuple[str, ...]  # ("BTC/USDT:USDT", "ETH/USDT:USDT", ...)
+    timestamp: npt.NDArray[np.int64]  # (T,) [1755360000000, 1755388800000, ...]
+    rates: npt.NDArray[np.float64]  # (T, N) [[0.0001, 0.00005, ...], ...]
+    step: int  # 28800000 (ms)
+
+    @property
+    def periods_per_year(self) -> float:
+        return _YEAR_MS / self.step
+
+    def column(self, symbol: str) -> npt.NDArray[np.float64]:
+        return self.rates[:, self.symbols.index(symbol)]
+
+    def annualized_carry(self, periods: int | None = None) -> npt.NDArray[np.float64]:
+        """
+        최근 periods행(기본값 전체) 평균 funding x 연간 step 수. 값이 하나도 없는 심볼은 NaN
+        """
+        rates = self.rates if periods is None else self.rates[-periods:]
+        valid = ~np.isnan(rates)
+        count = valid.sum(axis=0)
+        total = np.where(valid, rates, 0.0).sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(count > 0, total / count, np.nan) * self.periods_per_year
+
+    def rolling_mean(self, periods: int, min_periods: int | None = None) -> npt.NDArray[np.float64]:
+        """
+        최근 periods행 이동 평균. 창 안의 값이 min_periods(기본값 periods)개보다 적으면 NaN
+        """
+        mean, _ = self._rolling(periods, min_periods)
+        return mean
+
+    def rolling_std(self, periods: int, min_periods: int | None = None) -> npt.NDArray[np.float64]:
+        _, std = self._rolling(periods, min_periods)
+        return std
+
+    def zscore(self, periods: int, min_periods: int | None = None) -> npt.NDArray[np.float64]:
+        """
+        (funding - 이동 평균) / 이동 표준편차. 창에는 현재 행도 포함합니다. 표준편차가 0이면 NaN
+        """
+        mean, std = self._rolling(periods, min_periods)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(std > 0, (self.rates - mean) / std, np.nan)
+
+    def ranked(self, periods: int | None = None) -> list[str]:
+        """
+        연환산 carry가 큰 순서. 값이 없는 심볼은 뒤로 갑니다.
+        """
+        carry = self.annualized_carry(periods)
+        order = np.argsort(np.where(np.isnan(carry), -np.inf, -carry), kind="stable")
+        return [self.symbols[i] for i in order]
+
+    def _rolling(
+        self, periods: int, min_periods: int | None
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """
+        누적합 차이로 창 합계를 구합니다. (O(T x N), 창 크기와 무관)
+        자리수 손실을 줄이기 위해 심볼별 평균을 빼고 누적합니다.
+        """
+        if periods <= 0:
+            raise ValueError(f"periods must be positive, got {periods}")
+        min_periods = periods if min_periods is None else min_periods
+
+        valid = ~np.isnan(self.rates)
+        count = valid.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            center = np.where(count > 0, np.where(valid, self.rates, 0.0).sum(axis=0) / count, 0.0)
+        values = np.where(valid, self.rates - center, 0.0)
+
+        def window_sum(x: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+            total = np.cumsum(x, axis=0)
+            total[periods:] -= total[:-periods].copy()
+            return total
+
+        n = window_sum(valid.astype(np.float64))
+        s1 = window_sum(values)
+        s2 = window_sum(values * values)
+        ready = n >= max(min_periods, 1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = s1 / n
+            var = np.maximum(s2 / n - mean * mean, 0.0)
+        return np.where(ready, center + mean, np.nan), np.where(ready, np.sqrt(var), np.nan)
+
+
+class FundingHistoryStore:
+    """
+    심볼별 과거 funding rate를 FundingHistoryArrayDTO로 메모리에 보관합니다.
+
+    - download()는 since 커서로 페이지를 넘기며 받고, top_up()은 심볼마다 마지막 정산 이후만 동시에 받습니다.
+    - panel()은 여러 심볼을 시각 x 심볼 행렬(FundingPanel)로 정렬해서 한 번에 통계를 계산합니다.
+
+    Example:
+        store = FundingHistoryStore(MarketData(exchange))
+        await store.top_up(perps, since=now - 90 * 86_400_000)   # 이후에는 정산 주기마다 다시 호출
+        panel = store.panel(step="8h")
+        panel.ranked(periods=21)   # 최근 7일 연환산 carry 순서
+    """
+
+    def __init__(
+        self, market_data: MarketData, page_limit: int = 1000, max_concurrency: int = 16
+    ) -> None:
+        if page_limit <= 0 or max_concurrency <= 0:
+            raise ValueError("page_limit and max_concurrency must be positive.")
+
+        self._market_data = market_data
+        self._page_limit = min(
+            page_limit, _MAX_PAGE_LIMITS.get(market_data.exchange_id, page_limit)
+        )
+        self._max_concurrency = max_concurrency
+        self._histories: dict[str, FundingHistoryArrayDTO] = {}
+
+    def symbols(self) -> list[str]:
+        return list(self._histories)
+
+    def history(
+        self, symbol: str, start: int | None = None, end: int | None = None
+    ) -> FundingHistoryArrayDTO:
+        history = self._histories.get(symbol)
+        return (
+            history.between(start, end) if history is not None else FundingHistoryArrayDTO.empty()
+        )
+
+    def last_timestamp(self, symbol: str) -> int | None:
+        history = self._histories.get(symbol)
+        return int(history.timestamp[-1]) if history is not None and len(history) else None
+
+    def append(self, symbol: str, history: FundingHistoryArrayDTO) -> int:
+        """
+        저장된 마지막 정산 이후의 내역만 추가하고, 추가된 개수를 반환합니다.
+        """
+        last_timestamp = self.last_timestamp(symbol)
+        if last_timestamp is not None:
+            history = history.between(last_timestamp + 1)
+        if len(history) == 0:
+            return 0
+
+        current = self._histories.get(symbol)
+        self._histories[symbol] = (
+            FundingHistoryArrayDTO.concat([current, history]) if current is not None else history
+        )
+        return len(history)
+
+    # ---------------------------------------------------------
+    # Exchange Sync
+    # ---------------------------------------------------------
+    async def download(self, symbol: str, since: int, until: int | None = None) -> int:
+        """
+        [since, until) 구간을 since 커서로 페이지를 넘기며 받아 저장합니다.
+        page_limit보다 적은 페이지가 오면 끝난 것으로 봅니다. 그래서 page_limit은 거래소 최대값을 넘지 않도록
+        줄여서 사용합니다. (bybit는 since + limit x 정산 주기 구간에서 최신 200개까지만 돌려줍니다)
+        """
+        until = until if until is not None else int(time.time() * 1000)
+        cursor, added = since, 0
+
+        while cursor < until:
+            page = await self._market_data.fetch_funding_rate_history(
+                symbol, since=cursor, limit=self._page_limit
+            )
+            history = page.between(cursor, until)
+            added += self.append(symbol, history)
+            if len(page) < self._page_limit or len(history) == 0:
+                break
+            cursor = int(history.timestamp[-1]) + 1
+        return added
+
+    async def top_up(
+        self, symbols: Iterable[str], since: int, until: int | None = None
+    ) -> dict[str, int]:
+        """
+        심볼마다 저장된 마지막 정산 이후(없으면 since부터)를 최대 max_concurrency개씩 동시에 받습니다.
+        실패한 심볼은 기존 내역을 유지하고 결과에서 빠집니다.
+        """
+        symbols = list(symbols)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def top_up_one(symbol: str) -> int:
+            last_timestamp = self.last_timestamp(symbol)
+            async with semaphore:
+                return await self.download(
+                    symbol, since if last_timestamp is None else last_timestamp + 1, until
+                )
+
+        results = await asyncio.gather(
+            *(top_up_one(symbol) for symbol in symbols), return_exceptions=True
+        )
+        added: dict[str, int] = {}
+        for symbol, result in zip(symbols, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning("failed to fetch %s funding rate history: %r", symbol, result)
+            else:
+                added[symbol] = result
+        return added
+
+    # ---------------------------------------------------------
+    # Analytics
+    # ---------------------------------------------------------
+    def panel(
+        self,
+        symbols: Iterable[str] | None = None,
+        step: str = "8h",
+        start: int | None = None,
+        end: int | None = None,
+    ) -> FundingPanel:
+        """
+        [start, end) 구간의 정산을 step 격자에 맞춰 시각 x 심볼 행렬로 만듭니다.
+        start/end가 없으면 저장된 내역 전체를 덮는 격자를 씁니다.
+        """
+        symbols = tuple(symbols if symbols is not None else self._histories)
+        step_ms = timeframe_to_ms(step)
+        histories = [self.history(symbol, start, end) for symbol in symbols]
+        stored = [history for history in histories if len(history)]
+
+        if start is None:
+            start = min((int(h.timestamp[0]) for h in stored), default=0)
+        if end is None:
+            end = max((int(h.timestamp[-1]) + 1 for h in stored), default=start)
+        origin = start - start % step_ms
+        rows = max(-(-(end - origin) // step_ms), 0)
+
+        # 심볼마다의 (행, 열)을 평평한 인덱스로 바꿔 bincount 한 번으로 칸별 합계를 구합니다.
+        index = np.concatenate(
+            [
+                (history.timestamp - origin) // step_ms * len(symbols) + column
+                for column, history in enumerate(histories)
+            ]
+            or [np.empty(0, dtype=np.int64)]
+        )
+        rates = np.concatenate(
+            [history.funding_rate for history in histories] or [np.empty(0, dtype=np.float64)]
+        )
+        size = rows * len(symbols)
+        count = np.bincount(index, minlength=size)
+        total = np.bincount(index, weights=rates, minlength=size)
+
+        return FundingPanel(
+            symbols=symbols,
+            timestamp=origin + step_ms * np.arange(rows, dtype=np.int64),
+            rates=np.where(count > 0, total, np.nan).reshape(rows, len(symbols)),
+            step=step_ms,
+        )
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import math
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+
+from app.ccxt.api.market_data import MarketData
+from app.ccxt.dtos.liquidation_dto import LiquidationDTO, LiquidationSpikeDTO
+from app.ccxt.websocket.market_stream import MarketStream
+
+logger = logging.getLogger(__name__)
+
+type SpikeHandler = Callable[[LiquidationSpikeDTO], Awaitable[None] | None]
+
+
+class LiquidationWindow:
+    """
+    최근 window초 동안의 롱/숏 청산 금액을 bucket초 단위 칸으로 나눈 고정 크기 NumPy 배열(ring)에 모읍니다.
+
+    - 메모리: 칸 1개당 24 bytes (key int64, long/short float64), 청산 건수와 무관합니다.
+    - 칸의 key는 timestamp // bucket 입니다. 링을 한 바퀴 돈 칸은 새 key로 덮어쓰므로 따로 비우지 않습니다.
+    - 이미 덮어쓴 칸보다 오래된 청산은 window 밖이므로 버립니다.
+    """
+
+    __slots__ = ("_bucket", "_keys", "_long", "_short")
+
+    def __init__(self, window: float, bucket: float = 1.0) -> None:
+        if window <= 0 or bucket <= 0:
+            raise ValueError(f"window and bucket must be positive, got {window}, {bucket}")
+        size = math.ceil(window / bucket)
+        self._bucket = max(int(bucket * 1000), 1)
+        self._keys: npt.NDArray[np.int64] = np.full(size, -1, dtype=np.int64)
+        self._long: npt.NDArray[np.float64] = np.zeros(size, dtype=np.float64)
+        self._short: npt.NDArray[np.float64] = np.zeros(size, dtype=np.float64)
+
+    @property
+    def window(self) -> float:
+        return len(self._keys) * self._bucket / 1000
+
+    def add(self, timestamp: int, side: Literal["long", "short"], notional: float) -> bool:
+        key = timestamp // self._bucket
+        slot = key % len(self._keys)
+        current = self._keys[slot]
+        if key < current:
+            return False
+        if key > current:
+            self._keys[slot] = key
+            self._long[slot] = self._short[slot] = 0.0
+
+        if side == "long":
+            self._long[slot] += notional
+        else:
+            self._short[slot] += notional
+        return True
+
+    def totals(self, seconds: float | None = None, now: int | None = None) -> tuple[float, float]:
+        """
+        now(밀리초, 기본값 현재 시각)가 속한 칸부터 seconds초(기본값 window 전체) 동안의 (롱, 숏) 청산 금액.
+        seconds는 bucket 단위로 올림합니다.
+        """
+        now = now if now is not None else int(time.time() * 1000)
+        size = len(self._keys)
+        count = size if seconds is None else min(math.ceil(seconds * 1000 / self._bucket), size)
+        last = now // self._bucket
+        mask = (self._keys > last - count) & (self._keys <= last)
+        return float(self._long[mask].sum()), float(self._short[mask].sum())
+
+    def clear(self) -> None:
+        self._keys.fill(-1)
+
+
+@dataclass(slots=True)
+class _Subscription:
+    handler: SpikeHandler
+    threshold: float
+    seconds: float
+    symbol: str | None
+    side: Literal["long", "short"] | None
+
+
+class LiquidationFeed:
+    """
+    선물 청산을 REST(fetch_liquidations)와 스트림(watch_liquidations)으로 받아 심볼별 LiquidationWindow에 모으고,
+    최근 seconds초 청산 금액이 threshold를 넘는 순간 구독자 handler를 호출합니다.
+
+    - 판정은 청산 시각(거래소 시각) 기준이라 로컬 시계와 무관합니다.
+    - handler는 청산 하나가 합계를 threshold 아래에서 위로 올릴 때 한 번 호출됩니다. 합계가 내려갔다가
+      다시 넘으면 또 호출됩니다.
+    - async handler는 task로 실행하므로 같은 이벤트 루프에서 바로 주문(FutureOrder 등)을 낼 수 있습니다.
+    - backfill()은 집계만 채우고 handler를 호출하지 않습니다.
+
+    Example:
+        feed = LiquidationFeed(MarketData(exchange), stream=MarketStream(exchange), window=300)
+        feed.subscribe(on_spike, threshold=5_000_000, seconds=60, side="long")
+        feed.watch("BTC/USDT:USDT")
+    """
+
+    def __init__(
+        self,
+        market_data: MarketData,
+        stream: MarketStream | None = None,
+        window: float = 300.0,
+        bucket: float = 1.0,
+    ) -> None:
+        self._market_data = market_data
+        self._stream = stream
+        self._window = window
+        self._bucket = bucket
+        self._windows: dict[str, LiquidationWindow] = {}
+        self._subscriptions: list[_Subscription] = []
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._handlers: set[asyncio.Task[None]] = set()
+
+    def window(self, symbol: str) -> LiquidationWindow:
+        window = self._windows.get(symbol)
+        if window is None:
+            window = self._windows[symbol] = LiquidationWindow(self._window, self._bucket)
+        return window
+
+    # ---------------------------------------------------------
+    # Subscription
+    # ---------------------------------------------------------
+    def subscribe(
+        self,
+        handler: SpikeHandler,
+        threshold: float,
+        seconds: float = 60.0,
+        symbol: str | None = None,
+        side: Literal["long", "short"] | None = None,
+    ) -> Callable[[], None]:
+        """
+        symbol이 없으면 모든 심볼, side가 없으면 롱/숏 합계를 봅니다. 구독을 해제하는 함수를 반환합니다.
+        """
+        if threshold <= 0:
+            raise ValueError(f"threshold must be positive, got {threshold}")
+        if seconds > self._window:
+            raise ValueError(f"seconds must not exceed the window ({self._window}), got {seconds}")
+
+        subscription = _Subscription(handler, threshold, seconds, symbol, side)
+        self._subscriptions.append(subscription)
+
+        def unsubscribe() -> None:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+        return unsubscribe
+
+    def on_liquidation(self, liquidation: LiquidationDTO) -> None:
+        window = self.window(liquidation.symbol)
+        if not window.add(liquidation.timestamp, liquidation.side, liquidation.notional):
+            return
+
+        for subscription in self._subscriptions:
+            if subscription.symbol not in (None, liquidation.symbol):
+                continue
+            if subscription.side not in (None, liquidation.side):
+                continue
+
+            long, short = window.totals(subscription.seconds, liquidation.timestamp)
+            if subscription.side is None:
+                notional = long + short
+            else:
+                notional = long if subscription.side == "long" else short
+            if notional - liquidation.notional < subscription.threshold <= notional:
+                self._notify(
+                    subscription,
+                    LiquidationSpikeDTO(
+                        symbol=liquidation.symbol,
+                        side=subscription.side,
+                        notional=notional,
+                        threshold=subscription.threshold,
+                        window=subscription.seconds,
+                        timestamp=liquidation.timestamp,
+                    ),
+                )
+
+    def _notify(self, subscription: _Subscription, spike: LiquidationSpikeDTO) -> None:
+        try:
+            result = subscription.handler(spike)
+        except Exception:
+            logger.exception("liquidation handler failed for %s", spike.symbol)
+            return
+
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._handlers.add(task)
+            task.add_done_callback(self._on_handler_done)
+
+    def _on_handler_done(self, task: asyncio.Task[None]) -> None:
+        self._handlers.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("liquidation handler failed", exc_info=task.exception())
+
+    # ---------------------------------------------------------
+    # REST
+    # ---------------------------------------------------------
+    async def backfill(
+        self, symbol: str, since: int | None = None, limit: int | None = None
+    ) -> int:
+        """
+        REST로 받은 청산을 집계에 넣고 추가된 개수를 반환합니다. handler는 호출하지 않습니다.
+        """
+        liquidations = await self._market_data.fetch_liquidations(symbol, since=since, limit=limit)
+        window = self.window(symbol)
+        return sum(
+            window.add(liquidation.timestamp, liquidation.side, liquidation.notional)
+            for liquidation in liquidations
+        )
+
+    # ---------------------------------------------------------
+    # Streams
+    # ---------------------------------------------------------
+    def watch(self, symbol: str) -> None:
+        if self._stream is None:
+            raise RuntimeError("LiquidationFeed was created without a MarketStream.")
+        task = self._tasks.get(symbol)
+        if task is None or task.done():
+            self._tasks[symbol] = asyncio.create_task(self._watch_loop(self._stream, symbol))
+
+    async def stop(self) -> None:
+        for task in [*self._tasks.values(), *self._handlers]:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = {}
+        self._handlers = set()
+
+    async def _watch_loop(self, stream: MarketStream, symbol: str) -> None:
+        try:
+            async for liquidation in stream.watch_liquidations(symbol):
+                self.on_liquidation(liquidation)
+        except Exception:
+            logger.exception("liquidation stream of %s stopped", symbol)
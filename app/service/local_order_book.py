@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Sequence
+
+import ccxt.async_support as ccxt
+import numpy as np
+import numpy.typing as npt
+
+from app.ccxt.dtos.order_book_delta_dto import OrderBookDeltaDTO
+from app.ccxt.dtos.order_book_dto import OrderBookDTO, PriceLevelDTO
+from app.ccxt.exceptions.order_book_exception import OrderBookSyncError
+
+
+class BookSide:
+    """
+    한쪽 호가(bid 또는 ask)를 정렬된 NumPy 배열로 보관합니다.
+    bid는 가격에 -1을 곱한 key로 저장해서 양쪽 모두 index 0이 최우선 호가가 되도록 합니다.
+
+    - 최우선 호가 / 상위 N개: O(1) / O(N)
+    - 특정 가격까지의 누적 수량, 특정 수량을 채우는 가격: O(log n) (누적합은 변경 후 처음 조회할 때 계산)
+    """
+
+    __slots__ = ("_sign", "_keys", "_amounts", "_cumulative")
+
+    def __init__(self, descending: bool) -> None:
+        self._sign = -1.0 if descending else 1.0
+        self._keys: npt.NDArray[np.float64] = np.empty(0, dtype=np.float64)
+        self._amounts: npt.NDArray[np.float64] = np.empty(0, dtype=np.float64)
+        self._cumulative: npt.NDArray[np.float64] | None = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def load(self, levels: Sequence[PriceLevelDTO]) -> None:
+        keys, amounts = self._to_arrays(levels)
+        order = np.argsort(keys, kind="stable")
+        keys, amounts = keys[order], amounts[order]
+        keep = amounts > 0
+
+        self._keys, self._amounts = keys[keep], amounts[keep]
+        self._cumulative = None
+
+    def update(self, levels: Sequence[PriceLevelDTO]) -> None:
+        if len(levels) == 0:
+            return
+
+        keys, amounts = self._to_arrays(levels)
+
+        # 같은 가격이 한 업데이트에 여러 번 오면 마지막 값을 사용합니다.
+        keys, last_index = np.unique(keys[::-1], return_index=True)
+        amounts = amounts[::-1][last_index]
+
+        positions = np.searchsorted(self._keys, keys)
+        exists = positions < len(self._keys)
+        exists[exists] = self._keys[positions[exists]] == keys[exists]
+
+        self._amounts[positions[exists]] = amounts[exists]
+
+        insert = ~exists & (amounts > 0)
+        if insert.any():
+            self._keys = np.insert(self._keys, positions[insert], keys[insert])
+            self._amounts = np.insert(self._amounts, positions[insert], amounts[insert])
+
+        if (amounts == 0).any():
+            keep = self._amounts > 0
+            self._keys, self._amounts = self._keys[keep], self._amounts[keep]
+
+        self._cumulative = None
+
+    # ---------------------------------------------------------
+    # Reads
+    # ---------------------------------------------------------
+    def best(self) -> PriceLevelDTO | None:
+        if len(self._keys) == 0:
+            return None
+        return PriceLevelDTO(
+            price=float(self._sign * self._keys[0]), amount=float(self._amounts[0])
+        )
+
+    def top(self, limit: int | None = None) -> list[PriceLevelDTO]:
+        prices = (self._sign * self._keys[:limit]).tolist()
+        amounts = self._amounts[:limit].tolist()
+        return [
+            PriceLevelDTO(price=price, amount=amount)
+            for price, amount in zip(prices, amounts, strict=True)
+        ]
+
+    def depth_to_price(self, price: float) -> float:
+        """
+        최우선 호가부터 price(포함)까지의 누적 수량을 반환합니다.
+        """
+        index = int(np.searchsorted(self._keys, self._sign * price, side="right"))
+        return float(self._cumulative_amounts()[index - 1]) if index > 0 else 0.0
+
+    def price_for_amount(self, amount: float) -> float | None:
+        """
+        amount 만큼을 시장가로 채우려면 도달해야 하는 가장 불리한 가격을 반환합니다.
+        호가 전체 수량이 부족하면 None을 반환합니다.
+        """
+        index = int(np.searchsorted(self._cumulative_amounts(), amount, side="left"))
+        if index >= len(self._keys):
+            return None
+        return float(self._sign * self._keys[index])
+
+    def _cumulative_amounts(self) -> npt.NDArray[np.float64]:
+        if self._cumulative is None:
+            self._cumulative = np.cumsum(self._amounts)
+        return self._cumulative
+
+    def _to_arrays(
+        self, levels: Sequence[PriceLevelDTO]
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        keys = np.fromiter((level.price for level in levels), dtype=np.float64, count=len(levels))
+        amounts = np.fromiter(
+            (level.amount for level in levels), dtype=np.float64, count=len(levels)
+        )
+        return self._sign * keys, amounts
+
+
+class LocalOrderBook:
+    """
+    REST 스냅샷으로 시작해서 증분 depth 업데이트를 nonce 순서대로 반영하는 로컬 오더북입니다.
+    nonce가 이어지지 않으면(gap) snapshot 함수로 스냅샷을 다시 받아 맞춥니다.
+
+    Example:
+        book = LocalOrderBook("BTC/USDT", lambda: market_data.fetch_order_book("BTC/USDT", 1000))
+        await book.apply(delta)
+        book.best_bid, book.best_ask, book.bids.depth_to_price(117000.0)
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        snapshot: Callable[[], Awaitable[OrderBookDTO]],
+        max_resync_attempts: int = 3,
+    ) -> None:
+        self.symbol = symbol
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        self._snapshot = snapshot
+        self._max_resync_attempts = max_resync_attempts
+        self._nonce: int | None = None
+        self._timestamp: int | None = None
+
+    @property
+    def nonce(self) -> int | None:
+        return self._nonce
+
+    @property
+    def is_synced(self) -> bool:
+        return self._nonce is not None
+
+    @property
+    def best_bid(self) -> PriceLevelDTO | None:
+        return self.bids.best()
+
+    @property
+    def best_ask(self) -> PriceLevelDTO | None:
+        return self.asks.best()
+
+    def load_snapshot(self, order_book: OrderBookDTO) -> None:
+        self.bids.load(order_book.bids)
+        self.asks.load(order_book.asks)
+        self._nonce = order_book.nonce
+        self._timestamp = order_book.timestamp
+
+    async def apply(self, delta: OrderBookDeltaDTO) -> None:
+        """
+        오래된 업데이트는 무시하고, gap이 있으면 스냅샷을 다시 받은 뒤 업데이트를 반영합니다.
+        """
+        attempts = 0
+
+        while not self._can_apply(delta):
+            if self._nonce is not None and delta.nonce <= self._nonce:
+                return  # 이미 반영된 업데이트
+
+            if attempts >= self._max_resync_attempts:
+                message = f"{self.symbol}: cannot bridge nonce {self._nonce} -> {delta.first_nonce}"
+                self._nonce = None
+                raise OrderBookSyncError(message)
+
+            attempts += 1
+            self.load_snapshot(await self._snapshot())
+
+        self.bids.update(delta.bids)
+        self.asks.update(delta.asks)
+        self._nonce = delta.nonce
+        self._timestamp = delta.timestamp
+
+    def to_dto(self, limit: int | None = None) -> OrderBookDTO:
+        if self._nonce is None or self._timestamp is None:
+            raise OrderBookSyncError(f"{self.symbol}: order book is not synced")
+
+        return OrderBookDTO(
+            asks=self.asks.top(limit),
+            bids=self.bids.top(limit),
+            symbol=self.symbol,
+            datetime=ccxt.Exchange.iso8601(self._timestamp),
+            timestamp=self._timestamp,
+            nonce=self._nonce,
+        )
+
+    def _can_apply(self, delta: OrderBookDeltaDTO) -> bool:
+        if self._nonce is None:
+            return False
+        if delta.prev_nonce is not None and delta.prev_nonce == self._nonce:
+            return True
+        # 스냅샷 직후 첫 업데이트는 스냅샷 nonce를 걸쳐 있으면 됩니다. (first <= nonce + 1 <= last)
+        return delta.first_nonce <= self._nonce + 1 <= delta.nonce
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, ClassVar
+
+import orjson
+
+from app.ccxt.api.market_data import MarketData
+from app.ccxt.api.parser import parse_market
+from app.ccxt.domain.exchange import Exchange
+from app.ccxt.dtos.market_dto import MarketDTO
+from app.ccxt.enums.market_type import MarketType
+
+logger = logging.getLogger(__name__)
+
+
+class MarketRegistry:
+    """
+    load_markets 결과를 거래소/마켓 타입마다 한 번만 받아 MarketDTO 인덱스로 보관합니다.
+
+    - symbol, 거래소 id, base, quote 로 조회합니다. (MarketType에 맞는 마켓만 인덱싱)
+    - snapshot_dir 를 주면 원본 마켓 정보를 디스크에 저장하고, ttl 이내의 스냅샷으로 바로 시작합니다.
+    - start() 이후에는 ttl 마다 백그라운드에서 다시 받아옵니다.
+    - attach() 로 새 Exchange 클라이언트에 마켓 정보를 주입하면 ccxt가 load_markets를 다시 받지 않습니다.
+    """
+
+    _shared: ClassVar[dict[tuple[str, MarketType], MarketRegistry]] = {}
+
+    def __init__(
+        self,
+        market_data: MarketData,
+        ttl: float = 3600.0,
+        snapshot_dir: Path | None = None,
+    ) -> None:
+        self._market_data = market_data
+        self._ttl = ttl
+        self._snapshot_path = (
+            snapshot_dir / f"{market_data.exchange_id}_{market_data.market_type.value}.json"
+            if snapshot_dir is not None
+            else None
+        )
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._raw_markets: dict[str, Any] = {}
+        self._loaded_at: float | None = None
+
+        self._by_symbol: dict[str, MarketDTO] = {}
+        self._by_id: dict[str, MarketDTO] = {}
+        self._by_base: dict[str, list[MarketDTO]] = {}
+        self._by_quote: dict[str, list[MarketDTO]] = {}
+
+    @classmethod
+    def shared(
+        cls, market_data: MarketData, ttl: float = 3600.0, snapshot_dir: Path | None = None
+    ) -> MarketRegistry:
+        """
+        같은 거래소/마켓 타입에 대해 프로세스 전체에서 하나의 registry를 반환합니다.
+        """
+        key = (market_data.exchange_id, market_data.market_type)
+        if key not in cls._shared:
+            cls._shared[key] = cls(market_data, ttl=ttl, snapshot_dir=snapshot_dir)
+        return cls._shared[key]
+
+    @property
+    def loaded_at(self) -> float | None:
+        return self._loaded_at
+
+    # ---------------------------------------------------------
+    # Load / Refresh
+    # ---------------------------------------------------------
+    async def load(self) -> None:
+        """
+        아직 로드되지 않았다면 스냅샷 또는 거래소에서 마켓 정보를 읽어옵니다. 여러 번 호출해도 한 번만 읽습니다.
+        """
+        async with self._lock:
+            if self._loaded_at is not None:
+                return
+            if not self._load_snapshot():
+                await self._fetch()
+
+    async def refresh(self) -> None:
+        async with self._lock:
+            await self._fetch(reload=True)
+
+    def start(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    def attach(self, exchange: Exchange) -> None:
+        """
+        로드된 마켓 정보를 다른 ccxt 클라이언트에 주입합니다.
+        """
+        if self._loaded_at is None:
+            raise RuntimeError("MarketRegistry is not loaded yet.")
+        exchange.client.set_markets(self._raw_markets)
+
+    # ---------------------------------------------------------
+    # Lookup
+    # ---------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._by_symbol)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._by_symbol
+
+    def get(self, symbol: str) -> MarketDTO:
+        return self._by_symbol[symbol]
+
+    def by_id(self, market_id: str) -> MarketDTO | None:
+        return self._by_id.get(market_id)
+
+    def by_base(self, base: str) -> list[MarketDTO]:
+        return self._by_base.get(base, [])
+
+    def by_quote(self, quote: str) -> list[MarketDTO]:
+        return self._by_quote.get(quote, [])
+
+    def symbols(self) -> list[str]:
+        return list(self._by_symbol)
+
+    # ---------------------------------------------------------
+    # Internal
+    # ---------------------------------------------------------
+    async def _refresh_loop(self) -> None:
+        while True:
+            age = time.time() - (self._loaded_at or 0.0)
+            await asyncio.sleep(max(self._ttl - age, 0.0))
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("failed to refresh markets of %s", self._market_data.exchange_id)
+                await asyncio.sleep(min(self._ttl, 60.0))
+
+    async def _fetch(self, reload: bool = False) -> None:
+        raw_markets = await self._market_data.load_markets(reload=reload)
+        self._index(raw_markets, loaded_at=time.time())
+        self._save_snapshot()
+
+    def _index(self, raw_markets: dict[str, Any], loaded_at: float) -> None:
+        contract = self._market_data.market_type == MarketType.FUTURE
+        markets = [
+            parse_market(market)
+            for market in raw_markets.values()
+            if bool(market.get("contract")) == contract
+        ]
+
+        by_base: dict[str, list[MarketDTO]] = {}
+        by_quote: dict[str, list[MarketDTO]] = {}
+        for market in markets:
+            by_base.setdefault(market.base, []).append(market)
+            by_quote.setdefault(market.quote, []).append(market)
+
+        # 인덱스를 모두 만든 뒤 한 번에 교체해서 조회 중인 쪽이 반쯤 갱신된 상태를 보지 않도록 합니다.
+        self._raw_markets = raw_markets
+        self._by_symbol = {market.symbol: market for market in markets}
+        self._by_id = {market.id: market for market in markets}
+        self._by_base = by_base
+        self._by_quote = by_quote
+        self._loaded_at = loaded_at
+
+    def _load_snapshot(self) -> bool:
+        if self._snapshot_path is None or not self._snapshot_path.exists():
+            return False
+
+        snapshot = orjson.loads(self._snapshot_path.read_bytes())
+        if time.time() - snapshot["loaded_at"] > self._ttl:
+            return False
+
+        self._index(snapshot["markets"], loaded_at=snapshot["loaded_at"])
+        return True
+
+    def _save_snapshot(self) -> None:
+        if self._snapshot_path is None:
+            return
+
+        self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._snapshot_path.with_suffix(".tmp")
+        tmp_path.write_bytes(
+            orjson.dumps({"loaded_at": self._loaded_at, "markets": self._raw_markets})
+        )
+        os.replace(tmp_path, self._snapshot_path)
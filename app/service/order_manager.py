@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import replace
+from typing import Any, Literal
+
+import ccxt.async_support as ccxt
+
+from app.ccxt.domain.exchange import Exchange
+from app.ccxt.dtos.order.limit.limit_order_request_dto import LimitOrderRequestDTO
+from app.ccxt.dtos.order.market.market_order_request_dto import MarketOrderRequestDTO
+from app.ccxt.dtos.order.order_update_dto import OrderUpdateDTO
+from app.ccxt.enums.order_status import OrderStatus
+
+logger = logging.getLogger(__name__)
+
+type OrderWatcher = Callable[[], Awaitable[list[dict[str, Any]]]]
+
+CLIENT_ORDER_ID_PREFIX = "atlas-"
+
+
+class OrderManager:
+    """
+    client order id로 주문을 등록하고 열린 주문의 상태를 추적해서 변경(부분 체결, 취소 등)을 구독자에게 보냅니다.
+
+    - user-data 스트림(watch_orders)이 있으면 그 업데이트를 바로 반영하고, 스트림이 멈춘 뒤에만 폴링합니다.
+    - poll()은 심볼마다 fetch_open_orders 한 번으로 열린 주문 전체를 갱신하고,
+      목록에서 사라진 주문만 fetch_order로 최종 상태를 확인합니다. (주문 수가 아니라 심볼 수만큼 호출)
+    - subscribe()는 async iterator로 OrderUpdateDTO를 돌려줍니다. 체결 이벤트는 버리지 않습니다.
+
+    Example:
+        manager = OrderManager(exchange, watch_orders=exchange.ws_client.watch_orders)
+        manager.start()
+        update = await manager.submit_limit("buy", LimitOrderRequestDTO("BTC/USDT", 0.01, 117_000))
+        async for update in manager.subscribe(update.client_order_id):
+            ...
+    """
+
+    def __init__(
+        self,
+        exchange: Exchange,
+        poll_interval: float = 1.0,
+        watch_orders: OrderWatcher | None = None,
+        max_concurrency: int = 8,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+    ) -> None:
+        self._client = exchange.client
+        self._poll_interval = poll_interval
+        self._watch_orders = watch_orders
+        self._max_concurrency = max_concurrency
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+
+        self._orders: dict[str, OrderUpdateDTO] = {}  # client order id -> 마지막 상태
+        self._client_ids: dict[str, str] = {}  # 거래소 주문 id -> client order id
+        self._open: set[str] = set()
+        self._subscribers: dict[str | None, set[asyncio.Queue[OrderUpdateDTO]]] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+
+    # ---------------------------------------------------------
+    # Orders
+    # ---------------------------------------------------------
+    async def submit_limit(
+        self,
+        side: Literal["buy", "sell"],
+        order: LimitOrderRequestDTO,
+        client_order_id: str | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> OrderUpdateDTO:
+        return await self._submit(
+            "limit",
+            side,
+            order.ticker,
+            order.amount,
+            order.price,
+            client_order_id,
+            {"timeInForce": order.time_in_force.value} | (params or {}),
+        )
+
+    async def submit_market(
+        self,
+        side: Literal["buy", "sell"],
+        order: MarketOrderRequestDTO,
+        client_order_id: str | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> OrderUpdateDTO:
+        return await self._submit(
+            "market", side, order.ticker, order.amount, None, client_order_id, params or {}
+        )
+
+    def track(
+        self,
+        symbol: str,
+        side: Literal["buy", "sell"],
+        order_id: str,
+        amount: float,
+        price: float | None = None,
+        client_order_id: str | None = None,
+    ) -> OrderUpdateDTO:
+        """
+        다른 경로(SpotOrder, FutureOrder 등)로 낸 주문을 추적 대상에 추가합니다.
+        """
+        update = OrderUpdateDTO(
+            client_order_id=client_order_id or new_client_order_id(),
+            id=order_id,
+            symbol=symbol,
+            side=side,
+            status=OrderStatus.OPEN,
+            price=price,
+            average=None,
+            amount=amount,
+            filled=0.0,
+            remaining=amount,
+            timestamp=None,
+        )
+        self._register(update)
+        return update
+
+    async def cancel(self, client_order_id: str) -> OrderUpdateDTO:
+        current = self._orders[client_order_id]
+        if current.status.is_final:
+            return current
+        try:
+            order = await self._client.cancel_order(current.id, current.symbol)
+        except ccxt.OrderNotFound:
+            # 이미 체결/취소되어 거래소에서 사라진 경우 최종 상태를 다시 읽습니다.
+            order = await self._client.fetch_order(current.id, current.symbol)
+        return self.apply(order) or self._orders[client_order_id]
+
+    # ---------------------------------------------------------
+    # State
+    # ---------------------------------------------------------
+    def get(self, client_order_id: str) -> OrderUpdateDTO | None:
+        return self._orders.get(client_order_id)
+
+    def open_orders(self, symbol: str | None = None) -> list[OrderUpdateDTO]:
+        return [
+            self._orders[client_order_id]
+            for client_order_id in self._open
+            if symbol is None or self._orders[client_order_id].symbol == symbol
+        ]
+
+    def forget(self, client_order_id: str) -> None:
+        """
+        끝난 주문을 메모리에서 지웁니다.
+        """
+        update = self._orders.get(client_order_id)
+        if update is not None and update.status.is_final:
+            del self._orders[client_order_id]
+            self._client_ids.pop(update.id or "", None)
+
+    def apply(self, order: dict[str, Any]) -> OrderUpdateDTO | None:
+        """
+        ccxt unified 주문 하나를 반영합니다. 추적 중이 아니거나 바뀐 것이 없으면 None을 반환합니다.
+        """
+        client_order_id = self._client_ids.get(str(order.get("id")))
+        if client_order_id is None:
+            client_order_id = order.get("clientOrderId")
+        previous = self._orders.get(client_order_id) if client_order_id else None
+        if previous is None:
+            return None
+
+        filled = float(order.get("filled") or 0.0)
+        status = _status(order.get("status"))
+        if previous.status.is_final or (status == previous.status and filled <= previous.filled):
+            return None
+
+        amount = float(order.get("amount") or previous.amount)
+        remaining = order.get("remaining")
+        update = OrderUpdateDTO(
+            client_order_id=previous.client_order_id,
+            id=str(order["id"]) if order.get("id") is not None else previous.id,
+            symbol=previous.symbol,
+            side=previous.side,
+            status=status,
+            price=order.get("price") if previous.price is not None else None,
+            average=order.get("average"),
+            amount=amount,
+            filled=filled,
+            remaining=float(remaining) if remaining is not None else amount - filled,
+            timestamp=order.get("lastUpdateTimestamp") or order.get("timestamp"),
+            last_filled=max(filled - previous.filled, 0.0),
+        )
+        self._register(update)
+        self._publish(update)
+        return update
+
+    # ---------------------------------------------------------
+    # Subscription
+    # ---------------------------------------------------------
+    async def subscribe(self, client_order_id: str | None = None) -> AsyncIterator[OrderUpdateDTO]:
+        """
+        client_order_id가 없으면 모든 주문의 업데이트를 받습니다.
+        특정 주문을 구독하면 그 주문이 끝나는 업데이트 후에 종료됩니다.
+        """
+        queue: asyncio.Queue[OrderUpdateDTO] = asyncio.Queue()
+        subscribers = self._subscribers.setdefault(client_order_id, set())
+        subscribers.add(queue)
+        try:
+            if client_order_id is not None:
+                current = self._orders[client_order_id]
+                if current.status.is_final:
+                    yield current
+                    return
+            while True:
+                update = await queue.get()
+                yield update
+                if client_order_id is not None and update.status.is_final:
+                    return
+        finally:
+            subscribers.discard(queue)
+            if not subscribers and self._subscribers.get(client_order_id) is subscribers:
+                del self._subscribers[client_order_id]
+
+    async def wait(self, client_order_id: str) -> OrderUpdateDTO:
+        """
+        주문이 끝날 때(체결/취소/만료/거절)까지 기다려 최종 상태를 반환합니다.
+        기다리는 시간을 제한하려면 asyncio.timeout()으로 감쌉니다. (시간이 지나도 주문은 계속 추적합니다)
+        """
+        async for _ in self.subscribe(client_order_id):
+            pass
+        return self._orders[client_order_id]
+
+    # ---------------------------------------------------------
+    # Sync
+    # ---------------------------------------------------------
+    async def poll(self) -> None:
+        symbols = {self._orders[client_order_id].symbol for client_order_id in self._open}
+        if not symbols:
+            return
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        # 아직 접수 응답을 받지 못한(id가 없는) 주문은 제외합니다.
+        tracked = {self._orders[client_order_id].id for client_order_id in self._open} - {None}
+
+        async def open_orders(symbol: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self._client.fetch_open_orders(symbol)
+
+        seen: set[str] = set()
+        for orders in await asyncio.gather(*(open_orders(symbol) for symbol in symbols)):
+            for order in orders:
+                seen.add(str(order["id"]))
+                self.apply(order)
+
+        async def final_state(update: OrderUpdateDTO) -> None:
+            async with semaphore:
+                try:
+                    self.apply(await self._client.fetch_order(update.id, update.symbol))
+                except ccxt.OrderNotFound:
+                    logger.warning("tracked order %s not found on exchange", update.id)
+
+        # 열린 주문 목록에서 사라진 주문만 개별 조회해서 최종 상태를 확인합니다.
+        vanished = [
+            self._orders[client_order_id]
+            for client_order_id in list(self._open)
+            if self._orders[client_order_id].id in tracked - seen
+        ]
+        await asyncio.gather(*(final_state(update) for update in vanished))
+
+    def start(self) -> None:
+        if any(not task.done() for task in self._tasks):
+            return
+        # 스트림이 있으면 폴링하지 않고, 스트림이 끊겨 복구할 수 없을 때만 폴링으로 넘어갑니다.
+        if self._watch_orders is None:
+            self._tasks = [asyncio.create_task(self._poll_loop())]
+        else:
+            self._tasks = [asyncio.create_task(self._watch_loop(self._watch_orders))]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    # ---------------------------------------------------------
+    # Internal
+    # ---------------------------------------------------------
+    async def _submit(
+        self,
+        type: str,
+        side: Literal["buy", "sell"],
+        symbol: str,
+        amount: float,
+        price: float | None,
+        client_order_id: str | None,
+        params: dict[str, Any],
+    ) -> OrderUpdateDTO:
+        client_order_id = client_order_id or new_client_order_id()
+        if client_order_id in self._orders:
+            raise ValueError(f"client order id {client_order_id!r} is already tracked")
+
+        pending = OrderUpdateDTO(
+            client_order_id=client_order_id,
+            id=None,
+            symbol=symbol,
+            side=side,
+            status=OrderStatus.OPEN,
+            price=price,
+            average=None,
+            amount=amount,
+            filled=0.0,
+            remaining=amount,
+            timestamp=None,
+        )
+        # 응답보다 스트림 업데이트가 먼저 올 수 있으므로 요청 전에 등록합니다.
+        self._register(pending)
+        try:
+            order = await self._client.create_order(
+                symbol, type, side, amount, price, {"clientOrderId": client_order_id} | params
+            )
+        except Exception:
+            self._open.discard(client_order_id)
+            del self._orders[client_order_id]
+            raise
+
+        if self._orders[client_order_id].id is None:
+            self._register(replace(self._orders[client_order_id], id=str(order["id"])))
+        return self.apply(order) or self._orders[client_order_id]
+
+    def _register(self, update: OrderUpdateDTO) -> None:
+        self._orders[update.client_order_id] = update
+        if update.id is not None:
+            self._client_ids[update.id] = update.client_order_id
+        if update.status.is_final:
+            self._open.discard(update.client_order_id)
+        else:
+            self._open.add(update.client_order_id)
+
+    def _publish(self, update: OrderUpdateDTO) -> None:
+        for key in (update.client_order_id, None):
+            for queue in self._subscribers.get(key, ()):
+                queue.put_nowait(update)
+
+    async def _poll_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._poll_interval)
+            try:
+                await self.poll()
+            except Exception:
+                logger.exception("failed to poll open orders")
+
+    async def _watch_loop(self, watch_orders: OrderWatcher) -> None:
+        delay = self._reconnect_delay
+        while True:
+            try:
+                orders = await watch_orders()
+            except ccxt.NetworkError:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._max_reconnect_delay)
+                continue
+            except Exception:
+                logger.exception("order stream stopped, falling back to polling")
+                await self._poll_loop()
+                return
+
+            delay = self._reconnect_delay
+            for order in orders:
+                self.apply(order)
+
+
+def new_client_order_id() -> str:
+    return f"{CLIENT_ORDER_ID_PREFIX}{uuid.uuid4().hex[:24]}"
+
+
+def _status(status: str | None) -> OrderStatus:
+    try:
+        return OrderStatus(status)
+    except ValueError:
+        return OrderStatus.OPEN
@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Literal
+
+from app.ccxt.dtos.position_dto import PositionDTO
+from app.ccxt.dtos.ticker_dto import TickerDTO
+from app.ccxt.dtos.trade_dto import TradeDTO
+
+logger = logging.getLogger(__name__)
+
+type PositionFetcher = Callable[[], Awaitable[list[PositionDTO]]]
+
+
+@dataclass(slots=True)
+class _Position:
+    size: float = 0.0  # 롱은 양수, 숏은 음수
+    entry_price: float = 0.0
+    mark_price: float = math.nan
+    leverage: float | None = None  # None 이면 현물 (청산 없음)
+    margin_mode: Literal["cross", "isolated"] | None = None
+    realized_pnl: float = 0.0
+    unrealized_pnl: float = 0.0
+    liquidation_price: float | None = None
+    fills: int = 0  # reconcile 도중 들어온 체결을 구분하기 위한 카운터
+
+
+class PositionBook:
+    """
+    체결과 마크 가격으로 갱신되는 인메모리 포지션 장부입니다.
+    리스크 체크는 REST 호출 없이 이 장부를 읽고, 거래소와는 reconcile()로 주기적으로만 맞춥니다.
+
+    - on_fill / on_trade: 평균 진입가, 실현 손익을 갱신합니다. (O(1))
+    - on_mark / on_ticker: 미실현 손익과 전체 합계를 차이만큼 갱신합니다. (O(1))
+    - 청산가는 거래소 값(reconcile)을 우선 사용하고, 수량이 바뀌면 leverage와 유지증거금률로 추정합니다.
+    - spot=True 이면 거래소가 평균 매수가를 주지 않으므로 reconcile은 수량만 맞추고 로컬 entry_price를 유지합니다.
+
+    Example:
+        book = PositionBook(future_order.fetch_positions, leverage=10)
+        await book.reconcile()
+        book.start()
+        ...
+        book.on_fill("BTC/USDT:USDT", "buy", 0.01, 117_700.0)
+        book.liquidation_distance("BTC/USDT:USDT")
+    """
+
+    def __init__(
+        self,
+        fetch_positions: PositionFetcher | None = None,
+        reconcile_interval: float = 30.0,
+        leverage: float | None = None,
+        maintenance_margin_rate: float = 0.004,
+        tolerance: float = 1e-9,
+        spot: bool = False,
+    ) -> None:
+        self._fetch_positions = fetch_positions
+        self._reconcile_interval = reconcile_interval
+        self._leverage = leverage
+        self._maintenance_margin_rate = maintenance_margin_rate
+        self._tolerance = tolerance
+        self._spot = spot
+
+        self._positions: dict[str, _Position] = {}
+        self._unrealized_total = 0.0
+        self._realized_total = 0.0
+        self._reconcile_task: asyncio.Task[None] | None = None
+
+    # ---------------------------------------------------------
+    # Updates
+    # ---------------------------------------------------------
+    def on_fill(
+        self,
+        symbol: str,
+        side: Literal["buy", "sell"],
+        amount: float,
+        price: float,
+        fee: float = 0.0,
+    ) -> None:
+        """
+        체결 하나를 반영합니다. fee는 quote 통화 기준이며 실현 손익에서 뺍니다.
+        """
+        position = self._position(symbol)
+        signed = amount if side == "buy" else -amount
+        size = position.size
+
+        realized = -fee
+        if size == 0 or (size > 0) == (signed > 0):
+            # 증가: 가중 평균 진입가
+            position.entry_price = (abs(size) * position.entry_price + amount * price) / (
+                abs(size) + amount
+            )
+        else:
+            # 감소 / 청산 / 반대 방향 전환
+            closed = min(abs(size), amount)
+            realized += closed * (price - position.entry_price) * math.copysign(1.0, size)
+            if amount > abs(size):
+                position.entry_price = price
+
+        position.size = size + signed
+        if abs(position.size) <= self._tolerance:
+            position.size = 0.0
+            position.entry_price = 0.0
+
+        position.realized_pnl += realized
+        self._realized_total += realized
+        position.fills += 1
+        position.liquidation_price = None
+        if math.isnan(position.mark_price):
+            position.mark_price = price
+        self._revalue(position)
+
+    def on_trade(self, trade: TradeDTO, fee: float = 0.0) -> None:
+        """
+        내 체결 내역(fetch_my_trades / watch_my_trades)을 반영합니다.
+        """
+        self.on_fill(trade.symbol, trade.side, trade.amount, trade.price, fee)
+
+    def on_mark(self, symbol: str, price: float) -> None:
+        position = self._positions.get(symbol)
+        if position is None:
+            return
+        position.mark_price = price
+        self._revalue(position)
+
+    def on_ticker(self, ticker: TickerDTO) -> None:
+        self.on_mark(ticker.symbol, ticker.mark_price or ticker.last)
+
+    def set_leverage(self, symbol: str, leverage: float | None) -> None:
+        position = self._position(symbol)
+        position.leverage = leverage
+        position.liquidation_price = None
+
+    # ---------------------------------------------------------
+    # Reads
+    # ---------------------------------------------------------
+    def __contains__(self, symbol: object) -> bool:
+        position = self._positions.get(symbol)  # type: ignore[call-overload]
+        return position is not None and position.size != 0
+
+    def size(self, symbol: str) -> float:
+        """
+        부호 있는 수량 (롱 양수, 숏 음수)
+        """
+        position = self._positions.get(symbol)
+        return position.size if position is not None else 0.0
+
+    def unrealized_pnl(self, symbol: str | None = None) -> float:
+        if symbol is None:
+            return self._unrealized_total
+        position = self._positions.get(symbol)
+        return position.unrealized_pnl if position is not None else 0.0
+
+    def realized_pnl(self, symbol: str | None = None) -> float:
+        if symbol is None:
+            return self._realized_total
+        position = self._positions.get(symbol)
+        return position.realized_pnl if position is not None else 0.0
+
+    def liquidation_price(self, symbol: str) -> float | None:
+        position = self._positions.get(symbol)
+        if position is None or position.size == 0:
+            return None
+        if position.liquidation_price is not None:
+            return position.liquidation_price
+        return self._estimate_liquidation_price(position)
+
+    def liquidation_distance(self, symbol: str) -> float | None:
+        """
+        마크 가격에서 청산가까지 남은 거리 (비율). 0.05 = 5% 더 불리하게 움직이면 청산.
+        """
+        position = self._positions.get(symbol)
+        liquidation_price = self.liquidation_price(symbol)
+        if position is None or liquidation_price is None or not position.mark_price:
+            return None
+        distance = (position.mark_price - liquidation_price) / position.mark_price
+        return distance if position.size > 0 else -distance
+
+    def get(self, symbol: str) -> PositionDTO | None:
+        position = self._positions.get(symbol)
+        if position is None or position.size == 0:
+            return None
+        return self._to_dto(symbol, position)
+
+    def positions(self) -> list[PositionDTO]:
+        return [
+            self._to_dto(symbol, position)
+            for symbol, position in self._positions.items()
+            if position.size != 0
+        ]
+
+    # ---------------------------------------------------------
+    # Reconcile
+    # ---------------------------------------------------------
+    async def reconcile(self) -> list[str]:
+        """
+        거래소 포지션으로 장부를 맞추고, 로컬 값과 달랐던 symbol 목록을 반환합니다.
+        조회하는 동안 체결이 들어온 symbol은 로컬 값이 더 최신이므로 건너뜁니다.
+        """
+        if self._fetch_positions is None:
+            raise RuntimeError("PositionBook has no position fetcher to reconcile with.")
+
+        fills_before = {symbol: position.fills for symbol, position in self._positions.items()}
+        remote = {position.symbol: position for position in await self._fetch_positions()}
+
+        mismatched: list[str] = []
+        for symbol in set(self._positions) | set(remote):
+            position = self._positions.get(symbol)
+            if position is not None and position.fills != fills_before.get(symbol, 0):
+                continue
+            if symbol not in remote:
+                if position is not None and position.size != 0:
+                    mismatched.append(symbol)
+                    self._apply_remote(self._position(symbol), None)
+                continue
+
+            dto = remote[symbol]
+            size = dto.size if dto.side == "long" else -dto.size
+            local = self._position(symbol)
+            if abs(local.size - size) > self._tolerance or (
+                not self._spot
+                and abs(local.entry_price - dto.entry_price) > self._tolerance * dto.entry_price
+            ):
+                mismatched.append(symbol)
+            self._apply_remote(local, dto)
+
+        if mismatched:
+            logger.warning("position drift corrected for %s", sorted(mismatched))
+        return mismatched
+
+    def start(self) -> None:
+        if self._reconcile_task is None or self._reconcile_task.done():
+            self._reconcile_task = asyncio.create_task(self._reconcile_loop())
+
+    async def stop(self) -> None:
+        if self._reconcile_task is not None:
+            self._reconcile_task.cancel()
+            try:
+                await self._reconcile_task
+            except asyncio.CancelledError:
+                pass
+            self._reconcile_task = None
+
+    # ---------------------------------------------------------
+    # Internal
+    # ---------------------------------------------------------
+    async def _reconcile_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._reconcile_interval)
+            try:
+                await self.reconcile()
+            except Exception:
+                logger.exception("failed to reconcile positions")
+
+    def _position(self, symbol: str) -> _Position:
+        position = self._positions.get(symbol)
+        if position is None:
+            position = self._positions[symbol] = _Position(leverage=self._leverage)
+        return position
+
+    def _revalue(self, position: _Position) -> None:
+        unrealized = (
+            (position.mark_price - position.entry_price) * position.size
+            if position.size != 0 and not math.isnan(position.mark_price)
+            else 0.0
+        )
+        self._unrealized_total += unrealized - position.unrealized_pnl
+        position.unrealized_pnl = unrealized
+
+    def _apply_remote(self, position: _Position, dto: PositionDTO | None) -> None:
+        if dto is None:
+            position.size = position.entry_price = 0.0
+            position.liquidation_price = None
+        elif self._spot:
+            # 현물의 entry_price는 현재가이므로, 로컬에 추적한 평균 매수가가 없을 때만 사용합니다.
+            if position.size == 0:
+                position.entry_price = dto.entry_price
+            position.size = dto.size if dto.side == "long" else -dto.size
+            position.mark_price = dto.mark_price or position.mark_price
+        else:
+            position.size = dto.size if dto.side == "long" else -dto.size
+            position.entry_price = dto.entry_price
+            position.mark_price = dto.mark_price or position.mark_price
+            position.leverage = dto.leverage
+            position.margin_mode = dto.margin_mode
+            position.liquidation_price = dto.liquidation_price
+        self._revalue(position)
+
+    def _estimate_liquidation_price(self, position: _Position) -> float | None:
+        """
+        격리 마진 기준 근사치: 진입가에서 (1 / leverage - 유지증거금률) 만큼 불리하게 움직인 가격.
+        """
+        if position.leverage is None:
+            return None
+        move = 1.0 / position.leverage - self._maintenance_margin_rate
+        if position.size > 0:
+            return max(position.entry_price * (1.0 - move), 0.0)
+        return position.entry_price * (1.0 + move)
+
+    def _to_dto(self, symbol: str, position: _Position) -> PositionDTO:
+        size = abs(position.size)
+        mark_price = (
+            position.entry_price if math.isnan(position.mark_price) else position.mark_price
+        )
+        margin = size * position.entry_price / (position.leverage or 1.0)
+        return PositionDTO(
+            symbol=symbol,
+            side="long" if position.size > 0 else "short",
+            size=size,
+            notional=size * mark_price,
+            leverage=position.leverage or 1.0,
+            entry_price=position.entry_price,
+            mark_price=mark_price,
+            liquidation_price=self.liquidation_price(symbol),
+            margin_mode=position.margin_mode,
+            unrealized_pnl=position.unrealized_pnl,
+            percentage=position.unrealized_pnl / margin * 100 if margin else None,
+        )
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+import numpy as np
+import numpy.typing as npt
+
+from app.ccxt.api.market_data import MarketData
+from app.ccxt.dtos.trade_array_dto import TradeArrayDTO
+from app.ccxt.dtos.trade_dto import TradeDTO
+from app.ccxt.websocket.market_stream import MarketStream
+
+logger = logging.getLogger(__name__)
+
+_SIDES = {"buy": 1, "sell": -1}
+
+
+class TradeBuffer:
+    """
+    체결을 고정 크기 NumPy 배열(ring buffer)에 시간 순서대로 보관합니다. 가득 차면 가장 오래된 체결을 덮어씁니다.
+
+    - 메모리: 체결 1건당 25 bytes (timestamp int64, price/amount float64, side int8)
+    - 구간 조회는 링의 두 구간(오래된 쪽, 최근 쪽)에서 이진 탐색 후 view로 계산하므로 복사가 없습니다.
+    - timestamp는 감소하지 않아야 합니다. 마지막 체결보다 오래된 체결은 버립니다.
+    """
+
+    __slots__ = ("_timestamp", "_price", "_amount", "_side", "_head", "_size")
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self._timestamp: npt.NDArray[np.int64] = np.zeros(capacity, dtype=np.int64)
+        self._price: npt.NDArray[np.float64] = np.zeros(capacity, dtype=np.float64)
+        self._amount: npt.NDArray[np.float64] = np.zeros(capacity, dtype=np.float64)
+        self._side: npt.NDArray[np.int8] = np.zeros(capacity, dtype=np.int8)
+        self._head = 0  # 다음에 쓸 위치
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._timestamp)
+
+    @property
+    def last_timestamp(self) -> int | None:
+        return int(self._timestamp[self._head - 1]) if self._size else None
+
+    def __len__(self) -> int:
+        return self._size
+
+    # ---------------------------------------------------------
+    # Write
+    # ---------------------------------------------------------
+    def append(self, trades: TradeArrayDTO) -> int:
+        """
+        체결 묶음을 추가하고 추가된 개수를 반환합니다.
+        """
+        last_timestamp = self.last_timestamp
+        if last_timestamp is not None:
+            trades = trades.between(last_timestamp)
+
+        count = len(trades)
+        capacity = self.capacity
+        if count > capacity:
+            trades = trades.take(slice(count - capacity, count))
+            count = capacity
+        if count == 0:
+            return 0
+
+        first = min(count, capacity - self._head)
+        for column, values in (
+            (self._timestamp, trades.timestamp),
+            (self._price, trades.price),
+            (self._amount, trades.amount),
+            (self._side, trades.side),
+        ):
+            column[self._head : self._head + first] = values[:first]
+            column[: count - first] = values[first:]
+
+        self._head = (self._head + count) % capacity
+        self._size = min(self._size + count, capacity)
+        return count
+
+    def push(self, timestamp: int, price: float, amount: float, side: int) -> bool:
+        """
+        체결 한 건을 추가합니다. (스트림 경로, 배열을 만들지 않음)
+        """
+        if self._size and timestamp < self._timestamp[self._head - 1]:
+            return False
+
+        head = self._head
+        self._timestamp[head] = timestamp
+        self._price[head] = price
+        self._amount[head] = amount
+        self._side[head] = side
+        self._head = (head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        return True
+
+    def clear(self) -> None:
+        self._head = 0
+        self._size = 0
+
+    # ---------------------------------------------------------
+    # Query
+    # ---------------------------------------------------------
+    def window(self, start: int | None = None, end: int | None = None) -> TradeArrayDTO:
+        """
+        start <= timestamp < end 구간을 시간 순서의 TradeArrayDTO로 복사해서 반환합니다.
+        """
+        return TradeArrayDTO.concat([self._view(segment) for segment in self._segments(start, end)])
+
+    def count(self, seconds: float, now: int | None = None) -> int:
+        return sum(
+            segment.stop - segment.start for segment in self._segments(*self._range(seconds, now))
+        )
+
+    def volume(self, seconds: float, now: int | None = None) -> float:
+        """
+        최근 seconds초 동안의 체결 수량 합계
+        """
+        return sum(
+            float(self._amount[segment].sum())
+            for segment in self._segments(*self._range(seconds, now))
+        )
+
+    def imbalance(self, seconds: float, now: int | None = None) -> float | None:
+        """
+        (매수 수량 - 매도 수량) / 전체 수량. -1(전부 매도) ~ 1(전부 매수), 체결이 없으면 None
+        """
+        total = signed = 0.0
+        for segment in self._segments(*self._range(seconds, now)):
+            amount = self._amount[segment]
+            total += float(amount.sum())
+            signed += float(np.dot(amount, self._side[segment]))
+        return signed / total if total > 0 else None
+
+    def vwap(self, seconds: float, now: int | None = None) -> float | None:
+        total = notional = 0.0
+        for segment in self._segments(*self._range(seconds, now)):
+            amount = self._amount[segment]
+            total += float(amount.sum())
+            notional += float(np.dot(self._price[segment], amount))
+        return notional / total if total > 0 else None
+
+    # ---------------------------------------------------------
+    # Internal
+    # ---------------------------------------------------------
+    @staticmethod
+    def _range(seconds: float, now: int | None) -> tuple[int, int]:
+        """
+        now(밀리초, 기본값 현재 시각) 이전 seconds초 구간 [now - seconds, now]
+        """
+        now = now if now is not None else int(time.time() * 1000)
+        return now - int(seconds * 1000), now + 1
+
+    def _segments(self, start: int | None, end: int | None) -> list[slice]:
+        """
+        링을 시간 순서의 연속 구간(최대 2개)으로 나누고 각 구간에서 [start, end)를 잘라냅니다.
+        """
+        if self._size < self.capacity:
+            segments = [slice(0, self._size)]
+        else:
+            segments = [slice(self._head, self.capacity), slice(0, self._head)]
+
+        result = []
+        for segment in segments:
+            timestamps = self._timestamp[segment]
+            lo = 0 if start is None else int(np.searchsorted(timestamps, start, side="left"))
+            hi = (
+                len(timestamps)
+                if end is None
+                else int(np.searchsorted(timestamps, end, side="left"))
+            )
+            if lo < hi:
+                result.append(slice(segment.start + lo, segment.start + hi))
+        return result
+
+    def _view(self, segment: slice) -> TradeArrayDTO:
+        return TradeArrayDTO(
+            timestamp=self._timestamp[segment],
+            price=self._price[segment],
+            amount=self._amount[segment],
+            side=self._side[segment],
+        )
+
+
+class TradeTape:
+    """
+    심볼별 TradeBuffer에 REST 백필(fetch_trades 페이지네이션)과 스트림(watch_trades)으로 체결을 쌓습니다.
+    버퍼는 시간 순서만 받으므로 backfill()을 먼저 끝낸 뒤 watch()를 시작합니다.
+
+    Example:
+        tape = TradeTape(MarketData(exchange), stream=MarketStream(exchange), capacity=2_000_000)
+        await tape.backfill("BTC/USDT:USDT", since=now - 3_600_000)
+        tape.watch("BTC/USDT:USDT")
+        tape.buffer("BTC/USDT:USDT").imbalance(seconds=10)
+    """
+
+    def __init__(
+        self,
+        market_data: MarketData,
+        stream: MarketStream | None = None,
+        capacity: int = 1_000_000,
+        page_limit: int = 1000,
+        page_window: int = 3_600_000,
+    ) -> None:
+        self._market_data = market_data
+        self._stream = stream
+        self._capacity = capacity
+        self._page_limit = page_limit
+        self._page_window = page_window
+        self._buffers: dict[str, TradeBuffer] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+
+    def buffer(self, symbol: str) -> TradeBuffer:
+        buffer = self._buffers.get(symbol)
+        if buffer is None:
+            buffer = self._buffers[symbol] = TradeBuffer(self._capacity)
+        return buffer
+
+    # ---------------------------------------------------------
+    # REST
+    # ---------------------------------------------------------
+    async def backfill(self, symbol: str, since: int, until: int | None = None) -> int:
+        """
+        [since, until) 구간의 체결을 since 커서로 페이지를 넘기며 받아 버퍼에 추가합니다.
+        다음 페이지는 마지막 체결 시각부터 다시 받으므로 그 시각에 이미 받은 체결 수만큼 앞에서 건너뜁니다.
+        binance는 since만 주면 since + 1시간까지만 돌려주므로, page_limit보다 적은 페이지가 오면
+        그 구간(page_window, ms)을 다 받은 것으로 보고 커서를 다음 구간으로 옮깁니다.
+        """
+        until = until if until is not None else int(time.time() * 1000)
+        buffer = self.buffer(symbol)
+        cursor, skip, added = since, 0, 0
+
+        while cursor < until:
+            page = await self._market_data.fetch_trades(
+                symbol, since=cursor, limit=self._page_limit, columnar=True
+            )
+            trades = page.between(cursor, until).take(slice(skip, None))
+            added += buffer.append(trades)
+            if len(page) < self._page_limit:
+                cursor, skip = min(cursor + self._page_window, until), 0
+                continue
+            if len(trades) == 0:
+                break
+
+            last_timestamp = int(trades.timestamp[-1])
+            same = int(np.count_nonzero(trades.timestamp == last_timestamp))
+            if last_timestamp == cursor:
+                skip += same
+                if skip >= self._page_limit:
+                    # 한 시각의 체결이 페이지보다 많으면 더 받을 수 없으므로 다음 밀리초로 넘어갑니다.
+                    cursor, skip = cursor + 1, 0
+            else:
+                cursor, skip = last_timestamp, same
+        return added
+
+    # ---------------------------------------------------------
+    # Streams
+    # ---------------------------------------------------------
+    def on_trade(self, trade: TradeDTO) -> None:
+        self.buffer(trade.symbol).push(
+            trade.timestamp, trade.price, trade.amount, _SIDES.get(trade.side, 0)
+        )
+
+    def watch(self, symbol: str) -> None:
+        if self._stream is None:
+            raise RuntimeError("TradeTape was created without a MarketStream.")
+        task = self._tasks.get(symbol)
+        if task is None or task.done():
+            self._tasks[symbol] = asyncio.create_task(self._watch_loop(self._stream, symbol))
+
+    async def stop(self) -> None:
+        for task in self._tasks.values():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = {}
+
+    async def _watch_loop(self, stream: MarketStream, symbol: str) -> None:
+        try:
+            async for trade in stream.watch_trades(symbol):
+                self.on_trade(trade)
+        except Exception:
+            logger.exception("trade stream of %s stopped", symbol)
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.strategies.indicators import sma
+
+
+def golden_cross(candles: CandleArrayDTO, fast: int, slow: int) -> npt.NDArray[np.float64]:
+    """
+    단기 이동평균이 장기 이동평균보다 위에 있으면 롱(1), 아니면 포지션 없음(0).
+    장기 이동평균이 계산되기 전(slow - 1개 봉)에는 0입니다.
+    """
+    if not 0 < fast < slow:
+        raise ValueError(f"golden cross requires 0 < fast < slow, got {fast}, {slow}")
+
+    # 워밍업 구간의 NaN 비교는 False 이므로 포지션 없음(0)이 됩니다.
+    return (sma(candles.close, fast) > sma(candles.close, slow)).astype(np.float64)
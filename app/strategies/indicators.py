@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+
+import numpy as np
+import numpy.typing as npt
+
+from app.ccxt.dtos.candle_dto import CandleDTO
+from app.ccxt.dtos.ticker_dto import TickerDTO
+from app.core.timeframe import timeframe_to_ms
+
+# 기술적 지표를 두 가지 방식으로 제공합니다.
+#
+# - 배치: sma(), ema() ... 는 NumPy 배열 전체를 한 번에 계산합니다. (백테스트, 초기 로딩)
+# - 증분: SMA, EMA ... 클래스는 새 값(CandleDTO / TickerDTO / float)이 올 때마다 O(1)로 갱신합니다.
+#
+# 두 방식은 같은 정의를 사용하고 결과가 수치적으로 일치합니다. (상대 오차 ~1e-9 이내)
+# 값이 정의되지 않는 워밍업 구간은 NaN 입니다.
+#
+# - EMA: alpha = 2 / (window + 1), 첫 window개의 단순 평균으로 시작합니다.
+# - RSI, ATR: Wilder 평활(alpha = 1 / window), 첫 window개의 단순 평균으로 시작합니다.
+# - 표준편차: 모집단 표준편차(ddof=0)입니다.
+# - VWAP: 대표가격 (high + low + close) / 3 기준이며 session('1d' 등)마다 새로 시작합니다.
+
+type FloatArray = npt.NDArray[np.float64]
+
+# 증분 계산의 부동소수점 누적 오차를 없애기 위해 이 횟수만큼 갱신할 때마다 버퍼에서 다시 합산합니다.
+_RESYNC_INTERVAL = 4096
+_STD_CHUNK = 65_536
+
+
+# ---------------------------------------------------------
+# Batch
+# ---------------------------------------------------------
+def sma(values: FloatArray, window: int) -> FloatArray:
+    values = _as_float(values, window)
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        cumsum = np.concatenate(([0.0], np.cumsum(values)))
+        out[window - 1 :] = (cumsum[window:] - cumsum[:-window]) / window
+    return out
+
+
+def ema(values: FloatArray, window: int) -> FloatArray:
+    values = _as_float(values, window)
+    return _smooth(values, 2.0 / (window + 1), window)
+
+
+def rolling_std(values: FloatArray, window: int) -> FloatArray:
+    """
+    창마다 평균을 빼고 계산(two-pass)해서 큰 가격에서도 자리수 손실이 없도록 합니다.
+    메모리를 제한하기 위해 _STD_CHUNK 행씩 나눠 계산합니다.
+    """
+    values = _as_float(values, window)
+    out = np.full(len(values), np.nan)
+    if len(values) < window:
+        return out
+
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)
+    for start in range(0, len(windows), _STD_CHUNK):
+        out[window - 1 + start : window - 1 + start + _STD_CHUNK] = windows[
+            start : start + _STD_CHUNK
+        ].std(axis=1)
+    return out
+
+
+def bollinger(
+    values: FloatArray, window: int = 20, k: float = 2.0
+) -> tuple[FloatArray, FloatArray, FloatArray]:
+    """
+    (middle, upper, lower)
+    """
+    middle = sma(values, window)
+    width = k * rolling_std(values, window)
+    return middle, middle + width, middle - width
+
+
+def rsi(values: FloatArray, window: int = 14) -> FloatArray:
+    values = _as_float(values, window)
+    out = np.full(len(values), np.nan)
+    if len(values) <= window:
+        return out
+
+    change = np.diff(values)
+    gain = _smooth(np.maximum(change, 0.0), 1.0 / window, window)
+    loss = _smooth(np.maximum(-change, 0.0), 1.0 / window, window)
+    out[1:] = _rsi(gain, loss)
+    return out
+
+
+def atr(high: FloatArray, low: FloatArray, close: FloatArray, window: int = 14) -> FloatArray:
+    high, low, close = (_as_float(a, window) for a in (high, low, close))
+    previous = np.concatenate(([np.nan], close[:-1]))
+    true_range = np.fmax(high - low, np.fmax(np.abs(high - previous), np.abs(low - previous)))
+    return _smooth(true_range, 1.0 / window, window)
+
+
+def vwap(
+    high: FloatArray,
+    low: FloatArray,
+    close: FloatArray,
+    volume: FloatArray,
+    timestamp: npt.NDArray[np.int64] | None = None,
+    session: str | None = None,
+) -> FloatArray:
+    typical = (np.asarray(high) + np.asarray(low) + np.asarray(close)) / 3.0
+    volume = np.asarray(volume, dtype=np.float64)
+    price_volume = np.cumsum(typical * volume)
+    total_volume = np.cumsum(volume)
+
+    if session is not None:
+        if timestamp is None:
+            raise ValueError("vwap session requires timestamps")
+        bucket = np.asarray(timestamp) // timeframe_to_ms(session)
+        starts = np.flatnonzero(np.diff(bucket, prepend=bucket[0] - 1))
+        lengths = np.diff(np.append(starts, len(bucket)))
+        # 세션 시작 직전까지의 누적값을 빼서 세션마다 0부터 다시 누적합니다.
+        offset: npt.NDArray[np.intp] = np.repeat(starts, lengths)
+        price_volume = price_volume - np.where(offset > 0, price_volume[offset - 1], 0.0)
+        total_volume = total_volume - np.where(offset > 0, total_volume[offset - 1], 0.0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(total_volume > 0, price_volume / total_volume, np.nan)
+
+
+def _smooth(values: FloatArray, alpha: float, window: int) -> FloatArray:
+    """
+    y[window-1] = mean(values[:window]), y[t] = y[t-1] + alpha * (values[t] - y[t-1])
+    앞쪽 NaN(예: ATR의 첫 봉 이전)은 건너뛰고 첫 유효 값부터 window개를 사용합니다.
+    """
+    out = np.full(len(values), np.nan)
+    valid = np.flatnonzero(~np.isnan(values))
+    if len(valid) < window:
+        return out
+
+    first = int(valid[0])
+    seed_index = first + window - 1
+    y = float(values[first : seed_index + 1].sum()) / window
+    out[seed_index] = y
+
+    # 재귀식이라 벡터화할 수 없어서 파이썬 float 루프로 계산합니다. (NumPy 스칼라보다 빠름)
+    tail = values[seed_index + 1 :].tolist()
+    result = [0.0] * len(tail)
+    for i, x in enumerate(tail):
+        y += alpha * (x - y)
+        result[i] = y
+    out[seed_index + 1 :] = result
+    return out
+
+
+def _rsi(gain: FloatArray, loss: FloatArray) -> FloatArray:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(
+            loss == 0, np.where(gain == 0, 50.0, 100.0), 100.0 - 100.0 / (1.0 + gain / loss)
+        )
+
+
+def _rsi_value(gain: float, loss: float) -> float:
+    if loss == 0:
+        return 50.0 if gain == 0 else 100.0
+    return 100.0 - 100.0 / (1.0 + gain / loss)
+
+
+def _as_float(values: FloatArray, window: int) -> FloatArray:
+    _check_window(window)
+    return np.asarray(values, dtype=np.float64)
+
+
+def _check_window(window: int) -> None:
+    if window <= 0:
+        raise ValueError(f"window must be positive, got {window}")
+
+
+# ---------------------------------------------------------
+# Incremental
+# ---------------------------------------------------------
+class _PriceIndicator(ABC):
+    """
+    가격 하나로 갱신되는 지표의 공통 입력(CandleDTO 종가, TickerDTO 마지막 체결가)입니다.
+    """
+
+    __slots__ = ()
+
+    value: float
+
+    @abstractmethod
+    def update(self, price: float) -> float: ...
+
+    def on_candle(self, candle: CandleDTO) -> float:
+        return self.update(candle.close)
+
+    def on_ticker(self, ticker: TickerDTO) -> float:
+        return self.update(ticker.last)
+
+    @property
+    def ready(self) -> bool:
+        return not math.isnan(self.value)
+
+
+class SMA(_PriceIndicator):
+    __slots__ = ("window", "value", "_buffer", "_sum", "_updates")
+
+    def __init__(self, window: int) -> None:
+        _check_window(window)
+        self.window = window
+        self.value = math.nan
+        self._buffer: deque[float] = deque(maxlen=window)
+        self._sum = 0.0
+        self._updates = 0
+
+    def update(self, price: float) -> float:
+        if len(self._buffer) == self.window:
+            self._sum -= self._buffer[0]
+        self._buffer.append(price)
+        self._sum += price
+
+        self._updates += 1
+        if self._updates % _RESYNC_INTERVAL == 0:
+            self._sum = math.fsum(self._buffer)
+
+        if len(self._buffer) == self.window:
+            self.value = self._sum / self.window
+        return self.value
+
+
+class EMA(_PriceIndicator):
+    __slots__ = ("window", "value", "_alpha", "_seed")
+
+    def __init__(self, window: int) -> None:
+        _check_window(window)
+        self.window = window
+        self.value = math.nan
+        self._alpha = 2.0 / (window + 1)
+        self._seed: list[float] | None = []
+
+    def update(self, price: float) -> float:
+        self.value = _smooth_step(self, price, self._alpha)
+        return self.value
+
+
+class RollingStd(_PriceIndicator):
+    """
+    창의 평균/제곱편차합(M2)을 Welford 방식으로 교체 갱신합니다.
+    """
+
+    __slots__ = ("window", "value", "mean", "_buffer", "_m2", "_updates")
+
+    def __init__(self, window: int) -> None:
+        _check_window(window)
+        self.window = window
+        self.value = math.nan
+        self.mean = math.nan
+        self._buffer: deque[float] = deque(maxlen=window)
+        self._m2 = 0.0
+        self._updates = 0
+
+    def update(self, price: float) -> float:
+        count = len(self._buffer)
+        if count < self.window:
+            self._buffer.append(price)
+            mean = 0.0 if count == 0 else self.mean
+            delta = price - mean
+            self.mean = mean + delta / (count + 1)
+            self._m2 += delta * (price - self.mean)
+        else:
+            oldest = self._buffer[0]
+            self._buffer.append(price)
+            mean = self.mean + (price - oldest) / self.window
+            self._m2 += (price - oldest) * (price - mean + oldest - self.mean)
+            self.mean = mean
+
+        self._updates += 1
+        if self._updates % _RESYNC_INTERVAL == 0:
+            self.mean = math.fsum(self._buffer) / len(self._buffer)
+            self._m2 = math.fsum((x - self.mean) ** 2 for x in self._buffer)
+
+        if len(self._buffer) == self.window:
+            self.value = math.sqrt(max(self._m2, 0.0) / self.window)
+        return self.value
+
+
+class Bollinger(_PriceIndicator):
+    __slots__ = ("k", "value", "upper", "lower", "_std")
+
+    def __init__(self, window: int = 20, k: float = 2.0) -> None:
+        self.k = k
+        self.value = self.upper = self.lower = math.nan  # value = middle
+        self._std = RollingStd(window)
+
+    def update(self, price: float) -> float:
+        std = self._std.update(price)
+        if not math.isnan(std):
+            self.value = self._std.mean
+            self.upper = self.value + self.k * std
+            self.lower = self.value - self.k * std
+        return self.value
+
+
+class RSI(_PriceIndicator):
+    __slots__ = ("window", "value", "_previous", "_gain", "_loss")
+
+    def __init__(self, window: int = 14) -> None:
+        _check_window(window)
+        self.window = window
+        self.value = math.nan
+        self._previous: float | None = None
+        self._gain = _Wilder(window)
+        self._loss = _Wilder(window)
+
+    def update(self, price: float) -> float:
+        if self._previous is not None:
+            change = price - self._previous
+            gain = self._gain.update(max(change, 0.0))
+            loss = self._loss.update(max(-change, 0.0))
+            if not math.isnan(gain):
+                self.value = _rsi_value(gain, loss)
+        self._previous = price
+        return self.value
+
+
+class ATR:
+    __slots__ = ("window", "value", "_previous_close", "_smoothing")
+
+    def __init__(self, window: int = 14) -> None:
+        _check_window(window)
+        self.window = window
+        self.value = math.nan
+        self._previous_close: float | None = None
+        self._smoothing = _Wilder(window)
+
+    @property
+    def ready(self) -> bool:
+        return not math.isnan(self.value)
+
+    def update(self, high: float, low: float, close: float) -> float:
+        true_range = high - low
+        if self._previous_close is not None:
+            previous = self._previous_close
+            true_range = max(true_range, abs(high - previous), abs(low - previous))
+        self._previous_close = close
+        self.value = self._smoothing.update(true_range)
+        return self.value
+
+    def on_candle(self, candle: CandleDTO) -> float:
+        return self.update(candle.high, candle.low, candle.close)
+
+
+class VWAP:
+    __slots__ = ("value", "_session_ms", "_session", "_price_volume", "_volume")
+
+    def __init__(self, session: str | None = None) -> None:
+        self.value = math.nan
+        self._session_ms = timeframe_to_ms(session) if session is not None else None
+        self._session: int | None = None
+        self._price_volume = 0.0
+        self._volume = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return not math.isnan(self.value)
+
+    def update(
+        self, high: float, low: float, close: float, volume: float, timestamp: int | None = None
+    ) -> float:
+        if self._session_ms is not None:
+            if timestamp is None:
+                raise ValueError("vwap session requires timestamps")
+            session = timestamp // self._session_ms
+            if session != self._session:
+                self._session = session
+                self._price_volume = self._volume = 0.0
+
+        self._price_volume += (high + low + close) / 3.0 * volume
+        self._volume += volume
+        self.value = self._price_volume / self._volume if self._volume > 0 else math.nan
+        return self.value
+
+    def on_candle(self, candle: CandleDTO) -> float:
+        return self.update(candle.high, candle.low, candle.close, candle.volume, candle.timestamp)
+
+
+class _Wilder:
+    __slots__ = ("window", "value", "_alpha", "_seed")
+
+    def __init__(self, window: int) -> None:
+        _check_window(window)
+        self.window = window
+        self.value = math.nan
+        self._alpha = 1.0 / window
+        self._seed: list[float] | None = []
+
+    def update(self, x: float) -> float:
+        self.value = _smooth_step(self, x, self._alpha)
+        return self.value
+
+
+def _smooth_step(state: EMA | _Wilder, x: float, alpha: float) -> float:
+    """
+    _smooth()와 같은 식을 한 단계씩 계산합니다. 첫 window개는 모아서 단순 평균으로 시작합니다.
+    """
+    if state._seed is None:
+        return state.value + alpha * (x - state.value)
+
+    state._seed.append(x)
+    if len(state._seed) < state.window:
+        return math.nan
+
+    value = sum(state._seed) / state.window
+    state._seed = None
+    return value
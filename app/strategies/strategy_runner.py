@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from app.ccxt.enums.market_type import MarketType
+from app.core.config import BASE_DIR
+from app.service.backtester import Backtester
+from app.service.candle_store import CandleStore, CandleStoreKey
+from app.strategies.golden_cross import golden_cross
+
+
+def _window_range(value: str) -> range:
+    """
+    'start:stop:step' 형식 (stop 포함)
+    """
+    start, stop, step = (int(part) for part in value.split(":"))
+    return range(start, stop + 1, step)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Golden cross parameter sweep over stored candles")
+    parser.add_argument("--exchange", default="binance")
+    parser.add_argument("--market-type", type=MarketType, default=MarketType.FUTURE)
+    parser.add_argument("--symbol", default="BTC/USDT:USDT")
+    parser.add_argument("--timeframe", default="1m")
+    parser.add_argument("--root", type=Path, default=BASE_DIR / "data" / "candles")
+    parser.add_argument("--fast", type=_window_range, default=_window_range("5:50:5"))
+    parser.add_argument("--slow", type=_window_range, default=_window_range("20:400:20"))
+    parser.add_argument("--fee", type=float, default=0.0005)
+    parser.add_argument("--slippage", type=float, default=0.0001)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--top", type=int, default=10)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    key = CandleStoreKey(
+        exchange=args.exchange,
+        market_type=args.market_type,
+        symbol=args.symbol,
+        timeframe=args.timeframe,
+    )
+    candles = CandleStore(args.root).read(key)
+    if len(candles) == 0:
+        raise SystemExit(f"no candles stored under {key.directory(args.root)}")
+
+    params = [(fast, slow) for fast in args.fast for slow in args.slow if fast < slow]
+    backtester = Backtester(candles, fee=args.fee, slippage=args.slippage)
+
+    started = time.perf_counter()
+    results = backtester.sweep(golden_cross, params, max_workers=args.workers)
+    elapsed = time.perf_counter() - started
+
+    print(f"{len(params)} parameter pairs over {len(candles)} candles in {elapsed:.1f}s")
+    for result in sorted(results, key=lambda r: r.sharpe, reverse=True)[: args.top]:
+        fast, slow = result.params
+        print(
+            f"fast={fast:>4} slow={slow:>4} return={result.total_return:+.2%} "
+            f"mdd={result.max_drawdown:.2%} sharpe={result.sharpe:.2f} trades={result.trades}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+ccxt unified 파싱과 fast_parser의 메시지당 CPU 시간을 비교합니다. (네트워크 없음)
+
+    python -m benchmarks.fast_parser_benchmark [--number 20000]
+
+두 경로 모두 같은 원본 응답 bytes에서 시작해서 DTO를 만들 때까지의 시간을 잽니다.
+
+- ccxt: orjson.loads -> client.parse_ticker / parse_order_book / parse_order -> app.ccxt.api.parser
+- fast: app.ccxt.api.fast_parser
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+import ccxt.async_support as ccxt
+import orjson
+
+from app.ccxt.api.fast_parser import BinanceFastParser, BybitFastParser
+from app.ccxt.api.parser import parse_market_order, parse_order_book, parse_ticker
+
+_MARKET = {
+    "id": "BTCUSDT",
+    "base": "BTC",
+    "quote": "USDT",
+    "baseId": "BTC",
+    "quoteId": "USDT",
+    "active": True,
+    "precision": {},
+    "limits": {},
+    "margin": False,
+    "future": False,
+    "option": False,
+}
+SPOT_MARKET = _MARKET | {
+    "symbol": "BTC/USDT",
+    "type": "spot",
+    "spot": True,
+    "swap": False,
+    "contract": False,
+    "linear": None,
+    "inverse": None,
+    "settle": None,
+    "settleId": None,
+    "contractSize": None,
+}
+SWAP_MARKET = _MARKET | {
+    "symbol": "BTC/USDT:USDT",
+    "type": "swap",
+    "spot": False,
+    "swap": True,
+    "contract": True,
+    "linear": True,
+    "inverse": False,
+    "settle": "USDT",
+    "settleId": "USDT",
+    "contractSize": 1.0,
+}
+
+BINANCE_TICKER = orjson.dumps(
+    {
+        "symbol": "BTCUSDT",
+        "priceChange": "619.2",
+        "priceChangePercent": "0.529",
+        "weightedAvgPrice": "117428.01",
+        "prevClosePrice": "117080.8",
+        "lastPrice": "117700.0",
+        "lastQty": "0.001",
+        "bidPrice": "117699.9",
+        "bidQty": "1.2",
+        "askPrice": "117700.0",
+        "askQty": "0.5",
+        "openPrice": "117080.8",
+        "highPrice": "117859.4",
+        "lowPrice": "116812.0",
+        "volume": "66556.723",
+        "quoteVolume": "7815623475.78",
+        "openTime": 1755276000000,
+        "closeTime": 1755362327278,
+        "firstId": 5212413,
+        "lastId": 5345672,
+        "count": 133260,
+    }
+)
+BINANCE_ORDER_BOOK = orjson.dumps(
+    {
+        "lastUpdateId": 1027024,
+        "bids": [[f"{117699.9 - i * 0.1:.1f}", "0.125"] for i in range(100)],
+        "asks": [[f"{117700.0 + i * 0.1:.1f}", "0.250"] for i in range(100)],
+    }
+)
+BINANCE_ORDER = orjson.dumps(
+    {
+        "symbol": "BTCUSDT",
+        "orderId": 28,
+        "clientOrderId": "6gCrw2kRUAF9CvJDGP16IP",
+        "transactTime": 1755362327278,
+        "price": "0.00000000",
+        "origQty": "0.01000000",
+        "executedQty": "0.01000000",
+        "cummulativeQuoteQty": "1177.00500000",
+        "status": "FILLED",
+        "timeInForce": "GTC",
+        "type": "MARKET",
+        "side": "BUY",
+        "fills": [
+            {
+                "price": "117700.0",
+                "qty": "0.006",
+                "commission": "0.000006",
+                "commissionAsset": "BTC",
+            },
+            {
+                "price": "117701.25",
+                "qty": "0.004",
+                "commission": "0.000004",
+                "commissionAsset": "BTC",
+            },
+        ],
+    }
+)
+BYBIT_TICKER = orjson.dumps(
+    {
+        "retCode": 0,
+        "retMsg": "OK",
+        "result": {
+            "category": "linear",
+            "list": [
+                {
+                    "symbol": "BTCUSDT",
+                    "lastPrice": "117700.0",
+                    "indexPrice": "117690.1",
+                    "markPrice": "117699.5",
+                    "prevPrice24h": "117080.8",
+                    "price24hPcnt": "0.005289",
+                    "highPrice24h": "117859.4",
+                    "lowPrice24h": "116812.0",
+                    "prevPrice1h": "117650.0",
+                    "openInterest": "54321.123",
+                    "openInterestValue": "6393594231.12",
+                    "turnover24h": "7815623475.78",
+                    "volume24h": "66556.723",
+                    "fundingRate": "0.0001",
+                    "nextFundingTime": "1755388800000",
+                    "bid1Price": "117699.9",
+                    "bid1Size": "1.2",
+                    "ask1Price": "117700.0",
+                    "ask1Size": "0.5",
+                }
+            ],
+        },
+        "time": 1755362327278,
+    }
+)
+BYBIT_ORDER_BOOK = orjson.dumps(
+    {
+        "retCode": 0,
+        "retMsg": "OK",
+        "result": {
+            "s": "BTCUSDT",
+            "b": [[f"{117699.9 - i * 0.1:.1f}", "0.125"] for i in range(100)],
+            "a": [[f"{117700.0 + i * 0.1:.1f}", "0.250"] for i in range(100)],
+            "ts": 1755362327278,
+            "u": 18521288,
+            "seq": 7961638724,
+        },
+        "time": 1755362327280,
+    }
+)
+
+
+def _per_call_us(fn: Callable[[], Any], number: int) -> float:
+    """
+    5번 반복 중 가장 빠른 값을 사용합니다.
+    """
+    fn()
+    best = float("inf")
+    for _ in range(5):
+        started = time.process_time()
+        for _ in range(number):
+            fn()
+        best = min(best, time.process_time() - started)
+    return best / number * 1e6
+
+
+async def run(number: int) -> list[tuple[str, float, float]]:
+    binance, bybit = ccxt.binance(), ccxt.bybit()
+    binance.set_markets([SPOT_MARKET])
+    bybit.set_markets([SWAP_MARKET])
+    spot, swap = binance.market("BTC/USDT"), bybit.market("BTC/USDT:USDT")
+    binance_parser, bybit_parser = BinanceFastParser(), BybitFastParser()
+
+    def binance_book() -> Any:
+        book = binance.parse_order_book(orjson.loads(BINANCE_ORDER_BOOK), "BTC/USDT")
+        book["nonce"] = 1027024
+        return parse_order_book(book)
+
+    def bybit_ticker() -> Any:
+        ticker = orjson.loads(BYBIT_TICKER)["result"]["list"][0]
+        return parse_ticker(bybit.parse_ticker(ticker, swap) | {"timestamp": 0, "datetime": ""})
+
+    def bybit_book() -> Any:
+        result = orjson.loads(BYBIT_ORDER_BOOK)["result"]
+        return parse_order_book(
+            bybit.parse_order_book(result, "BTC/USDT:USDT", result["ts"], "b", "a")
+        )
+
+    cases: list[tuple[str, Callable[[], Any], Callable[[], Any]]] = [
+        (
+            "binance ticker",
+            lambda: parse_ticker(binance.parse_ticker(orjson.loads(BINANCE_TICKER), spot)),
+            lambda: binance_parser.ticker(BINANCE_TICKER, "BTC/USDT"),
+        ),
+        (
+            "binance order book (100x2)",
+            binance_book,
+            lambda: binance_parser.order_book(BINANCE_ORDER_BOOK, "BTC/USDT"),
+        ),
+        (
+            "binance market order",
+            lambda: parse_market_order(binance.parse_order(orjson.loads(BINANCE_ORDER), spot)),
+            lambda: binance_parser.market_order(BINANCE_ORDER),
+        ),
+        (
+            "bybit ticker",
+            bybit_ticker,
+            lambda: bybit_parser.ticker(BYBIT_TICKER, "BTC/USDT:USDT"),
+        ),
+        (
+            "bybit order book (100x2)",
+            bybit_book,
+            lambda: bybit_parser.order_book(BYBIT_ORDER_BOOK, "BTC/USDT:USDT"),
+        ),
+    ]
+
+    try:
+        return [
+            (name, _per_call_us(unified, number), _per_call_us(fast, number))
+            for name, unified, fast in cases
+        ]
+    finally:
+        await binance.close()
+        await bybit.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="ccxt unified parsing vs fast_parser CPU time")
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    print(f"{'message':<28}{'ccxt (us)':>12}{'fast (us)':>12}{'speedup':>10}")
+    for name, unified, fast in asyncio.run(run(args.number)):
+        print(f"{name:<28}{unified:>12.2f}{fast:>12.2f}{unified / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -29,13 +29,11 @@ async def test_spot() -> None:
         # Spot 보유 자산(포지션) 조회
         print("\n=== Spot 보유 자산 조회 ===")
         try:
-            positions = await spot_order.fetch_spot_positions()
+            positions = await spot_order.fetch_positions()
             if positions:
                 print("보유 자산:")
                 for pos in positions:
-                    print(
-                        f"  {pos['symbol']}: {pos['amount']} (USDT 가치: {pos['value_usdt']:.2f})"
-                    )
+                    print(f"  {pos.symbol}: {pos.size} (USDT 가치: {pos.notional:.2f})")
             else:
                 print("보유 자산이 없습니다.")
         except Exception as e:
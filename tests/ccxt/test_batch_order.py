@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import ccxt.async_support as ccxt
+import pytest
+
+from app.ccxt.api.future_order import FutureOrder
+from app.ccxt.api.spot_order import SpotOrder
+from app.ccxt.dtos.order.limit.limit_order_request_dto import LimitOrderRequestDTO
+from app.ccxt.dtos.order.market.market_order_request_dto import MarketOrderRequestDTO
+
+
+def order(order_id: str, status: str = "open", **info: Any) -> dict[str, Any]:
+    return {
+        "id": order_id,
+        "symbol": "BTC/USDT:USDT",
+        "status": status,
+        "timestamp": 1755365820000,
+        "datetime": "2025-08-16T16:37:00.000Z",
+        "price": 117700.0,
+        "average": None,
+        "amount": 0.01,
+        "filled": 0.0,
+        "remaining": 0.01,
+        "cost": 0.0,
+        "fee": None,
+        "info": info,
+    }
+
+
+class FakeClient:
+    def __init__(self, has: dict[str, bool]) -> None:
+        self.id = "fakeexchange"
+        self.options = {"defaultType": "future"}
+        self.has = has
+        self.markets: dict[str, Any] | None = None
+        self.batches: list[list[dict[str, Any]]] = []
+        self.single_orders: list[dict[str, Any]] = []
+        self.canceled: list[str] = []
+        self.cancel_batches: list[list[str]] = []
+
+    async def create_orders(self, orders: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if self.has.get("createOrdersRaises"):
+            raise ccxt.NotSupported("createOrders() does not support spot orders")
+        self.batches.append(orders)
+        return [
+            (
+                order("", "rejected", code=-4005, msg="Quantity greater than max quantity.")
+                if leg["amount"] > 1
+                else order(f"b{len(self.batches)}-{i}")
+            )
+            for i, leg in enumerate(orders)
+        ]
+
+    async def create_order(self, **leg: Any) -> dict[str, Any]:
+        if leg["amount"] > 1:
+            raise ccxt.InsufficientFunds("insufficient balance")
+        self.single_orders.append(leg)
+        return order(f"s{len(self.single_orders)}")
+
+    async def cancel_orders(self, ids: list[str], symbol: str) -> list[dict[str, Any]]:
+        if ":" not in symbol:
+            raise ccxt.BadRequest("cancelOrders() is only supported for swap markets")
+        if "down" in ids:
+            raise ccxt.ExchangeNotAvailable("cancelOrders")
+        self.cancel_batches.append(ids)
+        return [order(order_id, "canceled") for order_id in ids]
+
+    async def cancel_order(self, order_id: str, symbol: str) -> dict[str, Any]:
+        if order_id == "missing":
+            raise ccxt.OrderNotFound(order_id)
+        self.canceled.append(order_id)
+        return order(order_id, "canceled")
+
+    async def fetch_open_orders(self, symbol: str) -> list[dict[str, Any]]:
+        return [order("o1"), order("o2")]
+
+
+def limit_orders(*amounts: float) -> list[LimitOrderRequestDTO]:
+    return [LimitOrderRequestDTO(ticker="BTC/USDT:USDT", amount=a, price=117700.0) for a in amounts]
+
+
+@pytest.mark.asyncio
+async def test_native_batch_is_chunked_and_keeps_rejected_legs() -> None:
+    client = FakeClient({"createOrders": True})
+    future_order = FutureOrder(SimpleNamespace(client=client, is_future=lambda: True))
+
+    results = await future_order.open_long_limit_orders(limit_orders(*[0.01] * 6, 5.0))
+
+    assert sorted(len(batch) for batch in client.batches) == [2, 5]
+    assert all(leg["side"] == "buy" and leg["type"] == "limit" for leg in client.batches[0])
+    assert client.single_orders == []
+    assert [result.ok for result in results] == [True] * 6 + [False]
+    assert results[0].response.id is not None
+    assert isinstance(results[-1].error, ccxt.InvalidOrder)
+    assert "-4005" in str(results[-1].error)
+
+
+@pytest.mark.asyncio
+async def test_not_supported_batch_falls_back_to_fan_out() -> None:
+    client = FakeClient({"createOrders": True, "createOrdersRaises": True})
+    spot_order = SpotOrder(SimpleNamespace(client=client, is_spot=lambda: True))
+
+    results = await spot_order.close_limit_orders(limit_orders(0.01, 5.0, 0.02))
+
+    assert client.batches == []
+    assert [leg["side"] for leg in client.single_orders] == ["sell", "sell"]
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, ccxt.InsufficientFunds)
+
+
+@pytest.mark.asyncio
+async def test_market_orders_without_batch_endpoint() -> None:
+    client = FakeClient({})
+    future_order = FutureOrder(SimpleNamespace(client=client, is_future=lambda: True))
+    market_orders = [MarketOrderRequestDTO(ticker="BTC/USDT:USDT", amount=0.01)] * 3
+
+    results = await future_order.close_long_market_orders(market_orders, max_concurrency=2)
+
+    assert all(result.ok for result in results)
+    assert [leg["type"] for leg in client.single_orders] == ["market"] * 3
+    assert [leg["side"] for leg in client.single_orders] == ["sell"] * 3
+
+
+@pytest.mark.asyncio
+async def test_cancel_orders_and_cancel_all_fallback() -> None:
+    client = FakeClient({})
+    spot_order = SpotOrder(SimpleNamespace(client=client, is_spot=lambda: True))
+
+    results = await spot_order.cancel_orders(["a", "missing", "b"], "BTC/USDT")
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[0].response.status == "canceled"
+    assert isinstance(results[1].error, ccxt.OrderNotFound)
+
+    await spot_order.cancel_all_orders("BTC/USDT")
+    assert client.canceled == ["a", "b", "o1", "o2"]
+
+
+@pytest.mark.asyncio
+async def test_spot_cancel_orders_skips_native_batch() -> None:
+    client = FakeClient({"cancelOrders": True})
+    spot_order = SpotOrder(SimpleNamespace(client=client, is_spot=lambda: True))
+
+    results = await spot_order.cancel_orders(["a", "b"], "BTC/USDT")
+
+    assert all(result.ok for result in results)
+    assert client.cancel_batches == []
+    assert client.canceled == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_future_cancel_orders_is_chunked_and_falls_back_per_chunk() -> None:
+    client = FakeClient({"cancelOrders": True})
+    future_order = FutureOrder(SimpleNamespace(client=client, is_future=lambda: True))
+    order_ids = [f"c{i}" for i in range(12)] + ["down"]
+
+    results = await future_order.cancel_orders(order_ids, "BTC/USDT:USDT")
+
+    assert all(result.ok for result in results)
+    assert client.cancel_batches == [order_ids[:10]]
+    assert client.canceled == ["c10", "c11", "down"]
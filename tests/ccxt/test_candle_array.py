@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.ccxt.dtos.candle_dto import CandleDTO
+
+MINUTE = 60_000
+BASE_TS = 1755365820000 - 1755365820000 % (15 * MINUTE)
+
+
+@pytest.fixture
+def candles() -> CandleArrayDTO:
+    rows = [
+        [BASE_TS + i * MINUTE, 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 1.0 + i]
+        for i in range(30)
+    ]
+    return CandleArrayDTO.from_ohlcv(rows)
+
+
+def test_from_ohlcv(candles: CandleArrayDTO) -> None:
+    assert len(candles) == 30
+    assert candles.timestamp.dtype == np.int64
+    assert candles.close.dtype == np.float64
+    assert candles.close.flags["C_CONTIGUOUS"]
+
+
+def test_compatibility_view(candles: CandleArrayDTO) -> None:
+    first = candles[0]
+
+    assert isinstance(first, CandleDTO)
+    assert isinstance(first.timestamp, int)
+    assert isinstance(first.open, float)
+    assert first == CandleDTO(
+        timestamp=BASE_TS, open=100.0, high=101.0, low=99.0, close=100.5, volume=1.0
+    )
+    assert list(candles) == candles.to_dtos()
+    assert CandleArrayDTO.from_dtos(candles.to_dtos()).to_dtos() == candles.to_dtos()
+
+
+def test_slice_is_view(candles: CandleArrayDTO) -> None:
+    window = candles[5:10]
+
+    assert isinstance(window, CandleArrayDTO)
+    assert len(window) == 5
+    assert np.shares_memory(window.close, candles.close)
+
+
+def test_between(candles: CandleArrayDTO) -> None:
+    window = candles.between(BASE_TS + 3 * MINUTE, BASE_TS + 6 * MINUTE)
+
+    assert window.timestamp.tolist() == [BASE_TS + i * MINUTE for i in (3, 4, 5)]
+
+
+def test_resample(candles: CandleArrayDTO) -> None:
+    resampled = candles.resample("15m")
+
+    assert len(resampled) == 2
+    assert resampled.timestamp.tolist() == [BASE_TS, BASE_TS + 15 * MINUTE]
+    assert resampled.open.tolist() == [100.0, 115.0]
+    assert resampled.high.tolist() == [115.0, 130.0]
+    assert resampled.low.tolist() == [99.0, 114.0]
+    assert resampled.close.tolist() == [114.5, 129.5]
+    assert resampled.volume.tolist() == [sum(range(1, 16)), sum(range(16, 31))]
+
+
+def test_resample_weekly_aligns_to_monday() -> None:
+    day = 24 * 60 * MINUTE
+    monday = 1754870400000  # 2025-08-11 00:00 UTC (Monday)
+    rows = [
+        [monday - day + i * day, 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 1.0] for i in range(9)
+    ]
+    resampled = CandleArrayDTO.from_ohlcv(rows).resample("1w")
+
+    assert resampled.timestamp.tolist() == [monday - 7 * day, monday, monday + 7 * day]
+    assert resampled.open.tolist() == [100.0, 101.0, 108.0]
+    assert resampled.volume.tolist() == [1.0, 7.0, 1.0]
+
+
+def test_to_pandas_zero_copy(candles: CandleArrayDTO) -> None:
+    df = candles.to_pandas()
+
+    assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+    assert len(df) == len(candles)
+    assert np.shares_memory(df["close"].to_numpy(), candles.close)
+    assert np.shares_memory(df.index.asi8, candles.timestamp)
+
+
+def test_empty() -> None:
+    empty = CandleArrayDTO.from_ohlcv([])
+
+    assert len(empty) == 0
+    assert empty.to_dtos() == []
+    assert len(empty.resample("1h")) == 0
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import pytest
+
+from app.ccxt.domain.exchange import Binance, Bybit
+from app.ccxt.domain.exchange_pool import ExchangePool
+from app.ccxt.enums.market_type import MarketType
+
+
+@pytest.mark.asyncio
+async def test_acquire_shares_client_and_session() -> None:
+    pool = ExchangePool()
+    try:
+        first = await pool.acquire(Binance, MarketType.FUTURE)
+        second = await pool.acquire(Binance, MarketType.FUTURE)
+        spot = await pool.acquire(Binance, MarketType.SPOT)
+        bybit = await pool.acquire(Bybit, MarketType.FUTURE)
+
+        assert first is second
+        assert spot is not first
+        assert len(pool) == 3
+        assert first.client.session is spot.client.session is bybit.client.session
+        assert first.client.own_session is False
+    finally:
+        await pool.close()
+
+    assert len(pool) == 0
+    assert first.client.session is None
+
+
+@pytest.mark.asyncio
+async def test_release_closes_client_on_last_reference() -> None:
+    pool = ExchangePool()
+    try:
+        first = await pool.acquire(Binance, MarketType.FUTURE)
+        await pool.acquire(Binance, MarketType.FUTURE)
+
+        await pool.release(first)
+        assert len(pool) == 1
+
+        await pool.release(first)
+        assert len(pool) == 0
+
+        with pytest.raises(ValueError):
+            await pool.release(first)
+
+        async with pool.lease(Binance, MarketType.FUTURE) as leased:
+            assert leased is not first
+        assert len(pool) == 0
+    finally:
+        await pool.close()
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import dataclasses
+from types import SimpleNamespace
+from typing import Any
+
+import ccxt.async_support as ccxt
+import orjson
+import pytest
+
+from app.ccxt.api.fast_parser import BinanceFastParser, BybitFastParser, fast_parser_for
+from app.ccxt.api.market_data import MarketData
+from app.ccxt.api.parser import (
+    parse_limit_order,
+    parse_market_order,
+    parse_order_book,
+    parse_ticker,
+)
+
+MARKET_DEFAULTS = {
+    "precision": {},
+    "limits": {},
+    "active": True,
+    "margin": False,
+    "future": False,
+    "option": False,
+    "baseId": "BTC",
+    "quoteId": "USDT",
+    "base": "BTC",
+    "quote": "USDT",
+    "id": "BTCUSDT",
+}
+SPOT = dict(
+    MARKET_DEFAULTS,
+    symbol="BTC/USDT",
+    spot=True,
+    swap=False,
+    type="spot",
+    contract=False,
+    linear=None,
+    inverse=None,
+    settle=None,
+    settleId=None,
+    contractSize=None,
+)
+SWAP = dict(
+    MARKET_DEFAULTS,
+    symbol="BTC/USDT:USDT",
+    spot=False,
+    swap=True,
+    type="swap",
+    contract=True,
+    linear=True,
+    inverse=False,
+    settle="USDT",
+    settleId="USDT",
+    contractSize=1.0,
+)
+INVERSE = dict(
+    MARKET_DEFAULTS,
+    id="BTCUSD_PERP",
+    symbol="BTC/USD:BTC",
+    quote="USD",
+    quoteId="USD",
+    spot=False,
+    swap=True,
+    type="swap",
+    contract=True,
+    linear=False,
+    inverse=True,
+    settle="BTC",
+    settleId="BTC",
+    contractSize=100.0,
+)
+
+BINANCE_TICKER = {
+    "symbol": "BTCUSDT",
+    "priceChange": "619.2",
+    "priceChangePercent": "0.529",
+    "weightedAvgPrice": "117428.01",
+    "prevClosePrice": "117080.8",
+    "lastPrice": "117700.0",
+    "bidPrice": "117699.9",
+    "bidQty": "1.2",
+    "askPrice": "117700.0",
+    "askQty": "0.5",
+    "openPrice": "117080.8",
+    "highPrice": "117859.4",
+    "lowPrice": "116812.0",
+    "volume": "66556.723",
+    "quoteVolume": "7815623475.78",
+    "openTime": 1755276000000,
+    "closeTime": 1755362327278,
+}
+BINANCE_COINM_TICKER = {
+    "symbol": "BTCUSD_PERP",
+    "pair": "BTCUSD",
+    "priceChange": "619.2",
+    "priceChangePercent": "0.529",
+    "weightedAvgPrice": "117428.01",
+    "lastPrice": "117700.0",
+    "lastQty": "3",
+    "openPrice": "117080.8",
+    "highPrice": "117859.4",
+    "lowPrice": "116812.0",
+    "volume": "4265734",
+    "baseVolume": "3632.64",
+    "openTime": 1755276000000,
+    "closeTime": 1755362327278,
+}
+BINANCE_ORDER = {
+    "symbol": "BTCUSDT",
+    "orderId": 28,
+    "transactTime": 1755362327278,
+    "price": "0.00000000",
+    "origQty": "0.01000000",
+    "executedQty": "0.01000000",
+    "cummulativeQuoteQty": "1177.00500000",
+    "status": "FILLED",
+    "type": "MARKET",
+    "side": "BUY",
+    "fills": [
+        {"price": "117700.0", "qty": "0.006", "commission": "0.0000060", "commissionAsset": "BTC"},
+        {"price": "117701.25", "qty": "0.004", "commission": "0.0000040", "commissionAsset": "BTC"},
+    ],
+}
+BYBIT_TICKER = {
+    "retCode": 0,
+    "result": {
+        "category": "linear",
+        "list": [
+            {
+                "symbol": "BTCUSDT",
+                "lastPrice": "117700.0",
+                "indexPrice": "117690.1",
+                "markPrice": "117699.5",
+                "prevPrice24h": "117080.8",
+                "price24hPcnt": "0.005289",
+                "highPrice24h": "117859.4",
+                "lowPrice24h": "116812.0",
+                "volume24h": "66556.723",
+                "turnover24h": "7815623475.78",
+                "bid1Price": "117699.9",
+                "bid1Size": "1.2",
+                "ask1Price": "117700.0",
+                "ask1Size": "0.5",
+                "openInterestValue": "1",
+            }
+        ],
+    },
+    "time": 1755362327278,
+}
+BYBIT_ORDER_BOOK = {
+    "retCode": 0,
+    "result": {
+        "s": "BTCUSDT",
+        "b": [["117699.9", "1.2"], ["117699.8", "0.3"]],
+        "a": [["117700.0", "0.5"]],
+        "ts": 1755362327278,
+        "u": 18521288,
+        "seq": 7961638724,
+    },
+    "time": 1755362327280,
+}
+
+
+def make_client(exchange_id: str, market: dict[str, Any]) -> ccxt.Exchange:
+    client = getattr(ccxt, exchange_id)()
+    client.set_markets([market])
+    return client
+
+
+def assert_same(fast: Any, expected: Any, ignore: tuple[str, ...] = ()) -> None:
+    for field, value in dataclasses.asdict(expected).items():
+        if field in ignore:
+            continue
+        actual = getattr(fast, field)
+        if isinstance(value, float):
+            assert actual == pytest.approx(value, rel=1e-12), field
+        else:
+            assert actual == value, field
+
+
+@pytest.mark.asyncio
+async def test_binance_matches_ccxt_unified_parsing() -> None:
+    client = make_client("binance", SPOT)
+    parser = BinanceFastParser()
+    try:
+        market = client.market("BTC/USDT")
+        expected = parse_ticker(client.parse_ticker(BINANCE_TICKER, market))
+        assert_same(parser.ticker(orjson.dumps(BINANCE_TICKER), "BTC/USDT"), expected)
+
+        expected_order = parse_market_order(client.parse_order(BINANCE_ORDER, market))
+        assert_same(parser.market_order(BINANCE_ORDER), expected_order)
+        assert parser.market_order(BINANCE_ORDER).average == pytest.approx(117700.5)
+
+        raw_book = {"lastUpdateId": 1027024, "bids": [["4.0", "431.0"]], "asks": [["4.2", "12.0"]]}
+        book = parser.order_book(raw_book, "BTC/USDT")
+        ccxt_book = client.parse_order_book(raw_book, "BTC/USDT")
+        ccxt_book["nonce"] = raw_book["lastUpdateId"]
+        assert book == parse_order_book(ccxt_book)
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_bybit_matches_ccxt_unified_parsing() -> None:
+    client = make_client("bybit", SWAP)
+    parser = BybitFastParser()
+    try:
+        market = client.market("BTC/USDT:USDT")
+        raw = BYBIT_TICKER["result"]["list"][0]
+        expected = client.parse_ticker(raw, market)
+        expected["timestamp"] = BYBIT_TICKER["time"]  # ccxt는 None
+        expected["datetime"] = client.iso8601(BYBIT_TICKER["time"])
+        assert_same(
+            parser.ticker(orjson.dumps(BYBIT_TICKER), "BTC/USDT:USDT"), parse_ticker(expected)
+        )
+
+        result = BYBIT_ORDER_BOOK["result"]
+        ccxt_book = client.parse_order_book(result, "BTC/USDT:USDT", result["ts"], "b", "a")
+        ccxt_book["nonce"] = result["u"]
+        assert parser.order_book(BYBIT_ORDER_BOOK, "BTC/USDT:USDT") == parse_order_book(ccxt_book)
+
+        order = {
+            "orderId": "1c4a2b",
+            "symbol": "BTCUSDT",
+            "price": "117000",
+            "qty": "0.01",
+            "avgPrice": "116990",
+            "leavesQty": "0.004",
+            "cumExecQty": "0.006",
+            "cumExecValue": "701.94",
+            "cumExecFee": "0.38",
+            "createdTime": "1755362327278",
+            "orderStatus": "PartiallyFilled",
+        }
+        expected_order = parse_limit_order(client.parse_order(order, market))
+        fast_order = parser.limit_order({"retCode": 0, "result": {"list": [order]}})
+        assert_same(fast_order, expected_order, ignore=("fee",))  # ccxt는 수수료 통화를 몰라 None
+        assert fast_order.fee == 0.38
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_market_data_fast_path_uses_raw_endpoint() -> None:
+    requests: list[dict[str, Any]] = []
+
+    async def ticker_endpoint(request: dict[str, Any]) -> dict[str, Any]:
+        requests.append(request)
+        return BINANCE_TICKER
+
+    async def unified_fetch_ticker(symbol: str) -> dict[str, Any]:
+        raise AssertionError("fast path should not call fetch_ticker")
+
+    client = SimpleNamespace(
+        id="binance",
+        options={"defaultType": "spot"},
+        markets={"BTC/USDT": SPOT},
+        market=lambda symbol: SPOT,
+        publicGetTicker24hr=ticker_endpoint,
+        fetch_ticker=unified_fetch_ticker,
+    )
+    market_data = MarketData(SimpleNamespace(client=client), fast_path=True)
+
+    ticker = await market_data.fetch_ticker("BTC/USDT")
+    assert (ticker.symbol, ticker.last) == ("BTC/USDT", 117700.0)
+    assert requests == [{"symbol": "BTCUSDT"}]
+    assert fast_parser_for("kraken") is None
+
+
+@pytest.mark.asyncio
+async def test_binance_inverse_markets_use_coin_m_endpoints() -> None:
+    client = make_client("binance", INVERSE)
+    try:
+        expected = parse_ticker(
+            client.parse_ticker(BINANCE_COINM_TICKER, client.market(INVERSE["symbol"]))
+        )
+        assert_same(BinanceFastParser().ticker(BINANCE_COINM_TICKER, INVERSE["symbol"]), expected)
+    finally:
+        await client.close()
+
+    requests: list[tuple[str, dict[str, Any]]] = []
+
+    def endpoint(name: str, response: Any) -> Any:
+        async def call(request: dict[str, Any]) -> Any:
+            requests.append((name, request))
+            return response
+
+        return call
+
+    raw_book = {"lastUpdateId": 1, "T": 1755362327278, "bids": [["1.0", "2"]], "asks": []}
+    fake = SimpleNamespace(
+        id="binance",
+        options={"defaultType": "delivery"},
+        markets={INVERSE["symbol"]: INVERSE},
+        market=lambda symbol: INVERSE,
+        dapiPublicGetTicker24hr=endpoint("dapi", [BINANCE_COINM_TICKER]),
+        dapiPublicGetDepth=endpoint("dapi", raw_book),
+    )
+    market_data = MarketData(SimpleNamespace(client=fake), fast_path=True)
+
+    ticker = await market_data.fetch_ticker(INVERSE["symbol"])
+    order_book = await market_data.fetch_order_book(INVERSE["symbol"], limit=5)
+    assert ticker.quote_volume == pytest.approx(3632.64 * 117428.01)
+    assert order_book.bids[0].price == 1.0
+    assert requests == [
+        ("dapi", {"symbol": "BTCUSD_PERP"}),
+        ("dapi", {"symbol": "BTCUSD_PERP", "limit": 5}),
+    ]
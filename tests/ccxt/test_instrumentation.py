@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.ccxt.api.market_data import MarketData
+from app.ccxt.domain.instrumentation import instrument_client
+from app.ccxt.domain.rate_limiter import WeightedRateLimiter
+
+
+class FakeClient:
+    """
+    ccxt fetch2 처럼 throttle -> sign -> fetch 순서로 호출하는 클라이언트입니다.
+    """
+
+    id = "fakeexchange"
+    options = {"defaultType": "spot"}
+
+    async def throttle(self, cost: float | None = None) -> None:
+        await asyncio.sleep(0.01)
+
+    def sign(self, path: str, *args: Any) -> dict[str, Any]:
+        return {"url": path}
+
+    async def fetch(self, url: str, *args: Any) -> int:
+        await asyncio.sleep(0.02)
+        return 1_700_000_000_000
+
+    async def fetch_time(self) -> int:
+        await self.throttle(1)
+        request = self.sign("time")
+        return await self.fetch(request["url"])
+
+
+def sample(method: str, phase: str, suffix: str = "count") -> float:
+    value = REGISTRY.get_sample_value(
+        f"atlas_exchange_call_seconds_{suffix}",
+        {"exchange": "fakeexchange", "method": method, "market_type": "spot", "phase": phase},
+    )
+    return value or 0.0
+
+
+@pytest.mark.asyncio
+async def test_phases_are_recorded_per_call() -> None:
+    client = FakeClient()
+    instrument_client(client)
+    market_data = MarketData(SimpleNamespace(client=client))
+
+    phases = ("rate_limit_wait", "request_build", "network", "parse", "total")
+    before = {phase: sample("fetch_time", phase) for phase in phases}
+    network_sum = sample("fetch_time", "network", "sum")
+
+    assert await market_data.fetch_time() == 1_700_000_000_000
+
+    assert all(sample("fetch_time", phase) == before[phase] + 1 for phase in phases)
+    assert sample("fetch_time", "network", "sum") - network_sum >= 0.02
+    assert sample("fetch_time", "total", "sum") >= sample("fetch_time", "network", "sum")
+
+
+@pytest.mark.asyncio
+async def test_hooks_are_silent_outside_instrumented_calls() -> None:
+    client = FakeClient()
+    instrument_client(client)
+    before = sample("fetch_time", "total")
+
+    await client.fetch_time()
+
+    assert sample("fetch_time", "total") == before
+
+
+@pytest.mark.asyncio
+async def test_weighted_rate_limiter_reports_wait_phase() -> None:
+    client = FakeClient()
+    instrument_client(client)
+    limiter = WeightedRateLimiter("test-instrumentation", capacity=10)
+    limiter.install(SimpleNamespace(client=client))
+    market_data = MarketData(SimpleNamespace(client=client))
+    before = sample("fetch_time", "rate_limit_wait")
+
+    try:
+        await market_data.fetch_time()
+    finally:
+        await limiter.close()
+
+    assert sample("fetch_time", "rate_limit_wait") == before + 1
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from types import SimpleNamespace
+from typing import Any
+
+import ccxt.async_support as ccxt
+import pytest
+
+from app.ccxt.api.market_data import MarketData
+from app.ccxt.dtos.funding_rate_array_dto import FundingRateArrayDTO
+from app.ccxt.dtos.ticker_array_dto import TickerArrayDTO
+
+SYMBOLS = ["BTC/USDT:USDT", "ETH/USDT:USDT", "SOL/USDT:USDT"]
+
+
+def make_ticker(symbol: str, last: float) -> dict[str, Any]:
+    return {
+        "symbol": symbol,
+        "timestamp": 1755362327800,
+        "last": last,
+        "bid": last - 1,
+        "ask": None,
+    }
+
+
+def make_funding_rate(symbol: str, rate: float) -> dict[str, Any]:
+    return {
+        "symbol": symbol,
+        "fundingRate": rate,
+        "fundingTimestamp": 1755388800000,
+        "markPrice": 100.0,
+        "indexPrice": 100.1,
+    }
+
+
+class FakeClient:
+    id = "fake"
+
+    def __init__(
+        self, bulk: bool, delisted: tuple[str, ...] = (), offline: tuple[str, ...] = ()
+    ) -> None:
+        self.delisted = delisted
+        self.offline = offline
+        self.has = {"fetchTickers": bulk, "fetchFundingRates": bulk}
+        self.single_calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch_tickers(self, symbols: list[str]) -> dict[str, Any]:
+        return {s: make_ticker(s, 10.0 * (i + 1)) for i, s in enumerate(reversed(symbols))}
+
+    async def fetch_funding_rates(self, symbols: list[str]) -> dict[str, Any]:
+        return {s: make_funding_rate(s, 0.0001) for s in symbols}
+
+    async def fetch_ticker(self, symbol: str) -> dict[str, Any]:
+        self.single_calls += 1
+        if symbol in self.delisted:
+            raise ccxt.BadSymbol(f"{symbol} is delisted")
+        if symbol in self.offline:
+            raise ccxt.NetworkError("connection reset")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        return make_ticker(symbol, float(SYMBOLS.index(symbol)))
+
+    async def fetch_funding_rate(self, symbol: str) -> dict[str, Any]:
+        self.single_calls += 1
+        return make_funding_rate(symbol, -0.0002)
+
+
+@pytest.mark.asyncio
+async def test_fetch_tickers_bulk() -> None:
+    market_data = MarketData(SimpleNamespace(client=FakeClient(bulk=True)))
+
+    tickers = await market_data.fetch_tickers(SYMBOLS)
+
+    assert isinstance(tickers, TickerArrayDTO)
+    assert tickers.symbols == tuple(SYMBOLS)
+    assert tickers.last[tickers.index_of("BTC/USDT:USDT")] == 30.0
+    assert tickers.bid.tolist() == [29.0, 19.0, 9.0]
+    assert all(math.isnan(ask) for ask in tickers.ask)
+
+
+@pytest.mark.asyncio
+async def test_fetch_tickers_fan_out_is_bounded() -> None:
+    client = FakeClient(bulk=False)
+    market_data = MarketData(SimpleNamespace(client=client))
+
+    tickers = await market_data.fetch_tickers(SYMBOLS, max_concurrency=2)
+
+    assert client.single_calls == 3
+    assert client.max_in_flight == 2
+    assert tickers.last.tolist() == [0.0, 1.0, 2.0]
+    assert "ETH/USDT:USDT" in tickers
+
+
+@pytest.mark.asyncio
+async def test_fetch_tickers_fan_out_skips_failed_symbols() -> None:
+    client = FakeClient(bulk=False, delisted=("ETH/USDT:USDT",))
+    market_data = MarketData(SimpleNamespace(client=client))
+
+    tickers = await market_data.fetch_tickers(SYMBOLS)
+
+    assert client.single_calls == 3
+    assert tickers.symbols == ("BTC/USDT:USDT", "SOL/USDT:USDT")
+    assert tickers.last.tolist() == [0.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_fetch_tickers_fan_out_raises_non_symbol_errors() -> None:
+    client = FakeClient(bulk=False, delisted=("BTC/USDT:USDT",), offline=("ETH/USDT:USDT",))
+    market_data = MarketData(SimpleNamespace(client=client))
+
+    with pytest.raises(ccxt.NetworkError):
+        await market_data.fetch_tickers(SYMBOLS)
+
+
+@pytest.mark.asyncio
+async def test_fetch_funding_rates() -> None:
+    bulk = await MarketData(SimpleNamespace(client=FakeClient(bulk=True))).fetch_funding_rates(
+        SYMBOLS
+    )
+    fan_out = await MarketData(SimpleNamespace(client=FakeClient(bulk=False))).fetch_funding_rates(
+        SYMBOLS
+    )
+
+    assert isinstance(bulk, FundingRateArrayDTO)
+    assert bulk.funding_rate.tolist() == [0.0001] * 3
+    assert fan_out.funding_rate.tolist() == [-0.0002] * 3
+    assert fan_out.funding_timestamp.tolist() == [1755388800000] * 3
+    assert math.isnan(fan_out.next_funding_rate[0])
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 import pytest_asyncio
@@ -54,3 +56,33 @@ async def test_fetch_balance(order: SpotOrder) -> None:
         assert (
             abs(asset_balance.total - (asset_balance.free + asset_balance.used)) < 0.00001
         )  # floating point 오차 허용
+
+
+@pytest.mark.asyncio
+async def test_fetch_positions_skips_symbols_without_last_price() -> None:
+    async def fetch_balance() -> dict[str, Any]:
+        return {
+            "BTC": {"total": 0.5},
+            "ETH": {"total": 2.0},
+            "XRP": {"total": 100.0},
+            "USDT": {"total": 1_000.0},
+        }
+
+    async def load_markets() -> dict[str, Any]:
+        return client.markets
+
+    async def fetch_tickers(symbols: list[str]) -> dict[str, Any]:
+        return {"BTC/USDT": {"last": 117_700.0}, "ETH/USDT": {"last": None}}
+
+    client = SimpleNamespace(
+        markets={"BTC/USDT": {}, "ETH/USDT": {}, "XRP/USDT": {}},
+        fetch_balance=fetch_balance,
+        load_markets=load_markets,
+        fetch_tickers=fetch_tickers,
+    )
+    order = SpotOrder(SimpleNamespace(client=client, is_spot=lambda: True))
+
+    positions = await order.fetch_positions()
+
+    assert [(position.symbol, position.size) for position in positions] == [("BTC/USDT", 0.5)]
+    assert positions[0].notional == 0.5 * 117_700.0
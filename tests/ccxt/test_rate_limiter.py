@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import ccxt.async_support as ccxt
+import pytest
+from prometheus_client import REGISTRY
+
+from app.ccxt.domain.rate_limiter import (
+    LocalRateLimitBackend,
+    WeightedRateLimiter,
+    with_priority,
+)
+from app.ccxt.enums.request_priority import RequestPriority
+
+
+class CountingBackend(LocalRateLimitBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.granted_windows: list[int] = []
+
+    async def consume(self, key: str, weight: float, capacity: float, window: float) -> float:
+        wait = await super().consume(key, weight, capacity, window)
+        if wait == 0:
+            self.granted_windows.append(int(time.time() // window))
+        return wait
+
+
+@pytest.mark.asyncio
+async def test_weight_budget_per_window() -> None:
+    backend = CountingBackend()
+    limiter = WeightedRateLimiter("test-budget", capacity=10, window=0.2, backend=backend)
+    try:
+        await asyncio.gather(*(limiter.acquire(4) for _ in range(3)))
+
+        # 4 + 4 fits into one window, the third request waits for the next one
+        assert len(backend.granted_windows) == 3
+        assert backend.granted_windows[2] > backend.granted_windows[0]
+    finally:
+        await limiter.close()
+
+
+@pytest.mark.asyncio
+async def test_orders_jump_ahead_of_market_data() -> None:
+    limiter = WeightedRateLimiter("test-priority", capacity=1, window=0.05)
+    order: list[str] = []
+
+    async def request(name: str, priority: RequestPriority) -> None:
+        await limiter.acquire(1, priority)
+        order.append(name)
+
+    try:
+        await limiter.acquire(1)  # exhaust the current window
+        tasks = [
+            asyncio.create_task(request("candles", RequestPriority.MARKET_DATA)),
+            asyncio.create_task(request("ticker", RequestPriority.MARKET_DATA)),
+        ]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(request("order", RequestPriority.ORDER)))
+        await asyncio.gather(*tasks)
+
+        assert order == ["order", "candles", "ticker"]
+    finally:
+        await limiter.close()
+
+
+@pytest.mark.asyncio
+async def test_with_priority_sets_lane_for_ccxt_throttle() -> None:
+    limiter = WeightedRateLimiter("test-lane", capacity=100)
+
+    @with_priority(RequestPriority.ORDER)
+    async def place_order() -> None:
+        await limiter.throttle(2)
+
+    await place_order()
+    await limiter.throttle(1)
+
+    def count(priority: str) -> float | None:
+        return REGISTRY.get_sample_value(
+            "atlas_rate_limit_wait_seconds_count", {"limiter": "test-lane", "priority": priority}
+        )
+
+    assert count("order") == 1
+    assert count("market_data") == 1
+
+
+@pytest.mark.asyncio
+async def test_weight_over_capacity_is_rejected() -> None:
+    limiter = WeightedRateLimiter("test-capacity", capacity=5)
+
+    with pytest.raises(ValueError):
+        await limiter.acquire(6)
+
+
+@pytest.mark.asyncio
+async def test_install_converts_ccxt_cost_to_exchange_weight() -> None:
+    client = ccxt.binance()
+    limiter = WeightedRateLimiter("test-cost-scale", capacity=6000)
+    try:
+        limiter.install(SimpleNamespace(client=client))
+
+        # spot trades: Weight(IP) 10 -> ccxt cost 2
+        assert client.calculate_rate_limiter_cost("public", "GET", "trades", {}, {"cost": 2}) == 10
+        # sapi margin/asset: Weight(IP) 10 -> ccxt cost 1
+        assert (
+            client.calculate_rate_limiter_cost("sapi", "GET", "margin/asset", {}, {"cost": 1}) == 10
+        )
+        # fapi depth: Weight 2 -> ccxt cost 2
+        assert (
+            client.calculate_rate_limiter_cost("fapiPublic", "GET", "depth", {}, {"cost": 2}) == 2
+        )
+        assert client.throttle == limiter.throttle
+    finally:
+        await limiter.close()
+        await client.close()
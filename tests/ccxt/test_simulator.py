@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import ccxt.async_support as ccxt
+import numpy as np
+import pytest
+
+from app.ccxt.api.future_order import FutureOrder
+from app.ccxt.api.market_data import MarketData
+from app.ccxt.api.spot_order import SpotOrder
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.ccxt.dtos.order.limit.limit_order_request_dto import LimitOrderRequestDTO
+from app.ccxt.dtos.order.market.market_order_request_dto import MarketOrderRequestDTO
+from app.ccxt.dtos.order_book_dto import OrderBookDTO, PriceLevelDTO
+from app.ccxt.enums.market_type import MarketType
+from app.ccxt.simulator import MarketReplay, SimulatedExchange
+
+START = 1_755_360_000_000
+MINUTE = 60_000
+
+
+def book(timestamp: int, bid: float, ask: float) -> OrderBookDTO:
+    return OrderBookDTO(
+        asks=[PriceLevelDTO(ask, 1.0), PriceLevelDTO(ask + 1, 2.0)],
+        bids=[PriceLevelDTO(bid, 1.0), PriceLevelDTO(bid - 1, 2.0)],
+        symbol="BTC/USDT",
+        datetime=ccxt.Exchange.iso8601(timestamp),
+        timestamp=timestamp,
+        nonce=timestamp,
+    )
+
+
+def make_replay() -> MarketReplay:
+    timestamps = START + MINUTE * np.arange(10, dtype=np.int64)
+    close = 100.0 + np.arange(10, dtype=np.float64)
+    candles = CandleArrayDTO(
+        timestamp=timestamps,
+        open=close - 0.5,
+        high=close + 1,
+        low=close - 1,
+        close=close,
+        volume=np.full(10, 2.0),
+    )
+    replay = MarketReplay()
+    replay.add_candles("BTC/USDT", "1m", candles)
+    replay.add_order_books(
+        "BTC/USDT", [book(START + MINUTE, 100.0, 101.0), book(START + 3 * MINUTE, 95.0, 96.0)]
+    )
+    return replay
+
+
+@pytest.mark.asyncio
+async def test_market_data_replays_without_lookahead() -> None:
+    exchange = SimulatedExchange(MarketType.SPOT, make_replay())
+    market_data = MarketData(exchange)
+
+    candles = await market_data.fetch_candles("BTC/USDT", "1m", columnar=True)
+    assert candles.timestamp.tolist() == [START]  # 두 번째 봉은 아직 닫히지 않음
+
+    ticker = await market_data.fetch_ticker("BTC/USDT")
+    assert (ticker.bid, ticker.ask, ticker.last) == (100.0, 101.0, 100.5)
+
+    exchange.client.advance(2 * MINUTE)
+    order_book = await market_data.fetch_order_book("BTC/USDT", limit=1)
+    assert order_book.bids == [PriceLevelDTO(95.0, 1.0)]
+    assert len(await market_data.fetch_candles("BTC/USDT", "1m")) == 3
+    assert "BTC/USDT" in await market_data.load_markets()
+
+
+@pytest.mark.asyncio
+async def test_spot_orders_match_and_settle_balances() -> None:
+    exchange = SimulatedExchange(
+        MarketType.SPOT, make_replay(), balances={"USDT": 1_000.0}, taker_fee=0.001
+    )
+    spot_order = SpotOrder(exchange)
+
+    # 1.5 BTC 시장가 매수: 101 x 1.0 + 102 x 0.5
+    market = await spot_order.open_market_order(MarketOrderRequestDTO("BTC/USDT", 1.5))
+    assert market.filled == 1.5
+    assert market.cost == pytest.approx(152.0)
+
+    # 체결되지 않는 지정가는 대기하면서 USDT를 묶어 둡니다.
+    resting = await spot_order.open_limit_order(LimitOrderRequestDTO("BTC/USDT", 1.0, 96.0))
+    balance = await spot_order.fetch_balance()
+    assert balance.balances["USDT"].used == pytest.approx(96.0)
+    assert balance.balances["BTC"].total == pytest.approx(1.5 * (1 - 0.001))
+
+    fills = exchange.client.advance(2 * MINUTE)  # ask가 96으로 내려옴
+    assert [fill.order.id for fill in fills] == [resting.id]
+
+    balance = await spot_order.fetch_balance()
+    assert balance.balances["USDT"].total == pytest.approx(1_000.0 - 152.0 - 96.0)
+    assert balance.balances["USDT"].used == 0.0
+
+    with pytest.raises(ccxt.InsufficientFunds):
+        await spot_order.open_limit_order(LimitOrderRequestDTO("BTC/USDT", 100.0, 96.0))
+
+
+@pytest.mark.asyncio
+async def test_spot_buy_can_spend_full_quote_balance() -> None:
+    exchange = SimulatedExchange(
+        MarketType.SPOT, make_replay(), balances={"USDT": 960.0}, taker_fee=0.001
+    )
+    spot_order = SpotOrder(exchange)
+
+    # 수수료는 받는 BTC에서 차감되므로 USDT 전액(10 x 96)으로 매수할 수 있습니다.
+    resting = await spot_order.open_limit_order(LimitOrderRequestDTO("BTC/USDT", 10.0, 96.0))
+    fills = exchange.client.advance(2 * MINUTE)
+    assert [fill.order.id for fill in fills] == [resting.id]
+
+    balance = await spot_order.fetch_balance()
+    assert balance.balances["USDT"].total == pytest.approx(0.0)
+    assert balance.balances["BTC"].total == pytest.approx(10.0 * (1 - 0.0002))
+
+
+@pytest.mark.asyncio
+async def test_future_positions_and_batch_cancel() -> None:
+    exchange = SimulatedExchange(
+        MarketType.FUTURE, make_replay(), balances={"USDT": 1_000.0}, taker_fee=0.0, leverage=10
+    )
+    future_order = FutureOrder(exchange)
+
+    await future_order.open_long_market_order(MarketOrderRequestDTO("BTC/USDT:USDT", 1.0))
+    exchange.client.advance(2 * MINUTE)
+    await future_order.close_long_market_order(MarketOrderRequestDTO("BTC/USDT:USDT", 1.0))
+
+    balance = await future_order.fetch_balance()
+    assert balance.balances["USDT"].total == pytest.approx(1_000.0 + 95.0 - 101.0)
+
+    results = await future_order.open_long_limit_orders(
+        [LimitOrderRequestDTO("BTC/USDT:USDT", 0.1, price) for price in (90.0, 91.0, 92.0)]
+    )
+    assert all(result.ok for result in results)
+    assert len(await exchange.client.fetch_open_orders("BTC/USDT:USDT")) == 3
+
+    await future_order.cancel_all_orders("BTC/USDT:USDT")
+    assert await exchange.client.fetch_open_orders("BTC/USDT:USDT") == []
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_injection() -> None:
+    exchange = SimulatedExchange(MarketType.SPOT, make_replay(), rate_limit=(3, 60))
+    market_data = MarketData(exchange)
+
+    for _ in range(3):
+        await market_data.fetch_time()
+    with pytest.raises(ccxt.RateLimitExceeded):
+        await market_data.fetch_time()
+
+
+@pytest.mark.asyncio
+async def test_thousands_of_orders_without_network() -> None:
+    exchange = SimulatedExchange(MarketType.SPOT, make_replay(), balances={"USDT": 1e9})
+    spot_order = SpotOrder(exchange)
+
+    results = await spot_order.open_limit_orders(
+        [LimitOrderRequestDTO("BTC/USDT", 0.01, 50.0 + i * 0.001) for i in range(2_000)],
+        max_concurrency=64,
+    )
+    assert all(result.ok for result in results)
+
+    ids = [result.response.id for result in results]
+    canceled = await spot_order.cancel_orders(ids, "BTC/USDT")
+    assert all(result.ok for result in canceled)
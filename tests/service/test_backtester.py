@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.service.backtester import Backtester
+from app.strategies.golden_cross import golden_cross
+
+
+def make_candles(count: int = 500, seed: int = 7) -> CandleArrayDTO:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.002, count)))
+    open_ = np.concatenate(([100.0], close[:-1])) * (1 + rng.normal(0, 0.0005, count))
+    return CandleArrayDTO(
+        timestamp=1_755_360_000_000 + 60_000 * np.arange(count, dtype=np.int64),
+        open=open_,
+        high=np.maximum(open_, close) * 1.001,
+        low=np.minimum(open_, close) * 0.999,
+        close=close,
+        volume=np.ones(count),
+    )
+
+
+def reference_equity(
+    candles: CandleArrayDTO, positions: np.ndarray, fee: float, slippage: float
+) -> list[float]:
+    """
+    봉 단위 루프로 계산한 자산 가치. (다음 봉 시가 체결, 비용 = |변화| x (fee + slippage))
+    """
+    equity, held, curve = 1.0, 0.0, []
+    for i in range(len(candles)):
+        if i > 0:
+            equity *= 1 + held * (candles.open[i] / candles.close[i - 1] - 1)
+            target = positions[i - 1]
+            equity *= 1 - abs(target - held) * (fee + slippage)
+            held = target
+        equity *= 1 + held * (candles.close[i] / candles.open[i] - 1)
+        curve.append(equity)
+    return curve
+
+
+def test_vectorized_equity_matches_bar_loop() -> None:
+    candles = make_candles()
+    positions = golden_cross(candles, 5, 20)
+    backtester = Backtester(candles, fee=0.0005, slippage=0.0002, initial_capital=1.0)
+
+    expected = reference_equity(candles, positions, 0.0005, 0.0002)
+    np.testing.assert_allclose(backtester.equity(positions), expected, rtol=1e-12)
+
+    result = backtester.run(positions)
+    assert result.total_return == pytest.approx(expected[-1] - 1)
+    assert result.trades == np.count_nonzero(np.diff(positions[:-1], prepend=0.0))
+    assert result.max_drawdown <= 0
+
+
+def test_signal_is_executed_on_next_bar() -> None:
+    candles = make_candles()
+    backtester = Backtester(candles, fee=0.001, slippage=0.0, initial_capital=1.0)
+    positions = np.zeros(len(candles))
+    positions[100:] = 1.0
+
+    equity = backtester.equity(positions)
+
+    # 봉 100의 종가에서 정한 포지션은 봉 101 시가에 체결되므로 봉 100까지는 영향이 없습니다.
+    np.testing.assert_array_equal(equity[:101], np.ones(101))
+    assert equity[101] == pytest.approx(0.999 * candles.close[101] / candles.open[101])
+
+    # 마지막 봉의 신호는 체결될 봉이 없습니다.
+    last_only = np.zeros(len(candles))
+    last_only[-1] = 1.0
+    assert backtester.run(last_only).trades == 0
+
+
+def test_fees_and_fills() -> None:
+    candles = make_candles()
+    positions = golden_cross(candles, 5, 20)
+
+    free = Backtester(candles, fee=0.0, slippage=0.0).run(positions)
+    costly = Backtester(candles, fee=0.001, slippage=0.001).run(positions)
+    assert costly.total_return < free.total_return
+
+    fills = Backtester(candles, fee=0.001, slippage=0.001).fills(positions)
+    assert len(fills) == costly.trades
+    assert [fill.side for fill in fills[:2]] == ["buy", "sell"]
+    first = fills[0].order
+    assert first.price == pytest.approx(
+        candles.open[first.timestamp == candles.timestamp][0] * 1.001
+    )
+    assert first.fee == pytest.approx(first.cost * 0.001)
+
+
+def test_golden_cross_matches_pandas_rolling() -> None:
+    candles = make_candles()
+    close = pd.Series(candles.close)
+    expected = (close.rolling(10).mean() > close.rolling(30).mean()).to_numpy(dtype=np.float64)
+
+    positions = golden_cross(candles, 10, 30)
+    np.testing.assert_array_equal(positions[29:], expected[29:])
+    assert not positions[:29].any()
+
+
+def test_process_pool_sweep_matches_sequential() -> None:
+    backtester = Backtester(make_candles(2_000))
+    params = [(fast, slow) for fast in (3, 5, 8) for slow in (13, 21, 34)]
+
+    sequential = backtester.sweep(golden_cross, params, max_workers=1)
+    parallel = backtester.sweep(golden_cross, params, max_workers=2, chunksize=2)
+
+    assert parallel == sequential
+    assert [result.params for result in parallel] == params
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+
+import ccxt.async_support as ccxt
+import numpy as np
+import pytest
+
+from app.ccxt.api.spot_order import SpotOrder
+from app.ccxt.dtos.balance_dto import AssetBalanceDTO, BalanceDTO
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.ccxt.dtos.order.limit.limit_order_request_dto import LimitOrderRequestDTO
+from app.ccxt.enums.market_type import MarketType
+from app.ccxt.simulator import MarketReplay, SimulatedExchange
+from app.service.balance_cache import BalanceCache
+
+
+def balance(**totals: float) -> BalanceDTO:
+    return BalanceDTO(
+        balances={c: AssetBalanceDTO(free=t, used=0.0, total=t) for c, t in totals.items()}
+    )
+
+
+def make_exchange() -> SimulatedExchange:
+    close = 100.0 + np.arange(10, dtype=np.float64)
+    replay = MarketReplay()
+    replay.add_candles(
+        "BTC/USDT",
+        "1m",
+        CandleArrayDTO(
+            timestamp=1_755_360_000_000 + 60_000 * np.arange(10, dtype=np.int64),
+            open=close,
+            high=close + 1,
+            low=close - 1,
+            close=close,
+            volume=np.full(10, 2.0),
+        ),
+    )
+    return SimulatedExchange(MarketType.SPOT, replay, balances={"USDT": 1_000.0})
+
+
+@pytest.mark.asyncio
+async def test_reserve_fill_and_release_spot() -> None:
+    calls = 0
+
+    async def fetch_balance() -> BalanceDTO:
+        nonlocal calls
+        calls += 1
+        return balance(USDT=1_000.0, BTC=0.0)
+
+    cache = BalanceCache(fetch_balance, MarketType.SPOT)
+    await cache.load()
+    await cache.load()
+    assert calls == 1
+
+    assert cache.can_place("BTC/USDT", "buy", 5.0, 100.0)
+    assert not cache.can_place("BTC/USDT", "buy", 11.0, 100.0)
+
+    cache.reserve("a", "BTC/USDT", "buy", 5.0, 100.0)
+    assert cache.get("USDT") == AssetBalanceDTO(free=500.0, used=500.0, total=1_000.0)
+    with pytest.raises(ccxt.InsufficientFunds):
+        cache.reserve("b", "BTC/USDT", "buy", 6.0, 100.0)
+
+    # 2개가 99에 체결 (가격 개선분은 free로 돌아옴), 나머지는 취소
+    cache.on_fill("BTC/USDT", "buy", 2.0, 99.0, fee=0.002, fee_currency="BTC", key="a")
+    assert cache.get("USDT") == AssetBalanceDTO(free=502.0, used=300.0, total=802.0)
+    assert cache.free("BTC") == pytest.approx(1.998)
+
+    cache.release("a")
+    assert cache.get("USDT") == AssetBalanceDTO(free=802.0, used=0.0, total=802.0)
+
+
+@pytest.mark.asyncio
+async def test_future_margin_and_refresh_skips_local_changes() -> None:
+    started, finish = asyncio.Event(), asyncio.Event()
+
+    async def fetch_balance() -> BalanceDTO:
+        started.set()
+        await finish.wait()
+        return balance(USDT=900.0, BNB=1.0)
+
+    cache = BalanceCache(fetch_balance, MarketType.FUTURE, leverage=10)
+    cache.on_balance(balance(USDT=1_000.0))
+    assert cache.required("BTC/USDT:USDT", "sell", 1.0, 100.0) == ("USDT", 10.0)
+
+    refresh = asyncio.create_task(cache.refresh())
+    await started.wait()
+    cache.reserve("a", "BTC/USDT:USDT", "sell", 1.0, 100.0)  # 조회 중 로컬 변경
+    finish.set()
+    await refresh
+
+    assert cache.get("USDT") == AssetBalanceDTO(free=990.0, used=10.0, total=1_000.0)
+    assert cache.free("BNB") == 1.0
+    assert cache.loaded_at is not None
+
+
+@pytest.mark.asyncio
+async def test_follows_balance_stream_and_matches_exchange() -> None:
+    exchange = make_exchange()
+    spot_order = SpotOrder(exchange)
+    updates: asyncio.Queue[dict] = asyncio.Queue()
+
+    cache = BalanceCache(
+        spot_order.fetch_balance, MarketType.SPOT, refresh_interval=3600, watch_balance=updates.get
+    )
+    await cache.load()
+
+    cache.reserve("a", "BTC/USDT", "buy", 1.0, 50.0)
+    await spot_order.open_limit_order(LimitOrderRequestDTO("BTC/USDT", 1.0, 50.0))
+    assert cache.snapshot() == BalanceDTO(
+        balances={"USDT": AssetBalanceDTO(free=950.0, used=50.0, total=1_000.0)}
+    )
+
+    cache.start()
+    await updates.put(await exchange.client.fetch_balance())
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    await cache.stop()
+    assert cache.get("USDT") == (await spot_order.fetch_balance()).balances["USDT"]
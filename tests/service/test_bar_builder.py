@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.ccxt.dtos.candle_dto import CandleDTO
+from app.ccxt.dtos.trade_array_dto import TradeArrayDTO
+from app.ccxt.dtos.trade_dto import TradeDTO
+from app.service.bar_builder import (
+    BarBuilder,
+    DollarBarBuilder,
+    TickBarBuilder,
+    TimeBarBuilder,
+    VolumeBarBuilder,
+)
+
+START = 1_755_360_000_000
+
+
+def make_trades(rows: list[tuple[int, float, float]]) -> TradeArrayDTO:
+    timestamp, price, amount = zip(*rows, strict=True)
+    return TradeArrayDTO(
+        timestamp=np.array(timestamp, dtype=np.int64),
+        price=np.array(price, dtype=np.float64),
+        amount=np.array(amount, dtype=np.float64),
+        side=np.ones(len(rows), dtype=np.int8),
+    )
+
+
+def test_time_bars_close_on_next_interval_or_flush() -> None:
+    builder = TimeBarBuilder("5s")
+
+    assert builder.update(START + 100, 100.0, 1.0) is None
+    assert builder.update(START + 4_900, 102.0, 2.0) is None
+    closed = builder.update(START + 5_000, 101.0, 0.5)
+    assert closed == CandleDTO(START, 100.0, 102.0, 100.0, 102.0, 3.0)
+
+    assert builder.flush(START + 9_999) is None
+    assert builder.flush(START + 10_000) == CandleDTO(
+        START + 5_000, 101.0, 101.0, 101.0, 101.0, 0.5
+    )
+    assert builder.current is None
+
+
+def test_late_trade_after_flush_goes_to_the_next_bar() -> None:
+    builder = TimeBarBuilder("5s")
+    builder.update(1_000, 100.0, 1.0)
+    assert builder.flush(5_000) == CandleDTO(0, 100.0, 100.0, 100.0, 100.0, 1.0)
+
+    assert builder.update(4_999, 99.0, 1.0) is None  # 이미 닫힌 구간의 늦은 체결
+    assert builder.update(5_001, 101.0, 1.0) is None
+    assert builder.current == CandleDTO(5_000, 99.0, 101.0, 99.0, 101.0, 2.0)
+
+    batch = TimeBarBuilder("5s")
+    batch.update(1_000, 100.0, 1.0)
+    batch.flush(5_000)
+    assert len(batch.on_trades(make_trades([(4_999, 99.0, 1.0), (5_001, 101.0, 1.0)]))) == 0
+    assert batch.current == builder.current
+
+
+def test_volume_bars_include_the_trade_that_crosses_the_threshold() -> None:
+    builder = VolumeBarBuilder(2.0)
+    trades = [
+        TradeDTO("BTC/USDT", START, "", "buy", 100.0, 1.5),
+        TradeDTO("BTC/USDT", START + 1, "", "sell", 99.0, 1.0),  # 누적 2.5 -> 닫힘
+        TradeDTO("BTC/USDT", START + 2, "", "buy", 101.0, 1.4),  # 누적 3.9
+        TradeDTO(
+            "BTC/USDT", START + 3, "", "buy", 102.0, 3.0
+        ),  # 누적 6.9 -> 닫힘 (4, 6을 한 번에 넘음)
+    ]
+
+    closed = [bar for trade in trades if (bar := builder.on_trade(trade)) is not None]
+
+    assert closed == [
+        CandleDTO(START, 100.0, 100.0, 99.0, 99.0, 2.5),
+        CandleDTO(START + 2, 101.0, 102.0, 101.0, 102.0, 4.4),
+    ]
+    assert builder.current is None
+
+
+def test_tick_and_dollar_bars() -> None:
+    trades = make_trades([(START + i, 100.0 + i, 0.5) for i in range(7)])
+
+    ticks = TickBarBuilder(3).on_trades(trades)
+    assert ticks.open.tolist() == [100.0, 103.0]
+    assert ticks.close.tolist() == [102.0, 105.0]
+
+    dollars = DollarBarBuilder(100.0).on_trades(trades)
+    # 금액: 50, 50.5, 51, 51.5, 52, 52.5, 53 -> 누적 100.5, 203.0, 307.5
+    assert dollars.timestamp.tolist() == [START, START + 2, START + 4]
+    assert dollars.volume.tolist() == [1.0, 1.0, 1.0]
+
+
+@pytest.mark.parametrize(
+    "make_builder",
+    [
+        lambda: TimeBarBuilder("5s"),
+        lambda: TickBarBuilder(7),
+        lambda: VolumeBarBuilder(3.0),
+        lambda: DollarBarBuilder(250.0),
+    ],
+)
+def test_batch_matches_incremental(make_builder: Callable[[], BarBuilder]) -> None:
+    rng = np.random.default_rng(7)
+    count = 2_000
+    trades = TradeArrayDTO(
+        timestamp=START + np.cumsum(rng.integers(0, 400, count)).astype(np.int64),
+        price=100.0 + np.cumsum(rng.normal(0, 0.1, count)),
+        amount=rng.exponential(0.5, count),
+        side=np.ones(count, dtype=np.int8),
+    )
+
+    incremental = make_builder()
+    expected = [
+        bar
+        for t, p, a in zip(
+            trades.timestamp.tolist(), trades.price.tolist(), trades.amount.tolist(), strict=True
+        )
+        if (bar := incremental.update(t, p, a)) is not None
+    ]
+
+    batch = make_builder()
+    # 봉 중간에서 끊긴 묶음도 이어서 집계합니다.
+    chunks = [batch.on_trades(trades.take(slice(lo, lo + 333))) for lo in range(0, count, 333)]
+    bars = CandleArrayDTO.concat(chunks)
+
+    assert len(bars) == len(expected) > 10
+    assert bars.timestamp.tolist() == [bar.timestamp for bar in expected]
+    np.testing.assert_allclose(bars.close, [bar.close for bar in expected])
+    np.testing.assert_allclose(bars.high, [bar.high for bar in expected])
+    np.testing.assert_allclose(bars.volume, [bar.volume for bar in expected], rtol=1e-12)
+    current, expected_current = batch.current, incremental.current
+    assert current is not None and expected_current is not None
+    assert current.timestamp == expected_current.timestamp
+    assert current.volume == pytest.approx(expected_current.volume, rel=1e-12)
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import ccxt.async_support as ccxt
+import numpy as np
+import pytest
+
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.ccxt.dtos.latency_dto import LatencyDTO
+from app.ccxt.dtos.market_dto import MarketDTO, MarketLimitsDTO, MarketPrecisionDTO
+from app.ccxt.dtos.order_book_dto import OrderBookDTO, PriceLevelDTO
+from app.ccxt.enums.market_type import MarketType
+from app.ccxt.enums.order_status import OrderStatus
+from app.ccxt.simulator import MarketReplay, SimulatedExchange
+from app.service.best_price_router import BestPriceRouter, SymbolIndex
+from app.service.clock_monitor import ClockMonitor
+
+START = 1_755_360_000_000
+MINUTE = 60_000
+
+
+def make_exchange(
+    exchange_id: str, asks: list[tuple[float, float]], taker_fee: float
+) -> SimulatedExchange:
+    close = np.full(5, 100.0)
+    replay = MarketReplay()
+    replay.add_candles(
+        "BTC/USDT",
+        "1m",
+        CandleArrayDTO(
+            timestamp=START + MINUTE * np.arange(5, dtype=np.int64),
+            open=close,
+            high=close + 1,
+            low=close - 1,
+            close=close,
+            volume=np.full(5, 2.0),
+        ),
+    )
+    replay.add_order_books(
+        "BTC/USDT",
+        [
+            OrderBookDTO(
+                asks=[PriceLevelDTO(price, amount) for price, amount in asks],
+                bids=[PriceLevelDTO(99.0, 5.0)],
+                symbol="BTC/USDT",
+                datetime=ccxt.Exchange.iso8601(START),
+                timestamp=START,
+                nonce=1,
+            )
+        ],
+    )
+    return SimulatedExchange(
+        MarketType.SPOT,
+        replay,
+        balances={"USDT": 10_000.0},
+        taker_fee=taker_fee,
+        exchange_id=exchange_id,
+    )
+
+
+async def make_router(name: str) -> BestPriceRouter:
+    # a: 원시 호가는 더 싸지만 수수료가 0.1%, b: 수수료 없음
+    router = BestPriceRouter(
+        {
+            "a": make_exchange(f"{name}-a", [(100.0, 1.0), (100.5, 2.0)], taker_fee=0.001),
+            "b": make_exchange(f"{name}-b", [(100.05, 1.0), (101.0, 5.0)], taker_fee=0.0),
+        }
+    )
+    await router.load()
+    await router.refresh("BTC/USDT")
+    return router
+
+
+@pytest.mark.asyncio
+async def test_best_price_includes_taker_fee() -> None:
+    router = await make_router("router-best")
+
+    quotes = router.quotes("BTC/USDT", "buy")
+    assert [quote.venue for quote in quotes] == ["b", "a"]
+    assert quotes[1].price == 100.0
+    assert quotes[1].effective_price == pytest.approx(100.1)
+    assert router.best("BTC/USDT", "sell").venue == "b"  # 같은 bid -> 수수료 없는 쪽
+
+
+@pytest.mark.asyncio
+async def test_ties_prefer_venues_with_measured_rtt() -> None:
+    clock = ClockMonitor({})
+    clock.on_sample("b", LatencyDTO(rtt=80.0, offset=0.0, server_time=START, timestamp=START))
+    router = BestPriceRouter(
+        {
+            venue: make_exchange(f"router-rtt-{venue}", [(100.0, 1.0)], taker_fee=0.0)
+            for venue in ("a", "b")
+        },
+        clock=clock,
+    )
+    await router.load()
+    await router.refresh("BTC/USDT")
+
+    # a는 RTT 표본이 없으므로 같은 가격이면 b가 먼저입니다.
+    assert [quote.venue for quote in router.quotes("BTC/USDT", "buy")] == ["b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_plan_splits_by_effective_price_across_depth() -> None:
+    router = await make_router("router-plan")
+
+    legs = {leg.venue: leg for leg in router.plan("BTC/USDT", "buy", 2.5)}
+    # 100.05(b) -> 100.1(a, 100.0 + 수수료) -> 100.6005(a, 100.5 + 수수료) 순서로 채웁니다.
+    assert legs["b"].amount == pytest.approx(1.0)
+    assert legs["b"].price == 100.05
+    assert legs["a"].amount == pytest.approx(1.5)
+    assert legs["a"].price == 100.5
+    assert legs["a"].effective_price == pytest.approx((100.0 + 0.5 * 100.5) * 1.001 / 1.5)
+
+    # 보이는 호가보다 큰 수량은 배정하지 않습니다.
+    assert sum(leg.amount for leg in router.plan("BTC/USDT", "buy", 100.0)) == pytest.approx(9.0)
+
+
+@pytest.mark.asyncio
+async def test_execute_sends_ioc_legs_concurrently() -> None:
+    router = await make_router("router-execute")
+
+    legs = router.plan("BTC/USDT", "buy", 2.5)
+    results = await router.execute(legs)
+
+    assert all(result.ok for result in results)
+    assert [result.response.status for result in results] == [OrderStatus.CLOSED] * 2
+    assert {
+        leg.venue: result.response.filled for leg, result in zip(legs, results, strict=True)
+    } == {
+        "b": pytest.approx(1.0),
+        "a": pytest.approx(1.5),
+    }
+
+
+@pytest.mark.asyncio
+async def test_execute_resolves_legs_without_status_in_create_response() -> None:
+    router = await make_router("router-no-status")
+
+    for venue in ("a", "b"):
+        client = router._exchanges[venue].client
+        create_order = client.create_order
+
+        async def create_order_id_only(*args: Any, create_order: Any = create_order) -> Any:
+            # bybit create_order 응답처럼 id만 돌려줍니다. (status None)
+            order = await create_order(*args)
+            return {"id": order["id"], "clientOrderId": order["clientOrderId"], "status": None}
+
+        client.create_order = create_order_id_only
+
+    try:
+        results = await asyncio.wait_for(
+            router.execute(router.plan("BTC/USDT", "buy", 2.5)), timeout=5.0
+        )
+    finally:
+        await router.stop()
+
+    assert all(result.ok for result in results)
+    assert [result.response.status for result in results] == [OrderStatus.CLOSED] * 2
+
+
+def make_market(symbol: str, market_id: str, base: str) -> MarketDTO:
+    return MarketDTO(
+        symbol=symbol,
+        id=market_id,
+        base=base,
+        quote="USDT",
+        settle="USDT",
+        type="swap",
+        active=True,
+        contract=True,
+        contract_size=1.0,
+        precision=MarketPrecisionDTO(amount=1.0, price=1e-7),
+        limits=MarketLimitsDTO(None, None, None, None, None, None, None),
+        maker=None,
+        taker=None,
+    )
+
+
+def test_symbol_index_normalises_aliases_and_ids() -> None:
+    index = SymbolIndex(aliases={"bybit": {"SHIB1000": "1000SHIB"}})
+    index.add("binance", make_market("1000SHIB/USDT:USDT", "1000SHIBUSDT", "1000SHIB"))
+    index.add("bybit", make_market("SHIB1000/USDT:USDT", "SHIB1000USDT", "SHIB1000"))
+    index.add("bybit", make_market("ETH/USDT:USDT-251226", "ETHUSDT-26DEC25", "ETH"))
+
+    assert index.venues("1000SHIB/USDT:USDT") == ["binance", "bybit"]
+    assert index.canonical("bybit", "SHIB1000USDT") == "1000SHIB/USDT:USDT"
+    assert index.market("1000SHIB/USDT:USDT", "bybit").symbol == "SHIB1000/USDT:USDT"
+    assert index.canonical("bybit", "ETHUSDT-26DEC25") == "ETH/USDT:USDT-251226"
+    assert index.common() == ["1000SHIB/USDT:USDT"]
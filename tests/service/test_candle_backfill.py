@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import pytest
+
+from app.ccxt.api.market_data import MarketData
+from app.service.candle_backfill import BackfillCheckpoint, CandleBackfill
+
+MINUTE = 60_000
+SINCE = 1_755_360_000_000
+
+
+class FakeOHLCVClient:
+    """fetch_ohlcv만 흉내내는 가짜 ccxt 클라이언트 (since 직전 봉을 겹쳐서 반환합니다)."""
+
+    id = "binance"
+    options = {"defaultType": "future"}
+
+    def __init__(self, max_limit: int | None = None) -> None:
+        self.calls: list[int] = []
+        self.max_limit = max_limit
+
+    async def fetch_ohlcv(
+        self, symbol: str, timeframe: str, since: int, limit: int
+    ) -> list[list[Any]]:
+        self.calls.append(since)
+        if self.max_limit is not None:
+            limit = min(limit, self.max_limit)
+        first = since - MINUTE
+        return [
+            [ts, float(ts), float(ts) + 1, float(ts) - 1, float(ts), 1.0]
+            for ts in range(first, first + (limit + 1) * MINUTE, MINUTE)
+        ]
+
+
+@pytest.fixture
+def client() -> FakeOHLCVClient:
+    return FakeOHLCVClient()
+
+
+@pytest.fixture
+def market_data(client: FakeOHLCVClient) -> MarketData:
+    return MarketData(SimpleNamespace(client=client))
+
+
+@pytest.mark.asyncio
+async def test_fetch_splits_and_dedupes(market_data: MarketData, client: FakeOHLCVClient) -> None:
+    backfill = CandleBackfill(market_data, page_limit=10, max_concurrency=3)
+
+    candles = await backfill.fetch("BTC/USDT", "1m", since=SINCE, until=SINCE + 95 * MINUTE)
+
+    assert len(client.calls) == 10
+    assert len(candles) == 95
+    assert candles.timestamp[0] == SINCE
+    assert np.all(np.diff(candles.timestamp) == MINUTE)
+
+
+@pytest.mark.asyncio
+async def test_stream_resumes_from_checkpoint(
+    market_data: MarketData, client: FakeOHLCVClient, tmp_path: Path
+) -> None:
+    checkpoint_path = tmp_path / "backfill.json"
+    backfill = CandleBackfill(
+        market_data,
+        page_limit=10,
+        max_concurrency=2,
+        checkpoint=BackfillCheckpoint(checkpoint_path),
+    )
+
+    # crash while the third chunk is being processed: it must be delivered again on resume
+    stream = backfill.stream("BTC/USDT", "1m", since=SINCE, until=SINCE + 50 * MINUTE)
+    received = [await anext(stream), await anext(stream), await anext(stream)]
+    await stream.aclose()
+    assert sum(len(chunk) for chunk in received) == 30
+
+    client.calls.clear()
+    resumed = CandleBackfill(
+        market_data,
+        page_limit=10,
+        max_concurrency=2,
+        checkpoint=BackfillCheckpoint(checkpoint_path),
+    )
+    rest = await resumed.fetch("BTC/USDT", "1m", since=SINCE, until=SINCE + 50 * MINUTE)
+
+    assert client.calls[0] == SINCE + 20 * MINUTE
+    assert rest.timestamp[0] == SINCE + 20 * MINUTE
+    assert rest.timestamp[-1] == SINCE + 49 * MINUTE
+
+
+@pytest.mark.asyncio
+async def test_short_pages_are_continued_until_the_window_is_covered(tmp_path: Path) -> None:
+    # 거래소 최대 개수(4)가 page_limit(10)보다 작아서 매번 짧은 페이지가 옵니다.
+    client = FakeOHLCVClient(max_limit=4)
+    checkpoint = BackfillCheckpoint(tmp_path / "backfill.json")
+    backfill = CandleBackfill(
+        MarketData(SimpleNamespace(client=client)), page_limit=10, checkpoint=checkpoint
+    )
+
+    candles = await backfill.fetch("BTC/USDT", "1m", since=SINCE, until=SINCE + 25 * MINUTE)
+
+    assert len(candles) == 25
+    assert np.all(np.diff(candles.timestamp) == MINUTE)
+    assert checkpoint.load(backfill.checkpoint_key("BTC/USDT", "1m")) == SINCE + 25 * MINUTE
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import pytest
+
+from app.ccxt.api.market_data import MarketData
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.ccxt.enums.market_type import MarketType
+from app.service.candle_backfill import CandleBackfill
+from app.service.candle_store import CandleStore, CandleStoreKey
+
+MINUTE = 60_000
+SINCE = 1_755_360_000_000
+KEY = CandleStoreKey(
+    exchange="binance", market_type=MarketType.FUTURE, symbol="BTC/USDT:USDT", timeframe="1m"
+)
+
+
+def make_candles(start: int, count: int) -> CandleArrayDTO:
+    return CandleArrayDTO.from_ohlcv(
+        [[ts, 1.0, 2.0, 0.5, 1.5, 10.0] for ts in range(start, start + count * MINUTE, MINUTE)]
+    )
+
+
+class FakeOHLCVClient:
+    id = "binance"
+    options = {"defaultType": "future"}
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    async def fetch_ohlcv(
+        self, symbol: str, timeframe: str, since: int, limit: int
+    ) -> list[list[Any]]:
+        self.calls.append(since)
+        return [
+            [c.timestamp, c.open, c.high, c.low, c.close, c.volume]
+            for c in make_candles(since, limit)
+        ]
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> CandleStore:
+    return CandleStore(tmp_path)
+
+
+def test_append_and_read(store: CandleStore) -> None:
+    assert store.read(KEY).timestamp.tolist() == []
+
+    assert store.append(KEY, make_candles(SINCE, 10)) == 10
+    assert store.append(KEY, make_candles(SINCE + 5 * MINUTE, 10)) == 5  # overlap is skipped
+
+    candles = store.read(KEY)
+    assert len(candles) == 15
+    assert isinstance(candles.close, np.memmap)
+    assert store.last_timestamp(KEY) == SINCE + 14 * MINUTE
+
+    window = store.read(KEY, SINCE + 3 * MINUTE, SINCE + 6 * MINUTE)
+    assert window.timestamp.tolist() == [SINCE + i * MINUTE for i in (3, 4, 5)]
+
+
+def test_torn_append_is_ignored(store: CandleStore, tmp_path: Path) -> None:
+    store.append(KEY, make_candles(SINCE, 3))
+
+    # a crash after writing a price column but before the timestamp column
+    with (KEY.directory(tmp_path) / "open.bin").open("ab") as f:
+        np.array([9.0], dtype="<f8").tofile(f)
+
+    assert len(store.read(KEY)) == 3
+    assert store.append(KEY, make_candles(SINCE + 3 * MINUTE, 1)) == 1
+    assert store.read(KEY).open.tolist() == [1.0, 1.0, 1.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_sync_fetches_only_missing_tail(store: CandleStore) -> None:
+    client = FakeOHLCVClient()
+    market_data = MarketData(SimpleNamespace(client=client))
+    backfill = CandleBackfill(market_data, page_limit=100)
+
+    now = int(time.time() * 1000)
+    since = now - now % MINUTE - 250 * MINUTE
+
+    first = await store.sync(market_data, "BTC/USDT:USDT", "1m", since=since, backfill=backfill)
+    assert len(first) == 250
+    assert len(client.calls) == 3
+
+    client.calls.clear()
+    await store.sync(market_data, "BTC/USDT:USDT", "1m", since=since, backfill=backfill)
+    assert len(client.calls) <= 1
+    assert all(call > first.timestamp[-1] for call in client.calls)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from app.ccxt.api.market_data import MarketData
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.ccxt.dtos.latency_dto import LatencyDTO
+from app.ccxt.enums.market_type import MarketType
+from app.ccxt.simulator import MarketReplay, SimulatedExchange
+from app.service.clock_monitor import ClockMonitor
+
+START = 1_755_360_000_000
+MINUTE = 60_000
+
+
+def make_exchange(latency: float) -> SimulatedExchange:
+    close = np.full(5, 100.0)
+    replay = MarketReplay()
+    replay.add_candles(
+        "BTC/USDT",
+        "1m",
+        CandleArrayDTO(
+            timestamp=START + MINUTE * np.arange(5, dtype=np.int64),
+            open=close,
+            high=close,
+            low=close,
+            close=close,
+            volume=np.ones(5),
+        ),
+    )
+    return SimulatedExchange(MarketType.SPOT, replay, latency=latency)
+
+
+class ScriptedSampler:
+    def __init__(self, *samples: tuple[float, float]) -> None:
+        self.samples = [
+            LatencyDTO(rtt=rtt, offset=offset, server_time=0, timestamp=0)
+            for rtt, offset in samples
+        ]
+
+    async def __call__(self) -> LatencyDTO:
+        return self.samples.pop(0)
+
+
+@pytest.mark.asyncio
+async def test_fetch_latency_measures_round_trip_and_offset() -> None:
+    exchange = make_exchange(latency=0.02)
+
+    sample = await MarketData(exchange).fetch_latency()
+
+    assert sample.rtt >= 20.0
+    assert sample.server_time == exchange.client.milliseconds()
+    # 시뮬레이터 서버 시각은 replay 시각이라 offset은 로컬 시각과의 차이만큼 음수입니다.
+    assert sample.offset == pytest.approx(
+        sample.server_time - (sample.timestamp - sample.rtt / 2), abs=1
+    )
+    assert sample.offset == pytest.approx(sample.server_time - time.time() * 1000, abs=1_000)
+
+
+@pytest.mark.asyncio
+async def test_offset_uses_fastest_sample_and_keeps_percentiles() -> None:
+    sampler = ScriptedSampler((80.0, -30.0), (10.0, -12.0), (50.0, 5.0), (20.0, -20.0))
+    monitor = ClockMonitor({"binance": sampler}, window=3, min_recv_window=100)
+
+    for _ in range(4):
+        await monitor.sample()
+
+    stats = monitor.stats("binance")
+    assert stats is not None
+    assert stats.samples == 3  # 가장 오래된 표본은 window 밖으로 밀려납니다.
+    assert (stats.offset, stats.offset_error) == (-12.0, 5.0)
+    assert stats.rtt_p50 == 20.0
+    assert stats.rtt_p99 == pytest.approx(49.4)
+
+    exchange = make_exchange(latency=0.0)
+    monitor.attach("binance", exchange)
+    assert exchange.client.options["timeDifference"] == 12
+    assert exchange.client.options["recvWindow"] == 103  # 2 x p99 + offset 오차
+
+
+@pytest.mark.asyncio
+async def test_ranked_orders_venues_by_median_rtt_and_skips_failures() -> None:
+    async def failing() -> LatencyDTO:
+        raise ConnectionError("down")
+
+    monitor = ClockMonitor(
+        {
+            "slow": MarketData(make_exchange(latency=0.03)).fetch_latency,
+            "fast": MarketData(make_exchange(latency=0.0)).fetch_latency,
+            "down": failing,
+        }
+    )
+
+    samples = await monitor.sample()
+
+    assert set(samples) == {"slow", "fast"}
+    assert monitor.ranked() == ["fast", "slow", "down"]
+    assert monitor.stats("down") is None
+    assert monitor.offset("down") == 0.0
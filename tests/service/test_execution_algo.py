@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.ccxt.dtos.order_book_dto import OrderBookDTO, PriceLevelDTO
+from app.ccxt.enums.market_type import MarketType
+from app.ccxt.simulator import MarketReplay, SimulatedExchange
+from app.service.execution_algo import TWAP, VWAP, ExecutionScheduler, Iceberg, volume_profile
+from app.service.order_manager import CLIENT_ORDER_ID_PREFIX, OrderManager
+
+START = 1_755_360_000_000
+MINUTE = 60_000
+
+
+def make_candles(count: int = 30) -> CandleArrayDTO:
+    close = 100.0 - 0.5 * np.arange(count, dtype=np.float64)
+    return CandleArrayDTO(
+        timestamp=START + MINUTE * np.arange(count, dtype=np.int64),
+        open=close,
+        high=close + 0.25,
+        low=close - 0.25,
+        close=close,
+        volume=np.full(count, 2.0),
+    )
+
+
+def make_manager() -> tuple[SimulatedExchange, OrderManager]:
+    replay = MarketReplay()
+    replay.add_candles("BTC/USDT", "1m", make_candles())
+    exchange = SimulatedExchange(MarketType.SPOT, replay, balances={"USDT": 1e6})
+    return exchange, OrderManager(exchange)
+
+
+@pytest.mark.asyncio
+async def test_twap_and_vwap_slice_the_parent_order() -> None:
+    _, manager = make_manager()
+    scheduler = ExecutionScheduler(manager)
+
+    twap = scheduler.submit(TWAP("buy", "BTC/USDT", 1.0, duration=0.04, slices=4))
+    vwap = scheduler.submit(VWAP("buy", "BTC/USDT", 1.0, duration=0.02, profile=[1.0, 3.0]))
+
+    twap_report = await scheduler.wait(twap)
+    assert (twap_report.status, twap_report.children) == ("done", 4)
+    assert twap_report.filled == pytest.approx(1.0)
+    assert twap_report.average is not None
+
+    vwap_report = await scheduler.wait(vwap)
+    assert (vwap_report.status, vwap_report.filled) == ("done", pytest.approx(1.0))
+    assert manager.open_orders() == []
+
+
+@pytest.mark.asyncio
+async def test_schedulers_sharing_a_manager_use_unique_child_ids() -> None:
+    _, manager = make_manager()
+    first, second = ExecutionScheduler(manager), ExecutionScheduler(manager)
+
+    parents = [
+        first.submit(Iceberg("buy", "BTC/USDT", 1.0, price=90.0, display=0.5)),
+        second.submit(Iceberg("buy", "BTC/USDT", 1.0, price=90.0, display=0.5)),
+    ]
+    await asyncio.sleep(0.01)
+
+    assert parents[0] == parents[1]  # 스케줄러마다 부모 id를 따로 셉니다.
+    children = [order.client_order_id for order in manager.open_orders()]
+    assert len(children) == len(set(children)) == 2
+    assert all(child.startswith(CLIENT_ORDER_ID_PREFIX) for child in children)
+
+    await first.close()
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_many_parent_orders_share_one_loop() -> None:
+    _, manager = make_manager()
+    scheduler = ExecutionScheduler(manager, max_active=8)
+
+    parents = [
+        scheduler.submit(TWAP("buy", "BTC/USDT", 0.1, duration=0.01, slices=5)) for _ in range(40)
+    ]
+    reports = [await scheduler.wait(parent_id) for parent_id in parents]
+
+    assert all(report.status == "done" for report in reports)
+    assert sum(report.children for report in reports) == 200
+    assert scheduler.active() == []
+
+
+@pytest.mark.asyncio
+async def test_iceberg_refreshes_display_until_filled_and_cancels() -> None:
+    exchange, manager = make_manager()
+    scheduler = ExecutionScheduler(manager)
+
+    parent_id = scheduler.submit(Iceberg("buy", "BTC/USDT", 1.0, price=99.0, display=0.4))
+    for _ in range(10):
+        await asyncio.sleep(0)
+        exchange.client.advance(MINUTE)  # 가격이 내려와 걸어둔 조각이 체결됨
+        await manager.poll()
+        await asyncio.sleep(0)
+        if not scheduler.active():
+            break
+
+    report = await scheduler.wait(parent_id)
+    assert (report.status, report.children) == ("done", 3)  # 0.4 + 0.4 + 0.2
+    assert report.filled == pytest.approx(1.0)
+    assert report.average == pytest.approx(99.0)
+
+    # 체결되지 않는 가격의 iceberg는 취소하면 걸어둔 조각도 취소됩니다.
+    resting = scheduler.submit(Iceberg("buy", "BTC/USDT", 1.0, price=10.0, display=0.5))
+    await asyncio.sleep(0.01)
+    assert len(await exchange.client.fetch_open_orders("BTC/USDT")) == 1
+    assert (await scheduler.cancel(resting)).status == "canceled"
+    assert await exchange.client.fetch_open_orders("BTC/USDT") == []
+
+
+def test_volume_profile_buckets_by_time_of_day() -> None:
+    candles = make_candles(4)
+    profile = volume_profile(candles, 24)
+    assert profile.sum() == pytest.approx(1.0)
+    assert profile[np.argmax(profile)] == 1.0
+
+    with pytest.raises(ValueError):
+        VWAP("buy", "BTC/USDT", 1.0, duration=1.0, profile=[0.0, 0.0])
+
+
+@pytest.mark.asyncio
+async def test_canceled_parent_keeps_fills_of_the_resting_child() -> None:
+    replay = MarketReplay()
+    replay.add_candles("BTC/USDT", "1m", make_candles())
+    replay.add_order_books(
+        "BTC/USDT",
+        [
+            OrderBookDTO(
+                asks=[PriceLevelDTO(101.0, 1.0), PriceLevelDTO(102.0, 2.0)],
+                bids=[PriceLevelDTO(100.0, 1.0)],
+                symbol="BTC/USDT",
+                datetime=None,
+                timestamp=START,
+                nonce=START,
+            )
+        ],
+    )
+    exchange = SimulatedExchange(MarketType.SPOT, replay, balances={"USDT": 1e6})
+    scheduler = ExecutionScheduler(OrderManager(exchange))
+
+    # 101에 1.0만 즉시 체결되고 나머지 0.5는 걸려 있다가 취소됩니다.
+    parent_id = scheduler.submit(Iceberg("buy", "BTC/USDT", 2.0, price=101.0, display=1.5))
+    await asyncio.sleep(0.01)
+    report = await scheduler.cancel(parent_id)
+
+    assert report.status == "canceled"
+    assert report.filled == pytest.approx(1.0)
+    assert report.average == pytest.approx(101.0)
+    assert await exchange.client.fetch_open_orders("BTC/USDT") == []
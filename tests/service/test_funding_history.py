@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import math
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ccxt.api.market_data import MarketData
+from app.ccxt.dtos.funding_history_array_dto import FundingHistoryArrayDTO
+from app.service.funding_history import FundingHistoryStore, FundingPanel
+
+START = 1_755_360_000_000
+HOUR = 3_600_000
+
+
+def make_history(start: int, count: int, interval: int, rate: float) -> list[dict[str, Any]]:
+    # binance처럼 정산 시각이 몇 밀리초 늦게 찍히는 경우를 포함합니다.
+    return [
+        {"timestamp": start + i * interval + 3, "fundingRate": rate + i * 1e-6}
+        for i in range(count)
+    ]
+
+
+class FakeFundingClient:
+    id = "fake"
+    has = {"fetchFundingRateHistory": True}
+
+    def __init__(self, histories: dict[str, list[dict[str, Any]]]) -> None:
+        self.histories = histories
+        self.calls: list[tuple[str, int | None]] = []
+
+    async def fetch_funding_rate_history(
+        self, symbol: str, since: int | None = None, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        self.calls.append((symbol, since))
+        if symbol not in self.histories:
+            raise ConnectionError("unknown symbol")
+        rows = [row for row in self.histories[symbol] if since is None or row["timestamp"] >= since]
+        return rows[:limit]
+
+
+@pytest.mark.asyncio
+async def test_top_up_paginates_and_only_fetches_new_settlements() -> None:
+    client = FakeFundingClient(
+        {
+            "BTC/USDT:USDT": make_history(START, 5, 8 * HOUR, 0.0001),
+            "ETH/USDT:USDT": make_history(START, 2, 8 * HOUR, 0.0002),
+        }
+    )
+    store = FundingHistoryStore(MarketData(SimpleNamespace(client=client)), page_limit=2)
+
+    added = await store.top_up(
+        ["BTC/USDT:USDT", "ETH/USDT:USDT", "DOGE/USDT:USDT"], since=START, until=START + 100 * HOUR
+    )
+
+    assert added == {"BTC/USDT:USDT": 5, "ETH/USDT:USDT": 2}  # 실패한 심볼은 빠집니다.
+    assert [since for symbol, since in client.calls if symbol == "BTC/USDT:USDT"] == [
+        START,
+        START + 8 * HOUR + 4,
+        START + 24 * HOUR + 4,
+    ]
+
+    client.histories["BTC/USDT:USDT"] = make_history(START, 6, 8 * HOUR, 0.0001)
+    client.calls.clear()
+    assert await store.top_up(["BTC/USDT:USDT"], since=START, until=START + 100 * HOUR) == {
+        "BTC/USDT:USDT": 1
+    }
+    assert client.calls == [("BTC/USDT:USDT", START + 32 * HOUR + 4)]
+    assert len(store.history("BTC/USDT:USDT")) == 6
+
+
+class BybitFundingClient(FakeFundingClient):
+    """
+    bybit처럼 limit를 200개로 자르고, since + limit x 정산 주기 구간의 최신 limit개를 돌려주는 거래소
+    """
+
+    id = "bybit"
+
+    async def fetch_funding_rate_history(
+        self, symbol: str, since: int | None = None, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        limit = min(limit or 200, 200)
+        rows = await super().fetch_funding_rate_history(symbol, since, None)
+        if since is not None:
+            rows = [row for row in rows if row["timestamp"] <= since + limit * 8 * HOUR]
+        return rows[-limit:]
+
+
+@pytest.mark.asyncio
+async def test_download_clamps_page_limit_to_venue_maximum() -> None:
+    client = BybitFundingClient({"BTC/USDT:USDT": make_history(START, 450, 8 * HOUR, 0.0001)})
+    store = FundingHistoryStore(MarketData(SimpleNamespace(client=client)))
+
+    added = await store.download("BTC/USDT:USDT", since=START, until=START + 500 * 8 * HOUR)
+
+    assert added == 450
+    assert len(client.calls) == 3
+    assert store.history("BTC/USDT:USDT").timestamp[0] == START + 3
+
+
+def test_panel_aligns_symbols_on_a_common_grid() -> None:
+    store = FundingHistoryStore(MarketData(SimpleNamespace(client=FakeFundingClient({}))))
+    store.append(
+        "BTC/USDT:USDT", FundingHistoryArrayDTO.from_ccxt(make_history(START, 3, 8 * HOUR, 0.0001))
+    )
+    # 4시간 정산 심볼은 8시간 칸에 두 번씩 합산됩니다.
+    store.append(
+        "SOL/USDT:USDT", FundingHistoryArrayDTO.from_ccxt(make_history(START, 6, 4 * HOUR, 0.0))
+    )
+    # 늦게 상장된 심볼의 앞 칸은 NaN 입니다.
+    store.append(
+        "NEW/USDT:USDT",
+        FundingHistoryArrayDTO.from_ccxt(make_history(START + 16 * HOUR, 1, 8 * HOUR, -0.001)),
+    )
+
+    panel = store.panel(step="8h")
+
+    assert panel.timestamp.tolist() == [START, START + 8 * HOUR, START + 16 * HOUR]
+    np.testing.assert_allclose(panel.column("SOL/USDT:USDT"), [1e-6, 5e-6, 9e-6])
+    assert np.isnan(panel.column("NEW/USDT:USDT")[:2]).all()
+
+    carry = panel.annualized_carry()
+    assert carry[0] == pytest.approx(0.000101 * 3 * 365)
+    assert carry[2] == pytest.approx(-0.001 * 3 * 365)
+    assert panel.ranked() == ["BTC/USDT:USDT", "SOL/USDT:USDT", "NEW/USDT:USDT"]
+
+
+def test_rolling_statistics_match_pandas_with_missing_values() -> None:
+    rng = np.random.default_rng(7)
+    rates = rng.normal(0.0001, 0.00005, size=(200, 4))
+    rates[:50, 1] = np.nan  # 늦은 상장
+    rates[120:130, 2] = np.nan  # 누락
+    rates[:, 3] = 0.0001  # 변동이 없는 심볼
+    panel = FundingPanel(
+        symbols=("A", "B", "C", "D"),
+        timestamp=START + 8 * HOUR * np.arange(200, dtype=np.int64),
+        rates=rates,
+        step=8 * HOUR,
+    )
+
+    rolling = pd.DataFrame(rates).rolling(21, min_periods=15)
+    np.testing.assert_allclose(
+        panel.rolling_mean(21, min_periods=15), rolling.mean().to_numpy(), rtol=1e-9, equal_nan=True
+    )
+    np.testing.assert_allclose(
+        panel.rolling_std(21, min_periods=15),
+        rolling.std(ddof=0).to_numpy(),
+        rtol=1e-6,
+        atol=1e-15,
+        equal_nan=True,
+    )
+
+    zscore = panel.zscore(21)
+    expected = (rates[-1, 0] - rates[-21:, 0].mean()) / rates[-21:, 0].std()
+    assert zscore[-1, 0] == pytest.approx(expected)
+    assert math.isnan(zscore[-1, 3])  # 표준편차 0
+    assert np.isnan(zscore[:20]).all()
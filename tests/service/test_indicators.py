@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ccxt.dtos.candle_dto import CandleDTO
+from app.strategies.indicators import (
+    ATR,
+    EMA,
+    RSI,
+    SMA,
+    VWAP,
+    Bollinger,
+    RollingStd,
+    atr,
+    bollinger,
+    ema,
+    rolling_std,
+    rsi,
+    sma,
+    vwap,
+)
+
+START = 1_755_360_000_000
+MINUTE = 60_000
+
+
+def make_candles(count: int = 5_000, seed: int = 11) -> list[CandleDTO]:
+    rng = np.random.default_rng(seed)
+    close = 117_000.0 * np.exp(np.cumsum(rng.normal(0, 0.001, count)))
+    open_ = np.concatenate(([117_000.0], close[:-1]))
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.001, count))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.001, count))
+    volume = rng.uniform(0.1, 5.0, count)
+    return [
+        CandleDTO(START + i * MINUTE, open_[i], high[i], low[i], close[i], volume[i])
+        for i in range(count)
+    ]
+
+
+def column(candles: list[CandleDTO], name: str) -> np.ndarray:
+    return np.array([getattr(candle, name) for candle in candles])
+
+
+def assert_matches(streamed: list[float], batch: np.ndarray) -> None:
+    streamed_array = np.array(streamed)
+    np.testing.assert_array_equal(np.isnan(streamed_array), np.isnan(batch))
+    np.testing.assert_allclose(streamed_array, batch, rtol=1e-9)
+
+
+@pytest.mark.parametrize(
+    "indicator, batch",
+    [
+        (lambda: SMA(20), lambda x: sma(x, 20)),
+        (lambda: EMA(20), lambda x: ema(x, 20)),
+        (lambda: RollingStd(20), lambda x: rolling_std(x, 20)),
+        (lambda: Bollinger(20, 2.0), lambda x: bollinger(x, 20, 2.0)[0]),
+        (lambda: RSI(14), lambda x: rsi(x, 14)),
+    ],
+)
+def test_incremental_matches_batch(indicator, batch) -> None:
+    candles = make_candles()
+    streaming = indicator()
+
+    streamed = [streaming.on_candle(candle) for candle in candles]
+    assert_matches(streamed, batch(column(candles, "close")))
+    assert streaming.ready
+
+
+def test_candle_indicators_match_batch() -> None:
+    candles = make_candles()
+    high, low, close, volume = (column(candles, n) for n in ("high", "low", "close", "volume"))
+    timestamp = column(candles, "timestamp").astype(np.int64)
+
+    streaming_atr, streaming_vwap = ATR(14), VWAP(session="1h")
+    assert_matches([streaming_atr.on_candle(c) for c in candles], atr(high, low, close, 14))
+    assert_matches(
+        [streaming_vwap.on_candle(c) for c in candles],
+        vwap(high, low, close, volume, timestamp, session="1h"),
+    )
+
+    # 세션 첫 봉의 VWAP은 그 봉의 대표가격입니다.
+    first = vwap(high, low, close, volume, timestamp, session="1h")[60]
+    assert first == pytest.approx((high[60] + low[60] + close[60]) / 3)
+
+
+def test_batch_matches_pandas() -> None:
+    close = pd.Series(column(make_candles(), "close"))
+
+    np.testing.assert_allclose(sma(close, 30), close.rolling(30).mean(), rtol=1e-9)
+    np.testing.assert_allclose(rolling_std(close, 30), close.rolling(30).std(ddof=0), rtol=1e-6)
+
+    # 첫 window개의 평균으로 시작하는 EMA = 그 평균을 첫 값으로 둔 adjust=False ewm
+    seeded = pd.concat([pd.Series([close[:20].mean()]), close[20:]], ignore_index=True)
+    expected = seeded.ewm(span=20, adjust=False).mean().to_numpy()
+    np.testing.assert_allclose(ema(close, 20)[19:], expected, rtol=1e-9)
+
+
+def test_rsi_edges_and_warmup() -> None:
+    rising = np.arange(1.0, 40.0)
+    assert rsi(rising, 14)[-1] == 100.0
+    assert math.isnan(rsi(rising, 14)[13])
+    assert rsi(np.full(40, 5.0), 14)[-1] == 50.0
+
+    streaming = SMA(3)
+    for price in (1.0, 2.0):
+        streaming.update(price)
+    assert not streaming.ready
+    assert streaming.update(6.0) == 3.0
+
+    with pytest.raises(ValueError):
+        SMA(0)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.ccxt.api.market_data import MarketData
+from app.ccxt.dtos.liquidation_dto import LiquidationDTO, LiquidationSpikeDTO
+from app.ccxt.websocket.market_stream import MarketStream
+from app.service.liquidation_feed import LiquidationFeed, LiquidationWindow
+
+START = 1_755_360_000_000
+SYMBOL = "BTC/USDT:USDT"
+
+
+def make_liquidation(timestamp: int, side: str, notional: float) -> LiquidationDTO:
+    return LiquidationDTO(SYMBOL, timestamp, "", side, 100.0, notional / 100.0, notional)  # type: ignore[arg-type]
+
+
+def make_ccxt_liquidation(timestamp: int, side: str, contracts: float) -> dict[str, Any]:
+    return {
+        "symbol": SYMBOL,
+        "timestamp": timestamp,
+        "datetime": "",
+        "side": side,
+        "price": 100.0,
+        "contracts": contracts,
+        "contractSize": 1.0,
+        "baseValue": None,
+        "quoteValue": None,
+    }
+
+
+class FakeLiquidationClient:
+    def __init__(self, exchange_id: str, liquidations: list[dict[str, Any]]) -> None:
+        self.id = exchange_id
+        self.has = {"fetchLiquidations": True}
+        self.liquidations = liquidations
+        self.messages: asyncio.Queue[list[dict[str, Any]]] = asyncio.Queue()
+
+    async def fetch_liquidations(
+        self, symbol: str, since: int | None = None, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        return self.liquidations[:limit]
+
+    async def watch_liquidations(self, symbol: str) -> list[dict[str, Any]]:
+        return await self.messages.get()
+
+
+def test_window_rolls_buckets_and_drops_stale_liquidations() -> None:
+    window = LiquidationWindow(window=3.0, bucket=1.0)
+    assert window.add(START, "long", 100.0)
+    assert window.add(START + 1_500, "short", 50.0)
+    assert window.add(START + 2_999, "long", 10.0)
+
+    assert window.totals(now=START + 2_999) == (110.0, 50.0)
+    assert window.totals(seconds=2.0, now=START + 2_999) == (10.0, 50.0)
+
+    # 첫 칸을 덮어쓴 뒤에는 그 칸의 이전 청산이 사라지고, 그보다 오래된 청산은 버립니다.
+    assert window.add(START + 3_000, "long", 1.0)
+    assert not window.add(START + 10, "long", 1.0)
+    assert window.totals(now=START + 3_000) == (11.0, 50.0)
+    assert window.totals(now=START + 60_000) == (0.0, 0.0)
+
+
+@pytest.mark.asyncio
+async def test_handlers_fire_once_when_the_rolling_total_crosses_the_threshold() -> None:
+    feed = LiquidationFeed(MarketData(SimpleNamespace(client=FakeLiquidationClient("x", []))))
+    longs: list[LiquidationSpikeDTO] = []
+    both: list[LiquidationSpikeDTO] = []
+
+    async def on_both(spike: LiquidationSpikeDTO) -> None:
+        both.append(spike)
+
+    feed.subscribe(longs.append, threshold=1_000.0, seconds=10.0, side="long")
+    unsubscribe = feed.subscribe(on_both, threshold=1_500.0, seconds=10.0)
+
+    feed.on_liquidation(make_liquidation(START, "long", 600.0))
+    feed.on_liquidation(make_liquidation(START + 1_000, "short", 500.0))
+    feed.on_liquidation(make_liquidation(START + 2_000, "long", 500.0))  # 롱 1100 / 합계 1600
+    feed.on_liquidation(make_liquidation(START + 3_000, "long", 500.0))  # 이미 넘은 상태
+    # 처음 청산들이 window 밖으로 밀려나 합계가 내려간 뒤 다시 넘습니다.
+    feed.on_liquidation(make_liquidation(START + 12_500, "long", 600.0))
+    await asyncio.sleep(0)
+
+    assert [(spike.timestamp, spike.notional) for spike in longs] == [
+        (START + 2_000, 1_100.0),
+        (START + 12_500, 1_100.0),
+    ]
+    assert [(spike.side, spike.notional) for spike in both] == [(None, 1_600.0)]
+
+    unsubscribe()
+    feed.on_liquidation(make_liquidation(START + 13_000, "short", 5_000.0))
+    await asyncio.sleep(0)
+    assert len(both) == 1
+
+
+@pytest.mark.asyncio
+async def test_backfill_and_stream_normalize_liquidated_position_side() -> None:
+    # binance의 side는 청산 주문 방향(sell = 롱 청산)입니다.
+    rest = FakeLiquidationClient("binance", [make_ccxt_liquidation(START, "sell", 2.0)])
+    market_data = MarketData(SimpleNamespace(client=rest))
+    assert [
+        (item.side, item.notional) for item in await market_data.fetch_liquidations(SYMBOL)
+    ] == [("long", 200.0)]
+
+    # bybit의 side는 청산된 포지션 방향(buy = 롱 청산)입니다.
+    ws = FakeLiquidationClient("bybit", [])
+    feed = LiquidationFeed(market_data, stream=MarketStream(SimpleNamespace(ws_client=ws)))
+    spikes: list[LiquidationSpikeDTO] = []
+    feed.subscribe(spikes.append, threshold=250.0, side="long")
+
+    assert await feed.backfill(SYMBOL) == 1
+    assert spikes == []
+
+    feed.watch(SYMBOL)
+    await ws.messages.put([make_ccxt_liquidation(START + 1, "buy", 1.0)])
+    await ws.messages.put([make_ccxt_liquidation(START + 2, "sell", 5.0)])
+    for _ in range(5):
+        await asyncio.sleep(0)
+    await feed.stop()
+
+    assert feed.window(SYMBOL).totals(now=START + 2) == (300.0, 500.0)
+    assert [(spike.side, spike.notional) for spike in spikes] == [("long", 300.0)]
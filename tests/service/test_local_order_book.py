@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import pytest
+
+from app.ccxt.dtos.order_book_delta_dto import OrderBookDeltaDTO
+from app.ccxt.dtos.order_book_dto import OrderBookDTO, PriceLevelDTO
+from app.ccxt.exceptions.order_book_exception import OrderBookSyncError
+from app.service.local_order_book import LocalOrderBook
+
+
+def levels(*pairs: tuple[float, float]) -> list[PriceLevelDTO]:
+    return [PriceLevelDTO(price=price, amount=amount) for price, amount in pairs]
+
+
+def make_snapshot(nonce: int) -> OrderBookDTO:
+    return OrderBookDTO(
+        asks=levels((101.0, 1.0), (102.0, 2.0), (103.0, 3.0)),
+        bids=levels((100.0, 1.0), (99.0, 2.0), (98.0, 3.0)),
+        symbol="BTC/USDT",
+        datetime="2025-08-16T16:38:43.278Z",
+        timestamp=1755362323278,
+        nonce=nonce,
+    )
+
+
+def make_delta(
+    first_nonce: int,
+    nonce: int,
+    bids: list[PriceLevelDTO] | None = None,
+    asks: list[PriceLevelDTO] | None = None,
+) -> OrderBookDeltaDTO:
+    return OrderBookDeltaDTO(
+        asks=asks or [],
+        bids=bids or [],
+        symbol="BTC/USDT",
+        timestamp=1755362323300,
+        first_nonce=first_nonce,
+        nonce=nonce,
+    )
+
+
+class SnapshotSource:
+    def __init__(self, *nonces: int) -> None:
+        self.nonces = list(nonces)
+        self.calls = 0
+
+    async def __call__(self) -> OrderBookDTO:
+        self.calls += 1
+        return make_snapshot(self.nonces.pop(0))
+
+
+@pytest.mark.asyncio
+async def test_apply_delta_after_snapshot() -> None:
+    source = SnapshotSource(10)
+    book = LocalOrderBook("BTC/USDT", source)
+
+    await book.apply(make_delta(9, 12, bids=levels((100.5, 4.0), (99.0, 0.0))))
+    await book.apply(make_delta(13, 13, asks=levels((101.0, 0.0), (101.5, 0.5))))
+
+    assert source.calls == 1
+    assert book.nonce == 13
+    assert book.best_bid == PriceLevelDTO(price=100.5, amount=4.0)
+    assert book.best_ask == PriceLevelDTO(price=101.5, amount=0.5)
+    assert book.bids.top(3) == levels((100.5, 4.0), (100.0, 1.0), (98.0, 3.0))
+    assert book.asks.top(10) == levels((101.5, 0.5), (102.0, 2.0), (103.0, 3.0))
+
+
+@pytest.mark.asyncio
+async def test_stale_delta_is_ignored() -> None:
+    book = LocalOrderBook("BTC/USDT", SnapshotSource(10))
+    await book.apply(make_delta(11, 11))
+
+    await book.apply(make_delta(5, 8, bids=levels((100.0, 0.0))))
+
+    assert book.nonce == 11
+    assert book.best_bid == PriceLevelDTO(price=100.0, amount=1.0)
+
+
+@pytest.mark.asyncio
+async def test_gap_triggers_resync() -> None:
+    source = SnapshotSource(10, 20)
+    book = LocalOrderBook("BTC/USDT", source)
+    await book.apply(make_delta(11, 11))
+
+    await book.apply(make_delta(15, 21, bids=levels((100.0, 7.0))))
+
+    assert source.calls == 2
+    assert book.nonce == 21
+    assert book.best_bid == PriceLevelDTO(price=100.0, amount=7.0)
+
+
+@pytest.mark.asyncio
+async def test_resync_gives_up() -> None:
+    book = LocalOrderBook("BTC/USDT", SnapshotSource(10, 10, 10), max_resync_attempts=2)
+
+    with pytest.raises(OrderBookSyncError):
+        await book.apply(make_delta(50, 60))
+
+    assert not book.is_synced
+
+
+def test_depth_queries() -> None:
+    book = LocalOrderBook("BTC/USDT", SnapshotSource())
+    book.load_snapshot(make_snapshot(1))
+
+    assert book.bids.depth_to_price(99.0) == 3.0
+    assert book.bids.depth_to_price(100.5) == 0.0
+    assert book.asks.depth_to_price(102.5) == 3.0
+    assert book.asks.price_for_amount(2.5) == 102.0
+    assert book.bids.price_for_amount(6.0) == 98.0
+    assert book.bids.price_for_amount(6.5) is None
+    assert book.to_dto(limit=1).asks == levels((101.0, 1.0))
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.ccxt.api.market_data import MarketData
+from app.service.market_registry import MarketRegistry
+
+
+def make_market(symbol: str, market_id: str, contract: bool) -> dict[str, Any]:
+    base, quote = symbol.split(":")[0].split("/")
+    return {
+        "symbol": symbol,
+        "id": market_id,
+        "base": base,
+        "quote": quote,
+        "settle": quote if contract else None,
+        "type": "swap" if contract else "spot",
+        "active": True,
+        "contract": contract,
+        "contractSize": 1.0 if contract else None,
+        "precision": {"amount": 0.001, "price": 0.1},
+        "limits": {"amount": {"min": 0.001, "max": 1000.0}, "cost": {"min": 100.0}},
+        "maker": 0.0002,
+        "taker": 0.0005,
+    }
+
+
+MARKETS = {
+    m["symbol"]: m
+    for m in (
+        make_market("BTC/USDT", "BTCUSDT", contract=False),
+        make_market("BTC/USDT:USDT", "BTCUSDT", contract=True),
+        make_market("ETH/USDT:USDT", "ETHUSDT", contract=True),
+        make_market("ETH/BTC:BTC", "ETHBTC", contract=True),
+    )
+}
+
+
+class FakeClient:
+    id = "binance"
+    options = {"defaultType": "future"}
+
+    def __init__(self) -> None:
+        self.load_calls = 0
+        self.markets: Any = None
+
+    async def load_markets(self, reload: bool = False) -> dict[str, Any]:
+        # ccxt처럼 이미 로드된 마켓이 있으면 reload=True일 때만 다시 받아옵니다.
+        if self.markets is not None and not reload:
+            return self.markets
+        self.load_calls += 1
+        self.markets = dict(MARKETS)
+        return self.markets
+
+    def set_markets(self, markets: Any) -> None:
+        self.markets = markets
+
+
+@pytest.fixture
+def client() -> FakeClient:
+    return FakeClient()
+
+
+@pytest.fixture
+def market_data(client: FakeClient) -> MarketData:
+    return MarketData(SimpleNamespace(client=client))
+
+
+@pytest.mark.asyncio
+async def test_indexes_markets_of_market_type(market_data: MarketData, client: FakeClient) -> None:
+    registry = MarketRegistry(market_data)
+    await asyncio.gather(registry.load(), registry.load())
+
+    assert client.load_calls == 1
+    assert len(registry) == 3
+    assert "BTC/USDT" not in registry  # spot market is excluded from the future registry
+
+    btc = registry.get("BTC/USDT:USDT")
+    assert btc.precision.amount == 0.001
+    assert btc.limits.cost_min == 100.0
+    assert btc.limits.price_min is None
+    assert registry.by_id("ETHUSDT") == registry.get("ETH/USDT:USDT")
+    assert [m.symbol for m in registry.by_base("ETH")] == ["ETH/USDT:USDT", "ETH/BTC:BTC"]
+    assert [m.symbol for m in registry.by_quote("BTC")] == ["ETH/BTC:BTC"]
+
+
+@pytest.mark.asyncio
+async def test_warm_start_from_snapshot(market_data: MarketData, tmp_path: Path) -> None:
+    await MarketRegistry(market_data, snapshot_dir=tmp_path).load()
+
+    cold_client = FakeClient()
+    warm = MarketRegistry(MarketData(SimpleNamespace(client=cold_client)), snapshot_dir=tmp_path)
+    await warm.load()
+
+    assert cold_client.load_calls == 0
+    assert warm.symbols() == ["BTC/USDT:USDT", "ETH/USDT:USDT", "ETH/BTC:BTC"]
+
+    warm.attach(SimpleNamespace(client=cold_client))
+    assert cold_client.markets == MARKETS
+
+
+@pytest.mark.asyncio
+async def test_expired_snapshot_is_refetched(market_data: MarketData, tmp_path: Path) -> None:
+    await MarketRegistry(market_data, snapshot_dir=tmp_path).load()
+
+    client = FakeClient()
+    await MarketRegistry(
+        MarketData(SimpleNamespace(client=client)), ttl=0.0, snapshot_dir=tmp_path
+    ).load()
+
+    assert client.load_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_background_refresh(market_data: MarketData, client: FakeClient) -> None:
+    registry = MarketRegistry(market_data, ttl=0.01)
+    await registry.load()
+
+    registry.start()
+    await asyncio.sleep(0.05)
+    await registry.stop()
+
+    assert client.load_calls > 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_reloads_markets(market_data: MarketData, client: FakeClient) -> None:
+    registry = MarketRegistry(market_data)
+    await registry.load()
+
+    MARKETS["SOL/USDT:USDT"] = make_market("SOL/USDT:USDT", "SOLUSDT", contract=True)
+    try:
+        await registry.refresh()
+    finally:
+        del MARKETS["SOL/USDT:USDT"]
+
+    assert client.load_calls == 2
+    assert registry.get("SOL/USDT:USDT").id == "SOLUSDT"
+
+
+def test_shared_registry_per_exchange_and_market_type(market_data: MarketData) -> None:
+    assert MarketRegistry.shared(market_data) is MarketRegistry.shared(market_data)
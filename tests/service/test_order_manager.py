@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import ccxt.async_support as ccxt
+import numpy as np
+import pytest
+
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.ccxt.dtos.order.limit.limit_order_request_dto import LimitOrderRequestDTO
+from app.ccxt.dtos.order.market.market_order_request_dto import MarketOrderRequestDTO
+from app.ccxt.enums.market_type import MarketType
+from app.ccxt.enums.order_status import OrderStatus
+from app.ccxt.enums.time_in_force import TimeInForce
+from app.ccxt.simulator import MarketReplay, SimulatedExchange
+from app.service.order_manager import OrderManager
+
+MINUTE = 60_000
+
+
+def make_exchange() -> SimulatedExchange:
+    close = 100.0 - np.arange(10, dtype=np.float64)  # 100, 99, 98, ...
+    replay = MarketReplay()
+    replay.add_candles(
+        "BTC/USDT",
+        "1m",
+        CandleArrayDTO(
+            timestamp=1_755_360_000_000 + MINUTE * np.arange(10, dtype=np.int64),
+            open=close,
+            high=close + 0.5,
+            low=close - 0.5,
+            close=close,
+            volume=np.full(10, 2.0),
+        ),
+    )
+    return SimulatedExchange(MarketType.SPOT, replay, balances={"USDT": 1e6})
+
+
+class CountingClient:
+    def __init__(self, client: Any) -> None:
+        self._client = client
+        self.calls: dict[str, int] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._client, name)
+        if name.startswith(("fetch_", "cancel_", "create_")):
+            self.calls[name] = self.calls.get(name, 0) + 1
+        return attribute
+
+
+@pytest.mark.asyncio
+async def test_poll_uses_one_open_orders_call_per_symbol() -> None:
+    exchange = make_exchange()
+    counting = CountingClient(exchange.client)
+    manager = OrderManager(SimpleNamespace(client=counting))
+
+    prices = [97.0 - i * 0.01 for i in range(50)]
+    updates = [
+        await manager.submit_limit("buy", LimitOrderRequestDTO("BTC/USDT", 1.0, price))
+        for price in prices
+    ]
+    assert len(manager.open_orders()) == 50
+    assert all(update.id is not None for update in updates)
+
+    events: list = []
+
+    async def collect() -> None:
+        async for update in manager.subscribe():
+            events.append(update)
+
+    collector = asyncio.create_task(collect())
+    await asyncio.sleep(0)
+
+    counting.calls.clear()
+    await manager.poll()  # 변경 없음
+    assert counting.calls == {"fetch_open_orders": 1}
+
+    exchange.client.advance(3 * MINUTE)  # 가격이 97 아래로 내려와 일부 주문 체결
+    await manager.poll()
+    await asyncio.sleep(0)
+    collector.cancel()
+
+    filled = [update for update in events if update.status == OrderStatus.CLOSED]
+    assert filled and all(update.last_filled == 1.0 for update in filled)
+    assert len(manager.open_orders()) == 50 - len(filled)
+    assert counting.calls["fetch_order"] == len(filled)
+
+
+@pytest.mark.asyncio
+async def test_market_order_and_cancel_lifecycle() -> None:
+    exchange = make_exchange()
+    manager = OrderManager(exchange)
+
+    market = await manager.submit_market("buy", MarketOrderRequestDTO("BTC/USDT", 0.5))
+    assert (market.status, market.filled, market.last_filled) == (OrderStatus.CLOSED, 0.5, 0.5)
+    assert (await manager.wait(market.client_order_id)).status == OrderStatus.CLOSED
+
+    resting = await manager.submit_limit(
+        "buy", LimitOrderRequestDTO("BTC/USDT", 1.0, 50.0, TimeInForce.GTC), client_order_id="mine"
+    )
+    assert resting.client_order_id == "mine"
+    waiter = asyncio.create_task(manager.wait("mine"))
+    await asyncio.sleep(0)
+
+    canceled = await manager.cancel("mine")
+    assert canceled.status == OrderStatus.CANCELED
+    assert (await waiter).status == OrderStatus.CANCELED
+    assert manager.open_orders() == []
+
+    with pytest.raises(ValueError):
+        await manager.submit_limit("buy", LimitOrderRequestDTO("BTC/USDT", 1.0, 50.0), "mine")
+
+
+@pytest.mark.asyncio
+async def test_stream_updates_partial_fills() -> None:
+    exchange = make_exchange()
+    stream: asyncio.Queue[list[dict[str, Any]]] = asyncio.Queue()
+    manager = OrderManager(exchange, poll_interval=3600, watch_orders=stream.get)
+    tracked = manager.track("ETH/USDT", "sell", "e-1", 2.0, 3_000.0)
+    manager.start()
+
+    def order(filled: float, status: str) -> dict[str, Any]:
+        return {"id": "e-1", "status": status, "amount": 2.0, "filled": filled, "price": 3_000.0}
+
+    updates = []
+    subscription = manager.subscribe(tracked.client_order_id)
+    await stream.put([order(0.5, "open")])
+    updates.append(await anext(subscription))
+    await stream.put([order(0.5, "open"), order(2.0, "closed")])  # 중복은 무시
+    updates.append(await anext(subscription))
+    await manager.stop()
+
+    assert [(u.filled, u.last_filled, u.status) for u in updates] == [
+        (0.5, 0.5, OrderStatus.OPEN),
+        (2.0, 1.5, OrderStatus.CLOSED),
+    ]
+    assert updates[-1].remaining == 0.0
+
+
+@pytest.mark.asyncio
+async def test_stream_replaces_polling_until_it_stops() -> None:
+    counting = CountingClient(make_exchange().client)
+    stream: asyncio.Queue[list[dict[str, Any]]] = asyncio.Queue()
+    manager = OrderManager(
+        SimpleNamespace(client=counting), poll_interval=0.001, watch_orders=stream.get
+    )
+    manager.track("BTC/USDT", "buy", "o-1", 1.0, 50.0)
+    manager.start()
+    await asyncio.sleep(0.02)
+    assert "fetch_open_orders" not in counting.calls
+    await manager.stop()
+
+    async def broken_stream() -> list[dict[str, Any]]:
+        raise ccxt.NotSupported("watchOrders() is not supported")
+
+    manager = OrderManager(
+        SimpleNamespace(client=counting), poll_interval=0.001, watch_orders=broken_stream
+    )
+    manager.track("BTC/USDT", "buy", "o-2", 1.0, 50.0)
+    manager.start()
+    await asyncio.sleep(0.02)
+    assert counting.calls["fetch_open_orders"] > 0
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_finished_subscriptions_do_not_leave_subscriber_entries() -> None:
+    manager = OrderManager(make_exchange())
+    market = await manager.submit_market("buy", MarketOrderRequestDTO("BTC/USDT", 1.0))
+    await manager.wait(market.client_order_id)
+
+    subscription = manager.subscribe()
+    waiter = asyncio.create_task(anext(subscription))
+    await asyncio.sleep(0)
+    waiter.cancel()  # 구독자 쪽 취소로 끝나도 항목이 지워집니다.
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert manager._subscribers == {}
+
+
+@pytest.mark.asyncio
+async def test_wait_times_out_for_orders_that_stay_open() -> None:
+    manager = OrderManager(make_exchange())
+    update = await manager.submit_limit("buy", LimitOrderRequestDTO("BTC/USDT", 1.0, 50.0))
+
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.01):
+            await manager.wait(update.client_order_id)
+    assert manager.get(update.client_order_id).status == OrderStatus.OPEN
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.ccxt.api.future_order import FutureOrder
+from app.ccxt.api.spot_order import SpotOrder
+from app.ccxt.dtos.candle_array_dto import CandleArrayDTO
+from app.ccxt.dtos.order.market.market_order_request_dto import MarketOrderRequestDTO
+from app.ccxt.dtos.position_dto import PositionDTO
+from app.ccxt.enums.market_type import MarketType
+from app.ccxt.simulator import MarketReplay, SimulatedExchange
+from app.service.position_book import PositionBook
+
+SYMBOL = "BTC/USDT:USDT"
+
+
+def make_replay() -> MarketReplay:
+    close = 100.0 + np.arange(10, dtype=np.float64)
+    replay = MarketReplay()
+    replay.add_candles(
+        "BTC/USDT",
+        "1m",
+        CandleArrayDTO(
+            timestamp=1_755_360_000_000 + 60_000 * np.arange(10, dtype=np.int64),
+            open=close,
+            high=close + 1,
+            low=close - 1,
+            close=close,
+            volume=np.full(10, 2.0),
+        ),
+    )
+    return replay
+
+
+def test_fills_average_entry_and_realize_pnl() -> None:
+    book = PositionBook(leverage=10)
+
+    book.on_fill(SYMBOL, "buy", 1.0, 100.0)
+    book.on_fill(SYMBOL, "buy", 1.0, 110.0)
+    assert book.size(SYMBOL) == 2.0
+    assert book.get(SYMBOL).entry_price == pytest.approx(105.0)
+
+    book.on_mark(SYMBOL, 120.0)
+    assert book.unrealized_pnl(SYMBOL) == pytest.approx(30.0)
+
+    # 3 매도 = 2 청산(+15 x 2) + 1 숏 전환, 수수료 1
+    book.on_fill(SYMBOL, "sell", 3.0, 120.0, fee=1.0)
+    assert book.realized_pnl() == pytest.approx(29.0)
+    position = book.get(SYMBOL)
+    assert (position.side, position.size, position.entry_price) == ("short", 1.0, 120.0)
+
+    book.on_mark(SYMBOL, 118.0)
+    assert book.unrealized_pnl() == pytest.approx(2.0)
+
+    book.on_fill(SYMBOL, "buy", 1.0, 118.0)
+    assert SYMBOL not in book
+    assert book.unrealized_pnl() == 0.0
+    assert book.positions() == []
+
+
+def test_liquidation_distance() -> None:
+    book = PositionBook(leverage=10, maintenance_margin_rate=0.005)
+    book.on_fill(SYMBOL, "buy", 1.0, 100.0)
+
+    assert book.liquidation_price(SYMBOL) == pytest.approx(90.5)
+    book.on_mark(SYMBOL, 95.0)
+    assert book.liquidation_distance(SYMBOL) == pytest.approx((95.0 - 90.5) / 95.0)
+
+    book.on_fill("ETH/USDT:USDT", "sell", 1.0, 100.0)
+    assert book.liquidation_distance("ETH/USDT:USDT") == pytest.approx(0.095)
+
+    spot = PositionBook()
+    spot.on_fill("BTC/USDT", "buy", 1.0, 100.0)
+    assert spot.liquidation_distance("BTC/USDT") is None
+
+
+@pytest.mark.asyncio
+async def test_reconcile_corrects_drift_and_skips_fresh_fills() -> None:
+    remote = [
+        PositionDTO(SYMBOL, "long", 2.0, 200.0, 5.0, 100.0, 101.0, liquidation_price=81.0),
+        PositionDTO("ETH/USDT:USDT", "short", 1.0, 10.0, 5.0, 10.0, 10.0),
+    ]
+
+    async def fetch_positions() -> list[PositionDTO]:
+        book.on_fill("ETH/USDT:USDT", "sell", 3.0, 10.0)  # 조회 중에 들어온 체결
+        return remote
+
+    book = PositionBook(fetch_positions)
+    book.on_fill(SYMBOL, "buy", 1.0, 100.0)
+    book.on_fill("SOL/USDT:USDT", "buy", 1.0, 10.0)
+
+    assert sorted(await book.reconcile()) == [SYMBOL, "SOL/USDT:USDT"]
+    assert book.size(SYMBOL) == 2.0
+    assert book.liquidation_price(SYMBOL) == 81.0
+    assert book.unrealized_pnl(SYMBOL) == pytest.approx(2.0)
+    assert book.size("ETH/USDT:USDT") == -3.0
+    assert "SOL/USDT:USDT" not in book
+
+
+@pytest.mark.asyncio
+async def test_spot_reconcile_keeps_local_entry_price() -> None:
+    remote = [
+        PositionDTO("BTC/USDT", "long", 1.0, 120.0, 1.0, 120.0, 120.0),
+        PositionDTO("ETH/USDT", "long", 2.0, 20.0, 1.0, 10.0, 10.0),
+    ]
+
+    async def fetch_positions() -> list[PositionDTO]:
+        return remote
+
+    book = PositionBook(fetch_positions, spot=True)
+    book.on_fill("BTC/USDT", "buy", 1.0, 100.0)
+
+    # 현물 entry_price는 현재가이므로 수량이 같으면 drift가 아닙니다.
+    assert await book.reconcile() == ["ETH/USDT"]
+    assert book.get("BTC/USDT").entry_price == 100.0
+    assert book.unrealized_pnl("BTC/USDT") == pytest.approx(20.0)
+    assert book.get("ETH/USDT").entry_price == 10.0
+    assert book.liquidation_price("BTC/USDT") is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_positions_from_simulated_exchange() -> None:
+    exchange = SimulatedExchange(
+        MarketType.FUTURE, make_replay(), balances={"USDT": 1_000.0}, taker_fee=0.0, leverage=5
+    )
+    future_order = FutureOrder(exchange)
+    order = await future_order.open_short_market_order(MarketOrderRequestDTO(SYMBOL, 2.0))
+
+    book = PositionBook(future_order.fetch_positions)
+    book.on_fill(SYMBOL, "sell", order.filled, order.average)
+    assert await book.reconcile() == []
+    assert book.get(SYMBOL).leverage == 5.0
+
+    spot = SimulatedExchange(MarketType.SPOT, make_replay(), balances={"USDT": 1_000.0})
+    spot_order = SpotOrder(spot)
+    await spot_order.open_market_order(MarketOrderRequestDTO("BTC/USDT", 1.0))
+    [position] = await spot_order.fetch_positions()
+    assert (position.symbol, position.side) == ("BTC/USDT", "long")
+    assert position.notional == pytest.approx(position.size * position.mark_price)
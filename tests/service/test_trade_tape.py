@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import pytest
+
+from app.ccxt.api.market_data import MarketData
+from app.ccxt.dtos.trade_array_dto import TradeArrayDTO
+from app.ccxt.dtos.trade_dto import TradeDTO
+from app.service.trade_tape import TradeBuffer, TradeTape
+
+START = 1_755_360_000_000
+
+
+def make_trades(rows: list[tuple[int, float, float, str]]) -> list[dict[str, Any]]:
+    return [
+        {
+            "symbol": "BTC/USDT",
+            "timestamp": timestamp,
+            "datetime": "",
+            "side": side,
+            "price": price,
+            "amount": amount,
+            "cost": price * amount,
+            "id": str(i),
+        }
+        for i, (timestamp, price, amount, side) in enumerate(rows)
+    ]
+
+
+class FakeTradesClient:
+    """
+    since 이상인 체결을 앞에서부터 limit개 돌려주는 거래소
+    """
+
+    id = "fake"
+
+    def __init__(self, trades: list[dict[str, Any]]) -> None:
+        self.trades = trades
+        self.calls: list[int | None] = []
+
+    async def fetch_trades(
+        self, symbol: str, since: int | None = None, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        self.calls.append(since)
+        matched = [trade for trade in self.trades if since is None or trade["timestamp"] >= since]
+        return matched[:limit]
+
+
+class HourlyTradesClient(FakeTradesClient):
+    """
+    binance처럼 since부터 1시간 안의 체결만 돌려주는 거래소
+    """
+
+    async def fetch_trades(
+        self, symbol: str, since: int | None = None, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        page = await super().fetch_trades(symbol, since, limit)
+        return [trade for trade in page if since is None or trade["timestamp"] < since + 3_600_000]
+
+
+def test_buffer_wraps_around_and_keeps_time_order() -> None:
+    buffer = TradeBuffer(capacity=5)
+    buffer.append(
+        TradeArrayDTO.from_ccxt(make_trades([(START + i, 100.0, 1.0, "buy") for i in range(3)]))
+    )
+    buffer.append(
+        TradeArrayDTO.from_ccxt(make_trades([(START + i, 100.0, 1.0, "sell") for i in range(3, 7)]))
+    )
+
+    assert len(buffer) == 5
+    window = buffer.window()
+    assert window.timestamp.tolist() == [START + i for i in range(2, 7)]
+    assert window.side.tolist() == [1, -1, -1, -1, -1]
+    assert buffer.window(START + 4, START + 6).timestamp.tolist() == [START + 4, START + 5]
+
+    assert not buffer.push(START, 100.0, 1.0, 1)  # 마지막 체결보다 오래된 체결
+    assert buffer.push(START + 7, 100.0, 1.0, 1)
+    assert buffer.window().timestamp[0] == START + 3
+
+
+def test_window_queries_are_vectorized_over_both_segments() -> None:
+    buffer = TradeBuffer(capacity=4)
+    rows = [
+        (START, 90.0, 5.0, "sell"),
+        (START + 1_000, 100.0, 1.0, "buy"),
+        (START + 2_000, 101.0, 3.0, "buy"),
+        (START + 3_000, 102.0, 2.0, "sell"),
+        (START + 4_000, 103.0, 4.0, "buy"),  # 첫 체결을 덮어써서 링이 두 구간으로 나뉩니다.
+    ]
+    buffer.append(TradeArrayDTO.from_ccxt(make_trades(rows)))
+
+    now = START + 4_000
+    assert buffer.count(seconds=2.0, now=now) == 3
+    assert buffer.volume(seconds=2.0, now=now) == pytest.approx(9.0)
+    assert buffer.imbalance(seconds=2.0, now=now) == pytest.approx((3.0 - 2.0 + 4.0) / 9.0)
+    assert buffer.vwap(seconds=10.0, now=now) == pytest.approx(
+        (100.0 + 101.0 * 3 + 102.0 * 2 + 103.0 * 4) / 10.0
+    )
+    assert buffer.vwap(seconds=1.0, now=START + 60_000) is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_trades_returns_columnar_arrays() -> None:
+    client = FakeTradesClient(
+        make_trades([(START, 100.0, 0.5, "buy"), (START + 1, 99.0, 1.5, "sell")])
+    )
+    market_data = MarketData(SimpleNamespace(client=client))
+
+    trades = await market_data.fetch_trades("BTC/USDT", columnar=True)
+    assert trades.price.tolist() == [100.0, 99.0]
+    assert trades.side.dtype == np.int8 and trades.side.tolist() == [1, -1]
+
+    dtos = await market_data.fetch_trades("BTC/USDT", since=START + 1)
+    assert [(trade.side, trade.amount) for trade in dtos] == [("sell", 1.5)]
+
+
+@pytest.mark.asyncio
+async def test_backfill_paginates_without_duplicates_at_page_boundaries() -> None:
+    # 같은 시각의 체결이 페이지 경계에 걸치도록 만듭니다.
+    timestamps = [START, START + 1, START + 1, START + 1, START + 2, START + 3]
+    client = FakeTradesClient(
+        make_trades([(timestamp, 100.0 + i, 1.0, "buy") for i, timestamp in enumerate(timestamps)])
+    )
+    tape = TradeTape(MarketData(SimpleNamespace(client=client)), page_limit=3)
+
+    added = await tape.backfill("BTC/USDT", since=START, until=START + 10)
+
+    assert added == len(timestamps)
+    assert client.calls == [START, START + 1, START + 2]
+    assert tape.buffer("BTC/USDT").window().price.tolist() == [100.0 + i for i in range(6)]
+
+
+@pytest.mark.asyncio
+async def test_backfill_continues_past_short_hourly_pages() -> None:
+    hour = 3_600_000
+    # 두 번째 시간에는 체결이 없습니다.
+    timestamps = [START, START + 10, START + 2 * hour + 5, START + 3 * hour + 1]
+    client = HourlyTradesClient(
+        make_trades([(timestamp, 100.0 + i, 1.0, "buy") for i, timestamp in enumerate(timestamps)])
+    )
+    tape = TradeTape(MarketData(SimpleNamespace(client=client)), page_limit=1000)
+
+    added = await tape.backfill("BTC/USDT", since=START, until=START + 3 * hour)
+
+    assert added == 3
+    assert client.calls == [START, START + hour, START + 2 * hour]
+    assert tape.buffer("BTC/USDT").window().price.tolist() == [100.0, 101.0, 102.0]
+
+
+def test_stream_trades_are_pushed_to_the_symbol_buffer() -> None:
+    tape = TradeTape(MarketData(SimpleNamespace(client=FakeTradesClient([]))))
+    tape.on_trade(TradeDTO("ETH/USDT", START, "", "sell", 3000.0, 2.0))
+    tape.on_trade(TradeDTO("ETH/USDT", START + 5, "", "buy", 3001.0, 1.0))
+
+    buffer = tape.buffer("ETH/USDT")
+    assert buffer.imbalance(seconds=1.0, now=START + 5) == pytest.approx(-1 / 3)
+    assert len(tape.buffer("BTC/USDT")) == 0
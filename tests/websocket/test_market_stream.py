@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import ccxt.async_support as ccxt
+import pytest
+
+from app.ccxt.dtos.candle_dto import CandleDTO
+from app.ccxt.dtos.order_book_dto import OrderBookDTO
+from app.ccxt.dtos.ticker_dto import TickerDTO
+from app.ccxt.dtos.trade_dto import TradeDTO
+from app.ccxt.websocket.market_stream import MarketStream
+
+
+def make_ticker(last: float) -> dict[str, Any]:
+    return {
+        "symbol": "BTC/USDT:USDT",
+        "timestamp": 1755365820000,
+        "datetime": "2025-08-16T16:37:00.000Z",
+        "high": last,
+        "low": last,
+        "open": last,
+        "close": last,
+        "last": last,
+        "vwap": last,
+        "change": 0.0,
+        "percentage": 0.0,
+        "baseVolume": 1.0,
+        "quoteVolume": last,
+    }
+
+
+class FakeWsClient:
+    """ccxt.pro 클라이언트의 watch_* 메서드만 흉내내는 stand-in 입니다."""
+
+    def __init__(self) -> None:
+        self.ticker_messages: asyncio.Queue[Any] = asyncio.Queue()
+        self.watch_calls = 0
+
+    async def watch_ticker(self, symbol: str) -> dict[str, Any]:
+        self.watch_calls += 1
+        message = await self.ticker_messages.get()
+        if isinstance(message, Exception):
+            raise message
+        return message
+
+    async def watch_trades(self, symbol: str) -> list[dict[str, Any]]:
+        await asyncio.sleep(0)
+        return [
+            {
+                "symbol": symbol,
+                "timestamp": 1755365820000 + i,
+                "datetime": "2025-08-16T16:37:00.000Z",
+                "side": "buy",
+                "price": 100.0,
+                "amount": 0.1,
+            }
+            for i in range(3)
+        ]
+
+    async def watch_order_book(self, symbol: str, limit: int | None) -> dict[str, Any]:
+        await asyncio.sleep(0)
+        return {
+            "symbol": symbol,
+            "asks": [[101.0, 1.0]],
+            "bids": [[100.0, 2.0]],
+            "timestamp": 1755365820000,
+            "datetime": "2025-08-16T16:37:00.000Z",
+            "nonce": 1,
+        }
+
+    async def watch_ohlcv(self, symbol: str, timeframe: str) -> list[list[Any]]:
+        await asyncio.sleep(0)
+        return [[1755365820000, 1.0, 2.0, 0.5, 1.5, 10.0]]
+
+
+@pytest.fixture
+def client() -> FakeWsClient:
+    return FakeWsClient()
+
+
+@pytest.fixture
+def stream(client: FakeWsClient) -> MarketStream:
+    return MarketStream(SimpleNamespace(ws_client=client), queue_size=2, reconnect_delay=0.01)
+
+
+@pytest.mark.asyncio
+async def test_ticker_reconnects_on_network_error(
+    stream: MarketStream, client: FakeWsClient
+) -> None:
+    await client.ticker_messages.put(make_ticker(100.0))
+    await client.ticker_messages.put(ccxt.NetworkError("socket closed"))
+    await client.ticker_messages.put(make_ticker(101.0))
+
+    tickers = stream.watch_ticker("BTC/USDT:USDT")
+    first = await anext(tickers)
+    second = await anext(tickers)
+    await tickers.aclose()
+
+    assert isinstance(first, TickerDTO)
+    assert (first.last, second.last) == (100.0, 101.0)
+    assert client.watch_calls >= 3
+
+
+@pytest.mark.asyncio
+async def test_ticker_conflates_when_consumer_is_slow(
+    stream: MarketStream, client: FakeWsClient
+) -> None:
+    for last in range(10):
+        await client.ticker_messages.put(make_ticker(float(last)))
+
+    # the pump drains all ten messages before the consumer runs; only the newest two are kept
+    tickers = stream.watch_ticker("BTC/USDT:USDT")
+    received = [await anext(tickers), await anext(tickers)]
+    await tickers.aclose()
+
+    assert [ticker.last for ticker in received] == [8.0, 9.0]
+
+
+@pytest.mark.asyncio
+async def test_ticker_propagates_non_network_errors(
+    stream: MarketStream, client: FakeWsClient
+) -> None:
+    await client.ticker_messages.put(ccxt.BadSymbol("unknown symbol"))
+
+    with pytest.raises(ccxt.BadSymbol):
+        await anext(stream.watch_ticker("FOO/BAR"))
+
+
+@pytest.mark.asyncio
+async def test_trades_are_not_dropped(stream: MarketStream) -> None:
+    trades = stream.watch_trades("BTC/USDT:USDT")
+    received = [await anext(trades) for _ in range(7)]
+    await trades.aclose()
+
+    assert all(isinstance(trade, TradeDTO) for trade in received)
+    assert [trade.timestamp % 3 for trade in received] == [0, 1, 2, 0, 1, 2, 0]
+
+
+@pytest.mark.asyncio
+async def test_order_book_and_candles(stream: MarketStream) -> None:
+    order_book = await anext(stream.watch_order_book("BTC/USDT:USDT"))
+    candle = await anext(stream.watch_candles("BTC/USDT:USDT", "1m"))
+
+    assert isinstance(order_book, OrderBookDTO)
+    assert order_book.bids[0].price == 100.0
+    assert candle == CandleDTO(
+        timestamp=1755365820000, open=1.0, high=2.0, low=0.5, close=1.5, volume=10.0
+    )